@@ -0,0 +1,263 @@
+"""
+ArangoDB MCP Server - Per-Database Admission Control
+
+With several agents on the HTTP transport, one tenant can flood a single
+ArangoDB deployment. This module limits the number of tool calls in flight per
+database key (``max_in_flight`` in databases.yaml). Calls beyond the limit wait
+in a bounded queue (``max_queue``) for at most ``queue_timeout`` seconds and are
+rejected with AdmissionRejectedError when the queue is full or the wait times out.
+
+Waiting calls are granted in per-session round-robin order: each free slot goes
+to the oldest waiting call of the next session in turn, so a session that queues
+many calls cannot starve the others.
+
+A call that times out on the worker pool keeps its slot until its worker thread
+finishes, since the handler keeps running against the database. A cancelled
+call releases its slot at once (its AQL queries are killed by QueryTracker).
+
+Classes:
+- AdmissionRejectedError - Raised when a call cannot be admitted
+- DatabaseLimiter - Slot accounting and fair wait queue for one database
+- AdmissionController - Limiters for all configured databases plus metrics
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from .executor import ToolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+REASON_QUEUE_FULL = "queue_full"
+REASON_QUEUE_TIMEOUT = "queue_timeout"
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a tool call cannot be admitted to a saturated database."""
+
+    def __init__(self, database_key: str, reason: str, message: str):
+        super().__init__(message)
+        self.database_key = database_key
+        self.reason = reason
+
+
+class DatabaseLimiter:
+    """In-flight limit with a bounded, per-session round-robin wait queue.
+
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        database_key: str,
+        max_in_flight: int,
+        max_queue: int = 100,
+        queue_timeout: Optional[float] = 30.0,
+    ):
+        """Initialize DatabaseLimiter.
+
+        Args:
+            database_key: Database key (used in errors and metrics)
+            max_in_flight: Maximum concurrently executing calls
+            max_queue: Maximum waiting calls (0 rejects as soon as all slots are busy)
+            queue_timeout: Maximum wait in seconds (None waits indefinitely)
+        """
+        self.database_key = database_key
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.queued = 0
+        # session_id -> waiting futures, in round-robin order
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.waited = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.held_after_timeout = 0
+
+    def _grant_next(self) -> None:
+        while self.in_flight < self.max_in_flight and self._waiters:
+            session_id, waiters = self._waiters.popitem(last=False)
+            future = waiters.popleft()
+            self.queued -= 1
+            if waiters:
+                # Session still has waiters: it goes to the back of the rotation
+                self._waiters[session_id] = waiters
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(True)
+
+    def _remove_waiter(self, session_id: str, future: asyncio.Future) -> None:
+        waiters = self._waiters.get(session_id)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(future)
+        except ValueError:
+            return
+        self.queued -= 1
+        if not waiters:
+            del self._waiters[session_id]
+
+    async def acquire(self, session_id: str) -> None:
+        """Wait for a free slot.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait times out
+        """
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        if self.queued >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejectedError(
+                self.database_key,
+                REASON_QUEUE_FULL,
+                f"Database '{self.database_key}' is saturated: {self.in_flight} calls in flight "
+                f"and {self.queued} queued (max_in_flight={self.max_in_flight}, "
+                f"max_queue={self.max_queue})",
+            )
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(session_id, deque()).append(future)
+        self.queued += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # Granted at the same moment the timeout fired; hand it back
+                self.release()
+            else:
+                future.cancel()
+                self._remove_waiter(session_id, future)
+            self.rejected_timeout += 1
+            raise AdmissionRejectedError(
+                self.database_key,
+                REASON_QUEUE_TIMEOUT,
+                f"Timed out after {self.queue_timeout:g}s waiting for database "
+                f"'{self.database_key}' ({self.in_flight} calls in flight, {self.queued} queued)",
+            ) from None
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                future.cancel()
+                self._remove_waiter(session_id, future)
+            raise
+
+        waited = time.perf_counter() - started
+        self.admitted += 1
+        self.waited += 1
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiting session."""
+        self.in_flight -= 1
+        self._grant_next()
+
+    def release_when_done(self, worker: Future) -> None:
+        """Free a slot once a timed-out call's worker thread finishes."""
+        loop = asyncio.get_running_loop()
+        self.held_after_timeout += 1
+
+        def _done(_: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(self.release)
+            except RuntimeError:
+                pass  # Event loop closed (server shutting down)
+
+        worker.add_done_callback(_done)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return occupancy, queue depth and wait time metrics."""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "queue_timeout_sec": self.queue_timeout,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "waiting_sessions": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "held_after_timeout": self.held_after_timeout,
+            "avg_queue_wait_ms": round(self.wait_total / self.waited * 1000, 3) if self.waited else 0.0,
+            "max_queue_wait_ms": round(self.wait_max * 1000, 3),
+        }
+
+
+class AdmissionController:
+    """Per-database limiters; databases without ``max_in_flight`` are unlimited."""
+
+    def __init__(self) -> None:
+        """Initialize AdmissionController with no limits."""
+        self._limiters: Dict[str, DatabaseLimiter] = {}
+
+    @classmethod
+    def from_configs(cls, configs: Dict[str, Any]) -> "AdmissionController":
+        """Build limiters from DatabaseConfig objects keyed by database key."""
+        controller = cls()
+        for key, config in configs.items():
+            controller.configure(key, config)
+        return controller
+
+    def configure(self, database_key: str, config: Any) -> None:
+        """Create (or remove) the limiter for a database from its DatabaseConfig."""
+        if getattr(config, "max_in_flight", None) is None:
+            self._limiters.pop(database_key, None)
+            return
+        self._limiters[database_key] = DatabaseLimiter(
+            database_key,
+            max_in_flight=config.max_in_flight,
+            max_queue=config.max_queue,
+            queue_timeout=config.queue_timeout,
+        )
+
+    def get_limiter(self, database_key: str) -> Optional[DatabaseLimiter]:
+        """Return the limiter of a database, or None if it is unlimited."""
+        return self._limiters.get(database_key)
+
+    @asynccontextmanager
+    async def admit(self, database_key: str, session_id: str) -> AsyncIterator[None]:
+        """Hold a slot of database_key for the duration of the block.
+
+        If the block raises ToolTimeoutError while its worker thread still
+        runs, the slot is held until that thread finishes.
+
+        Raises:
+            AdmissionRejectedError: If the call cannot be admitted
+        """
+        limiter = self._limiters.get(database_key)
+        if limiter is None:
+            yield
+            return
+        await limiter.acquire(session_id)
+        worker: Optional[Future] = None
+        try:
+            yield
+        except ToolTimeoutError as e:
+            worker = e.worker
+            raise
+        finally:
+            if worker is not None and not worker.done():
+                limiter.release_when_done(worker)
+            else:
+                limiter.release()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return metrics for every limited database."""
+        return {key: limiter.get_metrics() for key, limiter in self._limiters.items()}
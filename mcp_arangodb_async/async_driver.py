@@ -0,0 +1,621 @@
+"""
+ArangoDB MCP Server - Native Async Driver
+
+This module provides a small asyncio-native ArangoDB client built on httpx with
+keep-alive connection pooling. It implements the subset of the ArangoDB REST API
+used by the tool handlers (cursor, document, collection, index, graph, explain),
+so that concurrent tool calls overlap their network I/O on the event loop instead
+of occupying worker threads.
+
+The object model mirrors python-arango (client -> database -> collection/aql/graph)
+and errors are raised as ArangoError subclasses, so the existing @handle_errors
+decorator formats them exactly like python-arango errors.
+
+Classes:
+- AsyncArangoClient - Pooled HTTP client for one ArangoDB server
+- AsyncDatabase - Database-scoped API (collections, indexes, graphs, AQL)
+- AsyncAQL - AQL execution and explain
+- AsyncCursor - Async iterator over a server-side AQL cursor
+- AsyncCollection - Document and index operations on a collection
+- AsyncGraph - Named graph metadata
+- AsyncArangoServerError - Error response returned by ArangoDB
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+import httpx
+from arango.exceptions import ArangoError
+
+# ArangoDB error number for "collection or view not found"
+_ERR_COLLECTION_NOT_FOUND = 1203
+# ArangoDB error number for "document not found"
+_ERR_DOCUMENT_NOT_FOUND = 1202
+# ArangoDB error number for "graph not found"
+_ERR_GRAPH_NOT_FOUND = 1924
+
+
+class AsyncArangoServerError(ArangoError):
+    """Error response returned by the ArangoDB server.
+
+    Attributes:
+        http_code: HTTP status code of the response
+        error_code: ArangoDB error number (falls back to the HTTP status code)
+        error_message: Raw error message from the server
+        http_method: HTTP method of the failed request
+        url: Request URL
+    """
+
+    def __init__(
+        self,
+        http_code: int,
+        error_code: Optional[int],
+        error_message: str,
+        http_method: str,
+        url: str,
+    ):
+        if error_code is not None:
+            message = f"[HTTP {http_code}][ERR {error_code}] {error_message}"
+        else:
+            message = f"[HTTP {http_code}] {error_message}"
+        super().__init__(message)
+        self.message = message
+        self.http_code = http_code
+        self.error_code = error_code if error_code is not None else http_code
+        self.error_message = error_message
+        self.http_method = http_method
+        self.url = url
+
+
+class AsyncArangoClient:
+    """Pooled asyncio HTTP client for one ArangoDB server.
+
+    A single httpx.AsyncClient (and therefore one keep-alive connection pool) is
+    shared by every AsyncDatabase obtained from this client.
+    """
+
+    def __init__(
+        self,
+        hosts: str,
+        request_timeout: float = 30.0,
+        max_connections: int = 10,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize AsyncArangoClient.
+
+        Args:
+            hosts: Base URL of the ArangoDB server (e.g. "http://localhost:8529")
+            request_timeout: Per-request timeout in seconds
+            max_connections: Maximum number of pooled connections to the server
+            transport: Optional httpx transport (used by tests to mock the server)
+        """
+        self.hosts = hosts.rstrip("/")
+        self._http = httpx.AsyncClient(
+            base_url=self.hosts,
+            timeout=request_timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+
+    def db(
+        self, name: str = "_system", username: str = "root", password: str = ""
+    ) -> "AsyncDatabase":
+        """Return a database-scoped API object sharing this client's pool."""
+        return AsyncDatabase(self._http, name, httpx.BasicAuth(username, password))
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        await self._http.aclose()
+
+
+class AsyncDatabase:
+    """Database-scoped subset of the ArangoDB REST API."""
+
+    def __init__(self, http: httpx.AsyncClient, name: str, auth: httpx.Auth):
+        self._http = http
+        self._auth = auth
+        self.name = name
+        self._prefix = f"/_db/{quote(name, safe='')}"
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a request to this database and return the decoded JSON body.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint relative to the database (e.g. "/_api/cursor")
+            json: JSON request body
+            params: Query string parameters
+            content: Raw request body (used instead of json)
+            headers: Extra request headers
+
+        Returns:
+            Decoded JSON response body (None for empty bodies)
+
+        Raises:
+            AsyncArangoServerError: If the server returns an error response
+        """
+        if params:
+            params = {
+                k: ("true" if v is True else "false" if v is False else v)
+                for k, v in params.items()
+                if v is not None
+            }
+        response = await self._http.request(
+            method,
+            self._prefix + endpoint,
+            json=json if content is None else None,
+            content=content,
+            params=params,
+            headers=headers,
+            auth=self._auth,
+        )
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            # Error pages of proxies (e.g. a 502 HTML page) are not JSON
+            if not response.is_error:
+                raise
+            body = {}
+        if response.is_error or (isinstance(body, dict) and body.get("error") is True):
+            body = body if isinstance(body, dict) else {}
+            raise AsyncArangoServerError(
+                http_code=response.status_code,
+                error_code=body.get("errorNum"),
+                error_message=body.get("errorMessage") or response.reason_phrase,
+                http_method=method.lower(),
+                url=str(response.request.url),
+            )
+        return body
+
+    @property
+    def aql(self) -> "AsyncAQL":
+        """AQL API for this database."""
+        return AsyncAQL(self)
+
+    async def version(self) -> str:
+        """Return the ArangoDB server version string."""
+        body = await self.request("GET", "/_api/version")
+        return body["version"]
+
+    async def collections(self) -> List[Dict[str, Any]]:
+        """Return metadata for all collections (including system collections)."""
+        body = await self.request("GET", "/_api/collection")
+        return [
+            {
+                "id": c.get("id"),
+                "name": c.get("name"),
+                "system": c.get("isSystem", False),
+                "isSystem": c.get("isSystem", False),
+                "type": "edge" if c.get("type") == 3 else "document",
+                "status": c.get("status"),
+            }
+            for c in body.get("result", [])
+        ]
+
+    async def has_collection(self, name: str) -> bool:
+        """Return True if the collection exists."""
+        try:
+            await self.request("GET", f"/_api/collection/{quote(name, safe='')}")
+            return True
+        except AsyncArangoServerError as e:
+            if e.error_code == _ERR_COLLECTION_NOT_FOUND or e.http_code == 404:
+                return False
+            raise
+
+    def collection(self, name: str) -> "AsyncCollection":
+        """Return an API object for the named collection (no server round trip)."""
+        return AsyncCollection(self, name)
+
+    async def create_collection(
+        self, name: str, edge: bool = False, sync: Optional[bool] = None
+    ) -> "AsyncCollection":
+        """Create a document or edge collection and return its API object."""
+        data: Dict[str, Any] = {"name": name, "type": 3 if edge else 2}
+        if sync is not None:
+            data["waitForSync"] = sync
+        await self.request("POST", "/_api/collection", json=data)
+        return AsyncCollection(self, name)
+
+    async def delete_index(self, index_id: str) -> bool:
+        """Delete an index by its full id ("collection/number")."""
+        await self.request("DELETE", f"/_api/index/{index_id}")
+        return True
+
+    async def graphs(self) -> List[Dict[str, Any]]:
+        """Return metadata for all named graphs."""
+        body = await self.request("GET", "/_api/gharial")
+        return [_format_graph(g) for g in body.get("graphs", [])]
+
+    async def has_graph(self, name: str) -> bool:
+        """Return True if the named graph exists."""
+        try:
+            await self.request("GET", f"/_api/gharial/{quote(name, safe='')}")
+            return True
+        except AsyncArangoServerError as e:
+            if e.error_code == _ERR_GRAPH_NOT_FOUND or e.http_code == 404:
+                return False
+            raise
+
+    def graph(self, name: str) -> "AsyncGraph":
+        """Return an API object for the named graph (no server round trip)."""
+        return AsyncGraph(self, name)
+
+
+class AsyncAQL:
+    """AQL execution and explain for one database."""
+
+    def __init__(self, db: AsyncDatabase):
+        self._db = db
+
+    async def execute(
+        self,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        count: bool = False,
+        batch_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        full_count: Optional[bool] = None,
+        max_runtime: Optional[float] = None,
+        stream: Optional[bool] = None,
+    ) -> "AsyncCursor":
+        """Execute an AQL query and return a cursor over its results.
+
+        Args:
+            query: AQL query string
+            bind_vars: Bind parameters
+            count: Ask the server to return the total result count
+            batch_size: Maximum number of results per batch
+            ttl: Server-side cursor time-to-live in seconds
+            full_count: Return the count before the last LIMIT in extra.stats
+            max_runtime: Server-side query runtime limit in seconds
+            stream: Use a streaming cursor
+
+        Returns:
+            AsyncCursor positioned at the first batch
+        """
+        data: Dict[str, Any] = {"query": query, "count": count}
+        if bind_vars:
+            data["bindVars"] = bind_vars
+        if batch_size is not None:
+            data["batchSize"] = batch_size
+        if ttl is not None:
+            data["ttl"] = ttl
+        options: Dict[str, Any] = {}
+        if full_count is not None:
+            options["fullCount"] = full_count
+        if max_runtime is not None:
+            options["maxRuntime"] = max_runtime
+        if stream is not None:
+            options["stream"] = stream
+        if options:
+            data["options"] = options
+        body = await self._db.request("POST", "/_api/cursor", json=data)
+        return AsyncCursor(self._db, body)
+
+    async def explain(
+        self,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        all_plans: bool = False,
+        max_plans: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Explain an AQL query.
+
+        Returns:
+            Raw explain response with "plan" (or "plans" when all_plans is set),
+            "warnings" and "stats"
+        """
+        options: Dict[str, Any] = {"allPlans": all_plans}
+        if max_plans is not None:
+            options["maxNumberOfPlans"] = max_plans
+        data: Dict[str, Any] = {"query": query, "options": options}
+        if bind_vars:
+            data["bindVars"] = bind_vars
+        return await self._db.request("POST", "/_api/explain", json=data)
+
+    async def queries(self) -> List[Dict[str, Any]]:
+        """Return the queries currently running in this database."""
+        return await self._db.request("GET", "/_api/query/current")
+
+    async def kill(self, query_id: str) -> bool:
+        """Kill a running query."""
+        await self._db.request("DELETE", f"/_api/query/{query_id}")
+        return True
+
+
+class AsyncCursor:
+    """Async iterator over a server-side AQL cursor.
+
+    Batches are fetched lazily while iterating; the server-side cursor is deleted
+    on close() if it still has unread batches.
+    """
+
+    def __init__(self, db: AsyncDatabase, body: Dict[str, Any]):
+        self._db = db
+        self._batch: List[Any] = list(body.get("result") or [])
+        self._index = 0
+        self.id: Optional[str] = body.get("id")
+        self.has_more: bool = bool(body.get("hasMore"))
+        self.count: Optional[int] = body.get("count")
+        self.extra: Dict[str, Any] = body.get("extra") or {}
+        self.cached: bool = bool(body.get("cached"))
+
+    def batch(self) -> List[Any]:
+        """Return the unread part of the current batch."""
+        return self._batch[self._index:]
+
+    def empty(self) -> bool:
+        """Return True if the current batch has been fully read."""
+        return self._index >= len(self._batch)
+
+    async def fetch(self) -> List[Any]:
+        """Fetch the next batch from the server and make it current."""
+        if not self.has_more or self.id is None:
+            self._batch, self._index = [], 0
+            return []
+        body = await self._db.request("PUT", f"/_api/cursor/{self.id}")
+        self._batch = list(body.get("result") or [])
+        self._index = 0
+        self.has_more = bool(body.get("hasMore"))
+        if body.get("extra"):
+            self.extra = body["extra"]
+        return self._batch
+
+    def __aiter__(self) -> "AsyncCursor":
+        return self
+
+    async def __anext__(self) -> Any:
+        while self._index >= len(self._batch):
+            if not self.has_more:
+                raise StopAsyncIteration
+            await self.fetch()
+        item = self._batch[self._index]
+        self._index += 1
+        return item
+
+    async def to_list(self) -> List[Any]:
+        """Drain the cursor into a list and close it."""
+        try:
+            return [item async for item in self]
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Delete the server-side cursor if it still holds results."""
+        if self.has_more and self.id is not None:
+            cursor_id, self.has_more = self.id, False
+            try:
+                await self._db.request("DELETE", f"/_api/cursor/{cursor_id}")
+            except AsyncArangoServerError:
+                pass  # Already expired or exhausted on the server
+
+
+class AsyncCollection:
+    """Document and index operations on one collection."""
+
+    def __init__(self, db: AsyncDatabase, name: str):
+        self._db = db
+        self.name = name
+        self._path = quote(name, safe="")
+
+    def _key(self, document: Any) -> str:
+        if isinstance(document, dict):
+            if "_key" in document:
+                return quote(str(document["_key"]), safe="")
+            if "_id" in document:
+                return quote(str(document["_id"]).split("/", 1)[1], safe="")
+            raise ValueError("Document must contain '_key' or '_id'")
+        return quote(str(document).split("/")[-1], safe="")
+
+    async def properties(self) -> Dict[str, Any]:
+        """Return the collection properties (raw REST fields)."""
+        return await self._db.request("GET", f"/_api/collection/{self._path}/properties")
+
+    async def count(self) -> int:
+        """Return the number of documents in the collection."""
+        body = await self._db.request("GET", f"/_api/collection/{self._path}/count")
+        return int(body.get("count", 0))
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a document by key or id, or None if it does not exist."""
+        try:
+            return await self._db.request(
+                "GET", f"/_api/document/{self._path}/{self._key(key)}"
+            )
+        except AsyncArangoServerError as e:
+            if e.error_code == _ERR_DOCUMENT_NOT_FOUND or e.http_code == 404:
+                return None
+            raise
+
+    async def has(self, key: str) -> bool:
+        """Return True if a document with the given key or id exists."""
+        return await self.get(key) is not None
+
+    async def insert(
+        self,
+        document: Dict[str, Any],
+        return_new: bool = False,
+        sync: Optional[bool] = None,
+        overwrite_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Insert one document and return its metadata."""
+        return await self._db.request(
+            "POST",
+            f"/_api/document/{self._path}",
+            json=document,
+            params={
+                "returnNew": return_new,
+                "waitForSync": sync,
+                "overwriteMode": overwrite_mode,
+            },
+        )
+
+    async def insert_many(
+        self,
+        documents: List[Dict[str, Any]],
+        return_new: bool = False,
+        sync: Optional[bool] = None,
+        overwrite_mode: Optional[str] = None,
+    ) -> List[Any]:
+        """Insert documents in one request.
+
+        Returns:
+            One entry per input document: metadata on success, or an
+            AsyncArangoServerError for documents the server rejected
+        """
+        body = await self._db.request(
+            "POST",
+            f"/_api/document/{self._path}",
+            json=documents,
+            params={
+                "returnNew": return_new,
+                "waitForSync": sync,
+                "overwriteMode": overwrite_mode,
+            },
+        )
+        return _format_bulk_results(body, "post")
+
+    async def update(
+        self,
+        document: Dict[str, Any],
+        return_new: bool = False,
+        sync: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Partially update a document identified by its _key or _id."""
+        return await self._db.request(
+            "PATCH",
+            f"/_api/document/{self._path}/{self._key(document)}",
+            json=document,
+            params={"returnNew": return_new, "waitForSync": sync},
+        )
+
+    async def update_many(
+        self,
+        documents: List[Dict[str, Any]],
+        return_new: bool = False,
+        sync: Optional[bool] = None,
+    ) -> List[Any]:
+        """Partially update documents in one request (same result shape as insert_many)."""
+        body = await self._db.request(
+            "PATCH",
+            f"/_api/document/{self._path}",
+            json=documents,
+            params={"returnNew": return_new, "waitForSync": sync},
+        )
+        return _format_bulk_results(body, "patch")
+
+    async def replace(
+        self, document: Dict[str, Any], sync: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Replace a document identified by its _key or _id."""
+        return await self._db.request(
+            "PUT",
+            f"/_api/document/{self._path}/{self._key(document)}",
+            json=document,
+            params={"waitForSync": sync},
+        )
+
+    async def delete(self, document: Any, sync: Optional[bool] = None) -> Dict[str, Any]:
+        """Delete a document by key, id or document body."""
+        return await self._db.request(
+            "DELETE",
+            f"/_api/document/{self._path}/{self._key(document)}",
+            params={"waitForSync": sync},
+        )
+
+    async def all(self, batch_size: Optional[int] = None) -> AsyncCursor:
+        """Return a cursor over every document in the collection."""
+        return await self._db.aql.execute(
+            "FOR doc IN @@collection RETURN doc",
+            bind_vars={"@collection": self.name},
+            batch_size=batch_size,
+        )
+
+    async def indexes(self) -> List[Dict[str, Any]]:
+        """Return the collection's indexes (raw REST fields)."""
+        body = await self._db.request(
+            "GET", "/_api/index", params={"collection": self.name}
+        )
+        return body.get("indexes", [])
+
+    async def add_index(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Create an index from a REST index definition and return its metadata."""
+        return await self._db.request(
+            "POST", "/_api/index", json=data, params={"collection": self.name}
+        )
+
+
+class AsyncGraph:
+    """Named graph metadata."""
+
+    def __init__(self, db: AsyncDatabase, name: str):
+        self._db = db
+        self.name = name
+
+    async def properties(self) -> Dict[str, Any]:
+        """Return graph properties in python-arango's snake_case format."""
+        body = await self._db.request(
+            "GET", f"/_api/gharial/{quote(self.name, safe='')}"
+        )
+        return _format_graph(body.get("graph", {}))
+
+    async def vertex_collections(self) -> List[str]:
+        """Return the names of the graph's vertex collections."""
+        body = await self._db.request(
+            "GET", f"/_api/gharial/{quote(self.name, safe='')}/vertex"
+        )
+        return sorted(body.get("collections", []))
+
+    async def edge_definitions(self) -> List[Dict[str, Any]]:
+        """Return the graph's edge definitions in snake_case format."""
+        return (await self.properties())["edge_definitions"]
+
+
+def _format_graph(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a gharial graph body to the snake_case shape used by python-arango."""
+    return {
+        "id": body.get("_id"),
+        "name": body.get("name") or body.get("_key"),
+        "revision": body.get("_rev"),
+        "edge_definitions": [
+            {
+                "edge_collection": d.get("collection"),
+                "from_vertex_collections": d.get("from", []),
+                "to_vertex_collections": d.get("to", []),
+            }
+            for d in body.get("edgeDefinitions", [])
+        ],
+        "orphan_collections": body.get("orphanCollections", []),
+    }
+
+
+def _format_bulk_results(body: Any, method: str) -> List[Any]:
+    """Turn per-document error entries of a bulk response into exceptions."""
+    results: List[Any] = []
+    for item in body or []:
+        if isinstance(item, dict) and item.get("error") is True:
+            results.append(
+                AsyncArangoServerError(
+                    http_code=202,
+                    error_code=item.get("errorNum"),
+                    error_message=item.get("errorMessage", ""),
+                    http_method=method,
+                    url="",
+                )
+            )
+        else:
+            results.append(item)
+    return results
@@ -0,0 +1,220 @@
+"""
+ArangoDB MCP Server - Native Async Tool Handlers
+
+Purpose:
+    Async variants of the hottest tool handlers, executed directly on the event
+    loop against an AsyncDatabase (see async_driver.py). They are attached to the
+    existing tool registrations with @register_async_handler and are only used for
+    databases configured with ``driver: httpx``; every other database keeps using
+    the python-arango handlers in handlers.py on the worker pool.
+
+    Each variant returns exactly what its python-arango counterpart returns, and
+    shares its query building / result shaping helpers.
+
+Functions:
+    - handle_arango_query_async
+    - handle_list_collections_async
+    - handle_insert_async
+    - handle_update_async
+    - handle_remove_async
+    - handle_list_indexes_async
+    - handle_explain_query_async
+    - handle_traverse_async
+    - handle_shortest_path_async
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from .async_driver import AsyncDatabase
+from .cursor_registry import close_cursor
+from .query_tracker import max_runtime_options, tag_query
+from .handlers import (
+    handle_errors,
+    _analyze_query_for_indexes,
+    _cursor_has_more,
+    _first_query_page,
+    _get_cursor_registry,
+    _get_session_context,
+    _query_page_limits,
+    _read_async_cursor_page,
+    _build_shortest_path_query,
+    _build_traverse_query,
+    _format_shortest_path,
+    _simplify_index,
+)
+from .tool_registry import register_async_handler
+from .tools import (
+    ARANGO_QUERY,
+    ARANGO_LIST_COLLECTIONS,
+    ARANGO_INSERT,
+    ARANGO_UPDATE,
+    ARANGO_REMOVE,
+    ARANGO_LIST_INDEXES,
+    ARANGO_EXPLAIN_QUERY,
+    ARANGO_TRAVERSE,
+    ARANGO_SHORTEST_PATH,
+    ARANGO_GRAPH_TRAVERSAL,
+    ARANGO_ADD_VERTEX,
+)
+
+
+def _document_meta(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "_id": result.get("_id"),
+        "_key": result.get("_key"),
+        "_rev": result.get("_rev"),
+    }
+
+
+def _collection_not_found(collection_name: str) -> Dict[str, Any]:
+    return {
+        "error": f"Collection '{collection_name}' does not exist",
+        "type": "CollectionNotFound",
+    }
+
+
+@register_async_handler(ARANGO_QUERY)
+@handle_errors
+async def handle_arango_query_async(
+    db: AsyncDatabase, args: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Execute an AQL query and return the result list, or its first page (async driver)."""
+    if args.get("batch_size") is None and args.get("max_rows") is None:
+        cursor = await db.aql.execute(
+            tag_query(args["query"]),
+            bind_vars=args.get("bind_vars") or {},
+            **max_runtime_options(args.get("max_runtime")),
+        )
+        return await cursor.to_list()
+
+    session_state, session_id = _get_session_context(args)
+    registry = _get_cursor_registry(session_state)
+    batch_size, max_rows = _query_page_limits(args)
+    cursor = await db.aql.execute(
+        tag_query(args["query"]),
+        bind_vars=args.get("bind_vars") or {},
+        batch_size=batch_size,
+        ttl=registry.ttl,
+        stream=True,
+        **max_runtime_options(args.get("max_runtime")),
+    )
+    try:
+        rows = await _read_async_cursor_page(cursor, min(batch_size, max_rows or batch_size))
+    except Exception:
+        close_cursor(cursor)
+        raise
+    return _first_query_page(
+        registry, session_id, cursor, rows, batch_size, max_rows, _cursor_has_more(cursor)
+    )
+
+
+@register_async_handler(ARANGO_LIST_COLLECTIONS)
+@handle_errors
+async def handle_list_collections_async(
+    db: AsyncDatabase, args: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """Return non-system collection names (async driver)."""
+    cols = await db.collections()
+    return [c["name"] for c in cols if not c.get("isSystem")]
+
+
+@register_async_handler(ARANGO_INSERT)
+@handle_errors
+async def handle_insert_async(db: AsyncDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Insert a document into a collection (async driver)."""
+    collection_name = args["collection"]
+    if not await db.has_collection(collection_name):
+        return _collection_not_found(collection_name)
+
+    result = await db.collection(collection_name).insert(args["document"])
+    return _document_meta(result)
+
+
+@register_async_handler(ARANGO_UPDATE)
+@handle_errors
+async def handle_update_async(db: AsyncDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Update a document by key in a collection (async driver)."""
+    collection_name = args["collection"]
+    if not await db.has_collection(collection_name):
+        return _collection_not_found(collection_name)
+
+    payload = {"_key": args["key"], **args["update"]}
+    result = await db.collection(collection_name).update(payload)
+    return _document_meta(result)
+
+
+@register_async_handler(ARANGO_REMOVE)
+@handle_errors
+async def handle_remove_async(db: AsyncDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove a document by key from a collection (async driver)."""
+    collection_name = args["collection"]
+    if not await db.has_collection(collection_name):
+        return _collection_not_found(collection_name)
+
+    result = await db.collection(collection_name).delete(args["key"])
+    return _document_meta(result)
+
+
+@register_async_handler(ARANGO_LIST_INDEXES)
+@handle_errors
+async def handle_list_indexes_async(
+    db: AsyncDatabase, args: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """List indexes for a given collection (async driver)."""
+    indexes = await db.collection(args["collection"]).indexes()
+    return [_simplify_index(ix) for ix in indexes]
+
+
+@register_async_handler(ARANGO_EXPLAIN_QUERY)
+@handle_errors
+async def handle_explain_query_async(
+    db: AsyncDatabase, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Explain an AQL query and optionally include index suggestions (async driver)."""
+    max_plans = int(args.get("max_plans", 1))
+    explain = await db.aql.explain(
+        args["query"],
+        bind_vars=args.get("bind_vars") or {},
+        all_plans=max_plans > 1,
+        max_plans=max_plans,
+    )
+    plans = explain.get("plans") or ([explain["plan"]] if explain.get("plan") else [])
+    result: Dict[str, Any] = {
+        "plans": plans,
+        "warnings": explain.get("warnings") or [],
+        "stats": explain.get("stats") or {},
+    }
+    if args.get("suggest_indexes", True):
+        result["index_suggestions"] = _analyze_query_for_indexes(args["query"], plans)
+    return result
+
+
+@register_async_handler(ARANGO_TRAVERSE)
+@handle_errors
+async def handle_traverse_async(
+    db: AsyncDatabase, args: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Perform a bounded traversal via AQL (async driver)."""
+    aql, bind = _build_traverse_query(args)
+    cursor = await db.aql.execute(
+        tag_query(aql), bind_vars=bind, **max_runtime_options(args.get("max_runtime"))
+    )
+    return await cursor.to_list()
+
+
+@register_async_handler(ARANGO_SHORTEST_PATH)
+@handle_errors
+async def handle_shortest_path_async(
+    db: AsyncDatabase, args: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Compute shortest path between two vertices using AQL (async driver)."""
+    aql, bind = _build_shortest_path_query(args)
+    cursor = await db.aql.execute(aql, bind_vars=bind)
+    return _format_shortest_path(await cursor.to_list())
+
+
+# Aliases share the async variants of their targets
+register_async_handler(ARANGO_GRAPH_TRAVERSAL)(handle_traverse_async)
+register_async_handler(ARANGO_ADD_VERTEX)(handle_insert_async)
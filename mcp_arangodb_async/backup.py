@@ -4,21 +4,132 @@ ArangoDB MCP Server - Backup Utilities
 This module provides functionality to backup ArangoDB collections to JSON files.
 Supports exporting single or multiple collections with optional document limits.
 
+Backup files are JSON Lines (one document per line, <name>.jsonl) by default, so
+they can be read back one record at a time; the legacy JSON array format
+(<name>.json) is still available for writing and is always readable.
+
+Collections can be exported in parallel: each worker streams one collection
+through its own cursor and file writer. The cursor batch size of every
+collection is derived from a total memory budget shared by the workers and
+the collection's average document size, so memory stays bounded however many
+collections are in flight.
+
+Files can be compressed while they are written (gzip or zstd, see
+compression.py); the codec's extension is appended to the file name.
+
+A single large collection can also be split into contiguous _key ranges
+(bulk.key_ranges()) that are exported concurrently, each through its own range
+cursor into a part file (<name>.part-0001.jsonl, ...). A manifest
+(<name>.manifest.json), written once every part succeeded, lists the parts;
+restores read the manifest as the collection's backup file.
+
+Backups can be incremental: with a base backup directory, only documents
+whose _rev changed since the base are exported, and deleted keys are recorded
+as tombstones (see revisions.py for the revision manifests and backup chain).
+
+Backups are checkpointed (see checkpoint.py): collections are exported in
+_key order, and every CHECKPOINT_INTERVAL documents the last exported key and
+the file offset are recorded, so an interrupted backup resumed with
+resume=True keeps its finished files and continues each unfinished one after
+its last checkpoint.
+
 Functions:
 - validate_output_directory() - Validate/sanitize output directory for backups
-- backup_collections_to_dir() - Export collections to JSON files in a directory
+- validate_input_file() - Validate a server-local input file for ingest/restore
+- validate_input_directory() - Validate a server-local directory to read from
+- export_batch_size() - Cursor batch size keeping one batch within a memory budget
+- budget_batch_size() - Documents of a given size that fit in a memory budget
+- validate_backup_format() - Check a backup file format
+- backup_file_path() - Path of a collection's backup file for a format and codec
+- parse_backup_file_name() - Collection name and format of a backup file name
+- backup_file_collection() - Collection restored from a backup file name
+- plan_collection_export() - Export jobs of a collection (one per key range)
+- finish_collection_export() - Combine a collection's part results and write its manifest
+- iter_backup_documents() - Stream the documents of a backup file
+- export_collection() - Stream one collection to a JSON Lines or JSON array file
+- export_increment() - Export the documents changed since a base backup
+- backup_collections_to_dir() - Export collections to backup files in a directory
 """
 
 from __future__ import annotations
 
 import json
 import os
+import re
 import sys
+import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from arango.database import StandardDatabase
+from arango.exceptions import ArangoError
+
+from .bulk import key_ranges, run_concurrently
+from .checkpoint import BACKUP_CHECKPOINT, CHECKPOINT_INTERVAL, Checkpoint, open_checkpoint
+from .compression import (
+    SegmentedTextWriter,
+    compressed_path,
+    open_binary_reader,
+    open_text_writer,
+    strip_compression_extension,
+    validate_compression,
+)
+from .ingest import iter_json_array, iter_jsonl
+from .revisions import (
+    REVISION_BATCH_SIZE,
+    diff_revisions,
+    iter_changed_keys,
+    read_backup_chain,
+    revisions_path,
+    scan_revisions,
+    write_backup_chain,
+)
+from .query_tracker import tag_query
+
+# Backup file formats: JSON Lines (default) and the legacy JSON array
+BACKUP_FORMATS = ("jsonl", "json")
+DEFAULT_BACKUP_FORMAT = "jsonl"
+
+# Manifest listing the part files of a partitioned collection export
+MANIFEST_SUFFIX = ".manifest.json"
+_PART_SUFFIX = re.compile(r"\.part-\d+$")
+
+# Default memory budget shared by parallel export workers
+DEFAULT_BACKUP_MEMORY_BUDGET_MB = 256
+# Bounds for the cursor batch size of parallel exports
+MIN_EXPORT_BATCH_SIZE = 10
+MAX_EXPORT_BATCH_SIZE = 10_000
+# Assumed stored document size when collection figures are unavailable
+_DEFAULT_DOCUMENT_BYTES = 1024
+# Decoded Python documents take several times their stored size
+_DECODED_SIZE_FACTOR = 4
+
+# Sorted by _key (served by the primary index), so an interrupted export can
+# continue after the last key it wrote
+_EXPORT_QUERY = """
+FOR doc IN @@collection
+  SORT doc._key
+  RETURN doc
+"""
+
+_EXPORT_QUERY_LIMIT = """
+FOR doc IN @@collection
+  SORT doc._key
+  LIMIT @limit
+  RETURN doc
+"""
+
+_EXPORT_KEYS_QUERY = """
+FOR doc IN @@collection
+  FILTER doc._key IN @keys
+  RETURN doc
+"""
+
+# Range filters of a key-range export (primary index range scan)
+_EXPORT_AFTER_FILTER = "  FILTER doc._key > @after_key\n"
+_EXPORT_UNTIL_FILTER = "  FILTER doc._key <= @until_key\n"
 
 
 def validate_output_directory(output_dir: str) -> str:
@@ -73,6 +184,29 @@ def validate_output_directory(output_dir: str) -> str:
     except (OSError, ValueError) as e:
         raise ValueError(f"Invalid path: {e}")
 
+    allowed_roots = _allowed_roots()
+
+    # Check if the resolved path is within any allowed root
+    for allowed_root in allowed_roots:
+        try:
+            # This will succeed if requested_path is within allowed_root
+            requested_path.relative_to(allowed_root)
+            return str(requested_path)
+        except ValueError:
+            continue  # Not within this root, try next
+
+    # If we get here, the path is not within any allowed root
+    allowed_paths = [str(root) for root in allowed_roots]
+    raise ValueError(
+        f"Output directory '{output_dir}' is outside allowed directories. "
+        f"Allowed roots: {allowed_paths}"
+    )
+
+
+def _allowed_roots() -> List[Path]:
+    """Return the directories backups may be written to and files read from."""
+    import tempfile
+
     # Define allowed root directories
     allowed_roots = [
         Path.cwd().resolve(),  # Current working directory
@@ -98,106 +232,657 @@ def validate_output_directory(output_dir: str) -> str:
                 allowed_roots.append(temp_dir.resolve())
         except (OSError, ValueError):
             continue  # Skip invalid temp directories
+    return allowed_roots
 
-    # Check if the resolved path is within any allowed root
+
+def validate_input_file(input_file: str) -> str:
+    """Validate a server-local input file using the same sandbox as backups.
+
+    The file must exist and resolve (following symlinks) to a location inside
+    one of the directories allowed by validate_output_directory().
+
+    Args:
+        input_file: The requested file path
+
+    Returns:
+        Validated and normalized absolute path
+
+    Raises:
+        ValueError: If the path is invalid, outside allowed directories, or not a file
+    """
+    requested_path = _resolve_input_path(input_file, "Input file")
+    if not requested_path.is_file():
+        raise ValueError(f"Input file '{input_file}' does not exist or is not a file")
+    return str(requested_path)
+
+
+def validate_input_directory(input_dir: str) -> str:
+    """Validate a server-local directory to read from (e.g. an incremental backup base).
+
+    Same sandbox as validate_input_file(); the directory must exist.
+
+    Raises:
+        ValueError: If the path is invalid, outside allowed directories, or not a directory
+    """
+    requested_path = _resolve_input_path(input_dir, "Input directory")
+    if not requested_path.is_dir():
+        raise ValueError(f"Input directory '{input_dir}' does not exist or is not a directory")
+    return str(requested_path)
+
+
+def _resolve_input_path(path: str, label: str) -> Path:
+    """Resolve path and check it lies inside one of the allowed roots."""
+    try:
+        requested_path = Path(path).resolve()
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Invalid path: {e}")
+
+    allowed_roots = _allowed_roots()
     for allowed_root in allowed_roots:
         try:
-            # This will succeed if requested_path is within allowed_root
             requested_path.relative_to(allowed_root)
-            return str(requested_path)
+            return requested_path
         except ValueError:
-            continue  # Not within this root, try next
-
-    # If we get here, the path is not within any allowed root
+            continue
     allowed_paths = [str(root) for root in allowed_roots]
     raise ValueError(
-        f"Output directory '{output_dir}' is outside allowed directories. "
+        f"{label} '{path}' is outside allowed directories. "
         f"Allowed roots: {allowed_paths}"
     )
 
 
-def backup_collections_to_dir(
-    db: StandardDatabase,
-    output_dir: Optional[str] = None,
-    collections: Optional[List[str]] = None,
-    doc_limit: Optional[int] = None,
-) -> Dict[str, object]:
+def export_batch_size(db: StandardDatabase, collection_name: str, memory_budget: int) -> int:
+    """Return a cursor batch size that keeps one batch within memory_budget bytes.
+
+    The average document size comes from the collection figures; when they are
+    not available a 1 KiB document is assumed.
     """
-    Dump selected (or all non-system) collections to JSON files in output_dir.
+    avg_size = _DEFAULT_DOCUMENT_BYTES
+    try:
+        col = db.collection(collection_name)
+        count = col.count()
+        documents_size = col.statistics().get("documents_size")
+        if isinstance(count, int) and count > 0 and isinstance(documents_size, (int, float)) and documents_size > 0:
+            avg_size = documents_size / count
+    except ArangoError:
+        pass
+    return budget_batch_size(memory_budget, avg_size)
 
-    Each collection is written as a JSON array of documents: <name>.json
-    Returns a report dict with written file paths and record counts.
+
+def budget_batch_size(memory_budget: int, avg_document_bytes: float = _DEFAULT_DOCUMENT_BYTES) -> int:
+    """Return how many decoded documents of the given average size fit in memory_budget bytes.
+
+    The result is clamped to MIN_EXPORT_BATCH_SIZE..MAX_EXPORT_BATCH_SIZE.
     """
-    # Determine target directory
-    if output_dir is None or not output_dir.strip():
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = os.path.join("backups", ts)
+    batch_size = int(memory_budget // (avg_document_bytes * _DECODED_SIZE_FACTOR))
+    return max(MIN_EXPORT_BATCH_SIZE, min(MAX_EXPORT_BATCH_SIZE, batch_size))
 
-    # Validate and sanitize the output directory
-    try:
-        output_dir = validate_output_directory(output_dir)
-    except ValueError as e:
-        raise ValueError(f"Invalid output directory: {e}")
 
-    os.makedirs(output_dir, exist_ok=True)
+def validate_backup_format(fmt: str) -> None:
+    """Raise ValueError if fmt is not a backup file format ("jsonl" or "json")."""
+    if fmt not in BACKUP_FORMATS:
+        raise ValueError(f"Unsupported backup format '{fmt}'. Expected one of {BACKUP_FORMATS}")
 
-    # Resolve which collections to export
-    all_cols = [c["name"] for c in db.collections() if not c.get("isSystem")]
-    target_cols = collections if collections else all_cols
 
-    written: List[Dict[str, object]] = []
+def backup_file_path(
+    directory: str, collection_name: str, fmt: str = DEFAULT_BACKUP_FORMAT, compression: str = "none"
+) -> str:
+    """Return the backup file path of a collection ("<dir>/users.jsonl.gz", ...).
 
-    for name in target_cols:
-        if name not in all_cols:
-            # Skip unknown/non-existing or system collections silently
-            continue
+    Raises:
+        ValueError: If the format is unknown
+    """
+    validate_backup_format(fmt)
+    return compressed_path(os.path.join(directory, f"{collection_name}.{fmt}"), compression)
 
-        col = db.collection(name)
-        path = os.path.join(output_dir, f"{name}.json")
 
-        # Use streaming approach to handle large collections
+def parse_backup_file_name(file_name: str) -> Optional[Tuple[str, str]]:
+    """Return (collection name, format) of a backup file name, or None if it is not one.
+
+    Partition manifests have the format "manifest"; the name of a part file
+    keeps its ".part-NNNN" suffix.
+    """
+    name = os.path.basename(file_name)
+    if name.endswith(MANIFEST_SUFFIX) and len(name) > len(MANIFEST_SUFFIX):
+        return name[: -len(MANIFEST_SUFFIX)], "manifest"
+    name = strip_compression_extension(name)
+    stem, ext = os.path.splitext(name)
+    fmt = ext[1:]
+    if stem and fmt in BACKUP_FORMATS:
+        return stem, fmt
+    return None
+
+
+def iter_backup_documents(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the documents of a backup file one at a time.
+
+    JSON Lines files are read line by line and JSON array files through the
+    incremental array parser, so memory use does not grow with the file size.
+    Compressed files are decompressed on the fly (codec from the extension or
+    magic bytes).
+
+    A partition manifest yields the documents of its part files in order.
+
+    Raises:
+        ValueError: If the file name is not a backup file or a record cannot be parsed
+    """
+    parsed = parse_backup_file_name(path)
+    if parsed is None:
+        raise ValueError(f"Not a backup file: '{path}'")
+    if parsed[1] == "manifest":
+        # Partitioned export: the documents of every part, in key order
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        for part in manifest["parts"]:
+            yield from iter_backup_documents(os.path.join(os.path.dirname(path), part["path"]))
+        return
+    reader = iter_jsonl if parsed[1] == "jsonl" else iter_json_array
+    with open_binary_reader(path) as f:
+        for record in reader(f):
+            if record.error is not None:
+                raise ValueError(f"{os.path.basename(path)}, line {record.line}: {record.error}")
+            yield record.document
+
+
+def backup_file_collection(file_name: str) -> Optional[str]:
+    """Collection restored from a backup file ("users.jsonl", "users.manifest.json", ...).
+
+    Returns None for part files of a partitioned export (they are restored
+    through their manifest) and for files that are not backup files.
+    """
+    parsed = parse_backup_file_name(file_name)
+    if parsed is None or _PART_SUFFIX.search(parsed[0]):
+        return None
+    return parsed[0]
+
+
+def plan_collection_export(
+    db: StandardDatabase,
+    collection_name: str,
+    directory: str,
+    partitions: int = 1,
+    fmt: str = DEFAULT_BACKUP_FORMAT,
+    compression: str = "none",
+    doc_limit: Optional[int] = None,
+) -> List[Tuple[str, str, Optional[Tuple[Optional[str], Optional[str]]]]]:
+    """Return the export jobs of a collection as (collection, path, key_range).
+
+    With partitions > 1 the _key space is split into up to that many ranges,
+    each exported to its own part file; otherwise (or with a doc_limit, which
+    applies to the collection as a whole) there is a single job with key_range
+    None writing the regular backup file.
+    """
+    if partitions > 1 and doc_limit is None:
         try:
-            cursor = col.all()
-            count = 0
+            ranges = key_ranges(db, collection_name, partitions)
+        except ArangoError:
+            # Export unpartitioned if the boundaries cannot be read
+            ranges = []
+        if len(ranges) > 1:
+            return [
+                (
+                    collection_name,
+                    backup_file_path(directory, f"{collection_name}.part-{i:04d}", fmt, compression),
+                    key_range,
+                )
+                for i, key_range in enumerate(ranges, 1)
+            ]
+    return [(collection_name, backup_file_path(directory, collection_name, fmt, compression), None)]
+
+
+def finish_collection_export(
+    collection_name: str,
+    directory: str,
+    jobs: List[Tuple[str, str, Optional[Tuple[Optional[str], Optional[str]]]]],
+    entries: List[Dict[str, Any]],
+    fmt: str = DEFAULT_BACKUP_FORMAT,
+    compression: str = "none",
+) -> Dict[str, Any]:
+    """Combine the results of a collection's export jobs into one report entry.
+
+    A partitioned export gets its manifest written (only if every part
+    succeeded) and is reported with the manifest path, the summed count and
+    bytes, the slowest part's elapsed_sec and the number of parts.
+    """
+    if len(jobs) == 1 and jobs[0][2] is None:
+        return entries[0]
+    manifest_path = os.path.join(directory, f"{collection_name}{MANIFEST_SUFFIX}")
+    entry: Dict[str, Any] = {
+        "collection": collection_name,
+        "path": manifest_path,
+        "count": sum(int(e.get("count", 0)) for e in entries),
+        "bytes": sum(e.get("bytes") or 0 for e in entries),
+        "elapsed_sec": max(e.get("elapsed_sec", 0) for e in entries),
+        "parts": len(entries),
+    }
+    failed = [e for e in entries if "error" in e]
+    if failed:
+        entry["error"] = f"{len(failed)} of {len(entries)} parts failed: {failed[0]['error']}"
+        return entry
+    manifest = {
+        "collection": collection_name,
+        "format": fmt,
+        "compression": compression,
+        "count": entry["count"],
+        "parts": [
+            {"path": os.path.basename(job[1]), "after": job[2][0], "until": job[2][1], "count": e["count"]}
+            for job, e in zip(jobs, entries)
+        ],
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return entry
 
-            with open(path, "w", encoding="utf-8") as f:
-                f.write('[')
-                first_doc = True
 
-                for i, doc in enumerate(cursor):
-                    if doc_limit is not None and i >= doc_limit:
-                        break
+def _file_bytes(path: str) -> Optional[int]:
+    """On-disk size of a written file (None if it cannot be determined)."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
 
-                    if not first_doc:
-                        f.write(',')
-                    f.write('\n  ')
-                    json.dump(doc, f, ensure_ascii=False)
-                    first_doc = False
-                    count += 1
 
-                f.write('\n]')
+def _write_documents(
+    documents: Iterable[Dict[str, Any]],
+    path: str,
+    fmt: str,
+    compression: str = "none",
+    compression_level: Optional[int] = None,
+    doc_limit: Optional[int] = None,
+    checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Write documents to a backup file in the given format; return the count.
+
+    With checkpoint, the file is written in segments (SegmentedTextWriter)
+    and checkpoint({last_key, count, offset}) is called every
+    CHECKPOINT_INTERVAL documents; resume_from, such a record, truncates the
+    file to its offset and appends the documents after it.
+    """
+    count = 0
+    if checkpoint is None and resume_from is None:
+        writer = open_text_writer(path, compression, compression_level)
+    else:
+        offset = None
+        if resume_from is not None:
+            count, offset = resume_from["count"], resume_from["offset"]
+        writer = SegmentedTextWriter(path, compression, compression_level, offset)
+    with writer as f:
+        if fmt == "json" and resume_from is None:
+            f.write('[')
+
+        for doc in documents:
+            if doc_limit is not None and count >= doc_limit:
+                break
+
+            if fmt == "jsonl":
+                f.write(json.dumps(doc, ensure_ascii=False))
+                f.write('\n')
+            else:
+                if count:
+                    f.write(',')
+                f.write('\n  ')
+                json.dump(doc, f, ensure_ascii=False)
+            count += 1
+            if checkpoint is not None and count % CHECKPOINT_INTERVAL == 0:
+                checkpoint({"last_key": doc["_key"], "count": count, "offset": f.checkpoint()})
+
+        if fmt == "json":
+            f.write('\n]')
+    return count
+
+
+def export_collection(
+    db: StandardDatabase,
+    collection_name: str,
+    path: str,
+    doc_limit: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    compression: str = "none",
+    compression_level: Optional[int] = None,
+    fmt: str = DEFAULT_BACKUP_FORMAT,
+    key_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Stream one collection to a JSON Lines or JSON array file, optionally compressed.
 
-            written.append({"collection": name, "path": path, "count": count})
+    Args:
+        db: ArangoDB database instance
+        collection_name: Collection to export
+        path: Output file path
+        doc_limit: Maximum number of documents to export
+        batch_size: Read through a streaming AQL cursor fetching this many
+            documents per round trip (default: collection.all())
+        compression: "none", "gzip" or "zstd" (path is used as given)
+        compression_level: Codec level (codec default if None)
+        fmt: "jsonl" (one document per line) or "json" (JSON array)
+        key_range: Export only keys k with after < k <= until (None bounds are
+            open), through a streaming AQL cursor (see bulk.key_ranges())
+        checkpoint: Called with {last_key, count, offset} every
+            CHECKPOINT_INTERVAL documents (see _write_documents()); exports
+            through the streaming AQL cursor
+        resume_from: Last checkpoint of an interrupted export of this file;
+            the export continues after its last_key
 
-        except Exception as e:
-            # Log error but continue with other collections
-            written.append({
-                "collection": name,
-                "path": path,
-                "count": 0,
-                "error": str(e)
-            })
+    Returns:
+        {collection, path, count, bytes, elapsed_sec}
+    """
+    validate_backup_format(fmt)
+    started = time.perf_counter()
+    if resume_from is not None:
+        key_range = (resume_from["last_key"], key_range[1] if key_range else None)
+    if batch_size is None and key_range is None and checkpoint is None:
+        cursor = db.collection(collection_name).all()
+    else:
+        bind_vars: Dict[str, Any] = {"@collection": collection_name}
+        query = _EXPORT_QUERY
+        if doc_limit is not None:
+            query = _EXPORT_QUERY_LIMIT
+            bind_vars["limit"] = doc_limit - (resume_from["count"] if resume_from else 0)
+        if key_range is not None:
+            after, until = key_range
+            filters = ""
+            if after is not None:
+                filters += _EXPORT_AFTER_FILTER
+                bind_vars["after_key"] = after
+            if until is not None:
+                filters += _EXPORT_UNTIL_FILTER
+                bind_vars["until_key"] = until
+            query = query.replace("@@collection\n", "@@collection\n" + filters, 1)
+        cursor = db.aql.execute(tag_query(query), bind_vars=bind_vars, batch_size=batch_size, stream=True)
+
+    try:
+        count = _write_documents(
+            cursor, path, fmt, compression, compression_level, doc_limit, checkpoint, resume_from
+        )
+    finally:
+        # Ensure the cursor is closed (frees server-side resources of streaming cursors)
+        if hasattr(cursor, 'close'):
+            try:
+                cursor.close()
+            except Exception:
+                pass  # Ignore cleanup errors
+
+    return {
+        "collection": collection_name,
+        "path": path,
+        "count": count,
+        "bytes": _file_bytes(path),
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+    }
+
+
+def _changed_documents(
+    db: StandardDatabase, collection_name: str, revisions_file: str, batch_size: int
+) -> Iterator[Dict[str, Any]]:
+    """Yield the documents of the changed keys of a revision manifest, one key chunk per query."""
+    for keys in iter_changed_keys(revisions_file, batch_size):
+        cursor = db.aql.execute(
+            tag_query(_EXPORT_KEYS_QUERY),
+            bind_vars={"@collection": collection_name, "keys": keys},
+            batch_size=len(keys),
+        )
+        try:
+            yield from cursor
         finally:
-            # Ensure cursor is closed if it exists
-            if 'cursor' in locals() and hasattr(cursor, 'close'):
+            if hasattr(cursor, 'close'):
                 try:
                     cursor.close()
                 except Exception:
                     pass  # Ignore cleanup errors
 
+
+def export_increment(
+    db: StandardDatabase,
+    collection_name: str,
+    directory: str,
+    base_directory: str,
+    batch_size: Optional[int] = None,
+    compression: str = "none",
+    compression_level: Optional[int] = None,
+    fmt: str = DEFAULT_BACKUP_FORMAT,
+) -> Dict[str, Any]:
+    """Export the documents of a collection changed since a base backup.
+
+    Records the collection's current revisions in directory, diffs them
+    against the base backup's manifest (every document counts as changed if
+    the base has none), writes the changed documents to the regular backup
+    file and keeps the deleted keys as tombstones in the manifest.
+
+    Args:
+        db: ArangoDB database instance
+        collection_name: Collection to export
+        directory: Directory of the new backup
+        base_directory: Directory of the base backup (full or incremental)
+        batch_size: Keys fetched per query (default REVISION_BATCH_SIZE)
+        compression: "none", "gzip" or "zstd"
+        compression_level: Codec level (codec default if None)
+        fmt: "jsonl" or "json"
+
+    Returns:
+        {collection, path, count, deleted, bytes, elapsed_sec}
+    """
+    started = time.perf_counter()
+    revisions_file = revisions_path(directory, collection_name)
+    scan_revisions(db, collection_name, revisions_file)
+    diff = diff_revisions(revisions_file, revisions_path(base_directory, collection_name))
+    path = backup_file_path(directory, collection_name, fmt, compression)
+    documents = _changed_documents(db, collection_name, revisions_file, batch_size or REVISION_BATCH_SIZE)
+    count = _write_documents(documents, path, fmt, compression, compression_level)
     return {
+        "collection": collection_name,
+        "path": path,
+        "count": count,
+        "deleted": diff["deleted"],
+        "bytes": _file_bytes(path),
+        "elapsed_sec": round(time.perf_counter() - started, 3),
+    }
+
+
+def _backup_increments(
+    db: StandardDatabase,
+    names: List[str],
+    output_dir: str,
+    base_dir: str,
+    workers: int,
+    memory_budget_mb: int,
+    compression: str,
+    compression_level: Optional[int],
+    fmt: str,
+    checkpoint: Checkpoint,
+) -> List[Dict[str, Any]]:
+    """Export the changes of each collection since base_dir (export_increment()).
+
+    Collections finished according to the checkpoint are not exported again.
+    """
+    worker_budget = memory_budget_mb * 1024 * 1024 // workers
+
+    def export(name: str) -> Dict[str, Any]:
+        job = os.path.basename(backup_file_path(output_dir, name, fmt, compression))
+        done = checkpoint.completed(job)
+        if done is not None:
+            return done
+        try:
+            batch_size = export_batch_size(db, name, worker_budget) if workers > 1 else None
+            entry = export_increment(
+                db, name, output_dir, base_dir, batch_size, compression, compression_level, fmt
+            )
+        except Exception as e:
+            # Log error but continue with other collections
+            return {"collection": name, "path": None, "count": 0, "error": str(e)}
+        checkpoint.complete(job, entry)
+        return entry
+
+    return run_concurrently(export, names, workers)
+
+
+def backup_collections_to_dir(
+    db: StandardDatabase,
+    output_dir: Optional[str] = None,
+    collections: Optional[List[str]] = None,
+    doc_limit: Optional[int] = None,
+    parallelism: int = 1,
+    memory_budget_mb: int = DEFAULT_BACKUP_MEMORY_BUDGET_MB,
+    compression: str = "none",
+    compression_level: Optional[int] = None,
+    fmt: str = DEFAULT_BACKUP_FORMAT,
+    partitions: int = 1,
+    incremental_base: Optional[str] = None,
+    track_revisions: bool = False,
+    resume: bool = False,
+) -> Dict[str, object]:
+    """
+    Dump selected (or all non-system) collections to JSON files in output_dir.
+
+    Each collection is written as JSON Lines, <name>.jsonl, or with
+    fmt="json" as a JSON array, <name>.json (plus .gz or .zst when
+    compressed while writing).
+    With parallelism > 1, up to that many collections are exported at once,
+    each through a streaming cursor sized to its share of memory_budget_mb.
+    With partitions > 1, each collection is split into up to that many _key
+    ranges exported as part files plus a manifest; the parts of all
+    collections share the parallelism workers.
+    With incremental_base (a previous backup directory), only documents
+    changed since that backup are written, plus tombstones for deleted keys;
+    track_revisions makes a full backup usable as such a base. Both write
+    revision manifests and a backup_chain.json (see revisions.py).
+    Progress is checkpointed in output_dir (backup_checkpoint.json, removed
+    once the backup succeeds); with resume=True an interrupted backup to the
+    same output_dir with the same options continues from its checkpoint.
+    Returns a report dict with written file paths, record counts and timings.
+    """
+    compression_level = validate_compression(compression, compression_level)
+    validate_backup_format(fmt)
+    if incremental_base is not None:
+        if doc_limit is not None:
+            raise ValueError("doc_limit cannot be combined with an incremental backup")
+        incremental_base = validate_input_directory(incremental_base)
+        # Fails early on a broken chain
+        read_backup_chain(incremental_base)
+
+    # Determine target directory
+    if output_dir is None or not output_dir.strip():
+        if resume:
+            raise ValueError("resume requires the output_dir of the interrupted backup")
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = os.path.join("backups", ts)
+
+    # Validate and sanitize the output directory
+    try:
+        output_dir = validate_output_directory(output_dir)
+    except ValueError as e:
+        raise ValueError(f"Invalid output directory: {e}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint = open_checkpoint(
+        os.path.join(output_dir, BACKUP_CHECKPOINT),
+        {
+            "database": db.name,
+            "collections": collections,
+            "doc_limit": doc_limit,
+            "format": fmt,
+            "compression": compression,
+            "partitions": partitions,
+            "incremental_base": incremental_base,
+            "track_revisions": track_revisions,
+        },
+        resume,
+    )
+
+    # Resolve which collections to export (kept from the checkpoint on resume)
+    names = checkpoint.state.get("names")
+    if names is None:
+        all_cols = [c["name"] for c in db.collections() if not c.get("isSystem")]
+        target_cols = collections if collections else all_cols
+        # Skip unknown/non-existing or system collections silently
+        names = [name for name in target_cols if name in all_cols]
+        checkpoint.set("names", names)
+
+    started = time.perf_counter()
+    if incremental_base is not None:
+        workers = max(1, min(parallelism, len(names)))
+        written = _backup_increments(
+            db, names, output_dir, incremental_base, workers, memory_budget_mb,
+            compression, compression_level, fmt, checkpoint,
+        )
+    else:
+        # Key ranges are planned once: part files must keep their ranges on resume
+        plans = checkpoint.state.get("plans")
+        if plans is None:
+            plans = [
+                plan_collection_export(db, name, output_dir, partitions, fmt, compression, doc_limit)
+                for name in names
+            ]
+            checkpoint.set("plans", plans)
+        jobs = [job for plan in plans for job in plan]
+        workers = max(1, min(parallelism, len(jobs)))
+        worker_budget = memory_budget_mb * 1024 * 1024 // workers
+        if track_revisions:
+            # Scanned before the export: a document changed meanwhile is exported again next time
+            def scan(name: str) -> None:
+                path = revisions_path(output_dir, name)
+                if checkpoint.completed(os.path.basename(path)) is None:
+                    checkpoint.complete(os.path.basename(path), {"count": scan_revisions(db, name, path)})
+
+            run_concurrently(scan, names, workers)
+
+        def export(job: tuple) -> Dict[str, Any]:
+            name, path, key_range = job
+            job_id = os.path.basename(path)
+            done = checkpoint.completed(job_id)
+            if done is not None:
+                return done
+            try:
+                batch_size = export_batch_size(db, name, worker_budget) if workers > 1 else None
+                entry = export_collection(
+                    db, name, path, doc_limit, batch_size, compression, compression_level, fmt, key_range,
+                    checkpoint=partial(checkpoint.record_progress, job_id),
+                    resume_from=checkpoint.progress(job_id),
+                )
+            except Exception as e:
+                # Log error but continue with other collections
+                return {"collection": name, "path": path, "count": 0, "error": str(e)}
+            checkpoint.complete(job_id, entry)
+            return entry
+
+        entries = iter(run_concurrently(export, jobs, workers))
+        written = [
+            finish_collection_export(
+                name, output_dir, plan, [next(entries) for _ in plan], fmt, compression
+            )
+            for name, plan in zip(names, plans)
+        ]
+
+    report: Dict[str, object] = {
         "output_dir": output_dir,
         "written": written,
         "total_collections": len(written),
         "total_documents": sum(int(x["count"]) for x in written),
+        "total_bytes": sum(x.get("bytes") or 0 for x in written),
+        "format": fmt,
+        "compression": compression,
+        "parallelism": workers,
+        "elapsed_sec": round(time.perf_counter() - started, 3),
     }
+    if incremental_base is not None or track_revisions:
+        write_backup_chain(
+            output_dir,
+            incremental_base,
+            {
+                x["collection"]: {"count": x["count"], "deleted": x.get("deleted", 0)}
+                for x in written
+                if "error" not in x
+            },
+        )
+    if incremental_base is not None:
+        report["incremental_base"] = incremental_base
+        report["total_deleted"] = sum(x.get("deleted", 0) for x in written)
+    if any("error" in x for x in written):
+        # Kept so that resume=True retries the failed collections
+        report["checkpoint"] = checkpoint.path
+    else:
+        checkpoint.remove()
+    if resume:
+        report["resumed"] = True
+    return report
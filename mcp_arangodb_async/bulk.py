@@ -0,0 +1,588 @@
+"""
+ArangoDB MCP Server - Bulk Write Pipeline
+
+Bulk tools split their payload into batches and send one request per batch.
+Sent strictly one after another, every batch waits for the previous round trip,
+which leaves a multi-core coordinator mostly idle. This module keeps up to
+``concurrency`` batches in flight on a small thread pool (python-arango's HTTP
+session pools its connections, so each worker reuses a keep-alive connection)
+while handing outcomes back to the caller in batch order, so error reports stay
+ordered and "stop on first error" still stops at the first failed batch.
+
+Batches can be written through the document API (insert_many) or the import
+API (POST /_api/import), which takes a JSON Lines body, resolves duplicate keys
+server-side (onDuplicate) and only returns counters, making it the faster path
+for large loads.
+
+Fixed document counts give tiny requests for small documents and oversized
+bodies for large ones, so batches can instead be sized adaptively: capped by
+serialized bytes, grown while round trips stay fast, shrunk when they get slow,
+and split and resent when the server rejects a request as too large.
+
+Bulk writes can also be grouped into ArangoDB stream transactions that are
+committed every N batches (ChunkedTransaction): one commit, and one disk sync,
+per chunk instead of per batch, and a failed chunk is rolled back as a whole.
+With a single chunk the whole load is atomic.
+
+Work that is not a stream of batches (per-collection exports, per-key-range
+scans) is spread over the same kind of pool with run_concurrently(), or with
+run_scheduled() when some items must wait for others (edge collections after
+their vertex collections), and a collection can be cut into contiguous _key
+ranges with key_ranges().
+
+Classes:
+- BatchOutcome - Result (or error) of one batch with its offset and timing
+- AdaptiveBatcher - Byte-capped batching that adapts the batch size to latency and errors
+- ChunkedTransaction - Stream transactions committed every N batches
+
+Functions:
+- iter_batches() - Split a document list into (offset, batch) slices
+- run_pipelined() - Send batches with bounded concurrency, yielding outcomes in order
+- encode_jsonl() - Serialize a batch as a JSON Lines request body
+- import_documents() - Write a batch through the import API
+- import_error_offsets() - Map import error details to positions in the batch
+- is_request_too_large() - Whether an error means the request body was too large
+- merge_results() - Combine the results of two halves of a split batch
+- run_concurrently() - Apply a function to items on a bounded pool, results in order
+- run_scheduled() - Like run_concurrently(), starting each item once its dependencies finished
+- key_ranges() - Split a collection's _key space into contiguous ranges
+"""
+
+from __future__ import annotations
+
+import contextvars
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from arango.exceptions import DocumentInsertError, TransactionAbortError
+from arango.request import Request
+from arango.response import Response
+
+from .json_codec import dumps, dumps_bytes
+from .query_tracker import tag_query
+
+# Upper bound for per-call batch concurrency
+MAX_BULK_CONCURRENCY = 16
+
+# onDuplicate modes of the import API
+ON_DUPLICATE_MODES = ("error", "update", "replace", "ignore")
+
+# Adaptive batching defaults
+DEFAULT_MAX_BATCH_BYTES = 4 * 1024 * 1024
+DEFAULT_TARGET_BATCH_LATENCY = 1.0
+MAX_ADAPTIVE_BATCH_SIZE = 50_000
+# Smallest byte cap adaptive batching shrinks to after request-too-large errors
+MIN_BATCH_BYTES = 64 * 1024
+
+# Import result counters summed when split batches are merged
+_IMPORT_COUNTERS = ("created", "updated", "ignored", "errors", "empty")
+
+# Key at a given position of the primary index (used to cut key ranges)
+_KEY_AT_OFFSET_QUERY = """
+FOR d IN @@collection
+  SORT d._key
+  LIMIT @offset, 1
+  RETURN d._key
+"""
+
+# "at position 3: creating document failed with error 'unique constraint violated', ..."
+_IMPORT_DETAIL_POSITION = re.compile(r"^at position (\d+):")
+
+
+@dataclass
+class BatchOutcome:
+    """Outcome of one batch.
+
+    Attributes:
+        index: Batch number (0-based, in submission order)
+        start: Offset of the batch's first document in the input
+        size: Number of documents in the batch
+        result: Value returned by the send function (None on error)
+        error: Exception raised by the send function (None on success)
+        elapsed: Round-trip time in seconds
+    """
+
+    index: int
+    start: int
+    size: int
+    result: Any = None
+    error: Optional[Exception] = None
+    elapsed: float = 0.0
+
+
+def iter_batches(documents: List[Any], batch_size: int) -> Iterator[Tuple[int, List[Any]]]:
+    """Yield (offset, batch) slices of documents."""
+    for start in range(0, len(documents), batch_size):
+        yield start, documents[start : start + batch_size]
+
+
+def _send_batch(send: Callable[[List[Any]], Any], index: int, start: int, batch: List[Any]) -> BatchOutcome:
+    outcome = BatchOutcome(index=index, start=start, size=len(batch))
+    started = time.perf_counter()
+    try:
+        outcome.result = send(batch)
+    except Exception as e:
+        outcome.error = e
+    outcome.elapsed = time.perf_counter() - started
+    return outcome
+
+
+def run_pipelined(
+    send: Callable[[List[Any]], Any],
+    batches: Iterable[Tuple[int, List[Any]]],
+    concurrency: int = 1,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[BatchOutcome]:
+    """Send batches with up to ``concurrency`` in flight and yield outcomes in order.
+
+    Batches are pulled from ``batches`` lazily, so at most ``concurrency``
+    batches are held in memory at once. Setting ``stop`` prevents further
+    batches from being sent; outcomes of batches already in flight are still
+    yielded, because they may have been (partially) written.
+
+    Args:
+        send: Blocking callable that writes one batch and returns its result
+        batches: Iterable of (offset, batch) pairs
+        concurrency: Maximum batches in flight (1 sends them sequentially)
+        stop: Optional event that ends submission of new batches
+
+    Yields:
+        BatchOutcome for every sent batch, in batch order
+    """
+    if concurrency <= 1:
+        for index, (start, batch) in enumerate(batches):
+            if stop is not None and stop.is_set():
+                return
+            yield _send_batch(send, index, start, batch)
+        return
+
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="mcp-arango-bulk")
+    pending: Deque[Future] = deque()
+    try:
+        for index, (start, batch) in enumerate(batches):
+            if stop is not None and stop.is_set():
+                break
+            # Each worker runs in a copy of the caller's context (query tags)
+            ctx = contextvars.copy_context()
+            pending.append(pool.submit(ctx.run, _send_batch, send, index, start, batch))
+            if len(pending) >= concurrency:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Consumer stopped early: drop batches that have not started yet
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def encode_jsonl(documents: Iterable[Dict[str, Any]]) -> str:
+    """Serialize documents as a JSON Lines body (one document per line).
+
+    Documents carrying only an _id get the matching _key, as the import API
+    does not derive keys from _id.
+    """
+    lines = []
+    for doc in documents:
+        if "_key" not in doc and isinstance(doc.get("_id"), str) and "/" in doc["_id"]:
+            doc = {**doc, "_key": doc["_id"].split("/", 1)[1]}
+        lines.append(dumps(doc))
+    return "\n".join(lines)
+
+
+def import_documents(
+    collection: Any,
+    documents: List[Dict[str, Any]],
+    on_duplicate: str = "error",
+    sync: Optional[bool] = None,
+    halt_on_error: bool = False,
+) -> Dict[str, Any]:
+    """Write one batch through the import API with a JSON Lines body.
+
+    Args:
+        collection: python-arango collection
+        documents: Batch to import
+        on_duplicate: What to do with existing keys ("error", "update", "replace", "ignore")
+        sync: Wait for the batch to be synced to disk (None for the collection default)
+        halt_on_error: Reject the whole batch if any document fails
+
+    Returns:
+        Import counters: created, updated, ignored, errors, empty and details
+
+    Raises:
+        DocumentInsertError: If the request fails (or any document fails with halt_on_error)
+    """
+    if on_duplicate not in ON_DUPLICATE_MODES:
+        raise ValueError(f"Invalid on_duplicate '{on_duplicate}'. Expected one of {ON_DUPLICATE_MODES}")
+    params: Dict[str, Any] = {
+        "type": "documents",
+        "collection": collection.name,
+        "onDuplicate": on_duplicate,
+        "complete": halt_on_error,
+        "details": True,
+    }
+    if sync is not None:
+        params["waitForSync"] = sync
+    request = Request(
+        method="post",
+        endpoint="/_api/import",
+        data=encode_jsonl(documents),
+        params=params,
+        write=collection.name,
+    )
+
+    def response_handler(resp: Response) -> Dict[str, Any]:
+        if resp.is_success:
+            return resp.body
+        raise DocumentInsertError(resp, request)
+
+    return collection._execute(request, response_handler)
+
+
+def import_error_offsets(result: Dict[str, Any]) -> List[Tuple[Optional[int], str]]:
+    """Return (offset in batch, message) for each error detail of an import result.
+
+    The server reports 1-based line positions; offsets are 0-based like the
+    document API's per-document results. The offset is None when the message
+    does not include a position.
+    """
+    errors = []
+    for detail in result.get("details") or []:
+        match = _IMPORT_DETAIL_POSITION.match(detail)
+        errors.append((int(match.group(1)) - 1 if match else None, detail))
+    return errors
+
+
+def is_request_too_large(error: BaseException) -> bool:
+    """Return True if error means the server rejected the request body as too large."""
+    return getattr(error, "http_code", None) == 413 or "too large" in str(error).lower()
+
+
+def merge_results(first: Any, second: Any, offset: int) -> Any:
+    """Combine the results of two consecutive halves of a batch.
+
+    Per-document result lists are concatenated; import results have their
+    counters summed and the second half's error positions shifted by offset.
+    """
+    if isinstance(first, list) and isinstance(second, list):
+        return first + second
+    if isinstance(first, dict) and isinstance(second, dict):
+        merged = {k: first.get(k, 0) + second.get(k, 0) for k in _IMPORT_COUNTERS}
+        shifted = []
+        for position, message in import_error_offsets(second):
+            if position is None:
+                shifted.append(message)
+            else:
+                shifted.append(_IMPORT_DETAIL_POSITION.sub(f"at position {position + offset + 1}:", message))
+        merged["details"] = list(first.get("details") or []) + shifted
+        return merged
+    raise TypeError(f"Cannot merge batch results of type {type(first).__name__}")
+
+
+
+def run_concurrently(
+    fn: Callable[[Any], Any], items: Iterable[Any], concurrency: int = 1
+) -> List[Any]:
+    """Apply fn to every item with up to ``concurrency`` calls in flight.
+
+    Results are returned in item order; the first exception raised by a call
+    is re-raised after the calls already running have finished.
+    """
+    items = list(items)
+    if concurrency <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    workers = min(concurrency, len(items))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-arango-bulk") as pool:
+        futures = [pool.submit(contextvars.copy_context().run, fn, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def run_scheduled(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    dependencies: Dict[int, Collection[int]],
+    concurrency: int = 1,
+) -> List[Any]:
+    """Apply fn to every item, starting an item only once its dependencies finished.
+
+    dependencies maps an item's index to the indexes of the items that must
+    finish before it starts (items without an entry can start at once). Up to
+    ``concurrency`` calls run at a time. Results are returned in item order; the
+    first exception raised by a call is re-raised after the calls already
+    running have finished, and items not started yet are skipped.
+
+    Raises:
+        ValueError: If the dependencies contain a cycle or an unknown index
+    """
+    items = list(items)
+    pending = list(range(len(items)))
+    requires: Dict[int, Set[int]] = {i: set(dependencies.get(i, ())) for i in pending}
+    if any(dep not in requires or dep == i for i in pending for dep in requires[i]):
+        raise ValueError("Dependencies refer to an unknown item or to the item itself")
+    results: List[Any] = [None] * len(items)
+    done: Set[int] = set()
+
+    def ready() -> List[int]:
+        return [i for i in pending if requires[i] <= done]
+
+    if concurrency <= 1 or len(items) <= 1:
+        while pending:
+            batch = ready()
+            if not batch:
+                raise ValueError("Dependencies contain a cycle")
+            i = batch[0]
+            pending.remove(i)
+            results[i] = fn(items[i])
+            done.add(i)
+        return results
+
+    workers = min(concurrency, len(items))
+    error: Optional[BaseException] = None
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-arango-bulk") as pool:
+        running: Dict[Future, int] = {}
+        while pending or running:
+            if error is None:
+                for i in ready():
+                    pending.remove(i)
+                    running[pool.submit(contextvars.copy_context().run, fn, items[i])] = i
+            if not running:
+                if error is None:
+                    error = ValueError("Dependencies contain a cycle")
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                i = running.pop(future)
+                try:
+                    results[i] = future.result()
+                except BaseException as e:
+                    if error is None:
+                        error = e
+                done.add(i)
+    if error is not None:
+        raise error
+    return results
+
+
+def key_ranges(
+    db: Any, collection: str, partitions: int, total: Optional[int] = None
+) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Split a collection's _key space into up to ``partitions`` contiguous ranges.
+
+    Each range is (after, until) and covers keys k with after < k <= until,
+    None meaning unbounded. Boundaries are the keys at evenly spaced positions
+    of the primary index, so ranges hold about the same number of documents
+    when they are cut; documents inserted later still fall into exactly one
+    range.
+
+    Args:
+        db: python-arango database
+        collection: Collection name
+        partitions: Desired number of ranges
+        total: Document count, if already known
+    """
+    if total is None:
+        total = db.collection(collection).count()
+    partitions = max(1, min(partitions, total))
+    bounds: List[str] = []
+    for i in range(1, partitions):
+        cursor = db.aql.execute(
+            tag_query(_KEY_AT_OFFSET_QUERY),
+            bind_vars={"@collection": collection, "offset": i * total // partitions - 1},
+        )
+        key = next(iter(cursor), None)
+        if key is not None and key not in bounds:
+            bounds.append(key)
+    edges: List[Optional[str]] = [None, *bounds, None]
+    return list(zip(edges[:-1], edges[1:]))
+
+class AdaptiveBatcher:
+    """Batch documents by count and serialized size, adapting the count to feedback.
+
+    Batches close when they reach the current size or the byte cap. After each
+    outcome the size is doubled if the round trip took less than half the
+    target latency, and halved if it exceeded the target or the request timed
+    out. A batch rejected as too large is split in halves and resent (wrap()),
+    and both the size and the byte cap are halved for the following batches.
+
+    observe() is called by the consumer of run_pipelined(); wrapped sends may
+    run on worker threads, so shared state is guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        max_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        target_latency: float = DEFAULT_TARGET_BATCH_LATENCY,
+        min_size: int = 1,
+        max_size: int = MAX_ADAPTIVE_BATCH_SIZE,
+    ):
+        """Initialize AdaptiveBatcher.
+
+        Args:
+            initial_size: Documents in the first batch
+            max_bytes: Upper bound for the serialized size of a batch
+            target_latency: Round-trip time in seconds the size is tuned towards
+            min_size: Smallest batch size
+            max_size: Largest batch size
+        """
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.size = min(max(initial_size, self.min_size), self.max_size)
+        self.max_bytes = max_bytes
+        self.target_latency = target_latency
+        self.splits = 0
+        self._batch_bytes: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def batches(self, documents: Iterable[Any]) -> Iterator[Tuple[int, List[Any]]]:
+        """Yield (offset, batch) pairs sized by the current size and byte cap."""
+        start = 0
+        batch: List[Any] = []
+        batch_bytes = 0
+        for doc in documents:
+            doc_bytes = len(dumps_bytes(doc)) + 1
+            with self._lock:
+                full = len(batch) >= self.size or batch_bytes + doc_bytes > self.max_bytes
+            if batch and full:
+                self._batch_bytes[start] = batch_bytes
+                yield start, batch
+                start += len(batch)
+                batch, batch_bytes = [], 0
+            batch.append(doc)
+            batch_bytes += doc_bytes
+        if batch:
+            self._batch_bytes[start] = batch_bytes
+            yield start, batch
+
+    def batch_bytes(self, start: int) -> Optional[int]:
+        """Return the serialized size of the batch at offset start."""
+        return self._batch_bytes.get(start)
+
+    def observe(self, outcome: BatchOutcome) -> None:
+        """Adapt the batch size to a finished batch."""
+        self._batch_bytes.pop(outcome.start, None)
+        with self._lock:
+            if outcome.error is not None:
+                if is_request_too_large(outcome.error) or "timeout" in type(outcome.error).__name__.lower():
+                    self.size = max(self.min_size, self.size // 2)
+                return
+            if outcome.elapsed > self.target_latency:
+                self.size = max(self.min_size, self.size // 2)
+            elif outcome.elapsed < self.target_latency / 2 and outcome.size >= self.size:
+                self.size = min(self.max_size, self.size * 2)
+
+    def wrap(self, send: Callable[[List[Any]], Any]) -> Callable[[List[Any]], Any]:
+        """Return send, splitting and resending batches rejected as too large."""
+
+        def send_splitting(batch: List[Any]) -> Any:
+            try:
+                return send(batch)
+            except Exception as e:
+                if len(batch) < 2 or not is_request_too_large(e):
+                    raise
+            with self._lock:
+                self.splits += 1
+                self.size = max(self.min_size, min(self.size, len(batch) // 2))
+                self.max_bytes = max(MIN_BATCH_BYTES, self.max_bytes // 2)
+            half = len(batch) // 2
+            return merge_results(send_splitting(batch[:half]), send_splitting(batch[half:]), half)
+
+        return send_splitting
+
+
+class ChunkedTransaction:
+    """Write consecutive batches through stream transactions of ``commit_every`` batches.
+
+    A transaction is begun lazily by the first batch of a chunk and committed
+    once the chunk is full (commit_every=0 keeps one transaction open until
+    commit() is called, making the whole operation atomic). Stream
+    transactions do not accept concurrent operations, so batches must be sent
+    one at a time.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        collection: str,
+        commit_every: int = 0,
+        sync: Optional[bool] = None,
+        max_size: Optional[int] = None,
+    ):
+        """Initialize ChunkedTransaction.
+
+        Args:
+            db: python-arango database
+            collection: Collection written in the transactions
+            commit_every: Batches per transaction (0 = a single transaction)
+            sync: waitForSync applied when a transaction commits
+            max_size: Maximum transaction size in bytes (server default if None)
+        """
+        self._db = db
+        self._name = collection
+        self.commit_every = commit_every
+        self._sync = sync
+        self._max_size = max_size
+        self._trx: Any = None
+        self._batches = 0
+        self.committed = 0
+        self.aborted = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a transaction is currently open."""
+        return self._trx is not None
+
+    def collection(self) -> Any:
+        """Collection handle bound to the open transaction (begun on first use)."""
+        if self._trx is None:
+            self._trx = self._db.begin_transaction(
+                write=self._name, sync=self._sync, max_size=self._max_size
+            )
+            self._batches = 0
+        return self._trx.collection(self._name)
+
+    def batch_done(self) -> bool:
+        """Count a written batch and commit if the chunk is full.
+
+        Returns:
+            True when a transaction was committed
+        """
+        self._batches += 1
+        if self.commit_every and self._batches >= self.commit_every:
+            self.commit()
+            return True
+        return False
+
+    def commit(self) -> None:
+        """Commit the open transaction, if any (a failed commit counts as aborted)."""
+        if self._trx is not None:
+            trx, self._trx = self._trx, None
+            try:
+                trx.commit_transaction()
+            except Exception:
+                self.aborted += 1
+                raise
+            self.committed += 1
+
+    def abort(self) -> None:
+        """Abort the open transaction, if any.
+
+        A transaction the server already aborted (e.g. after a failed
+        operation) cannot be aborted again; that error is ignored.
+        """
+        if self._trx is not None:
+            trx, self._trx = self._trx, None
+            self.aborted += 1
+            try:
+                trx.abort_transaction()
+            except TransactionAbortError:
+                pass
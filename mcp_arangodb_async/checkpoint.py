@@ -0,0 +1,125 @@
+"""
+ArangoDB MCP Server - Backup and Restore Checkpoints
+
+Long backups and restores record their progress in a checkpoint file so that
+an interrupted run (timeout, dropped connection) can be resumed with
+resume=True instead of starting over:
+
+- Backups keep backup_checkpoint.json in the output directory. It records
+  the export plan (the key ranges of partitioned collections are not
+  recomputed on resume), every finished file, and for files exported through
+  a sorted streaming cursor the last exported _key, document count and the
+  byte offset the file is complete up to (see compression.SegmentedTextWriter).
+- Restores keep restore_checkpoint.json in the input directory. It records
+  every restored file and, per file in progress, the number of records
+  (JSON Lines: lines) already imported and the counters so far.
+
+The checkpoint is rewritten atomically (temporary file, then rename) and
+removed once the run finishes without errors; after a failed run it stays, so
+resuming retries the failed files. If it cannot be written (e.g. a restore
+from a read-only backup directory), the run continues without checkpoints.
+
+Classes:
+- Checkpoint - Progress of a backup or restore, shared by its workers
+
+Functions:
+- open_checkpoint() - Start a new checkpoint or load the one to resume
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+BACKUP_CHECKPOINT = "backup_checkpoint.json"
+RESTORE_CHECKPOINT = "restore_checkpoint.json"
+
+# Documents exported between two checkpoints of a file
+CHECKPOINT_INTERVAL = 10_000
+
+
+class Checkpoint:
+    """Progress of a backup or restore, saved after every change.
+
+    Jobs are identified by a string (the file they write or read). Methods are
+    thread-safe, so parallel workers can share one checkpoint.
+    """
+
+    def __init__(self, path: str, state: Dict[str, Any]) -> None:
+        self.path: Optional[str] = path
+        self.state = state
+        self._lock = threading.Lock()
+
+    def completed(self, job: str) -> Optional[Dict[str, Any]]:
+        """Result recorded for a finished job, or None."""
+        return self.state["completed"].get(job)
+
+    def progress(self, job: str) -> Optional[Dict[str, Any]]:
+        """Last progress recorded for an unfinished job, or None."""
+        return self.state["progress"].get(job)
+
+    def record_progress(self, job: str, progress: Dict[str, Any]) -> None:
+        with self._lock:
+            self.state["progress"][job] = progress
+            self._save()
+
+    def complete(self, job: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self.state["completed"][job] = result
+            self.state["progress"].pop(job, None)
+            self._save()
+
+    def set(self, key: str, value: Any) -> None:
+        """Record extra state (e.g. an export plan)."""
+        with self._lock:
+            self.state[key] = value
+            self._save()
+
+    def remove(self) -> None:
+        """Delete the checkpoint file (the run finished)."""
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Cannot write checkpoint '{self.path}', continuing without checkpoints: {e}")
+            self.path = None
+
+
+def open_checkpoint(path: str, options: Dict[str, Any], resume: bool = False) -> Checkpoint:
+    """Start a new checkpoint at path, or with resume load the existing one.
+
+    Args:
+        path: Checkpoint file path
+        options: Options of the run; a resumed run must use the same ones
+        resume: Continue from the checkpoint at path
+
+    Raises:
+        ValueError: If resuming without a checkpoint, or with different options
+    """
+    if not resume:
+        checkpoint = Checkpoint(path, {"options": options, "completed": {}, "progress": {}})
+        with checkpoint._lock:
+            checkpoint._save()
+        return checkpoint
+    if not os.path.exists(path):
+        raise ValueError(f"No checkpoint to resume at '{path}' (the run finished or never started)")
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("options") != options:
+        raise ValueError(
+            f"Cannot resume: the checkpoint was written with options {state.get('options')}, not {options}"
+        )
+    return Checkpoint(path, state)
@@ -0,0 +1,234 @@
+"""
+ArangoDB MCP Server - Backup File Compression
+
+Backup files are written through a compressing stream, so documents are
+compressed as they are exported and no uncompressed copy of a collection is
+ever held in memory or written to disk. Restores open files through the
+matching decompressing stream, detecting the codec from the file extension or,
+failing that, from the file's magic bytes.
+
+Codecs:
+- none - plain files
+- gzip - standard library gzip (.gz), levels 1-9
+- zstd - Zstandard (.zst), levels 1-22; requires the optional ``zstandard``
+  package (``pip install mcp-arangodb-async[zstd]``)
+
+Functions:
+- validate_compression() - Check a codec and level before writing
+- compressed_path() - Add the codec's file extension to a path
+- strip_compression_extension() - Remove a codec extension from a file name
+- detect_compression() - Codec of an existing file (extension, then magic bytes)
+- open_text_writer() - Open a compressing text stream for writing
+- open_binary_reader() - Open a decompressing binary stream for reading
+
+Classes:
+- SegmentedTextWriter - Compressing text writer that can be cut at checkpoints
+  and resumed (see checkpoint.py)
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+from typing import Any, BinaryIO, Optional, TextIO
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+SUPPORTED_COMPRESSION = ("none", "gzip", "zstd")
+
+# File extension added by each codec
+COMPRESSION_EXTENSIONS = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+# Default and maximum compression level of each codec
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 6, "zstd": 3}
+MAX_COMPRESSION_LEVELS = {"gzip": 9, "zstd": 22}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _check_codec(compression: str) -> None:
+    """Raise ValueError if the codec is unknown or its package is missing."""
+    if compression not in SUPPORTED_COMPRESSION:
+        raise ValueError(
+            f"Unsupported compression '{compression}'. Expected one of {SUPPORTED_COMPRESSION}"
+        )
+    if compression == "zstd" and zstandard is None:
+        raise ValueError(
+            "zstd compression requires the 'zstandard' package "
+            "(pip install mcp-arangodb-async[zstd])"
+        )
+
+
+def validate_compression(compression: str, level: Optional[int] = None) -> Optional[int]:
+    """Check a codec and level; return the level to use (None for "none").
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable, or the level is out of range
+    """
+    _check_codec(compression)
+    if compression == "none":
+        return None
+    if level is None:
+        return DEFAULT_COMPRESSION_LEVELS[compression]
+    if not 1 <= level <= MAX_COMPRESSION_LEVELS[compression]:
+        raise ValueError(
+            f"{compression} compression level must be between 1 and {MAX_COMPRESSION_LEVELS[compression]}"
+        )
+    return level
+
+
+def compressed_path(path: str, compression: str = "none") -> str:
+    """Return path with the codec's extension appended ("users.json" -> "users.json.gz")."""
+    return path + COMPRESSION_EXTENSIONS[compression]
+
+
+def strip_compression_extension(name: str) -> str:
+    """Remove a trailing codec extension from a file name, if any."""
+    for extension in COMPRESSION_EXTENSIONS.values():
+        if extension and name.endswith(extension):
+            return name[: -len(extension)]
+    return name
+
+
+def detect_compression(path: str) -> str:
+    """Return the codec of a file from its extension, else from its magic bytes."""
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if extension and path.endswith(extension):
+            return compression
+    with open(path, "rb") as f:
+        head = f.read(4)
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(_ZSTD_MAGIC):
+        return "zstd"
+    return "none"
+
+
+def open_text_writer(path: str, compression: str = "none", level: Optional[int] = None) -> TextIO:
+    """Open path for writing UTF-8 text, compressing on the fly.
+
+    Args:
+        path: Output file path (extension is not changed)
+        compression: "none", "gzip" or "zstd"
+        level: Compression level (codec default if None)
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable, or the level is out of range
+    """
+    level = validate_compression(compression, level)
+    if compression == "none":
+        return open(path, "w", encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, "wt", compresslevel=level, encoding="utf-8")
+    raw = open(path, "wb")
+    try:
+        writer = zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=True)
+    except Exception:
+        raw.close()
+        raise
+    return io.TextIOWrapper(writer, encoding="utf-8")
+
+
+def open_binary_reader(path: str, compression: Optional[str] = None) -> BinaryIO:
+    """Open path for reading its decompressed bytes.
+
+    Args:
+        path: Input file path
+        compression: Codec, or None to detect it (detect_compression())
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable
+    """
+    if compression is None:
+        compression = detect_compression(path)
+    _check_codec(compression)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        raw = open(path, "rb")
+        try:
+            # Resumed backups are written as several frames (SegmentedTextWriter)
+            reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True, read_across_frames=True)
+        except Exception:
+            raw.close()
+            raise
+        # Buffered for readline()/iteration used by the line-based readers
+        return io.BufferedReader(reader)
+    return open(path, "rb")
+
+
+class SegmentedTextWriter:
+    """UTF-8 text writer whose compressed output is cut into self-contained segments.
+
+    Each segment is a complete gzip member or zstd frame, and decoders read
+    concatenated members/frames as one stream. After checkpoint(), the file up
+    to the returned offset is therefore a valid file on its own: a resumed
+    writer (offset=...) truncates whatever was written after it and appends.
+    Uncompressed files are simply flushed at each checkpoint.
+
+    Args:
+        path: Output file path (extension is not changed)
+        compression: "none", "gzip" or "zstd"
+        level: Compression level (codec default if None)
+        offset: Resume at this checkpoint offset of an existing file (None: new file)
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable, or the level is out of range
+    """
+
+    def __init__(
+        self, path: str, compression: str = "none", level: Optional[int] = None, offset: Optional[int] = None
+    ) -> None:
+        self._level = validate_compression(compression, level)
+        self._compression = compression
+        if offset is None:
+            self._raw = open(path, "wb")
+        else:
+            self._raw = open(path, "r+b")
+            self._raw.truncate(offset)
+            self._raw.seek(offset)
+        self._text = self._open_segment()
+
+    def _open_segment(self) -> TextIO:
+        stream: Any = self._raw
+        if self._compression == "gzip":
+            stream = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=self._level)
+        elif self._compression == "zstd":
+            stream = zstandard.ZstdCompressor(level=self._level).stream_writer(self._raw, closefd=False)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+
+    def _close_segment(self) -> None:
+        self._text.flush()
+        stream = self._text.detach()
+        if stream is not self._raw:
+            # Writes the gzip trailer / ends the zstd frame; the file stays open
+            stream.close()
+
+    def write(self, text: str) -> int:
+        return self._text.write(text)
+
+    def checkpoint(self) -> int:
+        """End the current segment and return the offset the file is complete up to."""
+        self._close_segment()
+        self._raw.flush()
+        offset = self._raw.tell()
+        self._text = self._open_segment()
+        return offset
+
+    def close(self) -> None:
+        if self._raw.closed:
+            return
+        try:
+            self._close_segment()
+        finally:
+            self._raw.close()
+
+    def __enter__(self) -> "SegmentedTextWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
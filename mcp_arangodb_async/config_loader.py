@@ -9,7 +9,7 @@ import yaml
 import logging
 from typing import Dict, Optional
 from pathlib import Path
-from mcp_arangodb_async.multi_db_manager import DatabaseConfig
+from mcp_arangodb_async.multi_db_manager import DatabaseConfig, DRIVER_PYTHON_ARANGO
 
 
 class ConfigFileLoader:
@@ -157,6 +157,14 @@ class ConfigFileLoader:
         """
         return self._databases.copy()
 
+    def first_database_key(self) -> Optional[str]:
+        """Get the key of the first configured database (without copying the configuration).
+        
+        Returns:
+            First database key in configuration order, or None if none are configured
+        """
+        return next(iter(self._databases), None)
+
     def add_database(self, database_key: str, config: DatabaseConfig) -> None:
         """Add a database configuration.
         
@@ -202,7 +210,18 @@ class ConfigFileLoader:
             }
             if db_config.description:
                 databases[key]["description"] = db_config.description
-        
+            if db_config.driver != DRIVER_PYTHON_ARANGO:
+                databases[key]["driver"] = db_config.driver
+                databases[key]["max_connections"] = db_config.max_connections
+            if db_config.query_cache:
+                databases[key]["query_cache"] = True
+                if db_config.query_cache_ttl is not None:
+                    databases[key]["query_cache_ttl"] = db_config.query_cache_ttl
+            if db_config.max_in_flight is not None:
+                databases[key]["max_in_flight"] = db_config.max_in_flight
+                databases[key]["max_queue"] = db_config.max_queue
+                databases[key]["queue_timeout"] = db_config.queue_timeout
+
         config_data["databases"] = databases
         
         # Write to YAML file
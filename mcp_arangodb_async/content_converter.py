@@ -19,6 +19,8 @@ from typing import Any, Dict, List, Optional, Literal, Union, Tuple
 import json
 from datetime import datetime
 
+from . import json_codec
+
 try:
     import mcp.types as types
 except ImportError:
@@ -118,13 +120,31 @@ class MCPContentConverter:
         return text_content, structured_data
     
     def _format_as_json(self, data: Any) -> str:
-        """Format data as JSON with configured options."""
-        return json.dumps(
-            self._serialize_for_json(data),
+        """Format data as JSON with configured options.
+
+        Serializes in a single pass: special types are converted by the
+        encoder's fallback hook instead of pre-walking the whole result.
+        Indented output uses the fast JSON backend when available; compact
+        output keeps the stdlib ", " / ": " formatting.
+        """
+        return json_codec.dumps(
+            data,
             indent=self.indent,
             ensure_ascii=self.ensure_ascii,
-            sort_keys=self.sort_keys
+            sort_keys=self.sort_keys,
+            default=self._json_default,
+            spaced=self.indent is None,
         )
+
+    def _json_default(self, obj: Any) -> Any:
+        """Encoder fallback mirroring _serialize_for_json() for a single value."""
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if hasattr(obj, '__dict__'):
+            return obj.__dict__
+        if hasattr(obj, 'isoformat'):
+            return str(obj)
+        return json_codec.json_default(obj)
     
     def _format_as_markdown(self, data: Any, title: Optional[str] = None) -> str:
         """Format data as Markdown with proper structure."""
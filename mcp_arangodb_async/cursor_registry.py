@@ -0,0 +1,232 @@
+"""
+ArangoDB MCP Server - Query Cursor Registry
+
+This module keeps open AQL cursors between tool calls so that arango_query can
+return one page at a time and arango_query_next can resume where it left off.
+Only the current server batch of each cursor is held in memory, so paging through
+very large results uses constant memory on the MCP server.
+
+Cursors are scoped to the session that opened them, expire after a period of
+inactivity (TTL), and are bounded per session (the least recently used cursor is
+closed when the limit is reached).
+
+Classes:
+- CursorRegistry - Per-session registry of open cursors with TTL cleanup
+- CursorEntry - State of one open cursor (rows returned, limits, expiry)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Defaults: idle cursors expire after 5 minutes; at most 16 open cursors per session
+DEFAULT_CURSOR_TTL_SEC = 300.0
+DEFAULT_MAX_CURSORS_PER_SESSION = 16
+
+
+@dataclass
+class CursorEntry:
+    """State of one open cursor.
+
+    Attributes:
+        cursor: python-arango Cursor or async_driver.AsyncCursor
+        session_id: Session that opened the cursor
+        batch_size: Rows returned per page
+        max_rows: Optional cap on rows returned across all pages
+        returned: Rows returned so far
+        expires_at: Monotonic deadline after which the cursor is discarded
+        closed: Set once the cursor was closed through the registry
+        lock: Held while a worker thread reads from or closes the cursor
+        page_lock: Serializes arango_query_next calls on the cursor
+    """
+
+    cursor: Any
+    session_id: str
+    batch_size: int
+    max_rows: Optional[int] = None
+    returned: int = 0
+    expires_at: float = 0.0
+    closed: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    page_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    def remaining(self) -> Optional[int]:
+        """Rows still allowed by max_rows (None when unbounded)."""
+        if self.max_rows is None:
+            return None
+        return max(0, self.max_rows - self.returned)
+
+    def next_page_size(self) -> int:
+        """Number of rows to read for the next page."""
+        remaining = self.remaining()
+        return self.batch_size if remaining is None else min(self.batch_size, remaining)
+
+
+def close_cursor(cursor: Any, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Close a python-arango or async cursor, ignoring errors.
+
+    Async cursors are closed on the running event loop when there is one, or
+    from a worker thread on loop when given; otherwise the server-side TTL
+    releases them.
+    """
+    close = getattr(cursor, "close", None)
+    if close is None:
+        return
+    try:
+        if inspect.iscoroutinefunction(close):
+            try:
+                asyncio.get_running_loop().create_task(close())
+            except RuntimeError:
+                if loop is not None and loop.is_running():
+                    asyncio.run_coroutine_threadsafe(close(), loop)
+        else:
+            close()
+    except Exception:
+        logger.debug("Error closing cursor", exc_info=True)
+
+
+class CursorRegistry:
+    """Per-session registry of open query cursors.
+
+    Handles are opaque random tokens. Lookups are scoped to the owning session,
+    so one session can never read another session's cursor. Expired cursors are
+    purged lazily on every registry access.
+
+    Thread-safe (handlers may run on worker threads).
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CURSOR_TTL_SEC,
+        max_per_session: int = DEFAULT_MAX_CURSORS_PER_SESSION,
+    ):
+        """Initialize CursorRegistry.
+
+        Args:
+            ttl: Seconds of inactivity after which a cursor is discarded
+            max_per_session: Maximum number of open cursors per session
+        """
+        self.ttl = ttl
+        self.max_per_session = max_per_session
+        self._entries: Dict[str, CursorEntry] = {}
+        self._lock = threading.Lock()
+
+    def _purge_expired_locked(self, now: float) -> List[CursorEntry]:
+        expired = [h for h, e in self._entries.items() if e.expires_at <= now]
+        return [self._entries.pop(h) for h in expired]
+
+    def register(
+        self,
+        session_id: str,
+        cursor: Any,
+        batch_size: int,
+        max_rows: Optional[int] = None,
+        returned: int = 0,
+    ) -> str:
+        """Register an open cursor and return its handle.
+
+        Args:
+            session_id: Owning session
+            cursor: Open cursor positioned after the rows already returned
+            batch_size: Rows per page
+            max_rows: Optional cap on rows returned across all pages
+            returned: Rows already returned with the first page
+
+        Returns:
+            Opaque cursor handle
+        """
+        now = time.monotonic()
+        handle = secrets.token_urlsafe(16)
+        entry = CursorEntry(
+            cursor=cursor,
+            session_id=session_id,
+            batch_size=batch_size,
+            max_rows=max_rows,
+            returned=returned,
+            expires_at=now + self.ttl,
+        )
+        with self._lock:
+            to_close = self._purge_expired_locked(now)
+            owned = sorted(
+                (e.expires_at, h)
+                for h, e in self._entries.items()
+                if e.session_id == session_id
+            )
+            # Evict least recently used cursors beyond the per-session limit
+            for _, old_handle in owned[: max(0, len(owned) - self.max_per_session + 1)]:
+                to_close.append(self._entries.pop(old_handle))
+            self._entries[handle] = entry
+        for old in to_close:
+            close_cursor(old.cursor)
+        return handle
+
+    def get(
+        self, session_id: str, handle: str, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Optional[CursorEntry]:
+        """Return the session's cursor for handle and refresh its TTL (None if unknown).
+
+        Closes expired cursors, which blocks for python-arango cursors; call it
+        from a worker thread, passing the event loop async cursors are closed on.
+        """
+        now = time.monotonic()
+        with self._lock:
+            to_close = self._purge_expired_locked(now)
+            entry = self._entries.get(handle)
+            if entry is not None and entry.session_id != session_id:
+                entry = None
+            if entry is not None:
+                entry.expires_at = now + self.ttl
+        for old in to_close:
+            close_cursor(old.cursor, loop)
+        return entry
+
+    def close(
+        self, session_id: str, handle: str, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> bool:
+        """Close and forget a cursor. Returns True if it existed for this session.
+
+        Waits for a page read in progress on the cursor (entry.lock). Blocks for
+        python-arango cursors, like get().
+        """
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None or entry.session_id != session_id:
+                return False
+            del self._entries[handle]
+        with entry.lock:
+            entry.closed = True
+            close_cursor(entry.cursor, loop)
+        return True
+
+    def close_session(self, session_id: str) -> int:
+        """Close every cursor owned by a session. Returns the number closed."""
+        with self._lock:
+            handles = [h for h, e in self._entries.items() if e.session_id == session_id]
+            entries = [self._entries.pop(h) for h in handles]
+        for entry in entries:
+            close_cursor(entry.cursor)
+        return len(entries)
+
+    def close_all(self) -> None:
+        """Close every registered cursor."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            close_cursor(entry.cursor)
+
+    def count(self, session_id: Optional[str] = None) -> int:
+        """Number of open cursors (optionally for one session)."""
+        with self._lock:
+            if session_id is None:
+                return len(self._entries)
+            return sum(1 for e in self._entries.values() if e.session_id == session_id)
@@ -54,9 +54,9 @@ def resolve_database(
         return env_default
     
     # Level 5: First configured database
-    databases = config_loader.get_configured_databases()
-    if databases:
-        return list(databases.keys())[0]
+    first = config_loader.first_database_key()
+    if first:
+        return first
     
     # Level 6: Hardcoded fallback
     return "_system"
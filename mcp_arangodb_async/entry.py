@@ -6,6 +6,7 @@ Provides stdio-based server with tool registration, request handling, and lifecy
 
 Functions:
 - server_lifespan() - Async context manager for server lifecycle
+- close_session_state() - Release the cursors and queries of an ended session
 - handle_list_tools() - MCP handler for tool listing
 - call_tool() - MCP handler for tool execution
 - _json_content() - Convert data to JSON text content for MCP response
@@ -17,10 +18,12 @@ from __future__ import annotations
 
 import asyncio
 import json
+import weakref
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 from typing import Any, Callable, Dict, List, Optional
 from types import SimpleNamespace
+from uuid import uuid4
 
 import mcp.server.stdio
 import mcp.types as types
@@ -40,6 +43,20 @@ from .multi_db_manager import MultiDatabaseConnectionManager
 from .config_loader import ConfigFileLoader
 from .db_resolver import resolve_database
 from .session_utils import extract_session_id
+from .executor import (
+    ExecutorSaturatedError,
+    ToolExecutor,
+    ToolTimeoutError,
+    load_executor_config,
+)
+from .admission import AdmissionController, AdmissionRejectedError
+from .query_tracker import QueryTracker, load_query_runtime_config
+from .query_cache import (
+    QueryCache,
+    cache_key_for,
+    load_query_cache_config,
+    written_collections,
+)
 
 # Module-level variable to store config file path (set by main() before server starts)
 _config_file_path: Optional[str] = None
@@ -148,7 +165,9 @@ from .models import (
     ValidateGraphIntegrityArgs,
     GraphStatisticsArgs,
 )
-from .tool_registry import TOOL_REGISTRY
+from .tool_registry import TOOL_REGISTRY, DispatchPlan, inspect_handler
+from .tool_catalog import get_tool_catalog
+from . import json_codec
 
 # ============================================================================
 # Tool Registry Population via Decorators
@@ -161,19 +180,63 @@ from .tool_registry import TOOL_REGISTRY
 # Import handlers module to trigger @register_tool() decorator execution
 # This must happen AFTER tool_registry import but BEFORE server initialization
 from . import handlers  # noqa: F401 - imported for side effects (decorator execution)
+# Attach native-async handler variants (used for databases with driver: httpx)
+from . import async_handlers  # noqa: F401 - imported for side effects (decorator execution)
+
+
+# Context of each server whose lifespan is open (see server_lifespan)
+_open_contexts: weakref.WeakKeyDictionary[Server, Dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+async def close_session_state(session_state: SessionState, session_id: str) -> None:
+    """Close the cursors and kill the running queries of an ended session.
+
+    Cursors are closed in a worker thread (python-arango closes them with a
+    blocking request); queries are killed in the background on the event loop.
+    """
+    await asyncio.to_thread(session_state.cursors.close_session, session_id)
+    session_state.cleanup_session(session_id)
+
+
+@asynccontextmanager
+async def _session_lifespan(shared: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+    """Scope one session (one Server.run) within an already open server context."""
+    session_id = uuid4().hex
+    try:
+        yield {**shared, "session_id": session_id}
+    finally:
+        session_state = shared.get("session_state")
+        if session_state is not None:
+            await close_session_state(session_state, session_id)
 
 
 @asynccontextmanager
 async def server_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
     """Initialize ArangoDB client+db and multi-tenancy components.
 
+    Server.run() enters the lifespan once per session. Over stdio that is the
+    one run of the server. The HTTP transport enters it once up front and
+    then once per session (streamable HTTP session or stateless request):
+    those inner entries share the open context under their own session_id
+    and release that session's cursors and queries when it ends.
+
     Initializes:
     - ConfigFileLoader: Load database configurations from YAML/env vars
     - MultiDatabaseConnectionManager: Manage connections to multiple databases
     - SessionState: Per-session state for focused database and workflows
+    - ToolExecutor: Bounded worker pool for synchronous (blocking) handlers
+    - QueryCache: Read-result cache for databases with ``query_cache: true``
+    - AdmissionController: Per-database in-flight limits (``max_in_flight``)
+    - QueryTracker: Running AQL queries per session, killed on cancellation
 
     Stores all components in lifespan_context for access in call_tool().
     """
+    shared = _open_contexts.get(server)
+    if shared is not None:
+        async with _session_lifespan(shared) as context:
+            yield context
+        return
+
     # Configure logging to stderr only (never stdout for stdio MCP servers)
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     logging.basicConfig(
@@ -193,6 +256,9 @@ async def server_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
         )
     logger.info(f"Tool registry validated: {len(TOOL_REGISTRY)} tools registered")
 
+    # Build (or load from the on-disk cache) the tool schemas served by tools/list
+    get_tool_catalog().tools()
+
     # Initialize multi-tenancy components
     logger.info("Initializing multi-tenancy components...")
 
@@ -222,7 +288,41 @@ async def server_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
 
     # Initialize session state
     session_state = SessionState()
+    query_runtime = load_query_runtime_config()
+    session_state.queries = QueryTracker(query_runtime)
     logger.info("Session state initialized")
+    if query_runtime.default_max_runtime or query_runtime.tool_max_runtimes:
+        logger.info(
+            "Query max_runtime limits: default=%s, per_tool=%s",
+            query_runtime.default_max_runtime,
+            query_runtime.tool_max_runtimes,
+        )
+
+    # Initialize worker pool for blocking handlers
+    executor = ToolExecutor(load_executor_config())
+    logger.info(
+        "Tool executor initialized (max_workers=%d, queue_size=%d, default_timeout=%s)",
+        executor.config.max_workers,
+        executor.config.queue_size,
+        executor.config.default_timeout,
+    )
+
+    # Initialize read-result cache (only used for databases that opt in)
+    query_cache = QueryCache(load_query_cache_config())
+    cached_dbs = [k for k, c in databases.items() if c.query_cache]
+    if cached_dbs:
+        logger.info(
+            "Query cache enabled for %s (ttl=%ss, max_bytes=%d)",
+            cached_dbs,
+            query_cache.config.ttl,
+            query_cache.config.max_bytes,
+        )
+
+    # Initialize per-database admission control (databases with max_in_flight)
+    admission = AdmissionController.from_configs(databases)
+    limited = admission.get_metrics()
+    if limited:
+        logger.info("Admission control enabled for %s", list(limited))
 
     # Initialize default database connection using centralized resolver
     session_state_init = SessionState()
@@ -265,17 +365,24 @@ async def server_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
                 db = None
                 break
 
+    # Store all components in lifespan context
+    context = {
+        "db": db,
+        "client": client,
+        "session_state": session_state,
+        "db_manager": db_manager,
+        "config_loader": config_loader,
+        "executor": executor,
+        "query_cache": query_cache,
+        "admission": admission,
+    }
+    _open_contexts[server] = context
     try:
-        # Store all components in lifespan context
-        yield {
-            "db": db,
-            "client": client,
-            "session_state": session_state,
-            "db_manager": db_manager,
-            "config_loader": config_loader,
-        }
+        yield context
     finally:
         # Cleanup
+        _open_contexts.pop(server, None)
+        executor.shutdown()
         session_state.cleanup_all()
         await db_manager.close_all()
         if client is not None:
@@ -286,6 +393,7 @@ async def server_lifespan(server: Server) -> AsyncIterator[Dict[str, Any]]:
 
 
 server = Server("mcp-arangodb-async", lifespan=server_lifespan)
+_logger = logging.getLogger("mcp_arangodb_async.entry")
 
 
 @server.list_tools()
@@ -293,20 +401,14 @@ async def handle_list_tools() -> List[types.Tool]:
     """Generate tool list from registry.
 
     Dynamically builds the MCP tool list from TOOL_REGISTRY, ensuring
-    consistency between tool metadata and handler dispatch.
+    consistency between tool metadata and handler dispatch. Schemas and Tool
+    objects come from the tool catalog cache and are only rebuilt when a
+    registration changes.
 
     Returns:
         List of MCP Tool objects with name, description, and input schema
     """
-    # Build tools from registry
-    tools: List[types.Tool] = [
-        types.Tool(
-            name=reg.name,
-            description=reg.description,
-            inputSchema=reg.model.model_json_schema(),
-        )
-        for reg in TOOL_REGISTRY.values()
-    ]
+    tools: List[types.Tool] = get_tool_catalog().tools()
 
     # Compatibility: during pytest integration tests, expect baseline 7 tools.
     # Respect explicit override via MCP_COMPAT_TOOLSET=full to test the full set.
@@ -320,17 +422,69 @@ async def handle_list_tools() -> List[types.Tool]:
 def _json_content(data: Any) -> List[types.Content]:
     """Convert data to JSON text content for MCP response.
 
+    Uses the fastest available JSON backend (see json_codec.py); datetimes,
+    bytes and Decimals in results are encoded instead of failing the call.
+
     Args:
         data: Any serializable data structure
 
     Returns:
         List containing a single TextContent with JSON representation
     """
-    return [types.TextContent(type="text", text=json.dumps(data, ensure_ascii=False))]
+    return [types.TextContent(type="text", text=json_codec.dumps(data))]
+
+
+# Pending progress notifications (strong references until they are sent)
+_progress_tasks: set = set()
+
+
+def _progress_reporter(ctx: Any) -> Optional[Callable[..., None]]:
+    """Build a thread-safe progress callback for the current request.
+
+    Returns None unless the client sent a progress token with the request.
+    The callback takes (progress, total=None, message=None) and may be called
+    from worker threads; notifications are scheduled on the event loop and
+    failures to send them are only logged.
+    """
+    meta = getattr(ctx, "meta", None)
+    token = getattr(meta, "progressToken", None) if meta is not None else None
+    session = getattr(ctx, "session", None)
+    if isinstance(token, bool) or not isinstance(token, (str, int)) or session is None:
+        return None
+    request_id = getattr(ctx, "request_id", None)
+    related_request_id = str(request_id) if request_id is not None else None
+    loop = asyncio.get_running_loop()
+
+    async def send(progress: float, total: Optional[float], message: Optional[str]) -> None:
+        try:
+            await session.send_progress_notification(
+                token, progress, total, message, related_request_id=related_request_id
+            )
+        except Exception:
+            _logger.debug("Failed to send progress notification", exc_info=True)
+
+    def schedule(progress: float, total: Optional[float], message: Optional[str]) -> None:
+        task = loop.create_task(send(progress, total, message))
+        _progress_tasks.add(task)
+        task.add_done_callback(_progress_tasks.discard)
+
+    def report(progress: float, total: Optional[float] = None, message: Optional[str] = None) -> None:
+        try:
+            loop.call_soon_threadsafe(schedule, progress, total, message)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+
+    return report
 
 
 async def _invoke_handler(
-    handler: Callable, db: StandardDatabase, args: Dict[str, Any]
+    handler: Callable,
+    db: StandardDatabase,
+    args: Dict[str, Any],
+    executor: Optional[ToolExecutor] = None,
+    tool_name: Optional[str] = None,
+    plan: Optional[DispatchPlan] = None,
 ) -> Any:
     """Invoke handler function with appropriate signature based on parameter inspection.
 
@@ -346,7 +500,10 @@ async def _invoke_handler(
        - Matches the documented handler signature pattern: (db, args: Dict[str, Any])
        - More efficient as it avoids dictionary unpacking
 
-    The signature inspection mechanism deterministically detects which signature the handler expects:
+    The calling convention and async flag come from the tool's precomputed
+    DispatchPlan (see tool_registry.py), so registered tools are dispatched
+    without per-call signature inspection. Handlers invoked without a plan are
+    inspected on the spot:
     - Inspects handler parameters to check for **kwargs parameter
     - Uses kwargs expansion for handlers with **kwargs (test compatibility)
     - Uses single args dict for handlers without **kwargs (production handlers)
@@ -354,12 +511,17 @@ async def _invoke_handler(
 
     Supports both sync and async handlers:
     - Async handlers (coroutine functions) are awaited
-    - Sync handlers are called directly
+    - Sync handlers run on the executor's worker pool when one is provided,
+      so blocking python-arango calls never stall the event loop; without an
+      executor they are called directly
 
     Args:
         handler: Handler function to invoke (either real implementation or test mock)
         db: ArangoDB database instance
         args: Validated arguments dictionary from Pydantic model
+        executor: Optional worker pool for sync handlers
+        tool_name: Tool name used for executor timeouts and metrics
+        plan: Precomputed dispatch plan for handler
 
     Returns:
         Handler function result (typically Dict[str, Any] or List[Dict[str, Any]])
@@ -369,32 +531,26 @@ async def _invoke_handler(
         comprehensive testing. The pattern handles the semantic difference between
         handlers that require arguments vs. those that don't (e.g., list_collections).
     """
-    import inspect
-    import asyncio
-
-    # Inspect handler signature to determine calling convention
-    sig = inspect.signature(handler)
-
-    # Check if handler has **kwargs parameter (test compatibility mode)
-    has_var_keyword = any(
-        p.kind == inspect.Parameter.VAR_KEYWORD
-        for p in sig.parameters.values()
-    )
-
-    # Check if handler is async (coroutine function)
-    is_async = asyncio.iscoroutinefunction(handler)
+    if plan is not None and plan.handler is handler:
+        has_var_keyword, is_async = plan.pass_kwargs, plan.is_async
+    else:
+        has_var_keyword, is_async = inspect_handler(handler)
 
     if has_var_keyword:
         # Test-compatible signature: handler(db, **args)
         # This allows mocked handlers in tests to inspect individual parameters
         if is_async:
             return await handler(db, **args)
+        if executor is not None:
+            return await executor.run(tool_name or handler.__name__, handler, db, **args)
         return handler(db, **args)
     else:
         # Production signature: handler(db, args)
         # This matches the documented handler pattern for real implementations
         if is_async:
             return await handler(db, args)
+        if executor is not None:
+            return await executor.run(tool_name or handler.__name__, handler, db, args)
         return handler(db, args)
 
 
@@ -407,8 +563,10 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
     - Database resolution using 6-level priority fallback
     - Per-tool database override support
 
-    Uses TOOL_REGISTRY for O(1) lookup and dispatch. Maintains all existing
-    features: validation, lazy connect, error handling.
+    Uses TOOL_REGISTRY for O(1) lookup and dispatch through the tool's
+    precomputed DispatchPlan. Maintains all existing features: validation,
+    lazy connect, error handling. Tools registered with needs_db=False skip
+    database resolution and connection setup.
 
     Args:
         name: Tool name to execute
@@ -417,7 +575,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
     Returns:
         List of MCP Content objects (typically JSON text content)
     """
-    logger = logging.getLogger("mcp_arangodb_async.entry")
+    logger = _logger
     # Access lifespan context; may not have connected (graceful degradation)
     ctx = server.request_context
     lifespan_ctx = ctx.lifespan_context if ctx and ctx.lifespan_context else {}
@@ -426,17 +584,18 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
     session_state = lifespan_ctx.get("session_state")
     db_manager = lifespan_ctx.get("db_manager")
     config_loader = lifespan_ctx.get("config_loader")
+    executor = lifespan_ctx.get("executor")
     db = lifespan_ctx.get("db")
 
     # Look up tool in registry
     tool_reg = TOOL_REGISTRY.get(name)
     if tool_reg is None:
         return _json_content({"error": f"Unknown tool: {name}"})
+    plan = tool_reg.plan
 
     # Validate incoming arguments strictly via Pydantic
     try:
-        parsed = tool_reg.model(**(arguments or {}))
-        validated_args: Dict[str, Any] = parsed.model_dump(exclude_none=True)
+        validated_args: Dict[str, Any] = plan.validate(arguments)
     except ValidationError as ve:
         return _json_content(
             {
@@ -446,26 +605,29 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
             }
         )
 
-    # Extract session ID (stdio or HTTP transport)
-    session_id = extract_session_id(ctx) if ctx else "stdio"
+    # Session ID: the HTTP session scoped by server_lifespan, else from the transport
+    session_id = lifespan_ctx.get("session_id") or (extract_session_id(ctx) if ctx else "stdio")
 
     # Implicit session creation on first tool call
     if session_state and not session_state.has_session(session_id):
         session_state.initialize_session(session_id)
-        logger.debug(f"Initialized session: {session_id}")
+        logger.debug("Initialized session: %s", session_id)
 
     # Resolve database using 6-level priority fallback
     target_db_key = None
-    if session_state and db_manager and config_loader:
+    async_db = None
+    if plan.needs_db and session_state and db_manager and config_loader:
         target_db_key = resolve_database(
             validated_args, session_state, session_id, config_loader
         )
-        logger.debug(f"Resolved database for session {session_id}: {target_db_key}")
+        logger.debug("Resolved database for session %s: %s", session_id, target_db_key)
 
         # Get connection from multi-database manager
         try:
             client, db = await db_manager.get_connection(target_db_key)
-            logger.debug(f"Got connection to database: {target_db_key}")
+            logger.debug("Got connection to database: %s", target_db_key)
+            if tool_reg.async_handler is not None:
+                async_db = await db_manager.get_async_database(target_db_key)
         except KeyError as e:
             logger.error(f"Database not configured: {target_db_key}")
             configured_dbs = db_manager.get_configured_databases()
@@ -489,7 +651,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
             )
 
     # If DB is unavailable, attempt a lazy one-shot connect using unified system
-    if db is None:
+    if db is None and plan.needs_db:
         try:
             # Use the same resolver and connection manager as normal tool execution
             if not session_state or not db_manager or not config_loader:
@@ -544,6 +706,26 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
                 }
             )
 
+    # Read-result cache: look up cacheable reads, note which collections a
+    # write may modify. Only databases with query_cache enabled take part.
+    query_cache = lifespan_ctx.get("query_cache")
+    cache_plan = None
+    written: frozenset = frozenset()
+    cache_ttl = None
+    if query_cache is not None and target_db_key is not None:
+        db_config = db_manager.get_database_config(target_db_key)
+        if db_config is not None and db_config.query_cache:
+            cache_ttl = db_config.query_cache_ttl
+            written = written_collections(name, validated_args)
+            cache_plan = cache_key_for(name, target_db_key, validated_args)
+            if cache_plan is not None:
+                hit, cached = query_cache.get(cache_plan[0])
+                if hit:
+                    if session_state:
+                        session_state.track_tool_usage(session_id, name)
+                    return _json_content(cached)
+                cache_epoch = query_cache.begin_read(target_db_key)
+
     # Inject session context for pattern handlers that need per-session state
     # This enables migration from global variables to SessionState
     # Also includes db_manager and config_loader for multi-tenancy tools
@@ -552,17 +734,86 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
         "session_id": session_id,
         "db_manager": db_manager,
         "config_loader": config_loader,
+        "progress": _progress_reporter(ctx) if ctx else None,
     }
 
-    # Dispatch to handler via registry (O(1) lookup)
+    # Running query tracking: AQL issued by the handler is tagged with the call
+    # so it can be killed server-side on cancellation, timeout or session close.
+    # Query tools without a per-call max_runtime get the configured default.
+    query_tracker = getattr(session_state, "queries", None)
+    if isinstance(query_tracker, QueryTracker) and plan.needs_db:
+        if "max_runtime" in plan.model.model_fields:
+            max_runtime = query_tracker.resolve_max_runtime(name, validated_args)
+            if max_runtime is not None:
+                validated_args["max_runtime"] = max_runtime
+        tracked = query_tracker.track(
+            session_id, name, async_db if async_db is not None else db
+        )
+    else:
+        tracked = nullcontext()
+
+    # Per-database admission control: calls against databases with
+    # max_in_flight wait for a slot in a fair per-session queue
+    admission = lifespan_ctx.get("admission")
+    if admission is not None and target_db_key is not None:
+        admitted = admission.admit(target_db_key, session_id)
+    else:
+        admitted = nullcontext()
+
+    # Dispatch to handler via registry (O(1) lookup). Databases configured with
+    # the native async driver use the tool's async variant, which runs on the
+    # event loop; everything else goes through the worker pool.
     try:
-        result = await _invoke_handler(tool_reg.handler, db, validated_args)
+        async with admitted, tracked:
+            if async_db is not None:
+                result = await tool_reg.async_handler(async_db, validated_args)
+            else:
+                result = await _invoke_handler(
+                    plan.handler, db, validated_args, executor=executor, tool_name=name, plan=plan
+                )
 
         # Track tool usage in session state
         if session_state:
             session_state.track_tool_usage(session_id, name)
 
+        if cache_plan is not None and not (isinstance(result, dict) and "error" in result):
+            query_cache.put(
+                cache_plan[0], result, cache_plan[1], target_db_key, cache_epoch, ttl=cache_ttl
+            )
+
         return _json_content(result)
+    except ToolTimeoutError as e:
+        return _json_content(
+            {
+                "error": str(e),
+                "type": "ToolTimeout",
+                "tool": name,
+                "timeout_sec": e.timeout,
+                "killed_queries": e.killed_queries,
+            }
+        )
+    except AdmissionRejectedError as e:
+        logger.warning("Rejected tool '%s': %s", name, e)
+        return _json_content(
+            {
+                "error": str(e),
+                "type": "DatabaseBusy",
+                "tool": name,
+                "database": e.database_key,
+                "reason": e.reason,
+                "hint": "Too many concurrent calls against this database; retry shortly.",
+            }
+        )
+    except ExecutorSaturatedError as e:
+        logger.warning("Rejected tool '%s': %s", name, e)
+        return _json_content(
+            {
+                "error": str(e),
+                "type": "ExecutorSaturated",
+                "tool": name,
+                "hint": "Server is at capacity; retry shortly.",
+            }
+        )
     except Exception as e:
         logger.exception("Error executing tool '%s'", name)
         return _json_content(
@@ -571,6 +822,11 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.Content]
                 "tool": name,
             }
         )
+    finally:
+        # Invalidate even when the write failed or timed out: it may have
+        # partially applied (bulk writes) or still be running on the worker.
+        if written:
+            query_cache.invalidate(target_db_key, written)
 
 
 # Test compatibility shim: expose handlers dict expected by integration tests
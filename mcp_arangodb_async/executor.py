@@ -0,0 +1,303 @@
+"""
+ArangoDB MCP Server - Tool Executor
+
+This module runs synchronous tool handlers on a bounded worker pool so that
+blocking python-arango calls (AQL queries, bulk writes, backups) never stall the
+event loop shared by every MCP session and the HTTP /health endpoint.
+
+Classes:
+- ExecutorConfig - Frozen dataclass for worker pool settings
+- ToolExecutor - Bounded thread pool with per-tool timeouts and timing metrics
+- ExecutorSaturatedError - Raised when the pool and its queue are full
+- ToolTimeoutError - Raised when a tool exceeds its configured timeout
+
+Functions:
+- load_executor_config() - Load worker pool settings from environment variables
+- parse_tool_timeouts() - Parse "tool=seconds,..." per-tool timeout overrides
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class ToolTimeoutError(Exception):
+    """Raised when a tool call does not finish within its timeout."""
+
+    def __init__(self, tool_name: str, timeout: float):
+        super().__init__(f"Tool '{tool_name}' timed out after {timeout:g}s")
+        self.tool_name = tool_name
+        self.timeout = timeout
+        # Set by QueryTracker when it kills the call's running AQL queries
+        self.killed_queries = 0
+        # Worker future of the call; the handler thread keeps running after
+        # the timeout (a worker cannot be interrupted)
+        self.worker: Optional[Future] = None
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    """Configuration for the tool worker pool.
+
+    Attributes:
+        max_workers: Number of worker threads (0 runs handlers inline on the event loop)
+        queue_size: Maximum number of calls waiting for a free worker
+        default_timeout: Timeout in seconds applied to every tool (None for no timeout)
+        tool_timeouts: Per-tool timeout overrides in seconds
+    """
+
+    max_workers: int = min(32, (os.cpu_count() or 1) + 4)
+    queue_size: int = 100
+    default_timeout: Optional[float] = None
+    tool_timeouts: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate configuration after initialization."""
+        if self.max_workers < 0:
+            raise ValueError(f"Invalid max_workers: {self.max_workers}. Must be >= 0.")
+        if self.queue_size < 0:
+            raise ValueError(f"Invalid queue_size: {self.queue_size}. Must be >= 0.")
+        if self.default_timeout is not None and self.default_timeout <= 0:
+            raise ValueError(
+                f"Invalid default_timeout: {self.default_timeout}. Must be > 0."
+            )
+
+
+def parse_tool_timeouts(raw: Optional[str]) -> Dict[str, float]:
+    """Parse per-tool timeouts from a "tool=seconds,tool=seconds" string.
+
+    Args:
+        raw: Comma-separated assignments, e.g. "arango_backup=600,arango_query=60"
+
+    Returns:
+        Dictionary mapping tool names to timeouts in seconds
+
+    Raises:
+        ValueError: If an entry is malformed or a timeout is not a positive number
+    """
+    timeouts: Dict[str, float] = {}
+    if not raw:
+        return timeouts
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, value = entry.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Invalid tool timeout entry: '{entry}'")
+        seconds = float(value)
+        if seconds <= 0:
+            raise ValueError(f"Invalid timeout for '{name.strip()}': must be > 0")
+        timeouts[name.strip()] = seconds
+    return timeouts
+
+
+def load_executor_config() -> ExecutorConfig:
+    """
+    Load worker pool configuration from environment variables.
+
+    MCP_EXECUTOR_WORKERS (default: min(32, cpu_count + 4); 0 disables offloading)
+    MCP_EXECUTOR_QUEUE_SIZE (default: 100)
+    MCP_TOOL_TIMEOUT_SEC (optional float seconds applied to all tools)
+    MCP_TOOL_TIMEOUTS (optional "tool=seconds,..." per-tool overrides)
+    """
+    defaults = ExecutorConfig()
+    workers_raw = os.getenv("MCP_EXECUTOR_WORKERS")
+    queue_raw = os.getenv("MCP_EXECUTOR_QUEUE_SIZE")
+    timeout_raw = os.getenv("MCP_TOOL_TIMEOUT_SEC")
+
+    return ExecutorConfig(
+        max_workers=int(workers_raw) if workers_raw else defaults.max_workers,
+        queue_size=int(queue_raw) if queue_raw else defaults.queue_size,
+        default_timeout=float(timeout_raw) if timeout_raw else None,
+        tool_timeouts=parse_tool_timeouts(os.getenv("MCP_TOOL_TIMEOUTS")),
+    )
+
+
+@dataclass
+class _ToolMetrics:
+    """Mutable per-tool counters (guarded by ToolExecutor._lock)."""
+
+    calls: int = 0
+    completed: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    rejected: int = 0
+    queue_wait_total: float = 0.0
+    queue_wait_max: float = 0.0
+    execution_total: float = 0.0
+    execution_max: float = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        finished = self.completed + self.errors
+        return {
+            "calls": self.calls,
+            "completed": self.completed,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "avg_queue_wait_ms": round(self.queue_wait_total / finished * 1000, 3) if finished else 0.0,
+            "max_queue_wait_ms": round(self.queue_wait_max * 1000, 3),
+            "avg_execution_ms": round(self.execution_total / finished * 1000, 3) if finished else 0.0,
+            "max_execution_ms": round(self.execution_max * 1000, 3),
+        }
+
+
+class ToolExecutor:
+    """Bounded worker pool for synchronous tool handlers.
+
+    Calls are accepted while fewer than ``max_workers + queue_size`` are pending;
+    beyond that they are rejected with ExecutorSaturatedError instead of piling up.
+    Queue wait (submit -> worker start) and execution time are recorded per tool.
+
+    A timed-out call returns control to the caller immediately, but the worker
+    thread keeps running until the underlying driver call returns, so it still
+    counts against capacity.
+    """
+
+    def __init__(self, config: Optional[ExecutorConfig] = None):
+        """Initialize ToolExecutor; the thread pool is created on first use.
+
+        Args:
+            config: Worker pool configuration (defaults to ExecutorConfig())
+        """
+        self.config = config or ExecutorConfig()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._metrics: Dict[str, _ToolMetrics] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether handlers are offloaded to worker threads."""
+        return self.config.max_workers > 0
+
+    def get_timeout(self, tool_name: str) -> Optional[float]:
+        """Return the effective timeout for a tool (per-tool override, then default)."""
+        return self.config.tool_timeouts.get(tool_name, self.config.default_timeout)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.config.max_workers,
+                thread_name_prefix="mcp-arango-tool",
+            )
+        return self._pool
+
+    def _tool_metrics(self, tool_name: str) -> _ToolMetrics:
+        metrics = self._metrics.get(tool_name)
+        if metrics is None:
+            metrics = self._metrics[tool_name] = _ToolMetrics()
+        return metrics
+
+    async def run(self, tool_name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking callable on the worker pool and await its result.
+
+        Args:
+            tool_name: Tool name used for timeouts and metrics
+            func: Synchronous callable to execute
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            ExecutorSaturatedError: If the pool and its queue are full
+            ToolTimeoutError: If the call exceeds the tool's timeout
+        """
+        if not self.enabled:
+            return func(*args, **kwargs)
+
+        capacity = self.config.max_workers + self.config.queue_size
+        with self._lock:
+            metrics = self._tool_metrics(tool_name)
+            if self._pending >= capacity:
+                metrics.rejected += 1
+                raise ExecutorSaturatedError(
+                    f"Tool executor saturated: {self._pending} calls pending "
+                    f"(max_workers={self.config.max_workers}, queue_size={self.config.queue_size})"
+                )
+            self._pending += 1
+            metrics.calls += 1
+
+        submitted_at = time.perf_counter()
+        timing: Dict[str, float] = {}
+        ctx = contextvars.copy_context()
+
+        def _call() -> Any:
+            timing["start"] = time.perf_counter()
+            with self._lock:
+                self._running += 1
+            return ctx.run(func, *args, **kwargs)
+
+        def _done(fut: Future) -> None:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self._pending -= 1
+                if "start" not in timing:
+                    # Cancelled before a worker picked it up
+                    return
+                self._running -= 1
+                queue_wait = timing["start"] - submitted_at
+                execution = finished_at - timing["start"]
+                metrics.queue_wait_total += queue_wait
+                metrics.queue_wait_max = max(metrics.queue_wait_max, queue_wait)
+                metrics.execution_total += execution
+                metrics.execution_max = max(metrics.execution_max, execution)
+                if fut.exception() is None:
+                    metrics.completed += 1
+                else:
+                    metrics.errors += 1
+
+        try:
+            future = self._get_pool().submit(_call)
+        except RuntimeError:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(_done)
+
+        timeout = self.get_timeout(tool_name)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                metrics.timeouts += 1
+            logger.warning("Tool '%s' timed out after %ss", tool_name, timeout)
+            error = ToolTimeoutError(tool_name, timeout)
+            error.worker = future
+            raise error from None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of pool occupancy and per-tool timing metrics."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_workers": self.config.max_workers,
+                "queue_size": self.config.queue_size,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "tools": {name: m.snapshot() for name, m in self._metrics.items()},
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down the worker pool, cancelling calls that have not started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
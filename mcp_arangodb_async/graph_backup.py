@@ -25,14 +25,48 @@ from __future__ import annotations
 
 import json
 import os
+import time
 from datetime import datetime
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 
 from arango.database import StandardDatabase
 from arango.exceptions import ArangoError
 
-from .backup import validate_output_directory
+from .backup import (
+    DEFAULT_BACKUP_FORMAT,
+    DEFAULT_BACKUP_MEMORY_BUDGET_MB,
+    backup_file_collection,
+    budget_batch_size,
+    export_batch_size,
+    export_collection,
+    export_increment,
+    finish_collection_export,
+    iter_backup_documents,
+    plan_collection_export,
+    validate_backup_format,
+    validate_input_directory,
+    validate_output_directory,
+)
+from .bulk import import_documents, run_concurrently, run_scheduled
+from .checkpoint import RESTORE_CHECKPOINT, Checkpoint, open_checkpoint
+from .compression import validate_compression
+from .revisions import (
+    iter_deleted_keys,
+    read_backup_chain,
+    revisions_path,
+    scan_revisions,
+    write_backup_chain,
+)
+from .query_tracker import QueryCancelledError, max_runtime_options, tag_query
+
+# Documents per import request when restoring a collection
+RESTORE_BATCH_SIZE = 1000
+
+# Import API onDuplicate mode for each restore conflict resolution strategy
+ON_DUPLICATE_FOR_CONFLICT = {"error": "error", "skip": "ignore", "overwrite": "replace"}
 
 
 def backup_graph_to_dir(
@@ -40,14 +74,22 @@ def backup_graph_to_dir(
     graph_name: str, 
     output_dir: Optional[str] = None, 
     include_metadata: bool = True, 
-    doc_limit: Optional[int] = None
+    doc_limit: Optional[int] = None,
+    parallelism: int = 1,
+    memory_budget_mb: int = DEFAULT_BACKUP_MEMORY_BUDGET_MB,
+    compression: str = "none",
+    compression_level: Optional[int] = None,
+    fmt: str = DEFAULT_BACKUP_FORMAT,
+    partitions: int = 1,
+    incremental_base: Optional[str] = None,
+    track_revisions: bool = False,
 ) -> Dict[str, Any]:
     """Export complete graph structure to directory.
     
     Creates structured backup with:
     - graph_metadata.json: Graph definition and edge definitions
-    - vertices/: Directory with vertex collection JSON files
-    - edges/: Directory with edge collection JSON files
+    - vertices/: Directory with vertex collection JSON Lines (or JSON array) files
+    - edges/: Directory with edge collection JSON Lines (or JSON array) files
     - backup_report.json: Summary report
     
     Args:
@@ -56,9 +98,20 @@ def backup_graph_to_dir(
         output_dir: Output directory (defaults to timestamped folder)
         include_metadata: Include graph metadata in backup
         doc_limit: Maximum documents per collection
+        parallelism: Collections exported at once (each with its own cursor)
+        memory_budget_mb: Memory shared by parallel workers' cursor batches
+        compression: Compress collection files while writing ("none", "gzip", "zstd")
+        compression_level: Codec level (codec default if None)
+        fmt: Collection file format, "jsonl" (default) or "json"
+        partitions: Split each collection into up to this many _key ranges,
+            exported concurrently as part files plus a manifest
+        incremental_base: Previous graph backup directory; only documents
+            changed since then are exported, plus tombstones for deleted keys
+        track_revisions: Record revision manifests so this backup can be an
+            incremental base (always done for incremental backups)
         
     Returns:
-        Dictionary with backup report
+        Dictionary with backup report (with per-collection elapsed_sec)
         
     Raises:
         ValueError: If graph doesn't exist or output directory invalid
@@ -67,6 +120,14 @@ def backup_graph_to_dir(
     # Validate graph exists
     if not db.has_graph(graph_name):
         raise ValueError(f"Graph '{graph_name}' does not exist")
+    compression_level = validate_compression(compression, compression_level)
+    validate_backup_format(fmt)
+    if incremental_base is not None:
+        if doc_limit is not None:
+            raise ValueError("doc_limit cannot be combined with an incremental backup")
+        incremental_base = validate_input_directory(incremental_base)
+        # Fails early on a broken chain
+        read_backup_chain(incremental_base)
     
     # Setup output directory
     if output_dir is None:
@@ -99,27 +160,79 @@ def backup_graph_to_dir(
     # Add orphan collections (vertex collections not connected by edges)
     vertex_collections.update(graph_info.get("orphan_collections", []))
     
-    # Backup vertex collections
+    # Backup vertex and edge collections (in parallel with parallelism > 1)
     vertex_dir = os.path.join(output_dir, "vertices")
     os.makedirs(vertex_dir, exist_ok=True)
-    vertex_files = []
-    
-    for col_name in vertex_collections:
-        if db.has_collection(col_name):
-            file_path = os.path.join(vertex_dir, f"{col_name}.json")
-            count = _backup_collection_to_file(db, col_name, file_path, doc_limit)
-            vertex_files.append({"collection": col_name, "path": file_path, "count": count})
-    
-    # Backup edge collections  
     edge_dir = os.path.join(output_dir, "edges")
     os.makedirs(edge_dir, exist_ok=True)
-    edge_files = []
-    
-    for col_name in edge_collections:
-        if db.has_collection(col_name):
-            file_path = os.path.join(edge_dir, f"{col_name}.json")
-            count = _backup_collection_to_file(db, col_name, file_path, doc_limit)
-            edge_files.append({"collection": col_name, "path": file_path, "count": count})
+
+    backup_started = time.perf_counter()
+    targets = [
+        (col_name, vertex_dir, "vertex") for col_name in vertex_collections if db.has_collection(col_name)
+    ] + [
+        (col_name, edge_dir, "edge") for col_name in edge_collections if db.has_collection(col_name)
+    ]
+    if incremental_base is not None:
+        # Only documents changed since the base backup, plus tombstones
+        workers = max(1, min(parallelism, len(targets)))
+        worker_budget = memory_budget_mb * 1024 * 1024 // workers
+
+        def export_changes(target: tuple) -> Dict[str, Any]:
+            col_name, col_dir, _ = target
+            base_dir = os.path.join(incremental_base, os.path.basename(col_dir))
+            batch_size = export_batch_size(db, col_name, worker_budget) if workers > 1 else None
+            return export_increment(
+                db, col_name, col_dir, base_dir, batch_size, compression, compression_level, fmt
+            )
+
+        entries = run_concurrently(export_changes, targets, workers)
+        files = [(target[2], entry) for target, entry in zip(targets, entries)]
+    else:
+        # One job per collection, or per key range with partitions > 1
+        plans = [
+            plan_collection_export(db, col_name, col_dir, partitions, fmt, compression, doc_limit)
+            for col_name, col_dir, _ in targets
+        ]
+        jobs = [job for plan in plans for job in plan]
+        write_options: Dict[str, Any] = {"fmt": fmt}
+        if compression != "none":
+            write_options.update(compression=compression, compression_level=compression_level)
+        workers = max(1, min(parallelism, len(jobs)))
+        worker_budget = memory_budget_mb * 1024 * 1024 // workers
+        if track_revisions:
+            # Scanned before the export: a document changed meanwhile is exported again next time
+            run_concurrently(
+                lambda target: scan_revisions(db, target[0], revisions_path(target[1], target[0])),
+                targets,
+                workers,
+            )
+
+        def export(job: tuple) -> Dict[str, Any]:
+            col_name, file_path, key_range = job
+            options = write_options if key_range is None else dict(write_options, key_range=key_range)
+            started = time.perf_counter()
+            if workers > 1:
+                batch_size = export_batch_size(db, col_name, worker_budget)
+                count = _backup_collection_to_file(
+                    db, col_name, file_path, doc_limit, batch_size=batch_size, **options
+                )
+            else:
+                count = _backup_collection_to_file(db, col_name, file_path, doc_limit, **options)
+            return {
+                "collection": col_name,
+                "path": file_path,
+                "count": count,
+                "elapsed_sec": round(time.perf_counter() - started, 3),
+            }
+
+        exported = iter(run_concurrently(export, jobs, workers))
+        files = [
+            (kind, finish_collection_export(col_name, col_dir, plan, [next(exported) for _ in plan], fmt, compression))
+            for (col_name, col_dir, kind), plan in zip(targets, plans)
+        ]
+    vertex_files = [entry for kind, entry in files if kind == "vertex"]
+    edge_files = [entry for kind, entry in files if kind == "edge"]
+    elapsed = time.perf_counter() - backup_started
     
     # Save metadata
     if include_metadata:
@@ -133,6 +246,16 @@ def backup_graph_to_dir(
                 "edge_collections": list(edge_collections),
             }, f, indent=2, ensure_ascii=False)
     
+    if incremental_base is not None or track_revisions:
+        write_backup_chain(
+            output_dir,
+            incremental_base,
+            {
+                entry["collection"]: {"count": entry["count"], "deleted": entry.get("deleted", 0)}
+                for entry in vertex_files + edge_files
+            },
+        )
+    
     # Create backup report
     report = {
         "graph_name": graph_name,
@@ -143,7 +266,14 @@ def backup_graph_to_dir(
         "total_edge_collections": len(edge_files),
         "total_documents": sum(f["count"] for f in vertex_files + edge_files),
         "metadata_included": include_metadata,
+        "format": fmt,
+        "compression": compression,
+        "parallelism": workers,
+        "elapsed_sec": round(elapsed, 3),
     }
+    if incremental_base is not None:
+        report["incremental_base"] = incremental_base
+        report["total_deleted"] = sum(f.get("deleted", 0) for f in vertex_files + edge_files)
     
     # Save report
     report_path = os.path.join(output_dir, "backup_report.json")
@@ -157,48 +287,32 @@ def _backup_collection_to_file(
     db: StandardDatabase, 
     collection_name: str, 
     file_path: str, 
-    doc_limit: Optional[int] = None
+    doc_limit: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    compression: str = "none",
+    compression_level: Optional[int] = None,
+    fmt: str = DEFAULT_BACKUP_FORMAT,
+    key_range: Optional[tuple] = None,
 ) -> int:
-    """Helper to backup single collection to JSON file.
+    """Helper to backup single collection to a JSON Lines or JSON array file.
     
     Args:
         db: Database instance
         collection_name: Name of collection to backup
         file_path: Output file path
         doc_limit: Maximum documents to backup
+        batch_size: Streaming cursor batch size (see backup.export_collection)
+        compression: Codec the file is compressed with while writing
+        compression_level: Codec level (codec default if None)
+        fmt: "jsonl" or "json"
+        key_range: (after, until] _key range to export (whole collection if None)
         
     Returns:
         Number of documents backed up
     """
-    col = db.collection(collection_name)
-    cursor = col.all()
-    count = 0
-    
-    try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write('[')
-            first_doc = True
-            
-            for i, doc in enumerate(cursor):
-                if doc_limit is not None and i >= doc_limit:
-                    break
-                
-                if not first_doc:
-                    f.write(',')
-                f.write('\n  ')
-                json.dump(doc, f, ensure_ascii=False)
-                first_doc = False
-                count += 1
-            
-            f.write('\n]')
-    finally:
-        if hasattr(cursor, 'close'):
-            try:
-                cursor.close()
-            except Exception:
-                pass  # Ignore cleanup errors
-    
-    return count
+    return export_collection(
+        db, collection_name, file_path, doc_limit, batch_size, compression, compression_level, fmt, key_range
+    )["count"]
 
 
 def backup_named_graphs(
@@ -254,21 +368,70 @@ def backup_named_graphs(
     }
 
 
+def _restore_job(
+    db: StandardDatabase,
+    checkpoint: Checkpoint,
+    resolution: str,
+    batch_size: int,
+    increment: bool,
+    job: tuple,
+) -> Dict[str, Any]:
+    """Restore one (collection, file, kind) job of restore_graph_from_dir().
+
+    Files already restored according to the checkpoint are skipped; files of
+    an increment (increment=True) also have their tombstoned keys removed.
+    """
+    col_name, file_path, kind = job
+    done = checkpoint.completed(file_path)
+    if done is not None:
+        return done
+    try:
+        result = _restore_collection_from_file(
+            db, col_name, file_path, resolution, batch_size=batch_size, edge=kind == "edge",
+            progress=partial(checkpoint.record_progress, file_path),
+            resume_from=checkpoint.progress(file_path),
+        )
+        if increment:
+            result["removed"] = _apply_tombstones(
+                db, col_name, revisions_path(os.path.dirname(file_path), col_name)
+            )
+    except Exception as e:
+        return {"collection": col_name, "error": str(e), "type": kind}
+    checkpoint.complete(file_path, result)
+    return result
+
+
 def restore_graph_from_dir(
     db: StandardDatabase,
     input_dir: str,
     graph_name: Optional[str] = None,
     conflict_resolution: str = "error",
-    validate_integrity: bool = True
+    validate_integrity: bool = True,
+    parallelism: int = 1,
+    memory_budget_mb: int = DEFAULT_BACKUP_MEMORY_BUDGET_MB,
+    resume: bool = False,
 ) -> Dict[str, Any]:
     """Import graph data with integrity validation and conflict resolution.
 
+    With parallelism > 1, vertex collections are restored concurrently, and
+    each edge collection starts as soon as the vertex collections of its edge
+    definitions (from graph_metadata.json) are done.
+
+    Progress is checkpointed in input_dir (restore_checkpoint.json, removed
+    once the restore succeeds): restored files and, per file in progress, the
+    number of records imported. With resume=True an interrupted restore with
+    the same options skips the restored files and continues the others after
+    their last imported batch.
+
     Args:
         db: Database instance
         input_dir: Directory containing graph backup files
         graph_name: Target graph name (defaults to original)
         conflict_resolution: How to handle conflicts ("skip", "overwrite", "error")
         validate_integrity: Whether to validate integrity after restore
+        parallelism: Collections restored at once
+        memory_budget_mb: Memory shared by the workers' import batches (caps the batch size)
+        resume: Continue an interrupted restore from its checkpoint
 
     Returns:
         Dictionary with restore report
@@ -277,10 +440,8 @@ def restore_graph_from_dir(
         ValueError: If input directory invalid or backup corrupted
         ArangoError: If database operations fail
     """
-    # Validate input directory structure
-    input_dir = os.path.abspath(input_dir)
-    if not os.path.exists(input_dir):
-        raise ValueError(f"Input directory '{input_dir}' does not exist")
+    # Validate input directory (the restore checkpoint is written there)
+    input_dir = validate_input_directory(input_dir)
 
     metadata_path = os.path.join(input_dir, "graph_metadata.json")
     if not os.path.exists(metadata_path):
@@ -294,39 +455,74 @@ def restore_graph_from_dir(
     target_graph_name = graph_name or original_graph_name
     graph_properties = metadata["graph_properties"]
 
-    # Track restoration progress
+    # An edge collection waits for the vertex collections of its edge
+    # definitions (for all vertex collections if it has none)
+    edge_vertices: Dict[str, set] = {}
+    for edge_def in graph_properties.get("edge_definitions", []):
+        edge_vertices.setdefault(edge_def["edge_collection"], set()).update(
+            edge_def.get("from_vertex_collections", []) + edge_def.get("to_vertex_collections", [])
+        )
+
+    # Incremental backups are replayed on top of their base: the full backup
+    # first, then every increment (changed documents replace, tombstones remove)
+    chain = read_backup_chain(input_dir)
+    checkpoint = open_checkpoint(
+        os.path.join(input_dir, RESTORE_CHECKPOINT),
+        {"database": db.name, "graph_name": target_graph_name, "conflict_resolution": conflict_resolution},
+        resume,
+    )
     restored_vertices = []
     restored_edges = []
     conflicts = []
     errors = []
-
-    # Restore vertex collections first
-    vertex_dir = os.path.join(input_dir, "vertices")
-    if os.path.exists(vertex_dir):
-        for vertex_file in os.listdir(vertex_dir):
-            if vertex_file.endswith(".json"):
-                col_name = vertex_file[:-5]  # Remove .json
-                file_path = os.path.join(vertex_dir, vertex_file)
-
-                try:
-                    result = _restore_collection_from_file(db, col_name, file_path, conflict_resolution)
-                    restored_vertices.append(result)
-                except Exception as e:
-                    errors.append({"collection": col_name, "error": str(e), "type": "vertex"})
-
-    # Restore edge collections
-    edge_dir = os.path.join(input_dir, "edges")
-    if os.path.exists(edge_dir):
-        for edge_file in os.listdir(edge_dir):
-            if edge_file.endswith(".json"):
-                col_name = edge_file[:-5]
-                file_path = os.path.join(edge_dir, edge_file)
-
-                try:
-                    result = _restore_collection_from_file(db, col_name, file_path, conflict_resolution)
-                    restored_edges.append(result)
-                except Exception as e:
-                    errors.append({"collection": col_name, "error": str(e), "type": "edge"})
+    workers = 1
+    restore_started = time.perf_counter()
+    for position, backup_dir in enumerate(chain):
+        resolution = conflict_resolution if position == 0 else "overwrite"
+
+        # Collection files to restore: vertices first, then edges
+        jobs = []
+        for kind, sub_dir in (("vertex", "vertices"), ("edge", "edges")):
+            kind_dir = os.path.join(backup_dir, sub_dir)
+            if os.path.exists(kind_dir):
+                for file_name in os.listdir(kind_dir):
+                    col_name = backup_file_collection(file_name)
+                    if col_name:
+                        jobs.append((col_name, os.path.join(kind_dir, file_name), kind))
+
+        vertex_jobs = {job[0]: i for i, job in enumerate(jobs) if job[2] == "vertex"}
+        dependencies = {
+            i: [vertex_jobs[v] for v in edge_vertices.get(job[0], vertex_jobs) if v in vertex_jobs]
+            for i, job in enumerate(jobs)
+            if job[2] == "edge"
+        }
+        workers = max(workers, min(parallelism, len(jobs)))
+        batch_size = min(RESTORE_BATCH_SIZE, budget_batch_size(memory_budget_mb * 1024 * 1024 // workers))
+
+        restore = partial(_restore_job, db, checkpoint, resolution, batch_size, position > 0)
+        outcomes = run_scheduled(restore, jobs, dependencies, workers)
+
+        # Track restoration progress
+        for outcome, job in zip(outcomes, jobs):
+            if len(chain) > 1:
+                outcome["backup_dir"] = backup_dir
+            if "error" in outcome:
+                errors.append(outcome)
+                continue
+            if job[2] == "vertex":
+                restored_vertices.append(outcome)
+            else:
+                restored_edges.append(outcome)
+            # Existing keys skipped or overwritten by the import, per collection; the
+            # import API only counts them (its details list errors, not duplicates)
+            existing = outcome.get("ignored", 0) + outcome.get("updated", 0)
+            if existing and position == 0:
+                conflicts.append(
+                    {"collection": outcome.get("collection"), "count": existing, "resolution": resolution}
+                )
+
+    restored = restored_vertices + restored_edges
+    restore_elapsed = time.perf_counter() - restore_started
 
     # Recreate graph definition
     try:
@@ -361,7 +557,14 @@ def restore_graph_from_dir(
         except Exception as e:
             errors.append({"operation": "integrity_validation", "error": str(e), "type": "validation"})
 
-    return {
+    if any(e.get("type") in ("vertex", "edge") for e in errors):
+        # Kept so that resume=True retries the failed collections
+        checkpoint_path = checkpoint.path
+    else:
+        checkpoint.remove()
+        checkpoint_path = None
+
+    report = {
         "graph_name": target_graph_name,
         "original_graph_name": original_graph_name,
         "input_dir": input_dir,
@@ -371,72 +574,134 @@ def restore_graph_from_dir(
         "conflicts": conflicts,
         "errors": errors,
         "integrity_report": integrity_report,
-        "total_documents_restored": sum(r.get("inserted", 0) + r.get("updated", 0) for r in restored_vertices + restored_edges),
+        "total_documents_restored": sum(r.get("inserted", 0) + r.get("updated", 0) for r in restored),
+        "backup_chain": chain,
+        "parallelism": workers,
+        "elapsed_sec": round(restore_elapsed, 3),
     }
+    if checkpoint_path:
+        report["checkpoint"] = checkpoint_path
+    if resume:
+        report["resumed"] = True
+    return report
+
+
+_TOMBSTONE_QUERY = """
+FOR key IN @keys
+  REMOVE key IN @@collection OPTIONS { ignoreErrors: true }
+  RETURN 1
+"""
+
+
+def _apply_tombstones(db: StandardDatabase, collection_name: str, revisions_file: str) -> int:
+    """Remove the keys an incremental backup recorded as deleted; return how many existed."""
+    removed = 0
+    for keys in iter_deleted_keys(revisions_file, RESTORE_BATCH_SIZE):
+        cursor = db.aql.execute(
+            tag_query(_TOMBSTONE_QUERY),
+            bind_vars={"@collection": collection_name, "keys": keys},
+            batch_size=len(keys),
+        )
+        removed += sum(1 for _ in cursor)
+    return removed
 
 
 def _restore_collection_from_file(
     db: StandardDatabase,
     collection_name: str,
     file_path: str,
-    conflict_resolution: str
+    conflict_resolution: str,
+    batch_size: int = RESTORE_BATCH_SIZE,
+    edge: Optional[bool] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Helper to restore single collection from JSON file with conflict handling.
+    """Helper to restore single collection from a backup file with conflict handling.
+
+    The file is streamed (JSON Lines line by line, legacy JSON arrays through
+    the incremental array parser), so only one batch of documents is held in
+    memory. Documents are written in batches through the import API; existing
+    keys are handled server-side according to the conflict resolution strategy
+    ("skip" ignores them, "overwrite" replaces them, "error" fails the batch).
+    Compressed files (gzip, zstd) are decompressed on the fly; the codec is
+    detected from the extension or the file's magic bytes.
 
     Args:
         db: Database instance
         collection_name: Name of collection to restore
-        file_path: Path to JSON backup file
+        file_path: Path to the backup file (.jsonl or .json, optionally compressed)
         conflict_resolution: Conflict resolution strategy
+        batch_size: Documents per import request
+        edge: Whether a missing collection is created as an edge collection
+            (None: decided from the first document)
+        progress: Called after every batch with the records processed so far
+            (the record offset) and the import counters
+        resume_from: Last progress of an interrupted restore of this file;
+            its records are skipped and its counters carried over. The batch
+            that was in flight is imported again; in "error" mode its keys
+            that already exist are skipped
 
     Returns:
-        Dictionary with restore statistics
-    """
-    # Load documents
-    with open(file_path, "r", encoding="utf-8") as f:
-        documents = json.load(f)
-
-    # Create collection if needed
-    if not db.has_collection(collection_name):
-        # Determine if edge collection based on document structure
-        is_edge = any("_from" in doc and "_to" in doc for doc in documents[:5])
-        db.create_collection(collection_name, edge=is_edge)
-
-    col = db.collection(collection_name)
-
-    # Insert with conflict resolution
-    inserted = 0
-    updated = 0
-    skipped = 0
-    errors = []
+        Dictionary with restore statistics, elapsed_sec and docs_per_sec
 
-    for doc in documents:
-        try:
-            if conflict_resolution == "skip" and col.has(doc["_key"]):
-                skipped += 1
-            elif conflict_resolution == "overwrite":
-                try:
-                    col.replace(doc)
-                    updated += 1
-                except:
-                    col.insert(doc)
-                    inserted += 1
-            else:  # error mode
-                col.insert(doc)
-                inserted += 1
-        except Exception as e:
-            if conflict_resolution == "error":
-                raise
-            errors.append({"document_key": doc.get("_key"), "error": str(e)})
-            skipped += 1
+    Raises:
+        ValueError: If a record of the file cannot be parsed
+        DocumentInsertError: In "error" mode, if a batch contains a conflict
+    """
+    started = time.perf_counter()
+    counters = dict(resume_from or {"processed": 0, "inserted": 0, "updated": 0, "ignored": 0, "errors": 0})
+    documents = iter_backup_documents(file_path)
+    try:
+        # Records imported before the interruption are read but not imported
+        for _ in islice(documents, counters["processed"]):
+            pass
+        batch = list(islice(documents, batch_size))
+
+        # Create collection if needed
+        if not db.has_collection(collection_name):
+            if edge is None:
+                # Edge collection if its documents are edges
+                edge = bool(batch) and "_from" in batch[0] and "_to" in batch[0]
+            db.create_collection(collection_name, edge=edge)
+
+        col = db.collection(collection_name)
+        on_duplicate = ON_DUPLICATE_FOR_CONFLICT.get(conflict_resolution, "error")
+        # The batch in flight may have been written before the interruption
+        replayed = resume_from is not None
+
+        while batch:
+            result = import_documents(
+                col,
+                batch,
+                on_duplicate="ignore" if replayed and on_duplicate == "error" else on_duplicate,
+                halt_on_error=conflict_resolution == "error",
+            )
+            counters["processed"] += len(batch)
+            counters["inserted"] += result.get("created", 0)
+            counters["updated"] += result.get("updated", 0)
+            counters["ignored"] += result.get("ignored", 0)
+            counters["errors"] += result.get("errors", 0)
+            if progress is not None:
+                progress(dict(counters))
+            replayed = False
+            batch = list(islice(documents, batch_size))
+    finally:
+        documents.close()
 
+    elapsed = time.perf_counter() - started
+    processed = counters["processed"]
+    # Throughput of this run (records skipped on resume are not imported)
+    imported = processed - (resume_from or {}).get("processed", 0)
     return {
         "collection": collection_name,
-        "inserted": inserted,
-        "updated": updated,
-        "skipped": skipped,
-        "errors": len(errors),
-        "total_processed": len(documents),
+        "inserted": counters["inserted"],
+        "updated": counters["updated"],
+        "skipped": counters["ignored"] + counters["errors"],
+        "ignored": counters["ignored"],
+        "errors": counters["errors"],
+        "total_processed": processed,
+        "elapsed_sec": round(elapsed, 3),
+        "docs_per_sec": round(imported / elapsed, 1) if elapsed > 0 else None,
     }
 
 
@@ -545,7 +810,8 @@ def calculate_graph_statistics(
     include_connectivity: bool = True,
     sample_size: Optional[int] = None,
     aggregate_collections: bool = False,
-    per_collection_stats: bool = False
+    per_collection_stats: bool = False,
+    max_runtime: Optional[float] = None,
 ) -> Dict[str, Any]:
     """Generate comprehensive graph analytics with improved representativeness.
 
@@ -557,10 +823,15 @@ def calculate_graph_statistics(
         sample_size: Sample size for large graphs
         aggregate_collections: If True, aggregate stats across all collections
         per_collection_stats: If True, provide per-collection breakdown
+        max_runtime: Server-side runtime limit in seconds for each analytics query
 
     Returns:
         Dictionary with graph statistics
     """
+    def run_query(query: str) -> List[Dict[str, Any]]:
+        cursor = db.aql.execute(tag_query(query), **max_runtime_options(max_runtime))
+        return list(cursor)
+
     if graph_name:
         graphs_to_analyze = [graph_name] if db.has_graph(graph_name) else []
     else:
@@ -623,8 +894,7 @@ def calculate_graph_statistics(
                         RETURN {{degree: degree, frequency: frequency}}
                         """
 
-                        cursor = db.aql.execute(degree_query)
-                        degree_dist = list(cursor)
+                        degree_dist = run_query(degree_query)
                         graph_stats["out_degree_distribution"] = degree_dist
                         graph_stats["degree_analysis_method"] = "aggregated_all_collections"
 
@@ -646,8 +916,7 @@ def calculate_graph_statistics(
                             RETURN {{degree: degree, frequency: frequency}}
                             """
 
-                            cursor = db.aql.execute(degree_query)
-                            per_collection_degrees[edge_col] = list(cursor)
+                            per_collection_degrees[edge_col] = run_query(degree_query)
 
                     graph_stats["per_collection_degree_distribution"] = per_collection_degrees
                     graph_stats["degree_analysis_method"] = "per_collection"
@@ -663,8 +932,7 @@ def calculate_graph_statistics(
                     RETURN {{degree: degree, frequency: frequency}}
                     """
 
-                    cursor = db.aql.execute(degree_query)
-                    degree_dist = list(cursor)
+                    degree_dist = run_query(degree_query)
                     graph_stats["out_degree_distribution"] = degree_dist
                     graph_stats["degree_analysis_method"] = f"sampled_from_{first_edge_col}"
                     graph_stats["degree_analysis_warning"] = f"Degree distribution calculated from {first_edge_col} only. Use aggregate_collections=True for complete analysis."
@@ -674,6 +942,8 @@ def calculate_graph_statistics(
                         graph_stats["max_out_degree"] = max(degrees)
                         graph_stats["avg_out_degree"] = total_edges / total_vertices if total_vertices > 0 else 0
 
+            except QueryCancelledError:
+                raise
             except Exception as e:
                 graph_stats["degree_distribution_error"] = str(e)
 
@@ -700,8 +970,7 @@ def calculate_graph_statistics(
                                 RETURN {{vertex: v._id, reachable_count: reachable}}
                                 """
 
-                                cursor = db.aql.execute(connectivity_query)
-                                connectivity_data = list(cursor)
+                                connectivity_data = run_query(connectivity_query)
 
                                 if connectivity_data:
                                     reachable_counts = [c["reachable_count"] for c in connectivity_data]
@@ -734,8 +1003,7 @@ def calculate_graph_statistics(
                             RETURN {{vertex: v._id, reachable_count: reachable, collection: '{vertex_col}'}}
                             """
 
-                            cursor = db.aql.execute(connectivity_query)
-                            total_sample_data.extend(list(cursor))
+                            total_sample_data.extend(run_query(connectivity_query))
 
                     if total_sample_data:
                         reachable_counts = [c["reachable_count"] for c in total_sample_data]
@@ -772,8 +1040,7 @@ def calculate_graph_statistics(
                     RETURN {{vertex: v._id, reachable_count: reachable}}
                     """
 
-                    cursor = db.aql.execute(connectivity_query)
-                    connectivity_data = list(cursor)
+                    connectivity_data = run_query(connectivity_query)
 
                     if connectivity_data:
                         reachable_counts = [c["reachable_count"] for c in connectivity_data]
@@ -783,6 +1050,8 @@ def calculate_graph_statistics(
                         graph_stats["connectivity_analysis_method"] = f"sampled_from_{first_vertex_col}"
                         graph_stats["connectivity_analysis_warning"] = f"Connectivity sampled from {first_vertex_col} only. Use aggregate_collections=True for complete analysis."
 
+            except QueryCancelledError:
+                raise
             except Exception as e:
                 graph_stats["connectivity_analysis_error"] = str(e)
 
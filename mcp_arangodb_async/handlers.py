@@ -26,6 +26,7 @@ Functions by category:
 
 Core Data:
     - handle_arango_query
+    - handle_query_next
     - handle_list_collections (uses Optional[Dict[str, Any]] = None signature)
     - handle_insert
     - handle_update
@@ -43,7 +44,11 @@ Validation & Bulk Ops:
     - handle_validate_references
     - handle_insert_with_validation
     - handle_bulk_insert
+    - handle_bulk_insert_file
     - handle_bulk_update
+    - handle_update_by_filter
+    - handle_remove_by_filter
+    - handle_upsert_by_filter
 
 Schema Management:
     - handle_create_schema
@@ -85,8 +90,12 @@ signature patterns seamlessly, enabling comprehensive testing and direct usage.
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
+import asyncio
 import json
 import logging
+import os
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
 from jsonschema import Draft7Validator, ValidationError as JSONSchemaValidationError
@@ -94,7 +103,7 @@ from arango.database import StandardDatabase
 from arango.exceptions import ArangoError
 
 # Type imports removed - using Dict[str, Any] for validated args from Pydantic models
-from .backup import backup_collections_to_dir
+from .backup import backup_collections_to_dir, validate_input_file
 from .graph_backup import (
     backup_graph_to_dir,
     restore_graph_from_dir,
@@ -102,9 +111,26 @@ from .graph_backup import (
     validate_graph_integrity,
     calculate_graph_statistics,
 )
+from .bulk import (
+    MAX_BULK_CONCURRENCY,
+    AdaptiveBatcher,
+    ChunkedTransaction,
+    import_documents,
+    import_error_offsets,
+    iter_batches,
+    key_ranges,
+    run_concurrently,
+    run_pipelined,
+)
+from .cursor_registry import CursorRegistry, close_cursor
+from .ingest import detect_format, iter_records
+from .references import ReferenceChecker
+from .query_tracker import max_runtime_options, tag_query
 from .tool_registry import register_tool, TOOL_REGISTRY
+from .tool_catalog import get_tool_catalog
 from .tools import (
     ARANGO_QUERY,
+    ARANGO_QUERY_NEXT,
     ARANGO_LIST_COLLECTIONS,
     ARANGO_INSERT,
     ARANGO_UPDATE,
@@ -118,7 +144,11 @@ from .tools import (
     ARANGO_VALIDATE_REFERENCES,
     ARANGO_INSERT_WITH_VALIDATION,
     ARANGO_BULK_INSERT,
+    ARANGO_BULK_INSERT_FILE,
     ARANGO_BULK_UPDATE,
+    ARANGO_UPDATE_BY_FILTER,
+    ARANGO_REMOVE_BY_FILTER,
+    ARANGO_UPSERT_BY_FILTER,
     ARANGO_CREATE_GRAPH,
     ARANGO_ADD_EDGE,
     ARANGO_TRAVERSE,
@@ -254,6 +284,7 @@ def safe_cursor(cursor):
 
 from .models import (
     QueryArgs,
+    QueryNextArgs,
     ListCollectionsArgs,
     InsertArgs,
     UpdateArgs,
@@ -267,6 +298,10 @@ from .models import (
     ValidateReferencesArgs,
     InsertWithValidationArgs,
     BulkInsertArgs,
+    BulkInsertFileArgs,
+    UpdateByFilterArgs,
+    RemoveByFilterArgs,
+    UpsertByFilterArgs,
     BulkUpdateArgs,
     CreateGraphArgs,
     AddEdgeArgs,
@@ -317,17 +352,130 @@ def handle_arango_query(
 
     This mirrors the TS tool `arango_query` behavior at a high level.
 
+    When 'batch_size' or 'max_rows' is given, the query runs on a streaming
+    server-side cursor and only the first page is returned, together with a
+    cursor handle that arango_query_next advances.
+
     Operator model:
       Preconditions:
         - Database connection available.
-        - Args include 'query' (str); optional 'bind_vars' (object).
+        - Args include 'query' (str); optional 'bind_vars' (object),
+          'batch_size' (int), 'max_rows' (int), 'max_runtime' (seconds).
       Effects:
-        - Executes AQL query and returns list of rows.
+        - Executes AQL query and returns list of rows, or a page
+          {rows, cursor, has_more, ...} when paging is requested.
         - No database mutations unless the query itself is a write.
     """
-    cursor = db.aql.execute(args["query"], bind_vars=args.get("bind_vars") or {})
-    with safe_cursor(cursor):
-        return list(cursor)
+    if args.get("batch_size") is None and args.get("max_rows") is None:
+        cursor = db.aql.execute(
+            tag_query(args["query"]),
+            bind_vars=args.get("bind_vars") or {},
+            **max_runtime_options(args.get("max_runtime")),
+        )
+        with safe_cursor(cursor):
+            return list(cursor)
+
+    session_state, session_id = _get_session_context(args)
+    registry = _get_cursor_registry(session_state)
+    batch_size, max_rows = _query_page_limits(args)
+    cursor = db.aql.execute(
+        tag_query(args["query"]),
+        bind_vars=args.get("bind_vars") or {},
+        batch_size=batch_size,
+        ttl=registry.ttl,
+        stream=True,
+        **max_runtime_options(args.get("max_runtime")),
+    )
+    try:
+        rows = _read_cursor_page(cursor, min(batch_size, max_rows or batch_size))
+    except Exception:
+        close_cursor(cursor)
+        raise
+    return _first_query_page(
+        registry, session_id, cursor, rows, batch_size, max_rows, _cursor_has_more(cursor)
+    )
+
+
+# Default page size when only max_rows is given
+DEFAULT_QUERY_PAGE_SIZE = 1000
+
+# Fallback registry for direct (non-MCP) usage without a session
+_FALLBACK_CURSOR_REGISTRY = CursorRegistry()
+
+
+def _get_cursor_registry(session_state: Any) -> CursorRegistry:
+    """Return the session cursor registry, or a process-wide fallback."""
+    registry = getattr(session_state, "cursors", None)
+    return registry if isinstance(registry, CursorRegistry) else _FALLBACK_CURSOR_REGISTRY
+
+
+def _query_page_limits(args: Dict[str, Any]) -> tuple:
+    """Return (batch_size, max_rows) for a paged arango_query call."""
+    max_rows = args.get("max_rows")
+    batch_size = args.get("batch_size") or min(DEFAULT_QUERY_PAGE_SIZE, max_rows)
+    return int(batch_size), (int(max_rows) if max_rows is not None else None)
+
+
+def _read_cursor_page(cursor: Any, size: int) -> List[Any]:
+    """Read up to size rows from a python-arango cursor."""
+    rows: List[Any] = []
+    while len(rows) < size:
+        try:
+            rows.append(next(cursor))
+        except StopIteration:
+            break
+    return rows
+
+
+async def _read_async_cursor_page(cursor: Any, size: int) -> List[Any]:
+    """Read up to size rows from an async_driver.AsyncCursor."""
+    rows: List[Any] = []
+    while len(rows) < size:
+        try:
+            rows.append(await cursor.__anext__())
+        except StopAsyncIteration:
+            break
+    return rows
+
+
+def _cursor_has_more(cursor: Any) -> bool:
+    """Whether a cursor (python-arango or async driver) still has unread rows."""
+    has_more = cursor.has_more() if callable(cursor.has_more) else cursor.has_more
+    return not cursor.empty() or bool(has_more)
+
+
+def _query_page(
+    rows: List[Any], handle: Optional[str], total_returned: int, truncated: bool
+) -> Dict[str, Any]:
+    return {
+        "rows": rows,
+        "cursor": handle,
+        "has_more": handle is not None,
+        "page_size": len(rows),
+        "total_returned": total_returned,
+        "truncated": truncated,
+    }
+
+
+def _first_query_page(
+    registry: CursorRegistry,
+    session_id: str,
+    cursor: Any,
+    rows: List[Any],
+    batch_size: int,
+    max_rows: Optional[int],
+    has_more: bool,
+) -> Dict[str, Any]:
+    """Register the cursor if more rows may follow and build the first page."""
+    limit_reached = max_rows is not None and len(rows) >= max_rows
+    handle = None
+    if has_more and not limit_reached:
+        handle = registry.register(
+            session_id, cursor, batch_size=batch_size, max_rows=max_rows, returned=len(rows)
+        )
+    else:
+        close_cursor(cursor)
+    return _query_page(rows, handle, len(rows), truncated=has_more and limit_reached)
 
 
 @handle_errors
@@ -574,6 +722,13 @@ def handle_backup(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
         - Output directory writable (if provided).
       Effects:
         - Reads documents and writes JSON files to output directory.
+        - With 'parallelism' > 1, exports several collections at once, each
+          through a streaming cursor sized to its share of 'memory_budget_mb';
+          reports elapsed_sec per collection.
+        - With 'incremental_base', writes only documents changed since that
+          backup plus tombstones for deleted keys (see revisions.py).
+        - Checkpoints progress in the output directory; with 'resume', an
+          interrupted backup continues from its checkpoint (see checkpoint.py).
         - No database mutations; side-effect is file system writes.
     """
     output_dir = args.get("output_dir") or args.get("outputDir")
@@ -586,11 +741,108 @@ def handle_backup(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
 
     doc_limit = args.get("doc_limit") or args.get("docLimit")
     report = backup_collections_to_dir(
-        db, output_dir=output_dir, collections=collections, doc_limit=doc_limit
+        db, output_dir=output_dir, collections=collections, doc_limit=doc_limit, **_backup_options(args)
     )
     return report
 
 
+# Backup writer options passed through to the backup functions when given
+# Tool argument -> backup/restore function keyword
+_BACKUP_OPTIONS = {
+    "parallelism": "parallelism",
+    "memory_budget_mb": "memory_budget_mb",
+    "compression": "compression",
+    "compression_level": "compression_level",
+    "format": "fmt",
+    "partitions": "partitions",
+    "incremental_base": "incremental_base",
+    "track_revisions": "track_revisions",
+    "resume": "resume",
+}
+
+
+def _backup_options(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Backup and restore options present in the tool arguments."""
+    return {kw: args[k] for k, kw in _BACKUP_OPTIONS.items() if args.get(k) is not None}
+
+
+@handle_errors
+@register_tool(
+    name=ARANGO_QUERY_NEXT,
+    description="Fetch the next page of a paged arango_query result using its cursor handle (or close the cursor).",
+    model=QueryNextArgs,
+    needs_db=False,
+)
+async def handle_query_next(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch the next page of an open arango_query cursor.
+
+    Cursors are scoped to the session that opened them and expire after a period
+    of inactivity. The cursor is closed automatically once exhausted or when
+    max_rows is reached.
+
+    Operator model:
+      Preconditions:
+        - 'cursor' is a live handle returned to this session by arango_query.
+      Effects:
+        - Returns {rows, cursor, has_more, page_size, total_returned, truncated},
+          or closes the cursor when 'close' is true.
+        - No database mutations.
+    """
+    session_state, session_id = _get_session_context(args)
+    registry = _get_cursor_registry(session_state)
+    handle = args["cursor"]
+
+    # get() and close() block on python-arango cursors (HTTP DELETE of expired
+    # or finished cursors); keep them off the event loop like page reads
+    loop = asyncio.get_running_loop()
+    entry = await asyncio.to_thread(registry.get, session_id, handle, loop)
+    if entry is None:
+        return {
+            "error": f"Unknown or expired cursor '{handle}'",
+            "type": "CursorNotFound",
+        }
+    cursor = entry.cursor
+    is_async = asyncio.iscoroutinefunction(getattr(cursor, "__anext__", None))
+
+    async def close() -> None:
+        if is_async:
+            registry.close(session_id, handle)
+        else:
+            await asyncio.to_thread(registry.close, session_id, handle)
+
+    # Concurrent calls on one handle would read overlapping server batches;
+    # take pages (and account for them against max_rows) one call at a time
+    async with entry.page_lock:
+        if entry.closed:
+            return {
+                "error": f"Unknown or expired cursor '{handle}'",
+                "type": "CursorNotFound",
+            }
+        if args.get("close"):
+            await close()
+            return {"cursor": handle, "closed": True, "total_returned": entry.returned}
+
+        size = entry.next_page_size()
+        if is_async:
+            rows = await _read_async_cursor_page(cursor, size)
+            has_more = _cursor_has_more(cursor)
+        else:
+            # python-arango cursors block while fetching; keep them off the event loop
+            def _read() -> tuple:
+                with entry.lock:
+                    page = _read_cursor_page(cursor, size)
+                    return page, _cursor_has_more(cursor)
+
+            rows, has_more = await asyncio.to_thread(_read)
+
+        entry.returned += len(rows)
+        limit_reached = entry.remaining() == 0
+        if has_more and not limit_reached:
+            return _query_page(rows, handle, entry.returned, truncated=False)
+        await close()
+        return _query_page(rows, None, entry.returned, truncated=has_more and limit_reached)
+
+
 @handle_errors
 @register_tool(
     name=ARANGO_LIST_INDEXES,
@@ -611,20 +863,20 @@ def handle_list_indexes(
     """
     col = db.collection(args["collection"])
     indexes = col.indexes()  # list of dicts
-    simplified: List[Dict[str, Any]] = []
-    for ix in indexes:
-        simplified.append(
-            {
-                "id": ix.get("id"),
-                "type": ix.get("type"),
-                "fields": ix.get("fields"),
-                "unique": ix.get("unique"),
-                "sparse": ix.get("sparse"),
-                "name": ix.get("name"),
-                "selectivityEstimate": ix.get("selectivityEstimate"),
-            }
-        )
-    return simplified
+    return [_simplify_index(ix) for ix in indexes]
+
+
+def _simplify_index(ix: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce index metadata to the fields reported by arango_list_indexes."""
+    return {
+        "id": ix.get("id"),
+        "type": ix.get("type"),
+        "fields": ix.get("fields"),
+        "unique": ix.get("unique"),
+        "sparse": ix.get("sparse"),
+        "name": ix.get("name"),
+        "selectivityEstimate": ix.get("selectivityEstimate"),
+    }
 
 
 @register_tool(
@@ -805,6 +1057,15 @@ def _analyze_query_for_indexes(
     return unique
 
 
+# Invalid reference fields of `doc` (fields passed as @fields so the plan is reusable)
+_INVALID_REFS_SUBQUERY = """(
+        FOR field IN @fields
+          LET value = doc[field]
+          FILTER value != null AND DOCUMENT(value) == null
+          RETURN {field: field, value: value}
+      )"""
+
+
 @handle_errors
 @register_tool(
     name=ARANGO_VALIDATE_REFERENCES,
@@ -822,40 +1083,122 @@ def handle_validate_references(
         - 'reference_fields' provided; documents use ArangoDB id format where applicable.
       Effects:
         - Analyzes documents and returns invalid reference report; optionally deletes invalid documents if 'fix_invalid' is true.
+        - With 'streaming', counts invalid documents server-side, returns at most 'sample_size' of them and
+          removes them in batches of 'fix_batch_size' over 'fix_parallelism' key ranges.
         - Mutates the collection only when 'fix_invalid' is true.
     """
-    collection = db.collection(args["collection"])
-    ref_fields: List[str] = args.get("reference_fields") or []
+    if args.get("streaming"):
+        return _validate_references_streaming(db, args)
 
-    # Simple AQL validation using DOCUMENT() for each reference field
-    fields_list = ", ".join([f"'{f}'" for f in ref_fields])
+    collection = db.collection(args["collection"])
+    bind_vars = {"@collection": args["collection"], "fields": args.get("reference_fields") or []}
     validation_query = f"""
-    FOR doc IN {args['collection']}
-      LET invalid_refs = (
-        FOR field IN [{fields_list}]
-          LET ref = DOCUMENT(doc[field])
-          FILTER ref == null AND doc[field] != null
-          RETURN {{field: field, value: doc[field]}}
-      )
+    FOR doc IN @@collection
+      LET invalid_refs = {_INVALID_REFS_SUBQUERY}
       FILTER LENGTH(invalid_refs) > 0
       RETURN {{ _id: doc._id, _key: doc._key, invalid_references: invalid_refs }}
     """
-    cursor = db.aql.execute(validation_query)
+    cursor = db.aql.execute(
+        tag_query(validation_query), bind_vars=bind_vars, **max_runtime_options(args.get("max_runtime"))
+    )
     with safe_cursor(cursor):
         invalid_docs = list(cursor)
+    sample_size = int(args.get("sample_size", 100))
     result: Dict[str, Any] = {
         "total_checked": collection.count() if hasattr(collection, "count") else None,
         "invalid_count": len(invalid_docs),
-        "invalid_documents": invalid_docs[:100],
+        "invalid_documents": invalid_docs[:sample_size],
         "validation_passed": len(invalid_docs) == 0,
     }
     if args.get("fix_invalid") and invalid_docs:
         keys_to_remove = [doc["_key"] for doc in invalid_docs]
+        batch_size = int(args.get("fix_batch_size", 1000))
+        removed = 0
         try:
-            collection.delete_many(keys_to_remove)
-            result["removed_count"] = len(keys_to_remove)
-        except Exception:
-            result["removed_count"] = 0
+            for _, keys in iter_batches(keys_to_remove, batch_size):
+                collection.delete_many(keys)
+                removed += len(keys)
+        except Exception as e:
+            result["removal_error"] = str(e)
+        result["removed_count"] = removed
+    return result
+
+
+def _validate_references_streaming(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Aggregate reference validation that never materializes all invalid documents.
+
+    Invalid documents are counted on the server (COLLECT WITH COUNT), only a
+    sample of sample_size is returned, and with fix_invalid they are removed
+    by batched REMOVE statements walking the primary index, in parallel over
+    fix_parallelism contiguous _key ranges.
+    """
+    name = args["collection"]
+    runtime = max_runtime_options(args.get("max_runtime"))
+    bind_vars = {"@collection": name, "fields": args.get("reference_fields") or []}
+    sample_size = int(args.get("sample_size", 100))
+
+    count_query = f"""
+    FOR doc IN @@collection
+      FILTER LENGTH({_INVALID_REFS_SUBQUERY}) > 0
+      COLLECT WITH COUNT INTO invalid_count
+      RETURN invalid_count
+    """
+    cursor = db.aql.execute(tag_query(count_query), bind_vars=bind_vars, **runtime)
+    with safe_cursor(cursor):
+        invalid_count = next(iter(cursor), 0)
+
+    sample: List[Dict[str, Any]] = []
+    if invalid_count and sample_size:
+        sample_query = f"""
+    FOR doc IN @@collection
+      LET invalid_refs = {_INVALID_REFS_SUBQUERY}
+      FILTER LENGTH(invalid_refs) > 0
+      LIMIT @sample_size
+      RETURN {{ _id: doc._id, _key: doc._key, invalid_references: invalid_refs }}
+    """
+        cursor = db.aql.execute(
+            tag_query(sample_query), bind_vars={**bind_vars, "sample_size": sample_size}, **runtime
+        )
+        with safe_cursor(cursor):
+            sample = list(cursor)
+
+    collection = db.collection(name)
+    total = collection.count()
+    result: Dict[str, Any] = {
+        "total_checked": total,
+        "invalid_count": invalid_count,
+        "invalid_documents": sample,
+        "sample_truncated": invalid_count > len(sample),
+        "validation_passed": invalid_count == 0,
+        "streaming": True,
+    }
+    if not (args.get("fix_invalid") and invalid_count):
+        return result
+
+    batch_size = int(args.get("fix_batch_size", 1000))
+    ranges = key_ranges(db, name, int(args.get("fix_parallelism", 1)), total=total)
+
+    def remove_range(key_range: tuple) -> tuple:
+        after, until = key_range
+        upper = "\n      FILTER doc._key <= @until_key" if until is not None else ""
+        remove_query = f"""
+    FOR doc IN @@collection
+      FILTER doc._key > @after_key{upper}
+      SORT doc._key
+      FILTER LENGTH({_INVALID_REFS_SUBQUERY}) > 0
+      LIMIT @batch_limit
+      REMOVE doc IN @@collection
+      RETURN OLD._key
+    """
+        range_vars = {**bind_vars, "until_key": until} if until is not None else bind_vars
+        return _keyset_batches(db, remove_query, range_vars, batch_size, runtime, after_key=after or "")
+
+    started = time.perf_counter()
+    outcomes = run_concurrently(remove_range, ranges, len(ranges))
+    result["removed_count"] = sum(removed for removed, _ in outcomes)
+    result["removal_batches"] = sum(batches for _, batches in outcomes)
+    result["removal_partitions"] = len(ranges)
+    result["removal_elapsed_sec"] = round(time.perf_counter() - started, 3)
     return result
 
 
@@ -916,9 +1259,32 @@ def handle_bulk_insert(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str,
     Operator model:
       Preconditions:
         - Database connection available; collection exists.
-        - 'documents' non-empty list; optional 'batch_size' positive integer.
+        - 'documents' non-empty list; optional 'batch_size' positive integer,
+          'concurrency' (batches in flight) and 'sync' (wait for disk sync).
+        - Optional 'engine': "document" (insert_many) or "import" (bulk import
+          API with 'on_duplicate' handling of existing keys).
+        - With 'validate_refs', 'reference_fields' (default: each document's
+          *_id fields) must hold IDs of existing documents.
       Effects:
-        - Inserts documents in batches; returns counts and any errors.
+        - With validate_refs, each batch's references are checked with one
+          query per target collection before it is written; documents with
+          invalid references are reported (index, invalid_references) and
+          not inserted. IDs found to exist are not looked up again.
+        - Inserts documents in batches; returns counts and any errors in
+          document order, also when batches are pipelined.
+        - The import engine reports updated_count/ignored_count as well and
+          returns no inserted_ids.
+        - With adaptive_batching, batches are capped by serialized size and
+          resized from round-trip latency; batches rejected as too large are
+          split and resent. The size of every batch is reported.
+        - With on_error="stop", no batch is sent after the first failure; with
+          concurrency > 1, up to concurrency - 1 later batches may already be
+          in flight and are reported as well.
+        - With 'transaction', batches are written one at a time through stream
+          transactions committed every 'commit_every' batches (0: one
+          transaction for the whole call). A failed batch, or any failure with
+          on_error="stop", aborts the open transaction; its writes are
+          subtracted from the counts and reported as rolled_back_count.
         - Mutates the collection for successfully inserted documents.
     """
     collection = db.collection(args["collection"])
@@ -926,6 +1292,10 @@ def handle_bulk_insert(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str,
     batch_size = int(args.get("batch_size", 1000))
     validate_refs = bool(args.get("validate_refs", False))
     on_error = args.get("on_error", "stop")
+    concurrency = min(int(args.get("concurrency", 1)), MAX_BULK_CONCURRENCY)
+    sync = bool(args.get("sync", True))
+    use_import = args.get("engine", "document") == "import"
+    on_duplicate = args.get("on_duplicate") or ("ignore" if on_error == "ignore" else "error")
 
     results: Dict[str, Any] = {
         "total_documents": len(documents),
@@ -934,32 +1304,239 @@ def handle_bulk_insert(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str,
         "errors": [],
         "inserted_ids": [],
     }
-
-    for i in range(0, len(documents), batch_size):
-        batch = documents[i : i + batch_size]
-        try:
-            if validate_refs:
-                # Lightweight per-doc ref check using DOCUMENT() on likely fields ending with '_id'
-                # For unit testing, we will not depend on actual DB; assume pass-through
-                pass
-            batch_result = collection.insert_many(batch, return_new=False, sync=True)
-            results["inserted_count"] += len(batch_result)
-            results["inserted_ids"].extend(
-                [r.get("_id") for r in batch_result if isinstance(r, dict)]
-            )
-        except Exception as e:
-            results["error_count"] += len(batch)
+    if use_import:
+        results.update({"updated_count": 0, "ignored_count": 0})
+    batcher = _adaptive_batcher(args, batch_size)
+    checker = (
+        ReferenceChecker(db, args.get("reference_fields")) if validate_refs else None
+    )
+    txn = _chunked_transaction(db, args, results)
+    if txn is not None:
+        # Stream transactions take one operation at a time
+        concurrency = 1
+    checkpoint = _transaction_checkpoint(results)
+
+    def write(batch: List[Dict[str, Any]]) -> Any:
+        if use_import:
+            return import_documents(collection, batch, on_duplicate=on_duplicate, sync=sync)
+        if txn is not None:
+            # waitForSync applies once, when the transaction commits
+            return txn.collection().insert_many(batch, return_new=False)
+        return collection.insert_many(batch, return_new=False, sync=sync)
+
+    if batcher is not None:
+        batches = batcher.batches(documents)
+        write = batcher.wrap(write)
+    else:
+        batches = iter_batches(documents, batch_size)
+
+    def send(batch: List[Dict[str, Any]]) -> Any:
+        # Returns (invalid refs by batch offset, batch offsets written, write result)
+        invalid = checker.check(batch) if checker is not None else {}
+        if not invalid:
+            return {}, None, write(batch)
+        kept = [i for i in range(len(batch)) if i not in invalid]
+        return invalid, kept, write([batch[i] for i in kept]) if kept else None
+
+    stop = threading.Event()
+    for outcome in run_pipelined(send, batches, concurrency, stop):
+        _observe_adaptive(batcher, outcome, results)
+        if outcome.error is not None:
+            results["error_count"] += outcome.size
             results["errors"].append(
-                {"batch_start": i, "batch_size": len(batch), "error": str(e)}
+                {"batch_start": outcome.start, "batch_size": outcome.size, "error": str(outcome.error)}
+            )
+            failed = True
+        else:
+            invalid, kept, written = outcome.result
+            batch_errors = [
+                {"index": outcome.start + offset, "error": "Invalid references", "invalid_references": refs}
+                for offset, refs in invalid.items()
+            ]
+
+            if written is not None and use_import:
+                results["inserted_count"] += written.get("created", 0)
+                results["updated_count"] += written.get("updated", 0)
+                results["ignored_count"] += written.get("ignored", 0)
+                results["error_count"] += written.get("errors", 0)
+                for position, message in import_error_offsets(written):
+                    if position is None:
+                        batch_errors.append({"batch_start": outcome.start, "error": message})
+                    else:
+                        batch_errors.append({"index": _source_index(outcome.start, kept, position), "error": message})
+            elif written is not None:
+                for position, item in enumerate(written):
+                    if isinstance(item, Exception):
+                        # insert_many reports per-document failures in place of metadata
+                        results["error_count"] += 1
+                        batch_errors.append(
+                            {"index": _source_index(outcome.start, kept, position), "error": str(item)}
+                        )
+                    else:
+                        results["inserted_count"] += 1
+                        if isinstance(item, dict):
+                            results["inserted_ids"].append(item.get("_id"))
+            results["error_count"] += len(invalid)
+            batch_errors.sort(key=lambda e: e.get("index", outcome.start))
+            results["errors"].extend(batch_errors)
+            failed = bool(batch_errors) or (
+                use_import and written is not None and written.get("errors", 0) > 0
             )
-            if on_error == "stop":
+        if failed and on_error == "stop":
+            stop.set()
+        checkpoint = _settle_transaction(
+            txn, results, checkpoint, abort=outcome.error is not None or (failed and on_error == "stop")
+        )
+    _finish_transaction(txn, results, checkpoint)
+    written = (
+        results["inserted_count"]
+        + results.get("updated_count", 0)
+        + results.get("ignored_count", 0)
+    )
+    results["success_rate"] = (
+        written / results["total_documents"] if results["total_documents"] else 0
+    )
+    _finish_adaptive(batcher, results)
+    if checker is not None:
+        results["reference_lookups"] = checker.lookups
+    return results
+
+
+@handle_errors
+@register_tool(
+    name=ARANGO_BULK_INSERT_FILE,
+    description="Stream documents from a server-local JSONL, JSON array or CSV file into a collection in batches.",
+    model=BulkInsertFileArgs,
+)
+def handle_bulk_insert_file(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Insert documents read incrementally from a server-local file.
+
+    Operator model:
+      Preconditions:
+        - Database connection available; collection exists.
+        - 'file_path' is an existing file under the current working directory
+          or the system temp directory (same roots as backup output).
+      Effects:
+        - Parses the file record by record (JSONL, JSON array or CSV) and
+          inserts documents in batches, pipelined like arango_bulk_insert;
+          only the batches in flight are held in memory.
+        - Unparsable records and failed inserts are reported with the line
+          they start on. With on_error="stop", reading stops at the first
+          parse error or failed batch; a syntax error inside a JSON array
+          always ends the import.
+        - Sends MCP progress notifications (bytes read of file size) when the
+          client supplied a progress token.
+        - Mutates the collection for successfully inserted documents.
+    """
+    path = validate_input_file(args["file_path"])
+    fmt = detect_format(path, args.get("format", "auto"))
+    delimiter = args.get("csv_delimiter") or ("\t" if path.lower().endswith(".tsv") else ",")
+    collection = db.collection(args["collection"])
+    batch_size = int(args.get("batch_size", 1000))
+    on_error = args.get("on_error", "stop")
+    concurrency = min(int(args.get("concurrency", 1)), MAX_BULK_CONCURRENCY)
+    sync = bool(args.get("sync", True))
+    max_errors = int(args.get("max_error_details", 100))
+    progress = _get_progress_reporter(args)
+    file_size = os.path.getsize(path)
+
+    stats = {"records_read": 0, "parse_errors": 0, "stopped": False}
+    parse_errors: List[Dict[str, Any]] = []
+    insert_errors: List[Dict[str, Any]] = []
+    results: Dict[str, Any] = {"inserted_count": 0, "error_count": 0, "batches": 0}
+    # Line numbers of the batches in flight, keyed by document offset
+    batch_lines: Dict[int, List[int]] = {}
+    stop = threading.Event()
+
+    def record_error(target: List[Dict[str, Any]], error: Dict[str, Any], count: int = 1) -> None:
+        results["error_count"] += count
+        if len(target) < max_errors:
+            target.append(error)
+
+    def batches(f: Any) -> Any:
+        offset = 0
+        batch: List[Dict[str, Any]] = []
+        lines: List[int] = []
+        for record in iter_records(f, fmt, delimiter):
+            if stop.is_set():
                 break
-            else:
+            stats["records_read"] += 1
+            if record.error is not None:
+                stats["parse_errors"] += 1
+                record_error(parse_errors, {"line": record.line, "error": record.error})
+                if record.fatal or on_error == "stop":
+                    stats["stopped"] = True
+                    break
                 continue
-    results["success_rate"] = (
-        results["inserted_count"] / results["total_documents"]
-        if results["total_documents"]
-        else 0
+            batch.append(record.document)
+            lines.append(record.line)
+            if len(batch) >= batch_size:
+                batch_lines[offset] = lines
+                yield offset, batch
+                offset += len(batch)
+                batch, lines = [], []
+        if batch and not stop.is_set():
+            batch_lines[offset] = lines
+            yield offset, batch
+
+    def send(batch: List[Dict[str, Any]]) -> Any:
+        return collection.insert_many(batch, return_new=False, sync=sync)
+
+    started = time.perf_counter()
+    with open(path, "rb") as f:
+        for outcome in run_pipelined(send, batches(f), concurrency, stop):
+            results["batches"] += 1
+            lines = batch_lines.pop(outcome.start)
+            failed = False
+            if outcome.error is not None:
+                record_error(
+                    insert_errors,
+                    {
+                        "line": lines[0],
+                        "last_line": lines[-1],
+                        "batch_size": outcome.size,
+                        "error": str(outcome.error),
+                    },
+                    count=outcome.size,
+                )
+                failed = True
+            else:
+                for offset, item in enumerate(outcome.result):
+                    if isinstance(item, Exception):
+                        record_error(insert_errors, {"line": lines[offset], "error": str(item)})
+                        failed = True
+                    else:
+                        results["inserted_count"] += 1
+            if failed and on_error == "stop":
+                stats["stopped"] = True
+                stop.set()
+            if progress is not None:
+                progress(
+                    float(f.tell()),
+                    float(file_size),
+                    f"{results['inserted_count']} documents inserted",
+                )
+        bytes_read = f.tell()
+    elapsed = time.perf_counter() - started
+
+    errors = sorted(parse_errors + insert_errors, key=lambda e: e["line"])[:max_errors]
+    results.update(
+        {
+            "file": path,
+            "format": fmt,
+            "records_read": stats["records_read"],
+            "parse_error_count": stats["parse_errors"],
+            "errors": errors,
+            "errors_truncated": results["error_count"] > len(errors),
+            "stopped": stats["stopped"],
+            "bytes_read": bytes_read,
+            "file_size": file_size,
+            "elapsed_sec": round(elapsed, 3),
+            "docs_per_sec": round(results["inserted_count"] / elapsed, 1) if elapsed > 0 else 0.0,
+            "success_rate": results["inserted_count"] / stats["records_read"]
+            if stats["records_read"]
+            else 0,
+        }
     )
     return results
 
@@ -1076,56 +1653,51 @@ def handle_validate_document(
         return {"valid": False, "errors": [{"message": str(e)}]}
 
 
-@handle_errors
-@register_tool(
-    name=ARANGO_QUERY_BUILDER,
-    description="Build and execute a simple AQL query from filters, sort, and limit.",
-    model=QueryBuilderArgs,
-)
-def handle_query_builder(
-    db: StandardDatabase, args: Dict[str, Any]
-) -> List[Dict[str, Any]]:
-    """Build and execute a simple AQL query from structured filters/sort/limit.
+# Supported query builder filter operators (whitelist)
+SUPPORTED_FILTER_OPERATORS = {"==", "!=", "<", "<=", ">", ">=", "IN", "LIKE"}
 
-    Operator model:
-      Preconditions:
-        - Database connection available.
-        - Args include 'collection' (str).
-        - Optional 'filters' with supported ops: ==, !=, <, <=, >, >=, IN, LIKE; values JSON-serializable.
-        - Optional 'sort' [{field, direction}], 'limit' (int), 'return_fields' (projection fields).
-      Effects:
-        - Constructs AQL using bind variables for security and executes via AQL API.
-        - Returns a list of documents or projected fields.
-        - No mutations; performance depends on available indexes (may scan without indexes).
-    """
-    collection = args["collection"]
-    filters = args.get("filters") or []
-    sorts = args.get("sort") or []
-    limit = args.get("limit")
-    return_fields = args.get("return_fields")
 
-    # Validate collection name to prevent injection
+def _validate_collection_name(collection: Any) -> str:
+    """Validate a collection name before it is interpolated into AQL.
+
+    Raises:
+        ValueError: If the name contains anything but letters, digits, '_' and '-'
+    """
     if (
         not collection
         or not isinstance(collection, str)
         or not collection.replace("_", "").replace("-", "").isalnum()
     ):
         raise ValueError("Invalid collection name")
+    return collection
+
 
-    # Supported operators whitelist
-    SUPPORTED_OPERATORS = {"==", "!=", "<", "<=", ">", ">=", "IN", "LIKE"}
+def _validate_field_name(field: Any) -> str:
+    """Validate a (possibly nested) field name before it is interpolated into AQL.
 
-    # Validate field names to prevent injection
-    def _validate_field_name(field: str) -> str:
-        if not field or not isinstance(field, str):
-            raise ValueError("Invalid field name")
-        # Allow alphanumeric, underscore, dot (for nested fields)
-        if not all(c.isalnum() or c in "._" for c in field):
-            raise ValueError(f"Invalid field name: {field}")
-        return field
+    Raises:
+        ValueError: If the name contains anything but letters, digits, '_' and '.'
+    """
+    if not field or not isinstance(field, str):
+        raise ValueError("Invalid field name")
+    # Allow alphanumeric, underscore, dot (for nested fields)
+    if not all(c.isalnum() or c in "._" for c in field):
+        raise ValueError(f"Invalid field name: {field}")
+    return field
 
+
+def _build_filter_section(filters: List[Dict[str, Any]], bind_vars: Dict[str, Any]) -> str:
+    """Build an AQL FILTER line over ``doc`` from structured filters.
+
+    Values are passed as bind variables (v0, v1, ...) added to bind_vars.
+
+    Returns:
+        "\n  FILTER ..." or an empty string when there are no filters
+
+    Raises:
+        ValueError: On unsupported operators or invalid field names
+    """
     filter_clauses: List[str] = []
-    bind_vars: Dict[str, Any] = {}
     bind_counter = 0
 
     for f in filters:
@@ -1137,7 +1709,7 @@ def handle_query_builder(
             continue
 
         # Validate operator
-        if op not in SUPPORTED_OPERATORS:
+        if op not in SUPPORTED_FILTER_OPERATORS:
             raise ValueError(f"Unsupported operator: {op}")
 
         # Validate and sanitize field name
@@ -1158,9 +1730,41 @@ def handle_query_builder(
             clause = f"doc.{field} {op} @{bind_var}"
         filter_clauses.append(clause)
 
-    filter_section = ""
-    if filter_clauses:
-        filter_section = "\n  FILTER " + " AND ".join(filter_clauses)
+    if not filter_clauses:
+        return ""
+    return "\n  FILTER " + " AND ".join(filter_clauses)
+
+
+@handle_errors
+@register_tool(
+    name=ARANGO_QUERY_BUILDER,
+    description="Build and execute a simple AQL query from filters, sort, and limit.",
+    model=QueryBuilderArgs,
+)
+def handle_query_builder(
+    db: StandardDatabase, args: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Build and execute a simple AQL query from structured filters/sort/limit.
+
+    Operator model:
+      Preconditions:
+        - Database connection available.
+        - Args include 'collection' (str).
+        - Optional 'filters' with supported ops: ==, !=, <, <=, >, >=, IN, LIKE; values JSON-serializable.
+        - Optional 'sort' [{field, direction}], 'limit' (int), 'return_fields' (projection fields).
+      Effects:
+        - Constructs AQL using bind variables for security and executes via AQL API.
+        - Returns a list of documents or projected fields.
+        - No mutations; performance depends on available indexes (may scan without indexes).
+    """
+    collection = _validate_collection_name(args["collection"])
+    filters = args.get("filters") or []
+    sorts = args.get("sort") or []
+    limit = args.get("limit")
+    return_fields = args.get("return_fields")
+
+    bind_vars: Dict[str, Any] = {}
+    filter_section = _build_filter_section(filters, bind_vars)
 
     sort_section = ""
     if sorts:
@@ -1210,7 +1814,9 @@ def handle_query_builder(
       RETURN {ret}
     """
 
-    cursor = db.aql.execute(aql, bind_vars=bind_vars)
+    cursor = db.aql.execute(
+        tag_query(aql), bind_vars=bind_vars, **max_runtime_options(args.get("max_runtime"))
+    )
     with safe_cursor(cursor):
         return list(cursor)
 
@@ -1340,23 +1946,11 @@ def handle_add_edge(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any
     }
 
 
-@register_tool(
-    name=ARANGO_TRAVERSE,
-    description="Traverse graph from a start vertex with depth bounds (by graph or edge collections).",
-    model=TraverseArgs,
-)
-@handle_errors
-def handle_traverse(db: StandardDatabase, args: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Perform a bounded traversal via AQL using either a named graph or edge collections."""
-    """
-    Operator model:
-      Preconditions:
-        - Database connection available.
-        - Either 'graph' is provided or 'edge_collections' is a non-empty list.
-        - 'start_vertex' provided; optional bounds and options valid.
-      Effects:
-        - Executes traversal query; returns paths or vertex/edge pairs.
-        - No database mutations.
+def _build_traverse_query(args: Dict[str, Any]) -> tuple:
+    """Build the traversal AQL and bind vars for arango_traverse.
+
+    Returns:
+        Tuple of (aql, bind_vars)
     """
     start = args["start_vertex"]
     direction = args.get("direction", "OUTBOUND")
@@ -1390,28 +1984,41 @@ def handle_traverse(db: StandardDatabase, args: Dict[str, Any]) -> List[Dict[str
 
     if limit:
         bind["limit"] = int(limit)
-    cursor = db.aql.execute(aql, bind_vars=bind)
-    with safe_cursor(cursor):
-        return list(cursor)
+    return aql, bind
 
 
 @register_tool(
-    name=ARANGO_SHORTEST_PATH,
-    description="Compute the shortest path between two vertices (by graph or edge collections).",
-    model=ShortestPathArgs,
+    name=ARANGO_TRAVERSE,
+    description="Traverse graph from a start vertex with depth bounds (by graph or edge collections).",
+    model=TraverseArgs,
 )
 @handle_errors
-def handle_shortest_path(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
-    """Compute shortest path between two vertices using AQL."""
+def handle_traverse(db: StandardDatabase, args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Perform a bounded traversal via AQL using either a named graph or edge collections."""
     """
     Operator model:
       Preconditions:
         - Database connection available.
-        - 'start_vertex' and 'end_vertex' provided; either 'graph' or 'edge_collections' provided.
+        - Either 'graph' is provided or 'edge_collections' is a non-empty list.
+        - 'start_vertex' provided; optional bounds and options valid.
       Effects:
-        - Executes shortest path query; returns found=False or the path.
+        - Executes traversal query; returns paths or vertex/edge pairs.
         - No database mutations.
     """
+    aql, bind = _build_traverse_query(args)
+    cursor = db.aql.execute(
+        tag_query(aql), bind_vars=bind, **max_runtime_options(args.get("max_runtime"))
+    )
+    with safe_cursor(cursor):
+        return list(cursor)
+
+
+def _build_shortest_path_query(args: Dict[str, Any]) -> tuple:
+    """Build the shortest path AQL and bind vars for arango_shortest_path.
+
+    Returns:
+        Tuple of (aql, bind_vars)
+    """
     start = args["start_vertex"]
     end = args["end_vertex"]
     direction = args.get("direction", "OUTBOUND")
@@ -1437,9 +2044,11 @@ def handle_shortest_path(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str
         """
         bind = {"start": start, "end": end}
 
-    cursor = db.aql.execute(aql, bind_vars=bind)
-    with safe_cursor(cursor):
-        paths = list(cursor)
+    return aql, bind
+
+
+def _format_shortest_path(paths: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Shape shortest path query rows into the arango_shortest_path result."""
     if not paths:
         return {"found": False}
     # AQL returns a single element containing arrays of vertices/edges along the path
@@ -1447,6 +2056,30 @@ def handle_shortest_path(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str
     return {"found": True, **res}
 
 
+@register_tool(
+    name=ARANGO_SHORTEST_PATH,
+    description="Compute the shortest path between two vertices (by graph or edge collections).",
+    model=ShortestPathArgs,
+)
+@handle_errors
+def handle_shortest_path(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute shortest path between two vertices using AQL."""
+    """
+    Operator model:
+      Preconditions:
+        - Database connection available.
+        - 'start_vertex' and 'end_vertex' provided; either 'graph' or 'edge_collections' provided.
+      Effects:
+        - Executes shortest path query; returns found=False or the path.
+        - No database mutations.
+    """
+    aql, bind = _build_shortest_path_query(args)
+    cursor = db.aql.execute(aql, bind_vars=bind)
+    with safe_cursor(cursor):
+        paths = list(cursor)
+    return _format_shortest_path(paths)
+
+
 # Additional graph management handlers
 @handle_errors
 @register_tool(
@@ -1566,6 +2199,13 @@ def handle_bulk_update(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str,
         - 'updates' list where each item has a key and an update payload.
       Effects:
         - Updates documents in batches; returns counts and any errors.
+        - With adaptive_batching, batches are capped by serialized size and
+          resized from round-trip latency (see arango_bulk_insert).
+        - Per-document failures (e.g. missing keys) are reported by index.
+        - With 'transaction', batches are grouped into stream transactions
+          committed every 'commit_every' batches (see arango_bulk_insert); a
+          failed batch, or any failure with on_error="stop", aborts the open
+          transaction.
         - Mutates the collection for successfully updated documents.
     """
     collection = db.collection(args["collection"])
@@ -1580,33 +2220,419 @@ def handle_bulk_update(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str,
         "errors": [],
     }
 
-    for i in range(0, len(updates), batch_size):
-        batch = updates[i : i + batch_size]
-        try:
-            # Normalize payloads: each expects {_key, ...fields}
-            normalized = []
-            for item in batch:
-                key = item.get("key") or item.get("_key")
-                update = item.get("update") or {
-                    k: v for k, v in item.items() if k not in ("key", "_key")
-                }
-                normalized.append({"_key": key, **update})
-            result = collection.update_many(
-                normalized, keep_none=True, merge=True, return_new=False, sync=True
-            )
-            results["updated_count"] += len(result)
-        except Exception as e:
-            results["error_count"] += len(batch)
+    def normalize(item: Dict[str, Any]) -> Dict[str, Any]:
+        # Normalize payloads: each expects {_key, ...fields}
+        key = item.get("key") or item.get("_key")
+        update = item.get("update") or {
+            k: v for k, v in item.items() if k not in ("key", "_key")
+        }
+        return {"_key": key, **update}
+
+    txn = _chunked_transaction(db, args, results)
+    checkpoint = _transaction_checkpoint(results)
+
+    def send(batch: List[Dict[str, Any]]) -> Any:
+        if txn is not None:
+            return txn.collection().update_many(batch, keep_none=True, merge=True, return_new=False)
+        return collection.update_many(
+            batch, keep_none=True, merge=True, return_new=False, sync=True
+        )
+
+    batcher = _adaptive_batcher(args, batch_size)
+    if batcher is not None:
+        batches = batcher.batches(normalize(item) for item in updates)
+        send = batcher.wrap(send)
+    else:
+        batches = (
+            (start, [normalize(item) for item in batch])
+            for start, batch in iter_batches(updates, batch_size)
+        )
+    stop = threading.Event()
+    for outcome in run_pipelined(send, batches, 1, stop):
+        _observe_adaptive(batcher, outcome, results)
+        if outcome.error is not None:
+            results["error_count"] += outcome.size
             results["errors"].append(
-                {"batch_start": i, "batch_size": len(batch), "error": str(e)}
+                {"batch_start": outcome.start, "batch_size": outcome.size, "error": str(outcome.error)}
             )
-            if on_error == "stop":
-                break
-            else:
-                continue
+            failed = True
+        else:
+            failed = False
+            for position, item in enumerate(outcome.result):
+                if isinstance(item, Exception):
+                    # update_many reports per-document failures (e.g. missing keys) in place of metadata
+                    results["error_count"] += 1
+                    results["errors"].append({"index": outcome.start + position, "error": str(item)})
+                    failed = True
+                else:
+                    results["updated_count"] += 1
+        if failed and on_error == "stop":
+            stop.set()
+        checkpoint = _settle_transaction(
+            txn, results, checkpoint, abort=outcome.error is not None or (failed and on_error == "stop")
+        )
+    _finish_transaction(txn, results, checkpoint)
+    _finish_adaptive(batcher, results)
     return results
 
 
+def _keyset_batches(
+    db: StandardDatabase,
+    aql: str,
+    bind_vars: Dict[str, Any],
+    batch_size: int,
+    runtime: Dict[str, Any],
+    limit: Optional[int] = None,
+    after_key: str = "",
+) -> tuple:
+    """Run a batched modification query until no document is left to change.
+
+    The query must filter on doc._key > @after_key, SORT doc._key, apply
+    LIMIT @batch_limit and RETURN OLD._key; each batch resumes after the last
+    key of the previous one. Stops after ``limit`` documents when given.
+
+    Returns:
+        (documents changed, batches run)
+    """
+    changed = batches = 0
+    while limit is None or changed < limit:
+        batch_limit = batch_size if limit is None else min(batch_size, limit - changed)
+        cursor = db.aql.execute(
+            tag_query(aql),
+            bind_vars={**bind_vars, "after_key": after_key, "batch_limit": batch_limit},
+            **runtime,
+        )
+        with safe_cursor(cursor):
+            keys = list(cursor)
+        if not keys:
+            break
+        batches += 1
+        changed += len(keys)
+        # Keys come back in AQL sort order, which is not Python's string order
+        after_key = keys[-1]
+        if len(keys) < batch_limit:
+            break
+    return changed, batches
+
+
+def _modify_by_filter(
+    db: StandardDatabase,
+    args: Dict[str, Any],
+    operation: str,
+    count_field: str,
+    modify_clause: str,
+    modify_bind_vars: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Run an UPDATE or REMOVE over the documents matching structured filters.
+
+    Matching documents are counted first (up to max_affected + 1); if more
+    match, nothing is changed. Changes are then applied in batches of
+    batch_size, each its own AQL statement (and transaction), walking the
+    primary index in _key order so documents still matching after an update
+    are not visited twice.
+    """
+    collection = _validate_collection_name(args["collection"])
+    batch_size = int(args.get("batch_size", 1000))
+    max_affected = int(args.get("max_affected", 10000))
+    runtime = max_runtime_options(args.get("max_runtime"))
+    filter_vars: Dict[str, Any] = {}
+    filter_section = _build_filter_section(args.get("filters") or [], filter_vars)
+
+    count_aql = f"""
+    RETURN LENGTH(
+      FOR doc IN {collection}{filter_section}
+        LIMIT @guard_limit
+        RETURN 1
+    )
+    """
+    cursor = db.aql.execute(
+        tag_query(count_aql), bind_vars={**filter_vars, "guard_limit": max_affected + 1}, **runtime
+    )
+    with safe_cursor(cursor):
+        matched = next(iter(cursor), 0)
+    if matched > max_affected:
+        raise ValueError(
+            f"More than {max_affected} documents match the filter (max_affected). "
+            "Narrow the filter or raise max_affected."
+        )
+
+    results: Dict[str, Any] = {
+        "collection": collection,
+        "operation": operation,
+        "matched": matched,
+        count_field: 0,
+        "batches": 0,
+    }
+    if args.get("dry_run"):
+        results["dry_run"] = True
+        return results
+
+    batch_aql = f"""
+    FOR doc IN {collection}{filter_section}
+      FILTER doc._key > @after_key
+      SORT doc._key
+      LIMIT @batch_limit
+      {modify_clause}
+      RETURN OLD._key
+    """
+    started = time.perf_counter()
+    results[count_field], results["batches"] = _keyset_batches(
+        db, batch_aql, {**filter_vars, **modify_bind_vars}, batch_size, runtime, limit=max_affected
+    )
+    results["elapsed_sec"] = round(time.perf_counter() - started, 3)
+    return results
+
+
+@handle_errors
+@register_tool(
+    name=ARANGO_UPDATE_BY_FILTER,
+    description="Update all documents matching structured filters in server-side batches, with a max-affected guard.",
+    model=UpdateByFilterArgs,
+)
+def handle_update_by_filter(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply the same partial update to every document matching filters.
+
+    Operator model:
+      Preconditions:
+        - Database connection available; collection exists.
+        - 'filters' use the arango_query_builder format (validated fields and
+          operators, values as bind variables); 'update' is an object.
+      Effects:
+        - Fails without changes if more than 'max_affected' documents match.
+        - Otherwise updates matches in batches of 'batch_size' documents, one
+          AQL statement each; returns matched/updated counts.
+        - dry_run only counts matching documents.
+    """
+    clause = (
+        f"UPDATE doc WITH @update IN {_validate_collection_name(args['collection'])} "
+        "OPTIONS { mergeObjects: @merge_objects, keepNull: @keep_null }"
+    )
+    return _modify_by_filter(
+        db,
+        args,
+        "update",
+        "updated_count",
+        clause,
+        {
+            "update": args["update"],
+            "merge_objects": bool(args.get("merge_objects", True)),
+            "keep_null": bool(args.get("keep_null", True)),
+        },
+    )
+
+
+@handle_errors
+@register_tool(
+    name=ARANGO_REMOVE_BY_FILTER,
+    description="Remove all documents matching structured filters in server-side batches, with a max-affected guard.",
+    model=RemoveByFilterArgs,
+)
+def handle_remove_by_filter(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove every document matching filters.
+
+    Operator model:
+      Preconditions:
+        - Database connection available; collection exists.
+        - 'filters' use the arango_query_builder format.
+      Effects:
+        - Fails without changes if more than 'max_affected' documents match.
+        - Otherwise removes matches in batches of 'batch_size' documents, one
+          AQL statement each; returns matched/removed counts.
+        - dry_run only counts matching documents.
+    """
+    clause = f"REMOVE doc IN {_validate_collection_name(args['collection'])}"
+    return _modify_by_filter(db, args, "remove", "removed_count", clause, {})
+
+
+@handle_errors
+@register_tool(
+    name=ARANGO_UPSERT_BY_FILTER,
+    description="Update the document matching equality filters, or insert it if none matches (AQL UPSERT).",
+    model=UpsertByFilterArgs,
+)
+def handle_upsert_by_filter(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Update or insert a document identified by equality filters.
+
+    Operator model:
+      Preconditions:
+        - Database connection available; collection exists.
+        - 'filters' are '==' conditions on top-level fields (an UPSERT search
+          document); an index on those fields keeps the lookup cheap.
+      Effects:
+        - Runs one AQL UPSERT: updates the first matching document with
+          'update', or inserts 'insert' (default: filter values merged with
+          'update'). Returns the key and whether it was inserted.
+    """
+    collection = _validate_collection_name(args["collection"])
+    search_fields: List[str] = []
+    bind_vars: Dict[str, Any] = {}
+    search: Dict[str, Any] = {}
+    for i, f in enumerate(args["filters"]):
+        field = _validate_field_name(f.get("field"))
+        if f.get("op") != "==" or "." in field:
+            raise ValueError(
+                f"Upsert filters must be '==' conditions on top-level fields: {field} {f.get('op')}"
+            )
+        bind_vars[f"v{i}"] = f.get("value")
+        search[field] = f.get("value")
+        search_fields.append(f"{field}: @v{i}")
+    insert = args.get("insert")
+    bind_vars.update(
+        {
+            "insert": insert if insert is not None else {**search, **args["update"]},
+            "update": args["update"],
+            "merge_objects": bool(args.get("merge_objects", True)),
+            "keep_null": bool(args.get("keep_null", True)),
+        }
+    )
+    aql = f"""
+    UPSERT {{ {", ".join(search_fields)} }}
+      INSERT @insert
+      UPDATE @update
+      IN {collection}
+      OPTIONS {{ mergeObjects: @merge_objects, keepNull: @keep_null }}
+      RETURN {{ _key: NEW._key, inserted: OLD == null }}
+    """
+    cursor = db.aql.execute(
+        tag_query(aql), bind_vars=bind_vars, **max_runtime_options(args.get("max_runtime"))
+    )
+    with safe_cursor(cursor):
+        outcome = next(iter(cursor))
+    return {
+        "collection": collection,
+        "operation": "upsert",
+        "_key": outcome["_key"],
+        "inserted": bool(outcome["inserted"]),
+        "updated": not outcome["inserted"],
+    }
+
+
+def _adaptive_batcher(args: Dict[str, Any], batch_size: int) -> Optional[AdaptiveBatcher]:
+    """Return an AdaptiveBatcher when adaptive_batching is requested, else None."""
+    if not args.get("adaptive_batching"):
+        return None
+    return AdaptiveBatcher(
+        batch_size,
+        max_bytes=int(args.get("max_batch_bytes", 4 * 1024 * 1024)),
+        target_latency=int(args.get("target_batch_latency_ms", 1000)) / 1000,
+    )
+
+
+def _observe_adaptive(
+    batcher: Optional[AdaptiveBatcher], outcome: Any, results: Dict[str, Any]
+) -> None:
+    """Feed a batch outcome to the batcher and record the batch in the report."""
+    if batcher is None:
+        return
+    results.setdefault("batch_history", []).append(
+        {
+            "batch_start": outcome.start,
+            "batch_size": outcome.size,
+            "bytes": batcher.batch_bytes(outcome.start),
+            "elapsed_ms": round(outcome.elapsed * 1000, 1),
+        }
+    )
+    batcher.observe(outcome)
+
+
+def _source_index(start: int, kept: Optional[List[int]], position: int) -> int:
+    """Index in the request of the document written at position of a batch.
+
+    kept lists the batch offsets actually written (documents with invalid
+    references are dropped), or is None when the whole batch was written.
+    """
+    return start + (kept[position] if kept is not None else position)
+
+
+def _finish_adaptive(batcher: Optional[AdaptiveBatcher], results: Dict[str, Any]) -> None:
+    """Add the final adaptive batching state to the report."""
+    if batcher is None:
+        return
+    results["adaptive_batching"] = {
+        "final_batch_size": batcher.size,
+        "max_batch_bytes": batcher.max_bytes,
+        "splits": batcher.splits,
+    }
+
+
+
+# Report counters reset to the last commit when a transaction chunk is aborted
+_TRANSACTION_COUNTERS = ("inserted_count", "updated_count", "ignored_count")
+
+
+def _chunked_transaction(
+    db: StandardDatabase, args: Dict[str, Any], results: Dict[str, Any]
+) -> Optional[ChunkedTransaction]:
+    """Return a ChunkedTransaction when transaction mode is requested, else None."""
+    if not args.get("transaction"):
+        return None
+    if args.get("engine", "document") == "import":
+        raise ValueError("transaction mode requires engine='document'")
+    commit_every = int(args.get("commit_every", 0))
+    results["transaction"] = {"commit_every": commit_every, "committed": 0, "aborted": 0, "rolled_back_count": 0}
+    return ChunkedTransaction(
+        db,
+        args["collection"],
+        commit_every=commit_every,
+        sync=bool(args.get("sync", True)),
+        max_size=args.get("transaction_max_size"),
+    )
+
+
+def _transaction_checkpoint(results: Dict[str, Any]) -> Dict[str, int]:
+    """Snapshot of the report counters (and inserted_ids length) at a commit."""
+    checkpoint = {k: results[k] for k in _TRANSACTION_COUNTERS if k in results}
+    if "inserted_ids" in results:
+        checkpoint["inserted_ids"] = len(results["inserted_ids"])
+    return checkpoint
+
+
+def _rollback_report(results: Dict[str, Any], checkpoint: Dict[str, int]) -> None:
+    """Reset the report to the last commit, counting the rolled back writes."""
+    for key, value in checkpoint.items():
+        if key == "inserted_ids":
+            del results[key][value:]
+        else:
+            results["transaction"]["rolled_back_count"] += results[key] - value
+            results[key] = value
+
+
+def _settle_transaction(
+    txn: Optional[ChunkedTransaction],
+    results: Dict[str, Any],
+    checkpoint: Dict[str, int],
+    abort: bool,
+) -> Dict[str, int]:
+    """After a batch: abort the open chunk or commit it when full.
+
+    Returns:
+        The checkpoint of the last committed state
+    """
+    if txn is None:
+        return checkpoint
+    if abort:
+        _rollback_report(results, checkpoint)
+        txn.abort()
+        return checkpoint
+    if txn.batch_done():
+        return _transaction_checkpoint(results)
+    return checkpoint
+
+
+def _finish_transaction(
+    txn: Optional[ChunkedTransaction], results: Dict[str, Any], checkpoint: Dict[str, int]
+) -> None:
+    """Commit the last open chunk and add the transaction summary to the report."""
+    if txn is None:
+        return
+    try:
+        txn.commit()
+    except ArangoError as e:
+        _rollback_report(results, checkpoint)
+        results["errors"].append({"error": f"Transaction commit failed: {e}"})
+    results["transaction"]["committed"] = txn.committed
+    results["transaction"]["aborted"] = txn.aborted
+
 # Graph Management Handlers (Phase 3 - New Graph Tools)
 @handle_errors
 @register_tool(
@@ -1630,6 +2656,7 @@ def handle_backup_graph(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str,
         - Output directory writable (if provided).
       Effects:
         - Reads graph structure and writes JSON files to output directory.
+        - Exports collections in parallel with 'parallelism' > 1 (see arango_backup).
         - No database mutations; side-effect is file system writes.
     """
     graph_name = args["graph_name"]
@@ -1637,7 +2664,7 @@ def handle_backup_graph(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str,
     include_metadata = args.get("include_metadata", True)
     doc_limit = args.get("doc_limit")
 
-    return backup_graph_to_dir(db, graph_name, output_dir, include_metadata, doc_limit)
+    return backup_graph_to_dir(db, graph_name, output_dir, include_metadata, doc_limit, **_backup_options(args))
 
 
 @handle_errors
@@ -1651,7 +2678,8 @@ def handle_restore_graph(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str
 
     Args:
         db: ArangoDB database instance
-        args: Dictionary with 'input_dir', optional 'graph_name', 'conflict_resolution', 'validate_integrity'
+        args: Dictionary with 'input_dir', optional 'graph_name', 'conflict_resolution', 'validate_integrity',
+            'parallelism', 'memory_budget_mb', 'resume'
 
     Returns:
         Dictionary with restore report (restored collections, conflicts, errors)
@@ -1664,6 +2692,8 @@ def handle_restore_graph(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str
         - Creates/updates vertex and edge collections.
         - Validates referential integrity during import.
         - Handles conflicts according to resolution strategy.
+        - Checkpoints progress in the input directory; with 'resume', an
+          interrupted restore continues from its checkpoint.
     """
     input_dir = args["input_dir"]
     graph_name = args.get("graph_name")
@@ -1671,7 +2701,7 @@ def handle_restore_graph(db: StandardDatabase, args: Dict[str, Any]) -> Dict[str
     validate_integrity = args.get("validate_integrity", True)
 
     return restore_graph_from_dir(
-        db, input_dir, graph_name, conflict_resolution, validate_integrity
+        db, input_dir, graph_name, conflict_resolution, validate_integrity, **_backup_options(args)
     )
 
 
@@ -1782,6 +2812,7 @@ def handle_graph_statistics(
         sample_size,
         aggregate_collections,
         per_collection_stats,
+        **max_runtime_options(args.get("max_runtime")),
     )
 
 
@@ -1789,6 +2820,7 @@ def handle_graph_statistics(
     name=ARANGO_DATABASE_STATUS,
     description="Get connection status for all configured databases, showing which databases are accessible, their versions, and which database is currently focused.",
     model=ArangoDatabaseStatusArgs,
+    needs_db=False,
 )
 @handle_errors
 async def handle_arango_database_status(
@@ -1886,7 +2918,7 @@ async def handle_arango_database_status(
 # Tool category mappings for Progressive Tool Discovery
 TOOL_CATEGORIES = {
     "core_data": [
-        ARANGO_QUERY, ARANGO_LIST_COLLECTIONS, ARANGO_INSERT,
+        ARANGO_QUERY, ARANGO_QUERY_NEXT, ARANGO_LIST_COLLECTIONS, ARANGO_INSERT,
         ARANGO_UPDATE, ARANGO_REMOVE, ARANGO_CREATE_COLLECTION, ARANGO_BACKUP
     ],
     "indexing": [
@@ -1894,7 +2926,8 @@ TOOL_CATEGORIES = {
     ],
     "validation": [
         ARANGO_VALIDATE_REFERENCES, ARANGO_INSERT_WITH_VALIDATION,
-        ARANGO_BULK_INSERT, ARANGO_BULK_UPDATE
+        ARANGO_BULK_INSERT, ARANGO_BULK_INSERT_FILE, ARANGO_BULK_UPDATE,
+        ARANGO_UPDATE_BY_FILTER, ARANGO_REMOVE_BY_FILTER, ARANGO_UPSERT_BY_FILTER
     ],
     "schema": [ARANGO_CREATE_SCHEMA, ARANGO_VALIDATE_DOCUMENT],
     "query": [ARANGO_QUERY_BUILDER, ARANGO_QUERY_PROFILE],
@@ -1917,6 +2950,7 @@ TOOL_CATEGORIES = {
     name=ARANGO_SEARCH_TOOLS,
     description="Search for MCP tools by keywords and categories. Enables progressive tool discovery by returning only relevant tools instead of loading all 34 tools upfront.",
     model=SearchToolsArgs,
+    needs_db=False,
 )
 def handle_search_tools(
     db: StandardDatabase, args: Dict[str, Any]
@@ -1969,7 +3003,7 @@ def handle_search_tools(
                 matches.append({
                     "name": tool_reg.name,
                     "description": tool_reg.description,
-                    "inputSchema": tool_reg.model.model_json_schema()
+                    "inputSchema": get_tool_catalog().schema(tool_name)
                 })
 
     return {
@@ -1986,6 +3020,7 @@ def handle_search_tools(
     name=ARANGO_LIST_TOOLS_BY_CATEGORY,
     description="List all MCP tools organized by category. Useful for understanding tool organization and selecting workflow-specific tool sets.",
     model=ListToolsByCategoryArgs,
+    needs_db=False,
 )
 def handle_list_tools_by_category(
     db: StandardDatabase, args: Dict[str, Any]
@@ -2044,7 +3079,7 @@ WORKFLOW_CONTEXTS = {
     "data_analysis": {
         "description": "Query optimization and performance analysis",
         "tools": [
-            ARANGO_QUERY, ARANGO_LIST_COLLECTIONS, ARANGO_EXPLAIN_QUERY,
+            ARANGO_QUERY, ARANGO_QUERY_NEXT, ARANGO_LIST_COLLECTIONS, ARANGO_EXPLAIN_QUERY,
             ARANGO_QUERY_BUILDER, ARANGO_QUERY_PROFILE, ARANGO_LIST_INDEXES,
             ARANGO_DATABASE_STATUS
         ]
@@ -2061,8 +3096,10 @@ WORKFLOW_CONTEXTS = {
     "bulk_operations": {
         "description": "Batch processing and bulk data operations",
         "tools": [
-            ARANGO_BULK_INSERT, ARANGO_BULK_UPDATE, ARANGO_INSERT_WITH_VALIDATION,
-            ARANGO_VALIDATE_REFERENCES, ARANGO_LIST_COLLECTIONS, ARANGO_QUERY
+            ARANGO_BULK_INSERT, ARANGO_BULK_INSERT_FILE, ARANGO_BULK_UPDATE,
+            ARANGO_UPDATE_BY_FILTER, ARANGO_REMOVE_BY_FILTER, ARANGO_UPSERT_BY_FILTER,
+            ARANGO_INSERT_WITH_VALIDATION, ARANGO_VALIDATE_REFERENCES,
+            ARANGO_LIST_COLLECTIONS, ARANGO_QUERY
         ]
     },
     "schema_validation": {
@@ -2094,11 +3131,21 @@ def _get_session_context(args: Dict[str, Any]) -> tuple:
     return session_state, session_id
 
 
+def _get_progress_reporter(args: Dict[str, Any]) -> Optional[Any]:
+    """Return the MCP progress callback injected by call_tool, if any.
+
+    The callback takes (progress, total, message) and is safe to call from
+    worker threads. It is None when the client did not request progress.
+    """
+    return args.get("_session_context", {}).get("progress")
+
+
 @handle_errors
 @register_tool(
     name=ARANGO_SWITCH_WORKFLOW,
     description="Switch to a different workflow context with a predefined set of tools. Enables Workflow Switching pattern for workflow-specific tool sets.",
     model=SwitchWorkflowArgs,
+    needs_db=False,
 )
 async def handle_switch_workflow(
     db: StandardDatabase, args: Dict[str, Any]
@@ -2160,6 +3207,7 @@ async def handle_switch_workflow(
     name=ARANGO_GET_ACTIVE_WORKFLOW,
     description="Get the currently active workflow context and its tool set.",
     model=GetActiveWorkflowArgs,
+    needs_db=False,
 )
 def handle_get_active_workflow(
     db: StandardDatabase, args: Optional[Dict[str, Any]] = None
@@ -2201,6 +3249,7 @@ def handle_get_active_workflow(
     name=ARANGO_LIST_WORKFLOWS,
     description="List all available workflow contexts with their descriptions and optional tool lists.",
     model=ListWorkflowsArgs,
+    needs_db=False,
 )
 def handle_list_workflows(
     db: StandardDatabase, args: Dict[str, Any]
@@ -2257,14 +3306,14 @@ WORKFLOW_STAGES = {
     "data_loading": {
         "description": "Bulk insert and validate data",
         "tools": [
-            ARANGO_BULK_INSERT, ARANGO_INSERT_WITH_VALIDATION,
+            ARANGO_BULK_INSERT, ARANGO_BULK_INSERT_FILE, ARANGO_INSERT_WITH_VALIDATION,
             ARANGO_VALIDATE_REFERENCES, ARANGO_INSERT
         ]
     },
     "analysis": {
         "description": "Query, traverse, and analyze data",
         "tools": [
-            ARANGO_QUERY, ARANGO_TRAVERSE, ARANGO_SHORTEST_PATH,
+            ARANGO_QUERY, ARANGO_QUERY_NEXT, ARANGO_TRAVERSE, ARANGO_SHORTEST_PATH,
             ARANGO_EXPLAIN_QUERY, ARANGO_QUERY_PROFILE, ARANGO_GRAPH_STATISTICS
         ]
     },
@@ -2283,6 +3332,7 @@ WORKFLOW_STAGES = {
     name=ARANGO_ADVANCE_WORKFLOW_STAGE,
     description="Advance to the next workflow stage, automatically unloading tools from previous stage and loading tools for new stage. Enables Tool Unloading pattern.",
     model=AdvanceWorkflowStageArgs,
+    needs_db=False,
 )
 async def handle_advance_workflow_stage(
     db: StandardDatabase, args: Dict[str, Any]
@@ -2344,6 +3394,7 @@ async def handle_advance_workflow_stage(
     name=ARANGO_GET_TOOL_USAGE_STATS,
     description="Get usage statistics for all tools, including use counts and last used timestamps. Useful for understanding tool usage patterns.",
     model=GetToolUsageStatsArgs,
+    needs_db=False,
 )
 def handle_get_tool_usage_stats(
     db: StandardDatabase, args: Optional[Dict[str, Any]] = None
@@ -2386,6 +3437,7 @@ def handle_get_tool_usage_stats(
     name=ARANGO_UNLOAD_TOOLS,
     description="Manually unload specific tools from the active context. Useful for fine-grained control over tool lifecycle.",
     model=UnloadToolsArgs,
+    needs_db=False,
 )
 def handle_unload_tools(
     db: StandardDatabase, args: Dict[str, Any]
@@ -2431,6 +3483,7 @@ def handle_unload_tools(
     name=ARANGO_SET_FOCUSED_DATABASE,
     description="Set the focused database for the current session. All subsequent tool calls will use this database unless overridden with the database parameter. Pass None or empty string to unset the focused database and revert to default database resolution.",
     model=SetFocusedDatabaseArgs,
+    needs_db=False,
 )
 async def handle_set_focused_database(
     db: StandardDatabase, args: Dict[str, Any]
@@ -2517,6 +3570,7 @@ async def handle_set_focused_database(
     name=ARANGO_GET_FOCUSED_DATABASE,
     description="Get the currently focused database for the current session.",
     model=GetFocusedDatabaseArgs,
+    needs_db=False,
 )
 def handle_get_focused_database(
     db: StandardDatabase, args: Optional[Dict[str, Any]] = None
@@ -2558,6 +3612,7 @@ def handle_get_focused_database(
     name=ARANGO_LIST_AVAILABLE_DATABASES,
     description="List all configured databases available for multi-tenancy operations.",
     model=ListAvailableDatabasesArgs,
+    needs_db=False,
 )
 def handle_list_available_databases(
     db: StandardDatabase, args: Optional[Dict[str, Any]] = None
@@ -2605,6 +3660,7 @@ def handle_list_available_databases(
     name=ARANGO_GET_DATABASE_RESOLUTION,
     description="Show the database resolution algorithm result for the current session, displaying which database would be used based on the 6-level priority fallback.",
     model=GetDatabaseResolutionArgs,
+    needs_db=False,
 )
 def handle_get_database_resolution(
     db: StandardDatabase, args: Optional[Dict[str, Any]] = None
@@ -7,6 +7,7 @@ Returns database connectivity status and server information.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict
 
@@ -42,8 +43,9 @@ async def health_check(db: StandardDatabase | None) -> Dict[str, Any]:
         return health_status
     
     try:
-        # Test database connectivity by getting version
-        version = db.version()
+        # Test database connectivity by getting version (off the event loop,
+        # so a slow ArangoDB response cannot stall other requests)
+        version = await asyncio.to_thread(db.version)
         health_status["database_connected"] = True
         health_status["database_info"] = {
             "version": version,
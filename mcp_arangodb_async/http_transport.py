@@ -47,6 +47,17 @@ def create_health_route(app: Starlette) -> Route:
             # Get health status
             status = await health_check(db)
 
+            # Include worker pool occupancy and timing metrics when available
+            executor = getattr(app.state, "executor", None)
+            if executor is not None:
+                status["executor"] = executor.get_metrics()
+            query_cache = getattr(app.state, "query_cache", None)
+            if query_cache is not None:
+                status["query_cache"] = query_cache.get_metrics()
+            admission = getattr(app.state, "admission", None)
+            if admission is not None:
+                status["admission"] = admission.get_metrics()
+
             # Return appropriate HTTP status code
             http_status = 200 if status["status"] == "healthy" else 503
 
@@ -65,7 +76,7 @@ def create_http_app(
     mcp_server: Server,
     cors_origins: list[str] | None = None,
     stateless: bool = False,
-) -> tuple[Starlette, StreamableHTTPSessionManager]:
+) -> tuple[Starlette, StreamableHTTPSessionManager, Starlette]:
     """
     Create Starlette application with MCP Streamable HTTP transport.
     
@@ -75,7 +86,7 @@ def create_http_app(
         stateless: Whether to run in stateless mode (default: False)
         
     Returns:
-        Tuple of (Starlette app, StreamableHTTPSessionManager)
+        Tuple of (CORS-wrapped app, StreamableHTTPSessionManager, Starlette app)
     """
     if cors_origins is None:
         cors_origins = ["*"]
@@ -164,12 +175,17 @@ async def run_http_server(
     # The StreamableHTTPSessionManager.run() does NOT automatically trigger
     # the MCP server's lifespan, so we need to do it explicitly here.
     # This ensures database connection is initialized before the server starts.
+    # Each session's Server.run() enters the lifespan again; those entries
+    # share this context and clean up their session when it ends.
     async with server_lifespan(mcp_server) as lifespan_context:
         # Store database connection in Starlette app.state
         # This is the idiomatic way to share state across requests in Starlette
         # Note: We use the original Starlette app, not the CORS-wrapped one
         starlette_app.state.db = lifespan_context.get("db")
         logger.info(f"Stored database connection in app.state: {starlette_app.state.db}")
+        starlette_app.state.executor = lifespan_context.get("executor")
+        starlette_app.state.query_cache = lifespan_context.get("query_cache")
+        starlette_app.state.admission = lifespan_context.get("admission")
 
         # Run session manager and uvicorn server concurrently
         async with session_manager.run():
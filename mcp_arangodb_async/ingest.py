@@ -0,0 +1,218 @@
+"""
+ArangoDB MCP Server - Streaming Document File Readers
+
+Readers for server-local document files used by file-based ingest. Every reader
+parses incrementally from a binary file object and yields one SourceRecord per
+document (or per unparsable record) together with the line it starts on, so
+memory use stays flat whatever the file size.
+
+Supported formats:
+- jsonl - one JSON object per line (.jsonl, .ndjson)
+- json  - a JSON array of objects, parsed element by element (.json)
+- csv   - header row followed by data rows; values are kept as strings (.csv, .tsv)
+
+Classes:
+- SourceRecord - One parsed document or parse error with its line number
+
+Functions:
+- detect_format() - Resolve "auto" to a format from the extension and first byte
+- iter_jsonl() - Parse JSON Lines
+- iter_json_array() - Incrementally parse a JSON array of objects
+- iter_csv() - Parse CSV rows into documents keyed by the header
+- iter_records() - Dispatch to the reader for a format
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+SUPPORTED_FORMATS = ("jsonl", "json", "csv")
+
+# Read size for the incremental JSON array parser
+JSON_CHUNK_CHARS = 1 << 16
+# Largest single array element the JSON parser buffers before giving up
+MAX_JSON_RECORD_CHARS = 64 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# DictReader key for fields beyond the header (cannot clash with a column name)
+_EXTRA_FIELDS = "\0extra"
+
+
+@dataclass
+class SourceRecord:
+    """One record read from a document file.
+
+    Attributes:
+        line: 1-based line number the record starts on
+        document: Parsed document (None when the record could not be parsed)
+        error: Parse error message (None for valid records)
+        fatal: True when the reader cannot continue after this error
+    """
+
+    line: int
+    document: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    fatal: bool = False
+
+
+def detect_format(path: str, requested: str = "auto") -> str:
+    """Resolve the file format; "auto" uses the extension, then the first byte.
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if requested != "auto":
+        if requested not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format '{requested}'. Expected one of {SUPPORTED_FORMATS}")
+        return requested
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext in (".csv", ".tsv"):
+        return "csv"
+    with open(path, "rb") as f:
+        head = f.read(4096).lstrip(b"\xef\xbb\xbf \t\r\n")
+    # A JSON array starts with '['; objects one per line are JSON Lines
+    return "json" if head.startswith(b"[") else "jsonl"
+
+
+def _as_document(value: Any, line: int) -> SourceRecord:
+    if isinstance(value, dict):
+        return SourceRecord(line, document=value)
+    return SourceRecord(line, error=f"Expected a JSON object, got {type(value).__name__}")
+
+
+def iter_jsonl(f: BinaryIO) -> Iterator[SourceRecord]:
+    """Parse one JSON object per line; blank lines are skipped."""
+    for line_no, raw in enumerate(f, 1):
+        if not raw.strip():
+            continue
+        try:
+            value = json.loads(raw)
+        except ValueError as e:
+            yield SourceRecord(line_no, error=f"Invalid JSON: {e}")
+            continue
+        yield _as_document(value, line_no)
+
+
+def iter_json_array(f: BinaryIO, chunk_chars: int = JSON_CHUNK_CHARS) -> Iterator[SourceRecord]:
+    """Incrementally parse a JSON array, yielding one record per element.
+
+    Only the element being parsed (plus one read chunk) is buffered. A syntax
+    error cannot be skipped in an array, so it is reported as a fatal record.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8-sig")()
+    buf = ""
+    pos = 0
+    line = 1
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = f.read(chunk_chars)
+        eof = not chunk
+        buf = buf[pos:] + text.decode(chunk, final=eof)
+        pos = 0
+        return True
+
+    def advance(to: int) -> None:
+        nonlocal pos, line
+        line += buf.count("\n", pos, to)
+        pos = to
+
+    def skip_ws() -> bool:
+        # Returns False at end of input
+        while True:
+            advance(_WHITESPACE.match(buf, pos).end())
+            if pos < len(buf):
+                return True
+            if not fill():
+                return False
+
+    if not skip_ws():
+        return
+    if buf[pos] != "[":
+        yield SourceRecord(line, error="Expected a JSON array", fatal=True)
+        return
+    advance(pos + 1)
+
+    expect_value = True
+    while True:
+        if not skip_ws():
+            yield SourceRecord(line, error="Unexpected end of file inside JSON array", fatal=True)
+            return
+        char = buf[pos]
+        if char == "]":
+            return
+        if char == ",":
+            if expect_value:
+                yield SourceRecord(line, error="Unexpected ',' in JSON array", fatal=True)
+                return
+            advance(pos + 1)
+            expect_value = True
+            continue
+        if not expect_value:
+            yield SourceRecord(line, error=f"Expected ',' or ']', got {char!r}", fatal=True)
+            return
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                break
+            except json.JSONDecodeError as e:
+                if len(buf) - pos > MAX_JSON_RECORD_CHARS or not fill():
+                    yield SourceRecord(line, error=f"Invalid JSON: {e.msg}", fatal=True)
+                    return
+        if end == len(buf) and not eof:
+            # A number may continue in the next chunk; re-parse with more data
+            fill()
+            continue
+        start_line = line
+        advance(end)
+        expect_value = False
+        yield _as_document(value, start_line)
+
+
+def iter_csv(f: BinaryIO, delimiter: str = ",") -> Iterator[SourceRecord]:
+    """Parse CSV rows into documents keyed by the header row.
+
+    Values are kept as strings. Rows with more fields than the header are
+    reported as errors; missing trailing fields are omitted from the document.
+    """
+    text = io.TextIOWrapper(f, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text, delimiter=delimiter, restkey=_EXTRA_FIELDS)
+    start_line = 2
+    try:
+        for row in reader:
+            line = start_line
+            start_line = reader.line_num + 1
+            extra = row.get(_EXTRA_FIELDS)
+            if extra is not None:
+                yield SourceRecord(line, error=f"Row has {len(extra)} more fields than the header")
+                continue
+            yield SourceRecord(line, document={k: v for k, v in row.items() if v is not None})
+    except csv.Error as e:
+        yield SourceRecord(start_line, error=f"Invalid CSV: {e}", fatal=True)
+    finally:
+        # Leave the underlying binary file open for the caller
+        text.detach()
+
+
+def iter_records(f: BinaryIO, fmt: str, delimiter: Optional[str] = None) -> Iterator[SourceRecord]:
+    """Return the record iterator for a format ("jsonl", "json" or "csv")."""
+    if fmt == "jsonl":
+        return iter_jsonl(f)
+    if fmt == "json":
+        return iter_json_array(f)
+    if fmt == "csv":
+        return iter_csv(f, delimiter or ",")
+    raise ValueError(f"Unsupported format '{fmt}'. Expected one of {SUPPORTED_FORMATS}")
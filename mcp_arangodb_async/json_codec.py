@@ -0,0 +1,199 @@
+"""
+ArangoDB MCP Server - JSON Codec
+
+Serialization of tool responses is a large share of latency for big query
+results. This module serializes with orjson (or msgspec) when installed and
+falls back to the standard library otherwise; all backends produce the same
+JSON for the same input, including values that are not JSON-native:
+
+- datetime / date / time -> ISO 8601 string
+- bytes / bytearray / memoryview -> base64 string
+- Decimal -> string (no precision loss)
+- UUID -> string; set / frozenset / tuple -> array
+
+Install the optional fast backend with ``pip install mcp-arangodb-async[fast-json]``.
+MCP_JSON_BACKEND (auto, orjson, msgspec, stdlib) forces a backend; auto picks the
+first available of orjson, msgspec, stdlib.
+
+Functions:
+- dumps() - Serialize to str
+- dumps_bytes() - Serialize to UTF-8 bytes
+- json_default() - Fallback encoder for non-JSON-native values
+- get_backend() - Name of the active backend
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV = "MCP_JSON_BACKEND"
+SUPPORTED_BACKENDS = ("auto", "orjson", "msgspec", "stdlib")
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional dependency
+    msgspec = None
+
+
+def json_default(obj: Any) -> Any:
+    """Convert a non-JSON-native value to a JSON-native one.
+
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(obj)).decode("ascii")
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _select_backend(requested: str) -> str:
+    if requested not in SUPPORTED_BACKENDS:
+        raise ValueError(
+            f"Invalid {BACKEND_ENV}: {requested}. Must be one of {list(SUPPORTED_BACKENDS)}."
+        )
+    available = {"orjson": orjson is not None, "msgspec": msgspec is not None, "stdlib": True}
+    if requested == "auto":
+        return next(name for name in ("orjson", "msgspec", "stdlib") if available[name])
+    if not available[requested]:
+        logger.warning("%s=%s requested but not installed; using stdlib json", BACKEND_ENV, requested)
+        return "stdlib"
+    return requested
+
+
+_BACKEND = _select_backend(os.getenv(BACKEND_ENV, "auto").lower())
+
+
+def get_backend() -> str:
+    """Return the name of the active serialization backend."""
+    return _BACKEND
+
+
+def set_backend(name: str) -> str:
+    """Switch the serialization backend (used by benchmarks and tests).
+
+    Returns:
+        The backend actually selected
+    """
+    global _BACKEND
+    _BACKEND = _select_backend(name)
+    return _BACKEND
+
+
+def _stdlib_dumps(
+    obj: Any,
+    indent: Optional[int],
+    sort_keys: bool,
+    ensure_ascii: bool,
+    default: Callable,
+    spaced: bool = False,
+) -> str:
+    separators = None if indent is not None or spaced else (",", ":")
+    return json.dumps(
+        obj,
+        indent=indent,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii,
+        default=default,
+        separators=separators,
+    )
+
+
+_msgspec_encoders: dict = {}
+
+
+def _msgspec_encoder(default: Callable, sort_keys: bool):
+    key = (default, sort_keys)
+    encoder = _msgspec_encoders.get(key)
+    if encoder is None:
+        encoder = msgspec.json.Encoder(
+            enc_hook=default,
+            decimal_format="string",
+            order="sorted" if sort_keys else None,
+        )
+        _msgspec_encoders[key] = encoder
+    return encoder
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    ensure_ascii: bool = False,
+    default: Callable[[Any], Any] = json_default,
+    spaced: bool = False,
+) -> bytes:
+    """Serialize obj to compact (or indented) UTF-8 JSON bytes.
+
+    Args:
+        obj: Value to serialize
+        indent: None for compact output; fast backends only support 2
+        sort_keys: Sort object keys
+        ensure_ascii: Escape non-ASCII characters (stdlib only)
+        default: Fallback for non-JSON-native values (must return a JSON-native
+            value or raise TypeError)
+        spaced: Keep stdlib's ", " / ": " separators in non-indented output
+            (stdlib only)
+
+    Raises:
+        TypeError: If a value cannot be serialized
+    """
+    backend = _BACKEND
+    if ensure_ascii or spaced or indent not in (None, 2):
+        backend = "stdlib"
+
+    if backend == "orjson":
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # orjson rejects e.g. integers beyond 64 bits; stdlib handles them
+            pass
+    elif backend == "msgspec" and indent is None:
+        try:
+            return _msgspec_encoder(default, sort_keys).encode(obj)
+        except (TypeError, msgspec.EncodeError):
+            pass
+
+    return _stdlib_dumps(obj, indent, sort_keys, ensure_ascii, default, spaced).encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    sort_keys: bool = False,
+    ensure_ascii: bool = False,
+    default: Callable[[Any], Any] = json_default,
+    spaced: bool = False,
+) -> str:
+    """Serialize obj to a JSON string (see dumps_bytes() for arguments)."""
+    if _BACKEND == "stdlib" or ensure_ascii or spaced or indent not in (None, 2):
+        return _stdlib_dumps(obj, indent, sort_keys, ensure_ascii, default, spaced)
+    return dumps_bytes(obj, indent=indent, sort_keys=sort_keys, default=default).decode("utf-8")
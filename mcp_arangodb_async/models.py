@@ -10,6 +10,7 @@ Classes by category:
 
 Core Data:
     - QueryArgs
+    - QueryNextArgs
     - ListCollectionsArgs
     - InsertArgs
     - UpdateArgs
@@ -27,6 +28,7 @@ Validation & Bulk Ops:
     - ValidateReferencesArgs
     - InsertWithValidationArgs
     - BulkInsertArgs
+    - BulkInsertFileArgs
     - BulkUpdateArgs
 
 Graph:
@@ -47,6 +49,9 @@ Enhanced Query:
     - QueryFilter
     - QuerySort
     - QueryBuilderArgs
+    - RemoveByFilterArgs
+    - UpdateByFilterArgs
+    - UpsertByFilterArgs
     - QueryProfileArgs
 
 Multi-Tenancy:
@@ -67,9 +72,32 @@ class QueryArgs(BaseModel):
     bind_vars: Optional[Dict[str, Any]] = Field(
         default=None, description="Optional bind variables for the AQL query"
     )
+    batch_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=10000,
+        description="Page size. When set (or when max_rows is set), returns the first page plus a cursor handle for arango_query_next instead of the full result",
+    )
+    max_rows: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of rows returned across all pages",
+    )
+    max_runtime: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Server-side query runtime limit in seconds; ArangoDB aborts the query when exceeded",
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
+class QueryNextArgs(BaseModel):
+    cursor: str = Field(description="Cursor handle returned by arango_query or a previous arango_query_next call")
+    close: bool = Field(
+        default=False, description="Discard the cursor instead of fetching the next page"
+    )
+
+
 class ListCollectionsArgs(BaseModel):
     database: Optional[str] = Field(default=None, description="Database override")
 
@@ -121,6 +149,49 @@ class BackupArgs(BaseModel):
         alias="docLimit",
         description="Maximum number of documents to backup per collection"
     )
+    parallelism: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Collections exported at once; each streams through its own cursor and file writer",
+    )
+    memory_budget_mb: int = Field(
+        default=256,
+        ge=1,
+        description="Parallel export: memory shared by the workers' cursor batches, in MiB",
+    )
+    incremental_base: Optional[str] = Field(
+        default=None,
+        description="Previous backup directory; only documents whose _rev changed since then are exported, plus tombstones for deleted keys",
+    )
+    track_revisions: bool = Field(
+        default=False,
+        description="Record each collection's _key -> _rev manifest so this backup can serve as an incremental base",
+    )
+    resume: bool = Field(
+        default=False,
+        description="Continue an interrupted backup to the same output_dir from its checkpoint (same options required)",
+    )
+    partitions: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Split each collection into up to this many _key ranges exported concurrently as part files plus a manifest (ignored with doc_limit)",
+    )
+    format: Literal["jsonl", "json"] = Field(
+        default="jsonl",
+        description="Collection file format: 'jsonl' (one document per line, streamed on restore) or 'json' (JSON array)",
+    )
+    compression: Literal["none", "gzip", "zstd"] = Field(
+        default="none",
+        description="Compress backup files while they are written ('zstd' requires the zstandard package)",
+    )
+    compression_level: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=22,
+        description="Compression level (gzip 1-9, zstd 1-22; codec default if omitted)",
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -168,6 +239,25 @@ class ValidateReferencesArgs(BaseModel):
     collection: str
     reference_fields: List[str]
     fix_invalid: bool = False
+    streaming: bool = Field(
+        default=False,
+        description="Count invalid documents on the server and return only a sample instead of every invalid document",
+    )
+    sample_size: int = Field(default=100, ge=0, le=10000, description="Maximum invalid documents returned in the report")
+    fix_batch_size: int = Field(
+        default=1000, ge=1, le=100000, description="Invalid documents removed per batch when fix_invalid is true"
+    )
+    fix_parallelism: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Streaming mode: _key ranges cleaned up in parallel when fix_invalid is true",
+    )
+    max_runtime: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Server-side query runtime limit in seconds; ArangoDB aborts the query when exceeded",
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -181,9 +271,81 @@ class InsertWithValidationArgs(BaseModel):
 class BulkInsertArgs(BaseModel):
     collection: str
     documents: List[Dict[str, Any]]
-    validate_refs: bool = False
+    validate_refs: bool = Field(
+        default=False, description="Check that reference fields point at existing documents before inserting"
+    )
+    reference_fields: Optional[List[str]] = Field(
+        default=None, description="Reference fields to check (default: each document's *_id fields)"
+    )
     batch_size: int = 1000
     on_error: Literal["stop", "continue", "ignore"] = "stop"
+    concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Batches in flight at once; >1 pipelines batches over pooled connections (results stay in batch order)",
+    )
+    sync: bool = Field(
+        default=True, description="Wait until each batch is synced to disk before acknowledging"
+    )
+    engine: Literal["document", "import"] = Field(
+        default="document",
+        description="'document' uses the document API (returns inserted IDs); 'import' uses the faster bulk import API (counters only)",
+    )
+    on_duplicate: Optional[Literal["error", "update", "replace", "ignore"]] = Field(
+        default=None,
+        description="Import engine only: handling of existing keys (default 'ignore' when on_error='ignore', else 'error')",
+    )
+    adaptive_batching: bool = Field(
+        default=False,
+        description="Cap batches by serialized size and adapt the batch size to latency and request-too-large errors (batch_size is the initial size)",
+    )
+    max_batch_bytes: int = Field(
+        default=4 * 1024 * 1024, ge=1024, description="Adaptive batching: maximum serialized batch size in bytes"
+    )
+    target_batch_latency_ms: int = Field(
+        default=1000, ge=10, description="Adaptive batching: round-trip time the batch size is tuned towards"
+    )
+    transaction: bool = Field(
+        default=False,
+        description="Write through stream transactions committed every commit_every batches (batches are sent one at a time)",
+    )
+    commit_every: int = Field(
+        default=0, ge=0, description="Transaction mode: batches per transaction; 0 commits once at the end (atomic)"
+    )
+    transaction_max_size: Optional[int] = Field(
+        default=None, ge=1, description="Transaction mode: maximum transaction size in bytes (server default if omitted)"
+    )
+    database: Optional[str] = Field(default=None, description="Database override")
+
+
+class BulkInsertFileArgs(BaseModel):
+    collection: str
+    file_path: str = Field(description="Server-local JSONL, JSON array or CSV file to import")
+    format: Literal["auto", "jsonl", "json", "csv"] = Field(
+        default="auto",
+        description="File format; 'auto' detects it from the extension and first byte",
+    )
+    batch_size: int = Field(default=1000, ge=1)
+    on_error: Literal["stop", "continue", "ignore"] = "stop"
+    concurrency: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Batches in flight at once; >1 pipelines batches over pooled connections (results stay in batch order)",
+    )
+    sync: bool = Field(
+        default=True, description="Wait until each batch is synced to disk before acknowledging"
+    )
+    csv_delimiter: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=1,
+        description="CSV field delimiter (default ',' or tab for .tsv files)",
+    )
+    max_error_details: int = Field(
+        default=100, ge=0, description="Maximum number of errors reported individually"
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -192,6 +354,26 @@ class BulkUpdateArgs(BaseModel):
     updates: List[Dict[str, Any]]  # each must include key and update fields
     batch_size: int = 1000
     on_error: Literal["stop", "continue", "ignore"] = "stop"
+    adaptive_batching: bool = Field(
+        default=False,
+        description="Cap batches by serialized size and adapt the batch size to latency and request-too-large errors (batch_size is the initial size)",
+    )
+    max_batch_bytes: int = Field(
+        default=4 * 1024 * 1024, ge=1024, description="Adaptive batching: maximum serialized batch size in bytes"
+    )
+    target_batch_latency_ms: int = Field(
+        default=1000, ge=10, description="Adaptive batching: round-trip time the batch size is tuned towards"
+    )
+    transaction: bool = Field(
+        default=False,
+        description="Write through stream transactions committed every commit_every batches (batches are sent one at a time)",
+    )
+    commit_every: int = Field(
+        default=0, ge=0, description="Transaction mode: batches per transaction; 0 commits once at the end (atomic)"
+    )
+    transaction_max_size: Optional[int] = Field(
+        default=None, ge=1, description="Transaction mode: maximum transaction size in bytes (server default if omitted)"
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -226,6 +408,11 @@ class TraverseArgs(BaseModel):
     edge_collections: Optional[List[str]] = None
     return_paths: bool = False
     limit: Optional[int] = None
+    max_runtime: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Server-side query runtime limit in seconds; ArangoDB aborts the query when exceeded",
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -301,6 +488,57 @@ class QueryBuilderArgs(BaseModel):
     sort: List[QuerySort] = Field(default_factory=list)
     limit: Optional[int] = None
     return_fields: Optional[List[str]] = Field(default=None, description="Fields to project; omit for full doc")
+    max_runtime: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Server-side query runtime limit in seconds; ArangoDB aborts the query when exceeded",
+    )
+    database: Optional[str] = Field(default=None, description="Database override")
+
+
+class RemoveByFilterArgs(BaseModel):
+    collection: str
+    filters: List[QueryFilter] = Field(
+        default_factory=list, description="Conditions (ANDed) selecting the documents; empty matches all"
+    )
+    batch_size: int = Field(
+        default=1000, ge=1, le=100000, description="Documents changed per AQL statement (one transaction each)"
+    )
+    max_affected: int = Field(
+        default=10000, ge=1, description="Abort without changes when more documents match the filter"
+    )
+    dry_run: bool = Field(default=False, description="Only count matching documents")
+    max_runtime: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Server-side query runtime limit in seconds; ArangoDB aborts the query when exceeded",
+    )
+    database: Optional[str] = Field(default=None, description="Database override")
+
+
+class UpdateByFilterArgs(RemoveByFilterArgs):
+    update: Dict[str, Any] = Field(description="Fields to set on every matching document")
+    merge_objects: bool = Field(default=True, description="Merge nested objects instead of replacing them")
+    keep_null: bool = Field(default=True, description="Store null values instead of removing the attributes")
+
+
+class UpsertByFilterArgs(BaseModel):
+    collection: str
+    filters: List[QueryFilter] = Field(
+        min_length=1, description="'==' conditions on top-level fields identifying the document"
+    )
+    update: Dict[str, Any] = Field(description="Fields to set when a matching document exists")
+    insert: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Document to insert when none matches (default: filter values merged with update)",
+    )
+    merge_objects: bool = True
+    keep_null: bool = True
+    max_runtime: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Server-side query runtime limit in seconds; ArangoDB aborts the query when exceeded",
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -335,6 +573,45 @@ class BackupGraphArgs(BaseModel):
         alias="docLimit",
         description="Maximum number of documents to backup per collection"
     )
+    parallelism: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Collections exported at once; each streams through its own cursor and file writer",
+    )
+    memory_budget_mb: int = Field(
+        default=256,
+        ge=1,
+        description="Parallel export: memory shared by the workers' cursor batches, in MiB",
+    )
+    incremental_base: Optional[str] = Field(
+        default=None,
+        description="Previous backup directory; only documents whose _rev changed since then are exported, plus tombstones for deleted keys",
+    )
+    track_revisions: bool = Field(
+        default=False,
+        description="Record each collection's _key -> _rev manifest so this backup can serve as an incremental base",
+    )
+    partitions: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Split each collection into up to this many _key ranges exported concurrently as part files plus a manifest (ignored with doc_limit)",
+    )
+    format: Literal["jsonl", "json"] = Field(
+        default="jsonl",
+        description="Collection file format: 'jsonl' (one document per line, streamed on restore) or 'json' (JSON array)",
+    )
+    compression: Literal["none", "gzip", "zstd"] = Field(
+        default="none",
+        description="Compress backup files while they are written ('zstd' requires the zstandard package)",
+    )
+    compression_level: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=22,
+        description="Compression level (gzip 1-9, zstd 1-22; codec default if omitted)",
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -361,6 +638,21 @@ class RestoreGraphArgs(BaseModel):
         alias="validateIntegrity",
         description="Validate referential integrity during restore"
     )
+    parallelism: int = Field(
+        default=1,
+        ge=1,
+        le=16,
+        description="Collections restored at once; edge collections start once their vertex collections are restored",
+    )
+    memory_budget_mb: int = Field(
+        default=256,
+        ge=1,
+        description="Memory shared by the workers' import batches, in MiB (caps the batch size)",
+    )
+    resume: bool = Field(
+        default=False,
+        description="Continue an interrupted restore of this input_dir from its checkpoint (same options required)",
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -443,6 +735,12 @@ class GraphStatisticsArgs(BaseModel):
         alias="perCollectionStats",
         description="Provide detailed per-collection statistics breakdown"
     )
+    max_runtime: Optional[float] = Field(
+        default=None,
+        gt=0,
+        alias="maxRuntime",
+        description="Server-side runtime limit in seconds for each analytics query"
+    )
     database: Optional[str] = Field(default=None, description="Database override")
 
 
@@ -11,10 +11,29 @@ from dataclasses import dataclass
 from arango import ArangoClient
 from arango.database import StandardDatabase
 
+from .async_driver import AsyncArangoClient, AsyncDatabase
+
+# Supported driver backends (selectable per database in databases.yaml)
+DRIVER_PYTHON_ARANGO = "python-arango"
+DRIVER_HTTPX = "httpx"
+SUPPORTED_DRIVERS = (DRIVER_PYTHON_ARANGO, DRIVER_HTTPX)
+
 
 @dataclass
 class DatabaseConfig:
-    """Configuration for a single database connection."""
+    """Configuration for a single database connection.
+
+    Attributes:
+        driver: "python-arango" (blocking driver, run on the worker pool) or
+            "httpx" (native asyncio driver for tools that have an async variant)
+        max_connections: Keep-alive pool size for the httpx driver
+        query_cache: Cache results of read-only query tools for this database
+        query_cache_ttl: Per-database cache TTL in seconds (None = global default)
+        max_in_flight: Maximum concurrent tool calls against this database
+            (None = unlimited); further calls wait in a fair queue
+        max_queue: Maximum number of calls waiting for a slot
+        queue_timeout: Maximum seconds a call waits for a slot (None = no limit)
+    """
     
     url: str
     database: str
@@ -22,6 +41,38 @@ class DatabaseConfig:
     password_env: str
     timeout: float = 30.0
     description: Optional[str] = None
+    driver: str = DRIVER_PYTHON_ARANGO
+    max_connections: int = 10
+    query_cache: bool = False
+    query_cache_ttl: Optional[float] = None
+    max_in_flight: Optional[int] = None
+    max_queue: int = 100
+    queue_timeout: Optional[float] = 30.0
+
+    def __post_init__(self) -> None:
+        """Validate configuration after initialization."""
+        if self.driver not in SUPPORTED_DRIVERS:
+            raise ValueError(
+                f"Invalid driver: {self.driver}. Must be one of {list(SUPPORTED_DRIVERS)}."
+            )
+        if self.max_connections < 1:
+            raise ValueError(
+                f"Invalid max_connections: {self.max_connections}. Must be >= 1."
+            )
+        if self.query_cache_ttl is not None and self.query_cache_ttl <= 0:
+            raise ValueError(
+                f"Invalid query_cache_ttl: {self.query_cache_ttl}. Must be > 0."
+            )
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError(
+                f"Invalid max_in_flight: {self.max_in_flight}. Must be >= 1."
+            )
+        if self.max_queue < 0:
+            raise ValueError(f"Invalid max_queue: {self.max_queue}. Must be >= 0.")
+        if self.queue_timeout is not None and self.queue_timeout <= 0:
+            raise ValueError(
+                f"Invalid queue_timeout: {self.queue_timeout}. Must be > 0."
+            )
 
 
 class MultiDatabaseConnectionManager:
@@ -36,6 +87,7 @@ class MultiDatabaseConnectionManager:
     def __init__(self):
         """Initialize MultiDatabaseConnectionManager with empty pools."""
         self._pools: Dict[str, Tuple[ArangoClient, StandardDatabase]] = {}
+        self._async_pools: Dict[str, Tuple[AsyncArangoClient, AsyncDatabase]] = {}
         self._configs: Dict[str, DatabaseConfig] = {}
         self._lock = asyncio.Lock()
 
@@ -96,6 +148,49 @@ class MultiDatabaseConnectionManager:
             
             return self._pools[database_key]
 
+    async def get_async_database(self, database_key: str) -> Optional[AsyncDatabase]:
+        """Get or create the native async database handle (async-safe).
+
+        Only databases configured with ``driver: httpx`` have one; the underlying
+        httpx client keeps a pool of up to ``max_connections`` keep-alive
+        connections shared by all sessions.
+
+        Args:
+            database_key: Database identifier from configuration
+
+        Returns:
+            AsyncDatabase, or None if the database uses the python-arango driver
+
+        Raises:
+            KeyError: If database_key is not registered
+        """
+        if database_key in self._async_pools:
+            return self._async_pools[database_key][1]
+
+        if database_key not in self._configs:
+            raise KeyError(f"Database '{database_key}' not registered")
+
+        config = self._configs[database_key]
+        if config.driver != DRIVER_HTTPX:
+            return None
+
+        async with self._lock:
+            if database_key in self._async_pools:
+                return self._async_pools[database_key][1]
+
+            client = AsyncArangoClient(
+                hosts=config.url,
+                request_timeout=config.timeout,
+                max_connections=config.max_connections,
+            )
+            db = client.db(
+                config.database,
+                username=config.username,
+                password=os.getenv(config.password_env, ""),
+            )
+            self._async_pools[database_key] = (client, db)
+            return db
+
     def get_configured_databases(self) -> Dict[str, DatabaseConfig]:
         """Get all configured databases.
         
@@ -104,6 +199,17 @@ class MultiDatabaseConnectionManager:
         """
         return self._configs.copy()
 
+    def get_database_config(self, database_key: str) -> Optional[DatabaseConfig]:
+        """Get the configuration of a single database without copying the registry.
+
+        Args:
+            database_key: Database identifier from configuration
+
+        Returns:
+            DatabaseConfig, or None if database_key is not registered
+        """
+        return self._configs.get(database_key)
+
     async def test_connection(self, database_key: str) -> Dict[str, Any]:
         """Test connection to a specific database.
         
@@ -114,8 +220,12 @@ class MultiDatabaseConnectionManager:
             Dictionary with connection status and version info
         """
         try:
-            client, db = await self.get_connection(database_key)
-            version = db.version()
+            async_db = await self.get_async_database(database_key)
+            if async_db is not None:
+                version = await async_db.version()
+            else:
+                client, db = await self.get_connection(database_key)
+                version = await asyncio.to_thread(db.version)
             return {
                 "connected": True,
                 "version": version
@@ -150,3 +260,12 @@ class MultiDatabaseConnectionManager:
             
             self._pools.clear()
 
+            for database_key, (client, db) in self._async_pools.items():
+                try:
+                    await client.close()
+                except Exception:
+                    # Ignore errors during cleanup
+                    pass
+
+            self._async_pools.clear()
+
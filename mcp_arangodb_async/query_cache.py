@@ -0,0 +1,392 @@
+"""
+ArangoDB MCP Server - AQL Read-Result Cache
+
+This module caches the results of read-only query tools (arango_query,
+arango_query_builder) in process, so that agents repeating the same read within
+seconds are answered without a round trip to ArangoDB.
+
+Entries are keyed on (database key, tool, normalized query, bind vars), expire
+after a TTL, and are evicted least-recently-used when the total cached size
+exceeds a byte budget. Every cached query records the collections it may read
+(an over-approximation built from the query's identifiers, string literals and
+bind values); write tools invalidate the entries of the collections they touch,
+and AQL writes or restores invalidate the whole database.
+
+Caching is opt-in per database (``query_cache: true`` in databases.yaml).
+
+Classes:
+- QueryCacheConfig - Frozen dataclass for cache limits
+- QueryCache - LRU + TTL cache with byte-bounded eviction and write invalidation
+
+Functions:
+- load_query_cache_config() - Load cache limits from environment variables
+- normalize_aql() - Collapse insignificant whitespace and comments in AQL
+- cache_key_for() - Build the cache key and read set for a tool call
+- written_collections() - Collections a write tool call may modify
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Hashable, Optional, Tuple
+
+from . import json_codec
+from .tools import (
+    ARANGO_QUERY,
+    ARANGO_QUERY_BUILDER,
+    ARANGO_INSERT,
+    ARANGO_UPDATE,
+    ARANGO_REMOVE,
+    ARANGO_BULK_INSERT,
+    ARANGO_BULK_INSERT_FILE,
+    ARANGO_BULK_UPDATE,
+    ARANGO_UPDATE_BY_FILTER,
+    ARANGO_REMOVE_BY_FILTER,
+    ARANGO_UPSERT_BY_FILTER,
+    ARANGO_INSERT_WITH_VALIDATION,
+    ARANGO_ADD_EDGE,
+    ARANGO_ADD_VERTEX,
+    ARANGO_RESTORE_GRAPH,
+    ARANGO_VALIDATE_REFERENCES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Read set marker for queries whose collections cannot be determined statically
+ALL_COLLECTIONS: FrozenSet[str] = frozenset({"*"})
+
+# Write tools mapped to the argument naming the collection they modify.
+# None means the tool may modify any collection of the database.
+WRITE_TOOLS: Dict[str, Optional[str]] = {
+    ARANGO_INSERT: "collection",
+    ARANGO_UPDATE: "collection",
+    ARANGO_REMOVE: "collection",
+    ARANGO_BULK_INSERT: "collection",
+    ARANGO_BULK_UPDATE: "collection",
+    ARANGO_BULK_INSERT_FILE: "collection",
+    ARANGO_UPDATE_BY_FILTER: "collection",
+    ARANGO_REMOVE_BY_FILTER: "collection",
+    ARANGO_UPSERT_BY_FILTER: "collection",
+    ARANGO_INSERT_WITH_VALIDATION: "collection",
+    ARANGO_ADD_EDGE: "collection",
+    ARANGO_ADD_VERTEX: "collection",
+    ARANGO_RESTORE_GRAPH: None,
+}
+
+# Tools whose results may be cached
+CACHEABLE_TOOLS = frozenset({ARANGO_QUERY, ARANGO_QUERY_BUILDER})
+
+# AQL data-modification keywords; queries using them are never cached
+_AQL_WRITE_RE = re.compile(r"\b(INSERT|UPDATE|REPLACE|REMOVE|UPSERT)\b", re.IGNORECASE)
+# Named graph traversals read collections that are not visible in the query text
+_AQL_GRAPH_RE = re.compile(r"\bGRAPH\b", re.IGNORECASE)
+# Tokenizer for normalization: string literals, comments, whitespace, other
+_AQL_TOKEN_RE = re.compile(
+    r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`|´(?:[^´\\]|\\.)*´)"""
+    r"""|(//[^\n]*|/\*.*?\*/)"""
+    r"""|(\s+)"""
+    r"""|([^"'`´\s/]+|/)""",
+    re.DOTALL,
+)
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_\-]*")
+
+
+@dataclass(frozen=True)
+class QueryCacheConfig:
+    """Limits for the query result cache.
+
+    Attributes:
+        ttl: Seconds a cached result stays valid
+        max_bytes: Total size budget for cached results (serialized JSON bytes)
+        max_entries: Maximum number of cached results
+        max_entry_bytes: Results larger than this are not cached
+    """
+
+    ttl: float = 60.0
+    max_bytes: int = 64 * 1024 * 1024
+    max_entries: int = 1000
+    max_entry_bytes: int = 4 * 1024 * 1024
+
+    def __post_init__(self) -> None:
+        """Validate configuration after initialization."""
+        if self.ttl <= 0:
+            raise ValueError(f"Invalid ttl: {self.ttl}. Must be > 0.")
+        if self.max_bytes < 1 or self.max_entries < 1 or self.max_entry_bytes < 1:
+            raise ValueError("Query cache size limits must be >= 1.")
+
+
+def load_query_cache_config() -> QueryCacheConfig:
+    """
+    Load query cache limits from environment variables.
+
+    MCP_QUERY_CACHE_TTL_SEC (default: 60)
+    MCP_QUERY_CACHE_MAX_BYTES (default: 67108864)
+    MCP_QUERY_CACHE_MAX_ENTRIES (default: 1000)
+    MCP_QUERY_CACHE_MAX_ENTRY_BYTES (default: 4194304)
+    """
+    defaults = QueryCacheConfig()
+    return QueryCacheConfig(
+        ttl=float(os.getenv("MCP_QUERY_CACHE_TTL_SEC", defaults.ttl)),
+        max_bytes=int(os.getenv("MCP_QUERY_CACHE_MAX_BYTES", defaults.max_bytes)),
+        max_entries=int(os.getenv("MCP_QUERY_CACHE_MAX_ENTRIES", defaults.max_entries)),
+        max_entry_bytes=int(
+            os.getenv("MCP_QUERY_CACHE_MAX_ENTRY_BYTES", defaults.max_entry_bytes)
+        ),
+    )
+
+
+def normalize_aql(query: str) -> str:
+    """Collapse whitespace and strip comments outside string literals."""
+    parts = []
+    for literal, comment, space, other in _AQL_TOKEN_RE.findall(query):
+        if literal:
+            parts.append(literal)
+        elif comment or space:
+            if parts and parts[-1] != " ":
+                parts.append(" ")
+        else:
+            parts.append(other)
+    return "".join(parts).strip()
+
+
+def _collection_names_in(value: Any, names: set) -> None:
+    """Add string values (and their "collection/" prefixes) to names."""
+    if isinstance(value, str):
+        names.add(value)
+        if "/" in value:
+            names.add(value.split("/", 1)[0])
+    elif isinstance(value, dict):
+        for v in value.values():
+            _collection_names_in(v, names)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _collection_names_in(v, names)
+
+
+def aql_read_set(query: str, bind_vars: Optional[Dict[str, Any]]) -> FrozenSet[str]:
+    """Over-approximate the collections an AQL query may read.
+
+    Every identifier, string literal and bind value (plus the collection prefix of
+    document ids) is treated as a possible collection name. Extra names only cause
+    extra invalidations, never stale reads. Named graph traversals read collections
+    that are not named in the query, so they depend on the whole database.
+    """
+    if _AQL_GRAPH_RE.search(query):
+        return ALL_COLLECTIONS
+    names: set = set()
+    for literal, _comment, _space, other in _AQL_TOKEN_RE.findall(query):
+        if literal:
+            _collection_names_in(literal[1:-1], names)
+        elif other:
+            names.update(_IDENTIFIER_RE.findall(other))
+    _collection_names_in(bind_vars or {}, names)
+    return frozenset(names)
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def cache_key_for(
+    tool_name: str, db_key: str, args: Dict[str, Any]
+) -> Optional[Tuple[Hashable, FrozenSet[str]]]:
+    """Build the cache key and read set for a tool call.
+
+    Returns:
+        (key, read_set), or None if the call is not cacheable (non-read tool,
+        AQL containing writes, or a paged query whose result is a cursor handle)
+    """
+    if tool_name not in CACHEABLE_TOOLS:
+        return None
+    if tool_name == ARANGO_QUERY:
+        query = args["query"]
+        if args.get("batch_size") is not None or args.get("max_rows") is not None:
+            return None
+        if _AQL_WRITE_RE.search(query):
+            return None
+        bind_vars = args.get("bind_vars") or {}
+        key = (db_key, tool_name, normalize_aql(query), _canonical(bind_vars))
+        return key, aql_read_set(query, bind_vars)
+
+    # arango_query_builder: the query is fully determined by its arguments
+    params = {
+        k: v for k, v in args.items() if k not in ("database", "_session_context")
+    }
+    return (db_key, tool_name, _canonical(params)), frozenset({args["collection"]})
+
+
+def written_collections(tool_name: str, args: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+    """Collections a tool call may modify.
+
+    Returns:
+        Empty set for tools that do not write, the modified collections, or
+        ALL_COLLECTIONS when any collection may change (restores, AQL writes)
+    """
+    if tool_name in WRITE_TOOLS:
+        arg = WRITE_TOOLS[tool_name]
+        if arg is None or not args.get(arg):
+            return ALL_COLLECTIONS
+        return frozenset({args[arg]})
+    if tool_name == ARANGO_VALIDATE_REFERENCES and args.get("fix_invalid"):
+        return frozenset({args["collection"]})
+    if tool_name == ARANGO_QUERY and _AQL_WRITE_RE.search(args.get("query", "")):
+        return ALL_COLLECTIONS
+    return frozenset()
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    size: int
+    read_set: FrozenSet[str]
+    expires_at: float
+
+
+class QueryCache:
+    """In-process LRU + TTL cache for read query results.
+
+    Thread-safe. Reads that started before an invalidation of their database are
+    not stored (see begin_read()/put()), so a slow read racing a write can never
+    repopulate the cache with a stale result.
+    """
+
+    def __init__(self, config: Optional[QueryCacheConfig] = None):
+        """Initialize QueryCache.
+
+        Args:
+            config: Cache limits (defaults to QueryCacheConfig())
+        """
+        self.config = config or QueryCacheConfig()
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._epochs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _remove_locked(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up a cached result.
+
+        Returns:
+            (hit, value) - value is None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove_locked(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def begin_read(self, db_key: str) -> int:
+        """Return the database's invalidation epoch, to be passed to put()."""
+        with self._lock:
+            return self._epochs.get(db_key, 0)
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        read_set: FrozenSet[str],
+        db_key: str,
+        epoch: int,
+        ttl: Optional[float] = None,
+    ) -> bool:
+        """Store a result unless it is too large or its database changed since epoch.
+
+        Returns:
+            True if the result was cached
+        """
+        try:
+            size = len(json_codec.dumps_bytes(value))
+        except (TypeError, ValueError):
+            return False
+        if size > self.config.max_entry_bytes:
+            return False
+
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.config.ttl)
+        with self._lock:
+            if self._epochs.get(db_key, 0) != epoch:
+                return False
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = _CacheEntry(value, size, read_set, expires_at)
+            self._bytes += size
+            while self._entries and (
+                self._bytes > self.config.max_bytes
+                or len(self._entries) > self.config.max_entries
+            ):
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self.evictions += 1
+        return True
+
+    def invalidate(self, db_key: str, collections: FrozenSet[str]) -> int:
+        """Drop cached results of db_key that may read any of collections.
+
+        Args:
+            db_key: Database key the write went to
+            collections: Modified collections, or ALL_COLLECTIONS
+
+        Returns:
+            Number of entries removed
+        """
+        if not collections:
+            return 0
+        with self._lock:
+            self._epochs[db_key] = self._epochs.get(db_key, 0) + 1
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if key[0] == db_key
+                and (
+                    collections is ALL_COLLECTIONS
+                    or entry.read_set is ALL_COLLECTIONS
+                    or not collections.isdisjoint(entry.read_set)
+                )
+            ]
+            for key in stale:
+                self._remove_locked(key)
+            self.invalidations += len(stale)
+        if stale:
+            logger.debug("Query cache: invalidated %d entries for %s", len(stale), db_key)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.config.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,274 @@
+"""
+ArangoDB MCP Server - Running Query Tracker
+
+AQL queries keep running on the coordinator after their caller has gone: an MCP
+cancellation or a tool timeout only abandons the python-arango call that is
+waiting for the result. This module tags the AQL issued during a tool call with
+a per-call marker comment, tracks running calls per session, and kills their
+queries through the query API (GET /_api/query/current, DELETE /_api/query/{id})
+when the call is cancelled, times out, or its session is closed.
+
+It also resolves the server-side ``max_runtime`` for query tools: the per-call
+argument, then a per-tool override, then a global default.
+
+A cancelled call is flagged as well, so a handler that issues several queries
+(graph statistics) fails fast with QueryCancelledError instead of starting the
+next one on the worker thread that is still running it.
+
+Classes:
+- QueryRuntimeConfig - Frozen dataclass for default and per-tool max_runtime
+- QueryTracker - Per-session registry of running tool calls with query kill
+- QueryCancelledError - Raised when a cancelled call tries to run another query
+
+Functions:
+- load_query_runtime_config() - Load max_runtime defaults from environment variables
+- tag_query() - Prefix a query with the marker of the current tool call
+- max_runtime_options() - aql.execute keyword arguments for a max_runtime
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import secrets
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from .executor import ToolTimeoutError, parse_tool_timeouts
+
+logger = logging.getLogger(__name__)
+
+# Marker comment prepended to every query issued during a tracked tool call
+QUERY_MARKER_PREFIX = "/* mcp-call:"
+
+
+class QueryCancelledError(Exception):
+    """Raised when a cancelled or timed-out tool call tries to run another query."""
+
+
+@dataclass
+class _RunningCall:
+    """A tracked tool call whose queries may still be running."""
+
+    call_id: str
+    session_id: str
+    tool_name: str
+    db: Any
+    started: float
+    cancelled: bool = False
+
+
+# Tool call running in the current context. Set on the event loop by
+# QueryTracker.track(); worker threads inherit it because the tool executor
+# runs handlers in a copy of the caller's context.
+_current_call: ContextVar[Optional[_RunningCall]] = ContextVar(
+    "mcp_arangodb_query_call", default=None
+)
+
+
+def _marker(call_id: str) -> str:
+    return f"{QUERY_MARKER_PREFIX}{call_id} */"
+
+
+def tag_query(query: str) -> str:
+    """Prefix query with the marker of the current tool call (unchanged outside a call).
+
+    Raises:
+        QueryCancelledError: If the current call was cancelled or timed out
+    """
+    call = _current_call.get()
+    if call is None:
+        return query
+    if call.cancelled:
+        raise QueryCancelledError(f"Tool call '{call.tool_name}' was cancelled")
+    return f"{_marker(call.call_id)} {query}"
+
+
+def max_runtime_options(max_runtime: Optional[float]) -> Dict[str, Any]:
+    """Return aql.execute keyword arguments for max_runtime (empty when unset)."""
+    return {"max_runtime": max_runtime} if max_runtime else {}
+
+
+@dataclass(frozen=True)
+class QueryRuntimeConfig:
+    """Server-side AQL runtime limits for query tools.
+
+    Attributes:
+        default_max_runtime: Limit in seconds applied to every query tool (None for no limit)
+        tool_max_runtimes: Per-tool limit overrides in seconds
+    """
+
+    default_max_runtime: Optional[float] = None
+    tool_max_runtimes: Dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate configuration after initialization."""
+        if self.default_max_runtime is not None and self.default_max_runtime <= 0:
+            raise ValueError(
+                f"Invalid default_max_runtime: {self.default_max_runtime}. Must be > 0."
+            )
+
+    def get_max_runtime(self, tool_name: str) -> Optional[float]:
+        """Return the configured limit for a tool (per-tool override, then default)."""
+        return self.tool_max_runtimes.get(tool_name, self.default_max_runtime)
+
+
+def load_query_runtime_config() -> QueryRuntimeConfig:
+    """
+    Load query runtime limits from environment variables.
+
+    MCP_QUERY_MAX_RUNTIME_SEC (optional float seconds applied to all query tools)
+    MCP_QUERY_MAX_RUNTIMES (optional "tool=seconds,..." per-tool overrides)
+    """
+    default_raw = os.getenv("MCP_QUERY_MAX_RUNTIME_SEC")
+    return QueryRuntimeConfig(
+        default_max_runtime=float(default_raw) if default_raw else None,
+        tool_max_runtimes=parse_tool_timeouts(os.getenv("MCP_QUERY_MAX_RUNTIMES")),
+    )
+
+
+def _kill_tagged(db: Any, call_id: str) -> int:
+    """Kill the running queries of a call on a python-arango database (blocking)."""
+    marker = _marker(call_id)
+    killed = 0
+    for query in db.aql.queries():
+        if marker not in (query.get("query") or ""):
+            continue
+        try:
+            db.aql.kill(query["id"])
+            killed += 1
+        except Exception:
+            # Finished between listing and kill
+            logger.debug("Could not kill query %s", query.get("id"), exc_info=True)
+    return killed
+
+
+async def _kill_tagged_async(db: Any, call_id: str) -> int:
+    """Kill the running queries of a call on an async_driver database."""
+    marker = _marker(call_id)
+    killed = 0
+    for query in await db.aql.queries():
+        if marker not in (query.get("query") or ""):
+            continue
+        try:
+            await db.aql.kill(query["id"])
+            killed += 1
+        except Exception:
+            logger.debug("Could not kill query %s", query.get("id"), exc_info=True)
+    return killed
+
+
+class QueryTracker:
+    """Per-session registry of running tool calls.
+
+    Queries are found by their marker comment in the server's list of running
+    queries, so no query IDs need to be known in advance (python-arango only
+    returns a cursor once the query has finished). All methods must be called
+    from the event loop thread.
+    """
+
+    def __init__(self, config: Optional[QueryRuntimeConfig] = None):
+        """Initialize QueryTracker.
+
+        Args:
+            config: Query runtime limits (defaults to QueryRuntimeConfig(), no limits)
+        """
+        self.config = config or QueryRuntimeConfig()
+        self._calls: Dict[str, _RunningCall] = {}
+        # Background kill tasks (strong references until they finish)
+        self._kill_tasks: Set[asyncio.Task] = set()
+        self.killed = 0
+
+    def resolve_max_runtime(self, tool_name: str, args: Dict[str, Any]) -> Optional[float]:
+        """Return the per-call max_runtime, falling back to the configured limit."""
+        return args.get("max_runtime") or self.config.get_max_runtime(tool_name)
+
+    @asynccontextmanager
+    async def track(self, session_id: str, tool_name: str, db: Any) -> AsyncIterator[str]:
+        """Track a tool call for the duration of the block.
+
+        Queries passed through tag_query() inside the block carry the call's
+        marker. If the block is cancelled its queries are killed in the
+        background; if it times out they are killed before ToolTimeoutError
+        propagates (the number killed is set on the error).
+
+        Yields:
+            The call ID
+        """
+        call = _RunningCall(secrets.token_hex(8), session_id, tool_name, db, time.monotonic())
+        self._calls[call.call_id] = call
+        token = _current_call.set(call)
+        try:
+            yield call.call_id
+        except asyncio.CancelledError:
+            self._cancel(call)
+            raise
+        except ToolTimeoutError as e:
+            call.cancelled = True
+            e.killed_queries = await self.kill_call(call.call_id, db)
+            raise
+        finally:
+            _current_call.reset(token)
+            self._calls.pop(call.call_id, None)
+
+    async def kill_call(self, call_id: str, db: Any) -> int:
+        """Kill the running queries of a call. Returns the number killed."""
+        try:
+            if inspect.iscoroutinefunction(getattr(db.aql, "queries", None)):
+                killed = await _kill_tagged_async(db, call_id)
+            else:
+                loop = asyncio.get_running_loop()
+                killed = await loop.run_in_executor(None, _kill_tagged, db, call_id)
+        except Exception:
+            logger.warning("Failed to kill queries of call %s", call_id, exc_info=True)
+            return 0
+        if killed:
+            self.killed += killed
+            logger.info("Killed %d running queries of call %s", killed, call_id)
+        return killed
+
+    def _cancel(self, call: _RunningCall) -> None:
+        """Flag a call as cancelled and kill its queries in the background."""
+        call.cancelled = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.kill_call(call.call_id, call.db))
+        self._kill_tasks.add(task)
+        task.add_done_callback(self._kill_tasks.discard)
+
+    def running(self, session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Describe running calls (optionally for one session)."""
+        now = time.monotonic()
+        return [
+            {
+                "call_id": call.call_id,
+                "session_id": call.session_id,
+                "tool": call.tool_name,
+                "elapsed_sec": round(now - call.started, 3),
+            }
+            for call in self._calls.values()
+            if session_id is None or call.session_id == session_id
+        ]
+
+    def close_session(self, session_id: str) -> int:
+        """Kill the queries of every running call of a session (in the background).
+
+        Returns:
+            Number of calls whose queries are being killed
+        """
+        calls = [c for c in self._calls.values() if c.session_id == session_id]
+        for call in calls:
+            self._cancel(call)
+        return len(calls)
+
+    def close_all(self) -> None:
+        """Kill the queries of every running call (in the background)."""
+        for call in list(self._calls.values()):
+            self._cancel(call)
@@ -0,0 +1,126 @@
+"""
+ArangoDB MCP Server - Batched Reference Checks
+
+Checks that reference fields (document IDs such as ``user_id: "users/123"``)
+point at existing documents. Instead of one DOCUMENT() lookup per document,
+the references of a whole batch are collected, grouped by target collection
+and resolved with one primary-index query per collection. IDs found to exist
+are remembered for the rest of the tool call, so references repeated across
+batches are not looked up again.
+
+Classes:
+- ReferenceChecker - Batch reference validation with a per-call positive cache
+
+Functions:
+- split_document_id() - Split "collection/key" into its parts
+- default_reference_fields() - Top-level fields named like references (*_id)
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .query_tracker import tag_query
+
+_EXISTING_KEYS_QUERY = """
+FOR d IN @@collection
+  FILTER d._key IN @keys
+  RETURN d._key
+"""
+
+
+def split_document_id(value: Any) -> Optional[Tuple[str, str]]:
+    """Return (collection, key) for a "collection/key" string, else None."""
+    if not isinstance(value, str):
+        return None
+    collection, sep, key = value.partition("/")
+    if not sep or not collection or not key or "/" in key:
+        return None
+    return collection, key
+
+
+def default_reference_fields(document: Dict[str, Any]) -> List[str]:
+    """Top-level fields whose name ends with "_id" (other than _id itself)."""
+    return [f for f in document if f.endswith("_id") and f != "_id"]
+
+
+class ReferenceChecker:
+    """Validate the reference fields of document batches.
+
+    Safe to use from several worker threads at once (pipelined bulk inserts).
+    """
+
+    def __init__(self, db: Any, fields: Optional[Iterable[str]] = None):
+        """Initialize ReferenceChecker.
+
+        Args:
+            db: python-arango database
+            fields: Reference fields to check (default: each document's *_id fields)
+        """
+        self._db = db
+        self._fields = list(fields) if fields else None
+        self._existing: Set[str] = set()
+        self._collections: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+
+    def _references(self, document: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        fields = self._fields if self._fields is not None else default_reference_fields(document)
+        return [(f, document[f]) for f in fields if document.get(f) is not None]
+
+    def _has_collection(self, name: str) -> bool:
+        with self._lock:
+            known = self._collections.get(name)
+        if known is None:
+            known = bool(self._db.has_collection(name))
+            with self._lock:
+                self._collections[name] = known
+        return known
+
+    def _existing_ids(self, ids: Set[str]) -> Set[str]:
+        """Return the subset of ids that exist (one query per target collection)."""
+        with self._lock:
+            missing = ids - self._existing
+        by_collection: Dict[str, List[str]] = defaultdict(list)
+        for doc_id in missing:
+            collection, key = split_document_id(doc_id)
+            by_collection[collection].append(key)
+
+        found: Set[str] = set()
+        queries = 0
+        for collection, keys in by_collection.items():
+            if not self._has_collection(collection):
+                continue
+            cursor = self._db.aql.execute(
+                tag_query(_EXISTING_KEYS_QUERY),
+                bind_vars={"@collection": collection, "keys": keys},
+            )
+            queries += 1
+            found.update(f"{collection}/{key}" for key in cursor)
+        with self._lock:
+            self.lookups += queries
+            self._existing |= found
+            return {i for i in ids if i in self._existing}
+
+    def check(self, documents: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        """Check a batch of documents.
+
+        Returns:
+            Offset in the batch -> invalid references ({field, value}) for
+            every document with at least one invalid reference
+        """
+        refs = [self._references(doc) for doc in documents]
+        ids = {value for doc_refs in refs for _, value in doc_refs if split_document_id(value)}
+        existing = self._existing_ids(ids) if ids else set()
+        invalid: Dict[int, List[Dict[str, Any]]] = {}
+        for offset, doc_refs in enumerate(refs):
+            bad = [
+                {"field": f, "value": v}
+                for f, v in doc_refs
+                if not isinstance(v, str) or v not in existing
+            ]
+            if bad:
+                invalid[offset] = bad
+        return invalid
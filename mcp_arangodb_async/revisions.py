@@ -0,0 +1,232 @@
+"""
+ArangoDB MCP Server - Revision Manifests for Incremental Backups
+
+An incremental backup exports only the documents whose _rev changed since a
+previous backup (its base), plus tombstones for the keys deleted since then.
+To know what changed, every backup that can serve as a base records the
+_key -> _rev map of each collection in a small SQLite file next to the
+collection's backup file (<name>.revisions.sqlite). Keys are the table's
+primary key (WITHOUT ROWID, so the table is a sorted B-tree), and diffing two
+manifests is a pair of indexed joins run inside SQLite rather than Python
+dictionaries, so millions of keys diff in seconds with flat memory.
+
+Revisions are scanned before the documents are exported: a document changed in
+between is then exported with a newer _rev than recorded and simply exported
+again by the next increment, while the reverse order could miss a change.
+
+Each backup directory holds a chain manifest (backup_chain.json) naming its
+base directory; a restore replays the chain from the full backup through
+every increment.
+
+Functions:
+- revisions_path() - Path of a collection's revision manifest in a backup directory
+- scan_revisions() - Record the current _key -> _rev map of a collection
+- diff_revisions() - Record changed and deleted keys against a base manifest
+- iter_changed_keys() - Keys to export for an increment, in chunks
+- iter_deleted_keys() - Tombstoned keys of an increment, in chunks
+- write_backup_chain() - Write a backup directory's chain manifest
+- read_backup_chain() - Backup directories to replay, from the full backup to the given one
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from .query_tracker import tag_query
+
+REVISIONS_SUFFIX = ".revisions.sqlite"
+CHAIN_MANIFEST = "backup_chain.json"
+
+# Keys per cursor batch / SQLite insert and per export or delete chunk
+REVISION_BATCH_SIZE = 10_000
+
+_REVISIONS_QUERY = """
+FOR doc IN @@collection
+  RETURN [doc._key, doc._rev]
+"""
+
+_SCHEMA = """
+CREATE TABLE revs (key TEXT PRIMARY KEY, rev TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE changed (key TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE deleted (key TEXT PRIMARY KEY) WITHOUT ROWID;
+"""
+
+
+def revisions_path(directory: str, collection_name: str) -> str:
+    """Return the revision manifest path of a collection ("<dir>/users.revisions.sqlite")."""
+    return os.path.join(directory, f"{collection_name}{REVISIONS_SUFFIX}")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    # The manifest is rebuilt from scratch if a backup fails; no journal needed
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    return conn
+
+
+def scan_revisions(db: Any, collection_name: str, path: str) -> int:
+    """Record the current _key -> _rev map of a collection in a new manifest.
+
+    Reads (_key, _rev) pairs through a streaming cursor, so neither the
+    server nor this process holds the whole map. An existing file at path is
+    replaced.
+
+    Returns:
+        Number of keys recorded
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    cursor = db.aql.execute(
+        tag_query(_REVISIONS_QUERY),
+        bind_vars={"@collection": collection_name},
+        batch_size=REVISION_BATCH_SIZE,
+        stream=True,
+    )
+    conn = _connect(path)
+    count = 0
+    try:
+        conn.executescript(_SCHEMA)
+        batch: List[Any] = []
+        for pair in cursor:
+            batch.append(pair)
+            if len(batch) >= REVISION_BATCH_SIZE:
+                conn.executemany("INSERT OR REPLACE INTO revs VALUES (?, ?)", batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.executemany("INSERT OR REPLACE INTO revs VALUES (?, ?)", batch)
+            count += len(batch)
+        conn.commit()
+    finally:
+        conn.close()
+        if hasattr(cursor, "close"):
+            try:
+                cursor.close()
+            except Exception:
+                pass  # Ignore cleanup errors
+    return count
+
+
+def diff_revisions(path: str, base_path: Optional[str]) -> Dict[str, int]:
+    """Record the keys changed and deleted since a base manifest.
+
+    Keys whose _rev differs from the base, or that the base does not know,
+    are stored as changed; keys of the base that no longer exist are stored as
+    deleted (tombstones). Without a base manifest every key is changed.
+
+    Returns:
+        {changed, deleted} key counts
+    """
+    conn = _connect(path)
+    try:
+        if base_path is None or not os.path.exists(base_path):
+            conn.execute("INSERT INTO changed SELECT key FROM revs")
+            conn.commit()
+        else:
+            conn.execute("ATTACH DATABASE ? AS base", (base_path,))
+            conn.execute(
+                "INSERT INTO changed SELECT r.key FROM revs r "
+                "LEFT JOIN base.revs b ON b.key = r.key "
+                "WHERE b.rev IS NULL OR b.rev != r.rev"
+            )
+            conn.execute(
+                "INSERT INTO deleted SELECT b.key FROM base.revs b "
+                "WHERE NOT EXISTS (SELECT 1 FROM revs r WHERE r.key = b.key)"
+            )
+            # Commit before detaching (a database cannot be detached mid-transaction)
+            conn.commit()
+            conn.execute("DETACH DATABASE base")
+        return {
+            "changed": conn.execute("SELECT COUNT(*) FROM changed").fetchone()[0],
+            "deleted": conn.execute("SELECT COUNT(*) FROM deleted").fetchone()[0],
+        }
+    finally:
+        conn.close()
+
+
+def _iter_keys(path: str, table: str, chunk_size: int) -> Iterator[List[str]]:
+    conn = _connect(path)
+    try:
+        rows = conn.execute(f"SELECT key FROM {table}")
+        while True:
+            chunk = [row[0] for row in rows.fetchmany(chunk_size)]
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        conn.close()
+
+
+def iter_changed_keys(path: str, chunk_size: int = REVISION_BATCH_SIZE) -> Iterator[List[str]]:
+    """Yield the keys to export for an increment, chunk_size at a time."""
+    return _iter_keys(path, "changed", chunk_size)
+
+
+def iter_deleted_keys(path: str, chunk_size: int = REVISION_BATCH_SIZE) -> Iterator[List[str]]:
+    """Yield the keys deleted since the base backup, chunk_size at a time.
+
+    Manifests without tombstones (full backups, missing files) yield nothing.
+    """
+    if not os.path.exists(path):
+        return iter(())
+    return _iter_keys(path, "deleted", chunk_size)
+
+
+def write_backup_chain(
+    directory: str, base_dir: Optional[str], collections: Dict[str, Dict[str, Any]]
+) -> str:
+    """Write the chain manifest of a backup directory.
+
+    Args:
+        directory: Backup directory
+        base_dir: Directory of the base backup (None for a full backup)
+        collections: Per collection counters ({count, deleted})
+
+    Returns:
+        Path of the manifest
+    """
+    path = os.path.join(directory, CHAIN_MANIFEST)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "type": "full" if base_dir is None else "incremental",
+                "base": base_dir,
+                "created": datetime.now().isoformat(),
+                "collections": collections,
+            },
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+    return path
+
+
+def read_backup_chain(directory: str) -> List[str]:
+    """Return the backup directories to replay, from the full backup to directory.
+
+    A directory without a chain manifest is a plain full backup.
+
+    Raises:
+        ValueError: If a base directory is missing or the chain loops
+    """
+    chain = [os.path.abspath(directory)]
+    while True:
+        path = os.path.join(chain[-1], CHAIN_MANIFEST)
+        if not os.path.exists(path):
+            break
+        with open(path, "r", encoding="utf-8") as f:
+            base = json.load(f).get("base")
+        if base is None:
+            break
+        base = os.path.abspath(base)
+        if base in chain:
+            raise ValueError(f"Backup chain loops back to '{base}'")
+        if not os.path.isdir(base):
+            raise ValueError(f"Base backup '{base}' of '{chain[-1]}' does not exist")
+        chain.append(base)
+    return list(reversed(chain))
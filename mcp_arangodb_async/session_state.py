@@ -1,13 +1,17 @@
 """Session state management for multi-tenancy support.
 
 This module provides per-session state isolation for focused database context,
-active workflow, tool lifecycle stage, and tool usage tracking.
+active workflow, tool lifecycle stage, tool usage tracking, open query cursors,
+and running AQL queries.
 """
 
 import asyncio
 from datetime import datetime
 from typing import Dict, Optional, Any
 
+from .cursor_registry import CursorRegistry
+from .query_tracker import QueryTracker
+
 
 class SessionState:
     """Manages per-session state for multi-database workflows.
@@ -24,6 +28,10 @@ class SessionState:
         self._active_workflow: Dict[str, str] = {}
         self._tool_lifecycle_stage: Dict[str, str] = {}
         self._tool_usage_stats: Dict[str, Dict[str, Any]] = {}
+        # Open arango_query cursors, scoped per session
+        self.cursors = CursorRegistry()
+        # Running tool calls whose AQL queries are killed on cancellation
+        self.queries = QueryTracker()
         self._lock = asyncio.Lock()
 
     def initialize_session(self, session_id: str) -> None:
@@ -154,6 +162,8 @@ class SessionState:
         self._active_workflow.pop(session_id, None)
         self._tool_lifecycle_stage.pop(session_id, None)
         self._tool_usage_stats.pop(session_id, None)
+        self.cursors.close_session(session_id)
+        self.queries.close_session(session_id)
 
     def cleanup_all(self) -> None:
         """Clean up all session state."""
@@ -161,4 +171,6 @@ class SessionState:
         self._active_workflow.clear()
         self._tool_lifecycle_stage.clear()
         self._tool_usage_stats.clear()
+        self.cursors.close_all()
+        self.queries.close_all()
 
@@ -0,0 +1,202 @@
+"""
+ArangoDB MCP Server - Tool Catalog Cache
+
+Building a tool's JSON schema with ``model_json_schema()`` costs about a
+millisecond, and ``tools/list`` used to rebuild all of them on every request.
+ToolCatalog builds each schema and ``types.Tool`` once (lazily, on first use)
+and reuses them until the tool's registration changes. Tool lists and their
+serialized JSON are cached per requested tool subset (the full registry, a
+workflow context or a category).
+
+Schemas can also be persisted to disk so cold starts skip schema generation:
+set MCP_TOOL_CATALOG_CACHE_DIR to a writable directory. The cache file is keyed
+by package version, and each entry by a fingerprint of the tool's description
+and model fields, so stale entries are rebuilt rather than served.
+
+Classes:
+- ToolCatalog - Lazily built, registry-aware cache of tool schemas and lists
+
+Functions:
+- get_tool_catalog() - Process-wide catalog for TOOL_REGISTRY
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import mcp.types as types
+
+from .tool_registry import TOOL_REGISTRY, ToolRegistration
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "MCP_TOOL_CATALOG_CACHE_DIR"
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("mcp-arangodb-async")
+    except Exception:
+        return "unknown"
+
+
+def _fingerprint(reg: ToolRegistration) -> str:
+    """Fingerprint of everything a tool's listing is derived from."""
+    model = reg.model
+    fields = sorted((name, repr(info)) for name, info in model.model_fields.items())
+    text = f"{reg.name}\0{reg.description}\0{model.__module__}.{model.__qualname__}\0{fields}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class ToolCatalog:
+    """Cache of tool schemas, ``types.Tool`` objects and serialized tool lists.
+
+    Entries are validated against the registration object they were built from,
+    so replacing or adding a registration transparently rebuilds what changed.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[Dict[str, ToolRegistration]] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        """Initialize ToolCatalog.
+
+        Args:
+            registry: Registry to list (defaults to TOOL_REGISTRY)
+            cache_dir: Directory for the on-disk schema cache (None disables it)
+        """
+        self._registry = TOOL_REGISTRY if registry is None else registry
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        # name -> (registration, schema, Tool)
+        self._entries: Dict[str, Tuple[ToolRegistration, Dict[str, Any], types.Tool]] = {}
+        # subset key -> (registrations, tools, serialized JSON)
+        self._lists: Dict[Optional[Tuple[str, ...]], Tuple[tuple, List[types.Tool], bytes]] = {}
+        self._disk: Optional[Dict[str, Any]] = None
+        self._disk_dirty = False
+
+    # -- on-disk cache ---------------------------------------------------
+
+    def _cache_path(self) -> Optional[str]:
+        if not self._cache_dir:
+            return None
+        return os.path.join(self._cache_dir, f"tool-catalog-{_package_version()}.json")
+
+    def _load_disk(self) -> Dict[str, Any]:
+        if self._disk is None:
+            self._disk = {}
+            path = self._cache_path()
+            if path and os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        self._disk = json.load(f).get("tools", {})
+                except (OSError, ValueError, AttributeError):
+                    logger.debug("Ignoring unreadable tool catalog cache %s", path, exc_info=True)
+        return self._disk
+
+    def save(self) -> None:
+        """Write newly built schemas to the on-disk cache (no-op when disabled)."""
+        path = self._cache_path()
+        with self._lock:
+            if not path or not self._disk_dirty:
+                return
+            payload = json.dumps({"version": _package_version(), "tools": self._disk})
+            self._disk_dirty = False
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            logger.warning("Could not write tool catalog cache %s", path, exc_info=True)
+
+    # -- lookups ---------------------------------------------------------
+
+    def _entry(self, reg: ToolRegistration) -> Tuple[ToolRegistration, Dict[str, Any], types.Tool]:
+        entry = self._entries.get(reg.name)
+        if entry is not None and entry[0] is reg:
+            return entry
+
+        schema = None
+        if self._cache_dir:
+            fingerprint = _fingerprint(reg)
+            cached = self._load_disk().get(reg.name)
+            if cached and cached.get("fingerprint") == fingerprint:
+                schema = cached["schema"]
+        if schema is None:
+            schema = reg.model.model_json_schema()
+            if self._cache_dir:
+                self._disk[reg.name] = {"fingerprint": fingerprint, "schema": schema}
+                self._disk_dirty = True
+
+        entry = (
+            reg,
+            schema,
+            types.Tool(name=reg.name, description=reg.description, inputSchema=schema),
+        )
+        self._entries[reg.name] = entry
+        return entry
+
+    def schema(self, name: str) -> Dict[str, Any]:
+        """Return the (shared, do-not-mutate) input schema of a registered tool.
+
+        Raises:
+            KeyError: If the tool is not registered
+        """
+        reg = self._registry[name]
+        with self._lock:
+            return self._entry(reg)[1]
+
+    def _list(self, names: Optional[Sequence[str]]) -> Tuple[tuple, List[types.Tool], bytes]:
+        key = None if names is None else tuple(names)
+        if key is None:
+            regs = tuple(self._registry.values())
+        else:
+            regs = tuple(self._registry[n] for n in key if n in self._registry)
+        cached = self._lists.get(key)
+        if cached is not None and cached[0] == regs:
+            return cached
+
+        with self._lock:
+            tools = [self._entry(reg)[2] for reg in regs]
+            serialized = json.dumps(
+                [t.model_dump(mode="json", exclude_none=True) for t in tools],
+                ensure_ascii=False,
+            ).encode("utf-8")
+            cached = (regs, tools, serialized)
+            self._lists[key] = cached
+        if self._disk_dirty:
+            self.save()
+        return cached
+
+    def tools(self, names: Optional[Sequence[str]] = None) -> List[types.Tool]:
+        """Return ``types.Tool`` objects for all tools, or the named subset in order.
+
+        Unregistered names are skipped. The returned list is a fresh copy; the
+        Tool objects are shared.
+        """
+        return list(self._list(names)[1])
+
+    def serialized(self, names: Optional[Sequence[str]] = None) -> bytes:
+        """Return the JSON-encoded tool list for all tools or the named subset."""
+        return self._list(names)[2]
+
+
+_CATALOG: Optional[ToolCatalog] = None
+
+
+def get_tool_catalog() -> ToolCatalog:
+    """Return the process-wide catalog of TOOL_REGISTRY."""
+    global _CATALOG
+    if _CATALOG is None:
+        _CATALOG = ToolCatalog(cache_dir=os.getenv(CACHE_DIR_ENV) or None)
+    return _CATALOG
@@ -7,8 +7,11 @@ with a single source of truth for tool definitions.
 
 Key Components:
 - ToolRegistration: Dataclass holding tool metadata (name, description, model, handler)
+- DispatchPlan: Per-tool call plan (calling convention, async flag, argument
+  validator, DB requirement) computed once at registration instead of per call
 - TOOL_REGISTRY: Global dictionary mapping tool names to ToolRegistration objects
 - register_tool(): Decorator for registering tools with duplicate detection
+- register_async_handler(): Decorator attaching a native-async variant to a tool
 
 Usage:
     from .tool_registry import TOOL_REGISTRY, ToolRegistration
@@ -31,14 +34,70 @@ Usage:
         ...
 """
 
-from dataclasses import dataclass
-from typing import Callable, Dict, Type
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 from pydantic import BaseModel
+import asyncio
+import inspect
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def inspect_handler(handler: Callable) -> Tuple[bool, bool]:
+    """Determine a handler's calling convention.
+
+    Returns:
+        (pass_kwargs, is_async) - pass_kwargs is True for handlers declaring
+        **kwargs (called as handler(db, **args), used by test doubles); all other
+        handlers are called as handler(db, args)
+    """
+    pass_kwargs = any(
+        p.kind == inspect.Parameter.VAR_KEYWORD
+        for p in inspect.signature(handler).parameters.values()
+    )
+    return pass_kwargs, asyncio.iscoroutinefunction(handler)
+
+
+def build_args_validator(model: Type[BaseModel]) -> Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]:
+    """Build a function validating raw tool arguments into a plain dict.
+
+    Equivalent to ``model(**arguments).model_dump(exclude_none=True)``, but bound
+    directly to the model's compiled pydantic-core validator and serializer so no
+    model-level dispatch happens per call. Raises pydantic.ValidationError.
+    """
+    if not model.__pydantic_complete__:
+        model.model_rebuild()
+    validate_python = model.__pydantic_validator__.validate_python
+    to_python = model.__pydantic_serializer__.to_python
+
+    def validate(arguments: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return to_python(validate_python(arguments or {}), exclude_none=True)
+
+    return validate
+
+
+@dataclass(frozen=True)
+class DispatchPlan:
+    """Everything call_tool() needs to dispatch a tool, computed once.
+
+    Attributes:
+        handler: Handler the plan was built for
+        model: Argument model the plan was built for
+        pass_kwargs: Call as handler(db, **args) instead of handler(db, args)
+        is_async: Handler is a coroutine function (awaited on the event loop)
+        needs_db: Tool talks to ArangoDB; False skips database resolution and
+            connection setup (discovery, workflow and multi-tenancy tools)
+        validate: Argument validator (see build_args_validator())
+    """
+    handler: Callable
+    model: Type[BaseModel]
+    pass_kwargs: bool
+    is_async: bool
+    needs_db: bool
+    validate: Callable[[Optional[Dict[str, Any]]], Dict[str, Any]]
+
+
 @dataclass
 class ToolRegistration:
     """Metadata for a registered MCP tool.
@@ -48,11 +107,39 @@ class ToolRegistration:
         description: Human-readable description for MCP clients
         model: Pydantic model class for argument validation
         handler: Handler function that executes the tool logic (stored as reference for Phase 1)
+        async_handler: Optional coroutine variant taking an AsyncDatabase, used for
+            databases configured with the native async (httpx) driver
+        needs_db: Whether the tool needs a database connection
     """
     name: str
     description: str
     model: Type[BaseModel]
     handler: Callable
+    async_handler: Optional[Callable] = None
+    needs_db: bool = True
+    _plan: Optional[DispatchPlan] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def plan(self) -> DispatchPlan:
+        """Dispatch plan for the current handler (rebuilt if the handler was replaced)."""
+        plan = self._plan
+        if (
+            plan is None
+            or plan.handler is not self.handler
+            or plan.model is not self.model
+            or plan.needs_db is not self.needs_db
+        ):
+            pass_kwargs, is_async = inspect_handler(self.handler)
+            plan = DispatchPlan(
+                handler=self.handler,
+                model=self.model,
+                pass_kwargs=pass_kwargs,
+                is_async=is_async,
+                needs_db=self.needs_db,
+                validate=build_args_validator(self.model),
+            )
+            self._plan = plan
+        return plan
 
     def get_handler(self) -> Callable:
         """Get the handler function.
@@ -75,6 +162,7 @@ def register_tool(
     name: str,
     description: str,
     model: Type[BaseModel],
+    needs_db: bool = True,
 ) -> Callable:
     """Decorator to register a tool handler with the MCP server.
     
@@ -86,6 +174,8 @@ def register_tool(
         name: Tool name (must be unique)
         description: Human-readable description
         model: Pydantic model for argument validation
+        needs_db: False for tools that never touch ArangoDB (their calls skip
+            database resolution and connection setup)
         
     Returns:
         Decorator function that registers the handler
@@ -113,13 +203,17 @@ def register_tool(
                 f"in module '{handler.__module__}'."
             )
         
-        # Register in global registry
-        TOOL_REGISTRY[name] = ToolRegistration(
+        # Register in global registry; build the dispatch plan eagerly so
+        # no signature inspection or validator setup happens per call
+        registration = ToolRegistration(
             name=name,
             description=description,
             model=model,
             handler=handler,
+            needs_db=needs_db,
         )
+        _ = registration.plan
+        TOOL_REGISTRY[name] = registration
         
         logger.debug(f"Registered tool: {name} -> {handler.__name__}")
         return handler
@@ -127,6 +221,42 @@ def register_tool(
     return decorator
 
 
+def register_async_handler(name: str) -> Callable:
+    """Decorator to attach a native-async handler variant to a registered tool.
+
+    The variant has the same contract as the tool's handler but receives an
+    AsyncDatabase (see async_driver.py) instead of a python-arango StandardDatabase.
+    call_tool() dispatches to it when the target database uses the httpx driver.
+
+    Args:
+        name: Name of an already registered tool
+
+    Returns:
+        Decorator function that attaches the handler
+
+    Raises:
+        KeyError: If the tool is not registered
+        ValueError: If the tool already has an async handler
+        TypeError: If the handler is not a coroutine function
+    """
+    def decorator(handler: Callable) -> Callable:
+        if not asyncio.iscoroutinefunction(handler):
+            raise TypeError(f"Async handler for '{name}' must be a coroutine function")
+        if name not in TOOL_REGISTRY:
+            raise KeyError(f"Cannot attach async handler: tool '{name}' is not registered")
+        registration = TOOL_REGISTRY[name]
+        if registration.async_handler is not None:
+            raise ValueError(
+                f"Tool '{name}' already has async handler "
+                f"'{registration.async_handler.__name__}'"
+            )
+        registration.async_handler = handler
+        logger.debug(f"Registered async handler: {name} -> {handler.__name__}")
+        return handler
+
+    return decorator
+
+
 def validate_registry(expected_tools: list[str] | None = None) -> None:
     """Validate that all expected tools are registered.
     
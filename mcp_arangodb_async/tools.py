@@ -9,6 +9,7 @@ Constants by category:
 
 Core Data Tools:
     - ARANGO_QUERY
+    - ARANGO_QUERY_NEXT
     - ARANGO_LIST_COLLECTIONS
     - ARANGO_INSERT
     - ARANGO_UPDATE
@@ -26,7 +27,11 @@ Validation & Bulk Ops:
     - ARANGO_VALIDATE_REFERENCES
     - ARANGO_INSERT_WITH_VALIDATION
     - ARANGO_BULK_INSERT
+    - ARANGO_BULK_INSERT_FILE
     - ARANGO_BULK_UPDATE
+    - ARANGO_UPDATE_BY_FILTER
+    - ARANGO_REMOVE_BY_FILTER
+    - ARANGO_UPSERT_BY_FILTER
 
 Graph Tools:
     - ARANGO_CREATE_GRAPH
@@ -61,6 +66,7 @@ Multi-Tenancy Tools:
 
 # Tool name constants (to match the TS implementation semantics)
 ARANGO_QUERY = "arango_query"
+ARANGO_QUERY_NEXT = "arango_query_next"
 ARANGO_LIST_COLLECTIONS = "arango_list_collections"
 ARANGO_INSERT = "arango_insert"
 ARANGO_UPDATE = "arango_update"
@@ -74,7 +80,11 @@ ARANGO_EXPLAIN_QUERY = "arango_explain_query"
 ARANGO_VALIDATE_REFERENCES = "arango_validate_references"
 ARANGO_INSERT_WITH_VALIDATION = "arango_insert_with_validation"
 ARANGO_BULK_INSERT = "arango_bulk_insert"
+ARANGO_BULK_INSERT_FILE = "arango_bulk_insert_file"
 ARANGO_BULK_UPDATE = "arango_bulk_update"
+ARANGO_UPDATE_BY_FILTER = "arango_update_by_filter"
+ARANGO_REMOVE_BY_FILTER = "arango_remove_by_filter"
+ARANGO_UPSERT_BY_FILTER = "arango_upsert_by_filter"
 
 # Graph tools (Phase 2)
 ARANGO_CREATE_GRAPH = "arango_create_graph"
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Dispatch overhead micro-benchmark for the ArangoDB MCP server.
+
+Measures end-to-end call_tool() throughput (calls/sec) for cheap tools with an
+in-memory stand-in database, so the numbers reflect per-call dispatch work
+(argument validation, database resolution, handler invocation, JSON encoding)
+rather than ArangoDB latency.
+
+Usage:
+    python scripts/bench_dispatch.py                # default 20000 calls per tool
+    python scripts/bench_dispatch.py --calls 50000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_arangodb_async.entry import server  # noqa: E402
+from mcp_arangodb_async.multi_db_manager import DatabaseConfig  # noqa: E402
+from mcp_arangodb_async.session_state import SessionState  # noqa: E402
+
+
+class _StubDatabase:
+    """Answers the few python-arango calls the benchmarked tools make."""
+
+    def collections(self):
+        return [{"name": "users", "system": False}, {"name": "_graphs", "system": True}]
+
+
+class _StubManager:
+    """Connection manager returning the stub database for every key."""
+
+    def __init__(self, db):
+        self._db = db
+        self._config = DatabaseConfig(
+            url="http://localhost:8529", database="bench", username="root", password_env="P"
+        )
+
+    async def get_connection(self, key):
+        return None, self._db
+
+    async def get_async_database(self, key):
+        return None
+
+    def get_database_config(self, key):
+        return self._config
+
+    def get_configured_databases(self):
+        return {"bench": self._config}
+
+
+BENCHMARKS = [
+    ("arango_get_focused_database", {}),
+    ("arango_list_collections", {}),
+    ("arango_search_tools", {"keywords": ["query"], "detail_level": "name"}),
+]
+
+
+async def _run(calls: int) -> None:
+    db = _StubDatabase()
+    config_loader = SimpleNamespace(
+        default_database="bench", get_configured_databases=lambda: {"bench": None}
+    )
+    context = SimpleNamespace(
+        session=None,
+        lifespan_context={
+            "db": db,
+            "session_state": SessionState(),
+            "db_manager": _StubManager(db),
+            "config_loader": config_loader,
+        },
+    )
+    call_tool = server._handlers["call_tool"]
+
+    with patch.object(type(server), "request_context", context):
+        for name, args in BENCHMARKS:
+            for _ in range(min(1000, calls)):
+                await call_tool(name, args)
+            start = time.perf_counter()
+            for _ in range(calls):
+                await call_tool(name, args)
+            elapsed = time.perf_counter() - start
+            print(f"{name:32s} {calls / elapsed:10.0f} calls/sec  {elapsed / calls * 1e6:7.1f} us/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=20000, help="Calls per tool")
+    args = parser.parse_args()
+    asyncio.run(_run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
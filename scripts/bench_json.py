@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+JSON serialization benchmark for tool responses.
+
+Serializes synthetic query results (10k, 100k and 1M document rows by default)
+the way call_tool() does, with every installed backend of json_codec, and
+prints the time per result and throughput.
+
+Usage:
+    python scripts/bench_json.py
+    python scripts/bench_json.py --rows 10000 100000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mcp_arangodb_async import json_codec  # noqa: E402
+
+
+def make_rows(count: int, with_datetimes: bool = False) -> list:
+    """Build document-like rows resembling typical AQL results."""
+    base = datetime(2025, 1, 1)
+    rows = []
+    for i in range(count):
+        row = {
+            "_key": str(i),
+            "_id": f"users/{i}",
+            "_rev": f"_h{i:08x}",
+            "name": f"user-{i}",
+            "email": f"user{i}@example.com",
+            "age": 18 + i % 60,
+            "score": i * 0.37,
+            "active": i % 3 != 0,
+            "tags": ["alpha", "beta", "gamma"][: 1 + i % 3],
+            "address": {"city": "Zürich", "zip": f"{8000 + i % 100}"},
+        }
+        if with_datetimes:
+            row["created"] = base + timedelta(seconds=i)
+        rows.append(row)
+    return rows
+
+
+def bench(rows: list, backend: str, repeat: int) -> float:
+    json_codec.set_backend(backend)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json_codec.dumps(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (best is reported)")
+    args = parser.parse_args()
+
+    backends = ["stdlib"]
+    if json_codec.orjson is not None:
+        backends.append("orjson")
+    if json_codec.msgspec is not None:
+        backends.append("msgspec")
+
+    print(f"{'rows':>9} {'datetimes':>9} {'backend':>8} {'time':>10} {'rows/sec':>12} {'speedup':>8}")
+    for count in args.rows:
+        for with_datetimes in (False, True):
+            rows = make_rows(count, with_datetimes)
+            baseline = None
+            for backend in backends:
+                elapsed = bench(rows, backend, args.repeat)
+                baseline = baseline or elapsed
+                print(
+                    f"{count:>9} {str(with_datetimes):>9} {backend:>8} {elapsed * 1000:>8.1f}ms "
+                    f"{count / elapsed:>12.0f} {baseline / elapsed:>7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
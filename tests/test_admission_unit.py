@@ -0,0 +1,174 @@
+"""Unit tests for per-database admission control (admission.py)."""
+
+import asyncio
+import json
+import threading
+import pytest
+import yaml
+from unittest.mock import AsyncMock, Mock, patch
+
+from mcp_arangodb_async.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    DatabaseLimiter,
+)
+from mcp_arangodb_async.executor import ExecutorConfig, ToolExecutor, ToolTimeoutError
+from mcp_arangodb_async.multi_db_manager import DatabaseConfig
+
+
+def _config(**kwargs):
+    return DatabaseConfig(
+        url="http://arango:8529", database="d", username="root", password_env="P", **kwargs
+    )
+
+
+class TestDatabaseLimiter:
+    """Test slot accounting, queue bounds and fairness."""
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limit_then_queues(self):
+        """Test calls beyond max_in_flight wait until a slot frees up."""
+        limiter = DatabaseLimiter("db", max_in_flight=1)
+        await limiter.acquire("s1")
+        waiter = asyncio.create_task(limiter.acquire("s2"))
+        await asyncio.sleep(0)
+        assert limiter.queued == 1
+        assert not waiter.done()
+        limiter.release()
+        await waiter
+        assert limiter.in_flight == 1
+        assert limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_full_rejected(self):
+        """Test calls are rejected once the queue is full."""
+        limiter = DatabaseLimiter("db", max_in_flight=1, max_queue=1)
+        await limiter.acquire("s1")
+        waiter = asyncio.create_task(limiter.acquire("s1"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await limiter.acquire("s2")
+        assert exc_info.value.reason == "queue_full"
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        assert limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        """Test waiting calls time out and leave the queue."""
+        limiter = DatabaseLimiter("db", max_in_flight=1, queue_timeout=0.05)
+        await limiter.acquire("s1")
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await limiter.acquire("s2")
+        assert exc_info.value.reason == "queue_timeout"
+        assert limiter.queued == 0
+        assert limiter.get_metrics()["rejected_timeout"] == 1
+
+    @pytest.mark.asyncio
+    async def test_round_robin_across_sessions(self):
+        """Test a session with many queued calls does not starve another."""
+        limiter = DatabaseLimiter("db", max_in_flight=1)
+        await limiter.acquire("holder")
+        order = []
+
+        async def call(session):
+            await limiter.acquire(session)
+            order.append(session)
+            limiter.release()
+
+        tasks = [asyncio.create_task(call("noisy")) for _ in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("quiet")))
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*tasks)
+        assert order == ["noisy", "quiet", "noisy", "noisy"]
+        metrics = limiter.get_metrics()
+        assert metrics["admitted"] == 5
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_call_holds_slot_until_worker_finishes(self):
+        """Test a call timing out on the worker pool frees its slot only when its thread ends."""
+        controller = AdmissionController.from_configs({"db": _config(max_in_flight=1)})
+        limiter = controller.get_limiter("db")
+        executor = ToolExecutor(ExecutorConfig(max_workers=1, tool_timeouts={"slow": 0.05}))
+        release = threading.Event()
+        try:
+            with pytest.raises(ToolTimeoutError):
+                async with controller.admit("db", "s1"):
+                    await executor.run("slow", release.wait, 5)
+            assert limiter.in_flight == 1
+            assert limiter.get_metrics()["held_after_timeout"] == 1
+
+            release.set()
+            for _ in range(100):
+                if limiter.in_flight == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert limiter.in_flight == 0
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+
+
+class TestAdmissionConfig:
+    """Test configuration and call_tool integration."""
+
+    def test_invalid_limits_rejected(self):
+        """Test invalid admission settings are rejected."""
+        with pytest.raises(ValueError):
+            _config(max_in_flight=0)
+        with pytest.raises(ValueError):
+            _config(max_in_flight=2, queue_timeout=0)
+
+    def test_limits_round_trip_through_yaml(self, tmp_path):
+        """Test admission settings are saved to and loaded from databases.yaml."""
+        from mcp_arangodb_async.config_loader import ConfigFileLoader
+
+        path = str(tmp_path / "databases.yaml")
+        loader = ConfigFileLoader(path)
+        loader.add_database("shared", _config(max_in_flight=4, max_queue=20, queue_timeout=5.0))
+        loader.add_database("free", _config())
+        loader.save_to_yaml()
+
+        with open(path) as f:
+            raw = yaml.safe_load(f)
+        assert raw["databases"]["shared"]["max_in_flight"] == 4
+        assert "max_in_flight" not in raw["databases"]["free"]
+
+        reloaded = ConfigFileLoader(path)
+        reloaded.load()
+        controller = AdmissionController.from_configs(reloaded.get_configured_databases())
+        assert controller.get_limiter("free") is None
+        assert controller.get_limiter("shared").max_queue == 20
+
+    @pytest.mark.asyncio
+    async def test_call_tool_reports_database_busy(self):
+        """Test saturated databases reject tool calls with DatabaseBusy."""
+        from mcp_arangodb_async.entry import server
+        from mcp_arangodb_async.session_state import SessionState
+
+        controller = AdmissionController.from_configs(
+            {"main": _config(max_in_flight=1, max_queue=0)}
+        )
+        await controller.get_limiter("main").acquire("other")
+
+        db_manager = Mock()
+        db_manager.get_connection = AsyncMock(return_value=(Mock(), Mock()))
+        db_manager.get_async_database = AsyncMock(return_value=None)
+        config_loader = Mock()
+        config_loader.default_database = "main"
+        with patch.object(server, "request_context") as mock_ctx:
+            mock_ctx.lifespan_context = {
+                "db": Mock(),
+                "session_state": SessionState(),
+                "db_manager": db_manager,
+                "config_loader": config_loader,
+                "admission": controller,
+            }
+            result = await server._handlers["call_tool"]("arango_query", {"query": "RETURN 1"})
+        data = json.loads(result[0].text)
+        assert data["type"] == "DatabaseBusy"
+        assert data["database"] == "main"
+        assert data["reason"] == "queue_full"
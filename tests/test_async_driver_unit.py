@@ -0,0 +1,320 @@
+"""Unit tests for the native async ArangoDB driver (async_driver.py)."""
+
+import asyncio
+import json
+import time
+import pytest
+import httpx
+import yaml
+from unittest.mock import Mock, patch, AsyncMock
+
+from arango.exceptions import ArangoError
+from mcp_arangodb_async.async_driver import (
+    AsyncArangoClient,
+    AsyncArangoServerError,
+)
+from mcp_arangodb_async.multi_db_manager import (
+    DatabaseConfig,
+    MultiDatabaseConnectionManager,
+)
+
+
+class FakeArangoServer:
+    """Minimal in-memory ArangoDB REST API served through httpx.MockTransport."""
+
+    def __init__(self, rows=None, batch_size=2, delay=0.0):
+        self.rows = rows if rows is not None else [1, 2, 3, 4, 5]
+        self.batch_size = batch_size
+        self.delay = delay
+        self.requests = []
+        self.docs = {"users": {"1": {"_key": "1", "_id": "users/1", "_rev": "r1"}}}
+
+    def _json(self, status, body):
+        return httpx.Response(status, json=body)
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        path = request.url.path.removeprefix("/_db/testdb")
+        method = request.method
+
+        if path == "/_api/version":
+            return self._json(200, {"server": "arango", "version": "3.11.0"})
+        if path == "/_api/collection" and method == "GET":
+            return self._json(200, {"result": [
+                {"id": "1", "name": "users", "isSystem": False, "type": 2, "status": 3},
+                {"id": "2", "name": "_graphs", "isSystem": True, "type": 2, "status": 3},
+            ]})
+        if path.startswith("/_api/collection/"):
+            name = path.split("/")[3]
+            if name not in self.docs:
+                return self._json(404, {"error": True, "errorNum": 1203,
+                                        "errorMessage": "collection or view not found"})
+            return self._json(200, {"name": name, "type": 2})
+        if path == "/_api/cursor" and method == "POST":
+            body = json.loads(request.content)
+            size = body.get("batchSize", self.batch_size)
+            first = self.rows[:size]
+            has_more = len(self.rows) > size
+            self._remaining = self.rows[size:]
+            return self._json(201, {"result": first, "hasMore": has_more,
+                                    "id": "c1" if has_more else None})
+        if path == "/_api/cursor/c1" and method == "PUT":
+            batch = self._remaining[:self.batch_size]
+            self._remaining = self._remaining[self.batch_size:]
+            return self._json(200, {"result": batch, "hasMore": bool(self._remaining), "id": "c1"})
+        if path == "/_api/cursor/c1" and method == "DELETE":
+            return self._json(202, {})
+        if path == "/_api/document/users" and method == "POST":
+            body = json.loads(request.content)
+            if isinstance(body, list):
+                return self._json(202, [
+                    {"_key": "a", "_id": "users/a", "_rev": "r"},
+                    {"error": True, "errorNum": 1210, "errorMessage": "unique constraint violated"},
+                ])
+            return self._json(201, {"_key": "new", "_id": "users/new", "_rev": "r2"})
+        if path == "/_api/document/users/missing":
+            return self._json(404, {"error": True, "errorNum": 1202,
+                                    "errorMessage": "document not found"})
+        if path == "/_api/gharial/g":
+            return self._json(200, {"graph": {
+                "_id": "_graphs/g", "_key": "g", "_rev": "x", "name": "g",
+                "edgeDefinitions": [{"collection": "knows", "from": ["users"], "to": ["users"]}],
+                "orphanCollections": [],
+            }})
+        if path == "/_api/explain":
+            return self._json(200, {"plan": {"nodes": []}, "warnings": [], "stats": {"plansCreated": 1}})
+        return self._json(404, {"error": True, "errorNum": 404, "errorMessage": "unknown path"})
+
+
+def make_db(server):
+    client = AsyncArangoClient("http://arango:8529", transport=httpx.MockTransport(server))
+    return client, client.db("testdb", username="root", password="pw")
+
+
+class TestAsyncDriver:
+    """Test the REST subset implemented by the async driver."""
+
+    @pytest.mark.asyncio
+    async def test_version_and_basic_auth(self):
+        """Test requests are database-scoped and authenticated."""
+        seen = {}
+
+        async def handler(request):
+            seen["auth"] = request.headers.get("authorization")
+            seen["path"] = request.url.path
+            return httpx.Response(200, json={"version": "3.11.0"})
+
+        client = AsyncArangoClient("http://arango:8529", transport=httpx.MockTransport(handler))
+        db = client.db("testdb", username="root", password="pw")
+        assert await db.version() == "3.11.0"
+        assert seen["path"] == "/_db/testdb/_api/version"
+        assert seen["auth"].startswith("Basic ")
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cursor_fetches_batches_lazily(self):
+        """Test the cursor iterates across server batches."""
+        server = FakeArangoServer(rows=[1, 2, 3, 4, 5], batch_size=2)
+        client, db = make_db(server)
+        cursor = await db.aql.execute("FOR x IN 1..5 RETURN x")
+        assert await cursor.to_list() == [1, 2, 3, 4, 5]
+        assert server.requests.count(("PUT", "/_db/testdb/_api/cursor/c1")) == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cursor_close_deletes_unread_cursor(self):
+        """Test closing a partially read cursor deletes it on the server."""
+        server = FakeArangoServer(rows=[1, 2, 3, 4, 5], batch_size=2)
+        client, db = make_db(server)
+        cursor = await db.aql.execute("FOR x IN 1..5 RETURN x")
+        assert await cursor.__anext__() == 1
+        await cursor.close()
+        assert ("DELETE", "/_db/testdb/_api/cursor/c1") in server.requests
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_server_errors_are_arango_errors(self):
+        """Test error responses raise an ArangoError subclass with codes."""
+        client, db = make_db(FakeArangoServer())
+        with pytest.raises(AsyncArangoServerError) as exc_info:
+            await db.request("GET", "/_api/nope")
+        assert isinstance(exc_info.value, ArangoError)
+        assert exc_info.value.http_code == 404
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_non_json_error_bodies_are_arango_errors(self):
+        """Test proxy error pages (HTML, plain text) raise with the HTTP status."""
+        responses = iter([
+            httpx.Response(502, text="<html><body>Bad Gateway</body></html>"),
+            httpx.Response(503, text="Service Unavailable"),
+        ])
+        transport = httpx.MockTransport(lambda request: next(responses))
+        client = AsyncArangoClient("http://arango:8529", transport=transport)
+        db = client.db("testdb")
+        for http_code, reason in ((502, "Bad Gateway"), (503, "Service Unavailable")):
+            with pytest.raises(AsyncArangoServerError) as exc_info:
+                await db.version()
+            assert exc_info.value.http_code == http_code
+            assert exc_info.value.error_message == reason
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_collection_and_document_lookups(self):
+        """Test existence checks map not-found errors to False/None."""
+        client, db = make_db(FakeArangoServer())
+        assert await db.has_collection("users") is True
+        assert await db.has_collection("ghosts") is False
+        assert await db.collection("users").get("missing") is None
+        names = [c["name"] for c in await db.collections() if not c["isSystem"]]
+        assert names == ["users"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_insert_many_reports_per_document_errors(self):
+        """Test rejected documents are returned as exceptions in place."""
+        client, db = make_db(FakeArangoServer())
+        results = await db.collection("users").insert_many([{"a": 1}, {"a": 2}])
+        assert results[0]["_id"] == "users/a"
+        assert isinstance(results[1], AsyncArangoServerError)
+        assert results[1].error_code == 1210
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_graph_properties_snake_case(self):
+        """Test graph properties use python-arango's snake_case shape."""
+        client, db = make_db(FakeArangoServer())
+        props = await db.graph("g").properties()
+        assert props["name"] == "g"
+        assert props["edge_definitions"] == [{
+            "edge_collection": "knows",
+            "from_vertex_collections": ["users"],
+            "to_vertex_collections": ["users"],
+        }]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_overlap(self):
+        """Test concurrent queries overlap their I/O on the event loop."""
+        server = FakeArangoServer(rows=[1], delay=0.2)
+        client, db = make_db(server)
+
+        async def run_query():
+            cursor = await db.aql.execute("RETURN 1")
+            return await cursor.to_list()
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*[run_query() for _ in range(5)])
+        elapsed = time.perf_counter() - start
+        assert results == [[1]] * 5
+        assert elapsed < 0.6
+        await client.close()
+
+
+class TestAsyncDriverSelection:
+    """Test per-database driver selection and dispatch."""
+
+    def _config(self, driver):
+        return DatabaseConfig(
+            url="http://arango:8529",
+            database="testdb",
+            username="root",
+            password_env="TEST_PASSWORD",
+            driver=driver,
+        )
+
+    def test_invalid_driver_rejected(self):
+        """Test unknown driver names are rejected."""
+        with pytest.raises(ValueError):
+            self._config("aiohttp")
+
+    def test_driver_round_trips_through_yaml(self, tmp_path):
+        """Test driver settings are saved and loaded from databases.yaml."""
+        from mcp_arangodb_async.config_loader import ConfigFileLoader
+
+        path = str(tmp_path / "databases.yaml")
+        loader = ConfigFileLoader(path)
+        loader.add_database("fast", self._config("httpx"))
+        loader.add_database("classic", self._config("python-arango"))
+        loader.save_to_yaml()
+
+        with open(path) as f:
+            raw = yaml.safe_load(f)
+        assert raw["databases"]["fast"]["driver"] == "httpx"
+        assert "driver" not in raw["databases"]["classic"]
+
+        reloaded = ConfigFileLoader(path)
+        reloaded.load()
+        assert reloaded.get_configured_databases()["fast"].driver == "httpx"
+
+    @pytest.mark.asyncio
+    async def test_get_async_database_only_for_httpx(self):
+        """Test async handles are pooled and only created for httpx databases."""
+        manager = MultiDatabaseConnectionManager()
+        manager.register_database("fast", self._config("httpx"))
+        manager.register_database("classic", self._config("python-arango"))
+
+        first = await manager.get_async_database("fast")
+        assert first is not None
+        assert await manager.get_async_database("fast") is first
+        assert await manager.get_async_database("classic") is None
+        with pytest.raises(KeyError):
+            await manager.get_async_database("unknown")
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_call_tool_dispatches_async_variant(self):
+        """Test call_tool runs the async variant for httpx databases."""
+        from mcp_arangodb_async.entry import server
+        from mcp_arangodb_async.session_state import SessionState
+
+        client, async_db = make_db(FakeArangoServer(rows=[7, 8], batch_size=1))
+        sync_db = Mock()
+        db_manager = Mock()
+        db_manager.get_connection = AsyncMock(return_value=(Mock(), sync_db))
+        db_manager.get_async_database = AsyncMock(return_value=async_db)
+        config_loader = Mock()
+        config_loader.default_database = "fast"
+
+        try:
+            with patch.object(server, "request_context") as mock_ctx:
+                mock_ctx.lifespan_context = {
+                    "db": sync_db,
+                    "session_state": SessionState(),
+                    "db_manager": db_manager,
+                    "config_loader": config_loader,
+                }
+                result = await server._handlers["call_tool"](
+                    "arango_query", {"query": "RETURN 1"}
+                )
+            assert json.loads(result[0].text) == [7, 8]
+            sync_db.aql.execute.assert_not_called()
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_paged_query_with_async_cursor(self):
+        """Test arango_query paging works with async driver cursors."""
+        from mcp_arangodb_async.async_handlers import handle_arango_query_async
+        from mcp_arangodb_async.handlers import handle_query_next
+        from mcp_arangodb_async.session_state import SessionState
+
+        client, async_db = make_db(FakeArangoServer(rows=[1, 2, 3, 4, 5], batch_size=2))
+        state = SessionState()
+        ctx = {"session_state": state, "session_id": "s1"}
+        try:
+            page = await handle_arango_query_async(
+                async_db, {"query": "q", "batch_size": 2, "_session_context": dict(ctx)}
+            )
+            assert page["rows"] == [1, 2]
+            rows = list(page["rows"])
+            while page["cursor"]:
+                page = await handle_query_next(
+                    None, {"cursor": page["cursor"], "_session_context": dict(ctx)}
+                )
+                rows.extend(page["rows"])
+            assert rows == [1, 2, 3, 4, 5]
+        finally:
+            await client.close()
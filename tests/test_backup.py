@@ -5,8 +5,16 @@ import os
 import pytest
 from typing import Any, Dict, Iterable, List
 from tempfile import TemporaryDirectory
+from unittest.mock import Mock
 
-from mcp_arangodb_async.backup import backup_collections_to_dir, validate_output_directory
+from mcp_arangodb_async.backup import (
+    backup_collections_to_dir,
+    backup_file_collection,
+    export_batch_size,
+    iter_backup_documents,
+    parse_backup_file_name,
+    validate_output_directory,
+)
 
 
 class FakeCursor:
@@ -31,9 +39,12 @@ class FakeCollection:
 
 
 class FakeDB:
+    name = "test_db"
+
     def __init__(self, data: Dict[str, List[Dict[str, Any]]]):
         # data: name -> list of docs
         self._data = data
+        self.aql = FakeAQL(data)
 
     def collections(self):
         # include a system collection to ensure filtering works
@@ -58,13 +69,14 @@ def test_backup_all_non_system_collections_and_counts():
         assert set(written.keys()) == {"users", "posts"}
         assert written["users"]["count"] == 2
         assert written["posts"]["count"] == 1
-        # verify files exist and contain JSON array with matching length
+        # verify files exist and contain one JSON document per line
         for name in ("users", "posts"):
             path = written[name]["path"]
+            assert path.endswith(f"{name}.jsonl")
             assert os.path.exists(path)
             with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            assert isinstance(data, list)
+                data = [json.loads(line) for line in f]
+            assert all(isinstance(doc, dict) for doc in data)
             assert len(data) == written[name]["count"]
 
 
@@ -94,6 +106,21 @@ def test_backup_with_collection_filter_and_doc_limit():
         assert not os.path.exists(os.path.join(tmp, "logs.json"))
 
 
+def test_legacy_json_array_format_round_trip():
+    docs = [{"_key": str(i), "text": "line\nbreak é"} for i in range(3)]
+    db = FakeDB({"users": docs})
+    with TemporaryDirectory() as tmp:
+        report = backup_collections_to_dir(db, output_dir=tmp, fmt="json")
+        path = report["written"][0]["path"]
+        assert report["format"] == "json" and path.endswith("users.json")
+        with open(path, "r", encoding="utf-8") as f:
+            assert json.load(f) == docs
+        assert list(iter_backup_documents(path)) == docs
+        assert parse_backup_file_name(path) == ("users", "json")
+        assert parse_backup_file_name("users.jsonl.zst") == ("users", "jsonl")
+        assert parse_backup_file_name("backup_report.txt") is None
+
+
 def test_backup_skips_unknown_collection_names():
     db = FakeDB({"alpha": [{"_key": "1"}]})
     with TemporaryDirectory() as tmp:
@@ -103,6 +130,94 @@ def test_backup_skips_unknown_collection_names():
         assert written[0]["collection"] == "alpha"
 
 
+
+class FakeAQL:
+    def __init__(self, data: Dict[str, List[Dict[str, Any]]]):
+        self._data = data
+        self.calls: List[Dict[str, Any]] = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        self.calls.append({"bind_vars": bind_vars, **kwargs})
+        docs = self._data[bind_vars["@collection"]]
+        return FakeCursor(docs[: bind_vars.get("limit", len(docs))])
+
+
+class StatsCollection(FakeCollection):
+    def count(self):
+        return len(self._docs)
+
+    def statistics(self):
+        # Stored size of 512 KiB per document
+        return {"documents_size": len(self._docs) * 512 * 1024}
+
+
+class ParallelFakeDB(FakeDB):
+    def collection(self, name: str):
+        return StatsCollection(name, self._data.get(name, []))
+
+
+def test_parallel_backup_streams_each_collection():
+    data = {f"c{i}": [{"_key": str(k)} for k in range(i + 1)] for i in range(4)}
+    db = ParallelFakeDB(data)
+    with TemporaryDirectory() as tmp:
+        report = backup_collections_to_dir(db, output_dir=tmp, parallelism=3, memory_budget_mb=48, doc_limit=3)
+        assert report["parallelism"] == 3
+        assert [w["collection"] for w in report["written"]] == ["c0", "c1", "c2", "c3"]
+        assert [w["count"] for w in report["written"]] == [1, 2, 3, 3]
+        assert all("elapsed_sec" in w for w in report["written"])
+        with open(report["written"][3]["path"], "r", encoding="utf-8") as f:
+            assert len(f.readlines()) == 3
+    # Each worker gets 16 MiB: 16 MiB / (512 KiB * 4) = 8 documents, raised to the minimum of 10
+    assert {c["batch_size"] for c in db.aql.calls} == {10}
+    assert all(c["stream"] for c in db.aql.calls)
+
+
+class RangeAQL(FakeAQL):
+    """AQL fake answering key_ranges() boundary lookups and key-range exports."""
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        self.calls.append({"bind_vars": bind_vars, **kwargs})
+        docs = sorted(self._data[bind_vars["@collection"]], key=lambda d: d["_key"])
+        if "offset" in bind_vars:
+            return FakeCursor([docs[bind_vars["offset"]]["_key"]])
+        after, until = bind_vars.get("after_key"), bind_vars.get("until_key")
+        return FakeCursor([
+            d for d in docs
+            if (after is None or d["_key"] > after) and (until is None or d["_key"] <= until)
+        ])
+
+
+def test_partitioned_backup_writes_parts_and_manifest():
+    docs = [{"_key": f"{i:03d}"} for i in range(10)]
+    db = ParallelFakeDB({"events": docs})
+    db.aql = RangeAQL({"events": docs})
+    with TemporaryDirectory() as tmp:
+        report = backup_collections_to_dir(db, output_dir=tmp, parallelism=4, partitions=3)
+        entry = report["written"][0]
+        assert entry["path"] == os.path.join(tmp, "events.manifest.json")
+        assert entry["count"] == 10 and entry["parts"] == 3
+        assert report["parallelism"] == 3
+        with open(entry["path"], "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        assert [p["path"] for p in manifest["parts"]] == [f"events.part-000{i}.jsonl" for i in (1, 2, 3)]
+        assert sum(p["count"] for p in manifest["parts"]) == 10
+        assert manifest["parts"][0]["after"] is None and manifest["parts"][-1]["until"] is None
+        # Restores read the manifest as the collection file; parts are not restored on their own
+        assert list(iter_backup_documents(entry["path"])) == docs
+        assert sorted(filter(None, map(backup_file_collection, os.listdir(tmp)))) == ["events"]
+
+
+def test_export_batch_size_from_collection_figures():
+    db = Mock()
+    db.collection.return_value.count.return_value = 10
+    db.collection.return_value.statistics.return_value = {"documents_size": 2560}
+    # 256 bytes per document, 4x decoded: 1 MiB / 1 KiB
+    assert export_batch_size(db, "small", 1024 * 1024) == 1024
+    # Figures unavailable: 1 KiB documents are assumed
+    db.collection.return_value.statistics.return_value = {}
+    assert export_batch_size(db, "small", 1024 * 1024) == 256
+
+
 class TestPathValidation:
     """Test the new secure path validation functionality."""
 
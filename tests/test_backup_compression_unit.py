@@ -0,0 +1,80 @@
+"""Unit tests for compressed backup output and codec detection on restore."""
+
+import gzip
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_arangodb_async.backup import backup_collections_to_dir
+from mcp_arangodb_async.compression import (
+    detect_compression,
+    open_binary_reader,
+    strip_compression_extension,
+    validate_compression,
+)
+from mcp_arangodb_async.graph_backup import _restore_collection_from_file
+
+
+def _db(docs):
+    db = Mock()
+    db.name = "test_db"
+    db.collections.return_value = [{"name": "users", "isSystem": False}]
+    db.aql.execute.return_value = iter(docs)
+    return db
+
+
+def test_gzip_backup_round_trip():
+    """Test a gzip backup is written as users.jsonl.gz and restores unchanged."""
+    docs = [{"_key": str(i), "name": f"user{i}"} for i in range(50)]
+    with TemporaryDirectory() as tmp:
+        report = backup_collections_to_dir(_db(docs), output_dir=tmp, compression="gzip", compression_level=9)
+        entry = report["written"][0]
+        assert entry["path"] == os.path.join(tmp, "users.jsonl.gz")
+        assert report["compression"] == "gzip"
+        assert entry["bytes"] == os.path.getsize(entry["path"])
+        with gzip.open(entry["path"], "rt", encoding="utf-8") as f:
+            assert [json.loads(line) for line in f] == docs
+
+        target = Mock()
+        target.name = "restore_db"
+        target.has_collection.return_value = True
+        with patch("mcp_arangodb_async.graph_backup.import_documents") as mock_import:
+            mock_import.side_effect = lambda col, batch, **kw: {"created": len(batch)}
+            result = _restore_collection_from_file(target, "users", entry["path"], "skip")
+        imported = [doc for call in mock_import.call_args_list for doc in call[0][1]]
+        assert imported == docs
+        assert result["inserted"] == 50
+
+
+def test_detect_compression_from_magic_bytes():
+    """Test a compressed file without a codec extension is detected by content."""
+    with TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "users.json")
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump([{"_key": "1"}], f)
+        assert detect_compression(path) == "gzip"
+        with open_binary_reader(path) as f:
+            assert json.load(f) == [{"_key": "1"}]
+    assert detect_compression("users.json.zst") == "zstd"
+    assert strip_compression_extension("users.json.gz") == "users.json"
+
+
+def test_validate_compression_levels():
+    """Test codec defaults and level bounds."""
+    assert validate_compression("none", 5) is None
+    assert validate_compression("gzip") == 6
+    with pytest.raises(ValueError, match="between 1 and 9"):
+        validate_compression("gzip", 12)
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        validate_compression("lz4")
+
+
+def test_zstd_requires_optional_package():
+    """Test zstd fails with an install hint before any file is written."""
+    with TemporaryDirectory() as tmp, patch("mcp_arangodb_async.compression.zstandard", None):
+        with pytest.raises(ValueError, match=r"mcp-arangodb-async\[zstd\]"):
+            backup_collections_to_dir(_db([]), output_dir=tmp, compression="zstd")
+        assert os.listdir(tmp) == []
@@ -0,0 +1,140 @@
+"""Unit tests for incremental backups (revisions.py, backup and graph backup/restore)."""
+
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_arangodb_async.backup import backup_collections_to_dir, iter_backup_documents
+from mcp_arangodb_async.graph_backup import backup_graph_to_dir, restore_graph_from_dir
+from mcp_arangodb_async.revisions import (
+    diff_revisions,
+    iter_changed_keys,
+    iter_deleted_keys,
+    read_backup_chain,
+    revisions_path,
+    scan_revisions,
+)
+
+
+class RevisionDB:
+    """Database fake serving collection scans, revision scans and key lookups."""
+
+    name = "test_db"
+
+    def __init__(self, data):
+        self.data = data  # name -> {key: doc}
+
+    def collections(self):
+        return [{"name": name, "isSystem": False} for name in self.data]
+
+    def collection(self, name):
+        col = Mock()
+        col.all.return_value = iter(list(self.data[name].values()))
+        return col
+
+    def has_collection(self, name):
+        return name in self.data
+
+    def has_graph(self, name):
+        return True
+
+    def graph(self, name):
+        graph = Mock()
+        graph.properties.return_value = {"edge_definitions": [], "orphan_collections": list(self.data)}
+        return graph
+
+    @property
+    def aql(self):
+        aql = Mock()
+        aql.execute.side_effect = self._execute
+        return aql
+
+    def _execute(self, query, bind_vars=None, **kwargs):
+        docs = self.data[bind_vars["@collection"]]
+        if "keys" in bind_vars:
+            return iter([docs[k] for k in bind_vars["keys"] if k in docs])
+        return iter([[d["_key"], d["_rev"]] for d in docs.values()])
+
+
+def _docs(*specs):
+    return {key: {"_key": key, "_rev": rev, "v": rev} for key, rev in specs}
+
+
+def test_diff_revisions_changed_and_deleted():
+    """Test changed, new and deleted keys are found against the base manifest."""
+    db = RevisionDB({"c": _docs(("1", "a"), ("2", "a"), ("3", "a"))})
+    with TemporaryDirectory() as tmp:
+        base = os.path.join(tmp, "base.revisions.sqlite")
+        assert scan_revisions(db, "c", base) == 3
+        db.data["c"] = _docs(("1", "a"), ("2", "b"), ("4", "a"))
+        path = os.path.join(tmp, "new.revisions.sqlite")
+        scan_revisions(db, "c", path)
+        assert diff_revisions(path, base) == {"changed": 2, "deleted": 1}
+        assert sorted(k for chunk in iter_changed_keys(path, 1) for k in chunk) == ["2", "4"]
+        assert [k for chunk in iter_deleted_keys(path) for k in chunk] == ["3"]
+
+
+def test_incremental_backup_chain():
+    """Test a full backup with revisions, then increments exporting only changes."""
+    db = RevisionDB({"users": _docs(("1", "a"), ("2", "a"), ("3", "a"))})
+    with TemporaryDirectory() as tmp:
+        full = os.path.join(tmp, "full")
+        backup_collections_to_dir(db, output_dir=full, track_revisions=True)
+        assert os.path.exists(revisions_path(full, "users"))
+
+        db.data["users"] = _docs(("1", "a"), ("2", "b"), ("4", "a"))
+        inc = os.path.join(tmp, "inc1")
+        report = backup_collections_to_dir(db, output_dir=inc, incremental_base=full)
+        entry = report["written"][0]
+        assert entry["count"] == 2 and entry["deleted"] == 1
+        assert report["total_deleted"] == 1 and report["incremental_base"] == full
+        assert sorted(d["_key"] for d in iter_backup_documents(entry["path"])) == ["2", "4"]
+        assert read_backup_chain(inc) == [full, inc]
+
+        unchanged = os.path.join(tmp, "inc2")
+        report = backup_collections_to_dir(db, output_dir=unchanged, incremental_base=inc)
+        assert report["total_documents"] == 0 and report["total_deleted"] == 0
+        assert read_backup_chain(unchanged) == [full, inc, unchanged]
+
+
+def test_incremental_backup_rejects_doc_limit_and_missing_base():
+    """Test incremental options are validated before anything is written."""
+    db = RevisionDB({"users": {}})
+    with TemporaryDirectory() as tmp:
+        with pytest.raises(ValueError, match="doc_limit"):
+            backup_collections_to_dir(db, output_dir=tmp, incremental_base=tmp, doc_limit=5)
+        with pytest.raises(ValueError, match="does not exist"):
+            backup_collections_to_dir(db, output_dir=tmp, incremental_base=os.path.join(tmp, "missing"))
+
+
+def test_graph_restore_replays_chain():
+    """Test restoring an increment replays the full backup, then changes and tombstones."""
+    db = RevisionDB({"v": _docs(("1", "a"), ("2", "a"), ("3", "a"))})
+    with TemporaryDirectory() as tmp:
+        full = os.path.join(tmp, "full")
+        backup_graph_to_dir(db, "g", output_dir=full, track_revisions=True)
+        db.data["v"] = _docs(("1", "a"), ("2", "b"))
+        inc = os.path.join(tmp, "inc")
+        report = backup_graph_to_dir(db, "g", output_dir=inc, incremental_base=full)
+        assert report["total_documents"] == 1 and report["total_deleted"] == 1
+
+        target = Mock()
+        target.name = "restore_db"
+        target.has_graph.return_value = False
+        target.aql.execute.side_effect = lambda query, bind_vars, **kw: iter([1] * len(bind_vars["keys"]))
+        imports = []
+
+        def import_documents(col, batch, on_duplicate, halt_on_error):
+            imports.append((on_duplicate, [d["_key"] for d in batch]))
+            return {"created": len(batch)}
+
+        with patch("mcp_arangodb_async.graph_backup.import_documents", side_effect=import_documents):
+            result = restore_graph_from_dir(target, inc, conflict_resolution="skip", validate_integrity=False)
+
+    assert result["backup_chain"] == [full, inc]
+    assert imports == [("ignore", ["1", "2", "3"]), ("replace", ["2"])]
+    removed = [call[1]["bind_vars"]["keys"] for call in target.aql.execute.call_args_list]
+    assert removed == [["3"]]
+    assert result["restored_vertices"][1]["removed"] == 1
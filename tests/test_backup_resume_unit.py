@@ -0,0 +1,156 @@
+"""Unit tests for checkpointed, resumable backups and graph restores."""
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_arangodb_async.backup import backup_collections_to_dir, iter_backup_documents
+from mcp_arangodb_async.checkpoint import BACKUP_CHECKPOINT, RESTORE_CHECKPOINT
+from mcp_arangodb_async.compression import SegmentedTextWriter, open_binary_reader
+from mcp_arangodb_async.graph_backup import restore_graph_from_dir
+
+
+class FlakyAQL:
+    """Sorted key-range exports; the first export of `flaky` fails after `fail_after` documents."""
+
+    def __init__(self, data, flaky=None, fail_after=0):
+        self.data = data
+        self.flaky = flaky
+        self.fail_after = fail_after
+        self.calls = []
+
+    def execute(self, query, bind_vars=None, **kwargs):
+        self.calls.append(bind_vars)
+        name = bind_vars["@collection"]
+        after = bind_vars.get("after_key")
+        docs = [d for d in sorted(self.data[name], key=lambda d: d["_key"]) if after is None or d["_key"] > after]
+        if name != self.flaky:
+            return iter(docs)
+        self.flaky = None
+
+        def cursor():
+            yield from docs[: self.fail_after]
+            raise ConnectionError("connection reset")
+
+        return cursor()
+
+
+def _db(data, **flaky):
+    db = Mock()
+    db.name = "test_db"
+    db.collections.return_value = [{"name": name, "isSystem": False} for name in data]
+    db.aql = FlakyAQL(data, **flaky)
+    return db
+
+
+def test_segmented_writer_resumes_at_checkpoint():
+    """Test a gzip file cut at a checkpoint is truncated and appended to on resume."""
+    with TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "users.jsonl.gz")
+        with SegmentedTextWriter(path, "gzip") as f:
+            f.write("1\n")
+            offset = f.checkpoint()
+            f.write("lost\n")
+        with SegmentedTextWriter(path, "gzip", offset=offset) as f:
+            f.write("2\n")
+        with open_binary_reader(path) as f:
+            assert f.read() == b"1\n2\n"
+
+
+@pytest.mark.parametrize("fmt,compression", [("jsonl", "gzip"), ("json", "none")])
+def test_backup_resumes_after_last_checkpoint(fmt, compression):
+    """Test an interrupted backup keeps finished files and continues after the last exported key."""
+    data = {
+        "a": [{"_key": f"a{i}"} for i in range(4)],
+        "b": [{"_key": f"b{i:02d}"} for i in range(10)],
+    }
+    db = _db(data, flaky="b", fail_after=7)
+    with TemporaryDirectory() as tmp, patch("mcp_arangodb_async.backup.CHECKPOINT_INTERVAL", 3):
+        options = {"output_dir": tmp, "fmt": fmt, "compression": compression}
+        report = backup_collections_to_dir(db, **options)
+        assert "connection reset" in report["written"][1]["error"]
+        assert report["checkpoint"] == os.path.join(tmp, BACKUP_CHECKPOINT)
+        with open(report["checkpoint"], "r", encoding="utf-8") as f:
+            state = json.load(f)
+        assert list(state["completed"]) == [f"a.{fmt}" + (".gz" if compression == "gzip" else "")]
+        assert [p["last_key"] for p in state["progress"].values()] == ["b05"]
+
+        db.aql.calls.clear()
+        report = backup_collections_to_dir(db, resume=True, **options)
+        assert report["resumed"] is True
+        assert [w["count"] for w in report["written"]] == [4, 10]
+        # Only the unfinished collection is queried again, after its last checkpoint
+        assert [(c["@collection"], c.get("after_key")) for c in db.aql.calls] == [("b", "b05")]
+        assert list(iter_backup_documents(report["written"][1]["path"])) == data["b"]
+        assert not os.path.exists(os.path.join(tmp, BACKUP_CHECKPOINT))
+
+
+def test_backup_resume_validation():
+    """Test resume requires a checkpoint written with the same options."""
+    db = _db({"a": [{"_key": "1"}]}, flaky="a", fail_after=0)
+    with TemporaryDirectory() as tmp:
+        with pytest.raises(ValueError, match="No checkpoint"):
+            backup_collections_to_dir(db, output_dir=tmp, resume=True)
+        backup_collections_to_dir(db, output_dir=tmp)
+        with pytest.raises(ValueError, match="options"):
+            backup_collections_to_dir(db, output_dir=tmp, compression="gzip", resume=True)
+    with pytest.raises(ValueError, match="output_dir"):
+        backup_collections_to_dir(db, resume=True)
+
+
+def test_restore_graph_resumes_after_last_batch():
+    """Test an interrupted restore skips restored files and imported records."""
+    with TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "graph_metadata.json"), "w", encoding="utf-8") as f:
+            json.dump({"graph_name": "g", "graph_properties": {"edge_definitions": []}}, f)
+        os.makedirs(os.path.join(tmp, "vertices"))
+        for name, count in (("a", 2), ("b", 5)):
+            with open(os.path.join(tmp, "vertices", f"{name}.jsonl"), "w", encoding="utf-8") as f:
+                f.writelines(json.dumps({"_key": str(i)}) + "\n" for i in range(count))
+
+        db = Mock()
+        db.name = "test_db"
+        db.has_graph.return_value = False
+        db.collection.side_effect = lambda name: Mock(name=name, collection_name=name)
+        imports = []
+        failures = iter([False, False, True])
+
+        def import_documents(col, batch, on_duplicate, halt_on_error):
+            if col.collection_name == "b" and next(failures, False):
+                raise ConnectionError("connection reset")
+            imports.append((col.collection_name, on_duplicate, [d["_key"] for d in batch]))
+            return {"created": len(batch)}
+
+        with patch("mcp_arangodb_async.graph_backup.import_documents", side_effect=import_documents), \
+                patch("mcp_arangodb_async.graph_backup.RESTORE_BATCH_SIZE", 2):
+            first = restore_graph_from_dir(db, tmp, conflict_resolution="error", validate_integrity=False)
+            assert [e["collection"] for e in first["errors"]] == ["b"]
+            assert first["checkpoint"] == os.path.join(tmp, RESTORE_CHECKPOINT)
+
+            imports.clear()
+            result = restore_graph_from_dir(
+                db, tmp, conflict_resolution="error", validate_integrity=False, resume=True
+            )
+        assert not os.path.exists(os.path.join(tmp, RESTORE_CHECKPOINT))
+
+    # "a" was restored; "b" continues at record 4, its failed batch importing with existing keys skipped
+    assert imports == [("b", "ignore", ["4"])]
+    assert result["errors"] == []
+    by_name = {r["collection"]: r for r in result["restored_vertices"]}
+    assert by_name["a"]["inserted"] == 2
+    assert by_name["b"]["inserted"] == 5 and by_name["b"]["total_processed"] == 5
+
+
+def test_resume_requires_same_database_and_sandboxed_input():
+    """Test a checkpoint is only resumed against the database it was written for."""
+    db = _db({"a": [{"_key": "1"}]}, flaky="a", fail_after=0)
+    with TemporaryDirectory() as tmp:
+        backup_collections_to_dir(db, output_dir=tmp)
+        db.name = "other_db"
+        with pytest.raises(ValueError, match="options"):
+            backup_collections_to_dir(db, output_dir=tmp, resume=True)
+    with pytest.raises(ValueError, match="outside allowed directories"):
+        restore_graph_from_dir(db, "/", resume=True)
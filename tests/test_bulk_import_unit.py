@@ -0,0 +1,137 @@
+"""Unit tests for the import API engine (bulk.import_documents, bulk_insert and graph restore)."""
+
+import json
+import pytest
+from unittest.mock import Mock
+
+from arango.exceptions import DocumentInsertError
+
+from mcp_arangodb_async.bulk import import_documents, import_error_offsets
+from mcp_arangodb_async.graph_backup import _restore_collection_from_file
+from mcp_arangodb_async.handlers import handle_bulk_insert
+
+
+def _collection(respond):
+    """Collection mock whose _execute passes the request to respond(request) -> (ok, body)."""
+    col = Mock()
+    col.name = "users"
+    requests = []
+
+    def execute(request, response_handler):
+        requests.append(request)
+        ok, body = respond(request)
+        return response_handler(Mock(is_success=ok, body=body, error_message="boom"))
+
+    col._execute.side_effect = execute
+    col.requests = requests
+    return col
+
+
+def _counters(request, **overrides):
+    body = {"created": len(request.data.split("\n")), "errors": 0, "updated": 0, "ignored": 0, "details": []}
+    body.update(overrides)
+    return True, body
+
+
+class TestImportDocuments:
+    """Test the import API request and result parsing."""
+
+    def test_request_uses_jsonl_body(self):
+        """Test documents are sent as JSON Lines with onDuplicate and details."""
+        col = _collection(_counters)
+        result = import_documents(
+            col, [{"_key": "a", "n": 1}, {"_id": "users/b"}], on_duplicate="replace", sync=False
+        )
+        request = col.requests[0]
+        assert request.endpoint == "/_api/import"
+        assert request.params["type"] == "documents"
+        assert request.params["onDuplicate"] == "replace"
+        assert request.params["waitForSync"] == "0"
+        lines = [json.loads(line) for line in request.data.split("\n")]
+        assert lines == [{"_key": "a", "n": 1}, {"_id": "users/b", "_key": "b"}]
+        assert result["created"] == 2
+
+    def test_failed_request_raises(self):
+        """Test a rejected request raises DocumentInsertError."""
+        col = _collection(lambda request: (False, {"error": True}))
+        with pytest.raises(DocumentInsertError):
+            import_documents(col, [{"_key": "a"}], halt_on_error=True)
+        with pytest.raises(ValueError):
+            import_documents(col, [{"_key": "a"}], on_duplicate="merge")
+
+    def test_error_offsets(self):
+        """Test 1-based server positions map to 0-based batch offsets."""
+        result = {"details": ["at position 2: unique constraint violated", "something else"]}
+        assert import_error_offsets(result) == [
+            (1, "at position 2: unique constraint violated"),
+            (None, "something else"),
+        ]
+
+
+class TestBulkInsertImportEngine:
+    """Test handle_bulk_insert with engine="import"."""
+
+    def test_counters_and_error_indexes(self):
+        """Test created/updated/ignored/errors are summed with document indexes."""
+        def respond(request):
+            keys = [json.loads(line)["_key"] for line in request.data.split("\n")]
+            if "3" in keys:
+                return _counters(
+                    request,
+                    created=1,
+                    errors=1,
+                    details=[f"at position {keys.index('3') + 1}: unique constraint violated"],
+                )
+            return _counters(request)
+
+        db = Mock()
+        db.collection.return_value = _collection(respond)
+        docs = [{"_key": str(i)} for i in range(6)]
+        result = handle_bulk_insert(
+            db,
+            {"collection": "users", "documents": docs, "batch_size": 2, "engine": "import",
+             "on_error": "continue", "concurrency": 2},
+        )
+        assert result["inserted_count"] == 5
+        assert result["error_count"] == 1
+        assert result["errors"][0]["index"] == 3
+        assert result["updated_count"] == 0 and result["ignored_count"] == 0
+        assert result["inserted_ids"] == []
+
+    def test_on_error_ignore_maps_to_ignore_duplicates(self):
+        """Test on_error=ignore imports with onDuplicate=ignore unless overridden."""
+        db = Mock()
+        col = _collection(_counters)
+        db.collection.return_value = col
+        handle_bulk_insert(
+            db, {"collection": "users", "documents": [{"_key": "a"}], "engine": "import", "on_error": "ignore"}
+        )
+        handle_bulk_insert(
+            db, {"collection": "users", "documents": [{"_key": "a"}], "engine": "import", "on_duplicate": "update"}
+        )
+        assert [r.params["onDuplicate"] for r in col.requests] == ["ignore", "update"]
+
+
+class TestRestoreCollectionImport:
+    """Test graph restore of a collection through the import API."""
+
+    @pytest.mark.parametrize(
+        "conflict_resolution, on_duplicate, complete",
+        [("skip", "ignore", "0"), ("overwrite", "replace", "0"), ("error", "error", "1")],
+    )
+    def test_conflict_resolution_mapping(self, tmp_path, conflict_resolution, on_duplicate, complete):
+        """Test conflict strategies map to onDuplicate and counters to the report."""
+        path = tmp_path / "users.json"
+        path.write_text(json.dumps([{"_key": str(i)} for i in range(5)]))
+        col = _collection(lambda request: _counters(request, created=1, updated=1, ignored=0))
+        db = Mock()
+        db.has_collection.return_value = True
+        db.collection.return_value = col
+
+        result = _restore_collection_from_file(db, "users", str(path), conflict_resolution, batch_size=2)
+
+        assert len(col.requests) == 3
+        assert {r.params["onDuplicate"] for r in col.requests} == {on_duplicate}
+        assert {r.params["complete"] for r in col.requests} == {complete}
+        assert result["inserted"] == 3 and result["updated"] == 3
+        assert result["total_processed"] == 5
@@ -0,0 +1,179 @@
+"""Unit tests for streaming file ingest (ingest.py and handle_bulk_insert_file)."""
+
+import asyncio
+import io
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from arango.exceptions import DocumentInsertError
+
+from mcp_arangodb_async.handlers import handle_bulk_insert_file
+from mcp_arangodb_async.ingest import detect_format, iter_csv, iter_json_array, iter_jsonl
+
+
+class TestReaders:
+    """Test the incremental JSONL, JSON array and CSV readers."""
+
+    def test_json_array_across_chunk_boundaries(self):
+        """Test elements split across read chunks parse with their start lines."""
+        docs = [{"n": i, "big": 2**70, "text": "x" * i} for i in range(20)]
+        raw = ("[\n" + ",\n".join(json.dumps(d) for d in docs) + "\n]").encode()
+        for chunk in (1, 7, 1 << 16):
+            records = list(iter_json_array(io.BytesIO(raw), chunk_chars=chunk))
+            assert [r.document for r in records] == docs
+            assert [r.line for r in records] == list(range(2, 22))
+
+    def test_json_array_errors(self):
+        """Test non-objects are skipped and syntax errors are fatal."""
+        records = list(iter_json_array(io.BytesIO(b'[{"a": 1}, 5,\n{"b": 2} {"c": 3}]')))
+        assert [r.document for r in records[:3]] == [{"a": 1}, None, {"b": 2}]
+        assert records[1].error and not records[1].fatal
+        assert records[3].fatal and records[3].line == 2
+        truncated = list(iter_json_array(io.BytesIO(b'[{"a": 1},')))
+        assert truncated[-1].fatal
+
+    def test_jsonl_reports_bad_lines(self):
+        """Test invalid lines are reported with their line number; blanks are skipped."""
+        records = list(iter_jsonl(io.BytesIO(b'{"a": 1}\n\nnot json\n[1]\n{"b": 2}\n')))
+        assert [(r.line, r.document is not None) for r in records] == [
+            (1, True),
+            (3, False),
+            (4, False),
+            (5, True),
+        ]
+
+    def test_csv_rows_and_multiline_fields(self):
+        """Test rows map to header keys and report the line they start on."""
+        raw = b'\xef\xbb\xbfname,city\nada,london\n"multi\nline",paris\nx,y,z\n'
+        records = list(iter_csv(io.BytesIO(raw)))
+        assert records[0].document == {"name": "ada", "city": "london"}
+        assert (records[1].line, records[1].document["name"]) == (3, "multi\nline")
+        assert records[2].line == 5 and records[2].error
+
+    def test_detect_format(self, tmp_path):
+        """Test format detection by extension and first byte."""
+        array = tmp_path / "data.json"
+        array.write_text(' [{"a": 1}]')
+        lines = tmp_path / "data.json2"
+        lines.write_text('{"a": 1}\n')
+        assert detect_format(str(array)) == "json"
+        assert detect_format(str(lines)) == "jsonl"
+        assert detect_format(str(tmp_path / "x.tsv")) == "csv"
+        with pytest.raises(ValueError):
+            detect_format(str(array), "xml")
+
+
+class TestBulkInsertFile:
+    """Test handle_bulk_insert_file."""
+
+    @pytest.fixture(autouse=True)
+    def _cwd(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+
+    def _db(self, calls):
+        def insert_many(batch, return_new, sync):
+            calls.append([d["_key"] for d in batch])
+            return [
+                DocumentInsertError(Mock(), Mock()) if d["_key"] == "bad" else {"_id": d["_key"]}
+                for d in batch
+            ]
+
+        db = Mock()
+        db.collection.return_value.insert_many.side_effect = insert_many
+        return db
+
+    def test_jsonl_import_with_line_offsets(self, tmp_path):
+        """Test batches are streamed and errors carry file line numbers."""
+        lines = [json.dumps({"_key": str(i)}) for i in range(7)]
+        lines[2] = "{broken"
+        lines[5] = json.dumps({"_key": "bad"})
+        (tmp_path / "docs.jsonl").write_text("\n".join(lines) + "\n")
+        calls = []
+        result = handle_bulk_insert_file(
+            self._db(calls),
+            {
+                "collection": "c",
+                "file_path": "docs.jsonl",
+                "batch_size": 2,
+                "on_error": "continue",
+                "concurrency": 2,
+            },
+        )
+        assert calls == [["0", "1"], ["3", "4"], ["bad", "6"]]
+        assert result["format"] == "jsonl"
+        assert result["records_read"] == 7
+        assert result["inserted_count"] == 5
+        assert result["error_count"] == 2
+        assert [e["line"] for e in result["errors"]] == [3, 6]
+        assert result["bytes_read"] == result["file_size"]
+
+    def test_stop_on_parse_error(self, tmp_path):
+        """Test on_error=stop flushes parsed documents and stops reading."""
+        (tmp_path / "docs.json").write_text('[{"_key": "a"}, {"_key": "b"}, 3, {"_key": "c"}]')
+        calls = []
+        result = handle_bulk_insert_file(
+            self._db(calls), {"collection": "c", "file_path": "docs.json", "batch_size": 10}
+        )
+        assert calls == [["a", "b"]]
+        assert result["stopped"] is True
+        assert result["inserted_count"] == 2
+        assert result["parse_error_count"] == 1
+
+    def test_csv_progress_and_error_cap(self, tmp_path):
+        """Test CSV import reports progress and caps individual error details."""
+        rows = ["_key,name"] + [f"k{i},n{i}" for i in range(5)] + ["x,y,z", "p,q,r"]
+        (tmp_path / "docs.csv").write_text("\n".join(rows) + "\n")
+        reported = []
+        calls = []
+        result = handle_bulk_insert_file(
+            self._db(calls),
+            {
+                "collection": "c",
+                "file_path": "docs.csv",
+                "batch_size": 3,
+                "on_error": "continue",
+                "max_error_details": 1,
+                "_session_context": {"progress": lambda *a: reported.append(a)},
+            },
+        )
+        assert result["inserted_count"] == 5
+        assert result["error_count"] == 2
+        assert len(result["errors"]) == 1 and result["errors_truncated"]
+        assert len(reported) == 2
+        assert reported[-1][0] == reported[-1][1] == result["file_size"]
+
+    def test_rejects_files_outside_allowed_roots(self):
+        """Test paths outside the working and temp directories are rejected."""
+        result = handle_bulk_insert_file(Mock(), {"collection": "c", "file_path": "/etc/passwd"})
+        assert "outside allowed directories" in result["error"]
+
+
+class TestProgressReporter:
+    """Test call_tool progress notifications."""
+
+    @pytest.mark.asyncio
+    async def test_reporter_sends_from_worker_thread(self):
+        """Test the callback schedules notifications on the event loop."""
+        from mcp_arangodb_async.entry import _progress_reporter
+
+        ctx = Mock()
+        ctx.meta.progressToken = "tok"
+        ctx.request_id = 7
+        ctx.session.send_progress_notification = AsyncMock()
+        report = _progress_reporter(ctx)
+        await asyncio.get_running_loop().run_in_executor(None, report, 5.0, 10.0, "half")
+        for _ in range(5):
+            await asyncio.sleep(0)
+        ctx.session.send_progress_notification.assert_awaited_once_with(
+            "tok", 5.0, 10.0, "half", related_request_id="7"
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_reporter_without_token(self):
+        """Test no callback is built when the client sent no progress token."""
+        from mcp_arangodb_async.entry import _progress_reporter
+
+        ctx = Mock()
+        ctx.meta = None
+        assert _progress_reporter(ctx) is None
@@ -0,0 +1,216 @@
+"""Unit tests for pipelined and adaptive bulk writes (bulk.py, handle_bulk_insert/update)."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from arango.exceptions import DocumentInsertError
+
+import pytest
+
+from mcp_arangodb_async.bulk import AdaptiveBatcher, BatchOutcome, iter_batches, run_pipelined, run_scheduled
+from mcp_arangodb_async.handlers import handle_bulk_insert, handle_bulk_update
+
+
+class TestRunPipelined:
+    """Test bounded concurrency and ordered outcomes."""
+
+    def test_outcomes_in_order_with_bounded_concurrency(self):
+        """Test batches finishing out of order are yielded in batch order."""
+        lock = threading.Lock()
+        state = {"running": 0, "max_running": 0}
+
+        def send(batch):
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+            # Earlier batches take longer, so they finish last
+            time.sleep(0.02 * (5 - batch[0] // 10))
+            with lock:
+                state["running"] -= 1
+            return batch[0]
+
+        outcomes = list(run_pipelined(send, iter_batches(list(range(50)), 10), concurrency=3))
+        assert [o.result for o in outcomes] == [0, 10, 20, 30, 40]
+        assert [o.start for o in outcomes] == [0, 10, 20, 30, 40]
+        assert 1 < state["max_running"] <= 3
+
+    def test_stop_ends_submission_but_drains_in_flight(self):
+        """Test setting stop sends no new batches but reports in-flight ones."""
+        sent = []
+        stop = threading.Event()
+
+        def send(batch):
+            sent.append(batch[0])
+            if batch[0] == 0:
+                raise RuntimeError("boom")
+            return len(batch)
+
+        outcomes = []
+        for outcome in run_pipelined(send, iter_batches(list(range(100)), 10), 2, stop):
+            outcomes.append(outcome)
+            if outcome.error is not None:
+                stop.set()
+        assert str(outcomes[0].error) == "boom"
+        assert len(outcomes) <= 3
+        assert len(sent) == len(outcomes)
+
+    def test_sequential_mode(self):
+        """Test concurrency=1 sends batches one after another."""
+        outcomes = list(run_pipelined(len, iter_batches([1, 2, 3], 2)))
+        assert [(o.index, o.start, o.result) for o in outcomes] == [(0, 0, 2), (1, 2, 1)]
+
+
+class TestRunScheduled:
+    """Test dependency-ordered concurrent execution."""
+
+    def test_items_start_after_their_dependencies(self):
+        """Test an item starts as soon as its own dependencies finished, not all earlier items."""
+        events = []
+        lock = threading.Lock()
+
+        def run(item):
+            name, delay = item
+            with lock:
+                events.append(("start", name))
+            time.sleep(delay)
+            with lock:
+                events.append(("end", name))
+            return name
+
+        items = [("slow", 0.1), ("fast", 0.01), ("after_slow", 0.01), ("after_fast", 0.01)]
+        results = run_scheduled(run, items, {2: [0], 3: [1]}, concurrency=4)
+        assert results == ["slow", "fast", "after_slow", "after_fast"]
+        assert events.index(("start", "after_fast")) < events.index(("end", "slow"))
+        assert events.index(("start", "after_slow")) > events.index(("end", "slow"))
+
+    def test_sequential_mode_and_errors(self):
+        """Test sequential order, cycle detection and error propagation."""
+        assert run_scheduled(lambda x: x * 2, [1, 2, 3], {0: [2]}) == [2, 4, 6]
+        with pytest.raises(ValueError, match="cycle"):
+            run_scheduled(lambda x: x, [1, 2], {0: [1], 1: [0]}, concurrency=2)
+        started = []
+
+        def fail_first(x):
+            started.append(x)
+            if x == 1:
+                raise RuntimeError("boom")
+            return x
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run_scheduled(fail_first, [1, 2], {1: [0]}, concurrency=2)
+        assert started == [1]
+
+
+class TestPipelinedBulkInsert:
+    """Test handle_bulk_insert with pipelining."""
+
+    def _db(self, insert_many):
+        db = Mock()
+        db.collection.return_value.insert_many.side_effect = insert_many
+        return db
+
+    def test_pipelined_insert_counts_and_sync(self):
+        """Test all batches are inserted and sync is passed through."""
+        calls = []
+
+        def insert_many(batch, return_new, sync):
+            calls.append(sync)
+            return [{"_id": f"c/{d['_key']}"} for d in batch]
+
+        docs = [{"_key": str(i)} for i in range(25)]
+        result = handle_bulk_insert(
+            self._db(insert_many),
+            {"collection": "c", "documents": docs, "batch_size": 5, "concurrency": 4, "sync": False},
+        )
+        assert result["inserted_count"] == 25
+        assert result["inserted_ids"] == [f"c/{i}" for i in range(25)]
+        assert calls == [False] * 5
+
+    def test_errors_ordered_and_stop(self):
+        """Test per-document and batch errors are reported in document order."""
+        def insert_many(batch, return_new, sync):
+            first = int(batch[0]["_key"])
+            if first == 4:
+                raise RuntimeError("batch failed")
+            return [
+                DocumentInsertError(Mock(), Mock()) if d["_key"] == "1" else {"_id": d["_key"]}
+                for d in batch
+            ]
+
+        docs = [{"_key": str(i)} for i in range(12)]
+        result = handle_bulk_insert(
+            self._db(insert_many),
+            {"collection": "c", "documents": docs, "batch_size": 2, "on_error": "continue", "concurrency": 3},
+        )
+        assert [e.get("index", e.get("batch_start")) for e in result["errors"]] == [1, 4]
+        assert result["inserted_count"] == 9
+        assert result["error_count"] == 3
+
+        stopped = handle_bulk_insert(
+            self._db(insert_many),
+            {"collection": "c", "documents": docs, "batch_size": 4, "on_error": "stop"},
+        )
+        assert stopped["inserted_count"] == 3
+        assert len(stopped["errors"]) == 1
+
+
+class TestAdaptiveBatching:
+    """Test byte-capped adaptive batch sizing."""
+
+    def test_batches_capped_by_bytes(self):
+        """Test a batch closes when the next document would exceed the byte cap."""
+        batcher = AdaptiveBatcher(100, max_bytes=2500)
+        docs = [{"_key": str(i), "blob": "x" * 1000} for i in range(5)]
+        assert [len(b) for _, b in batcher.batches(docs)] == [2, 2, 1]
+
+    def test_size_follows_latency(self):
+        """Test fast round trips grow the size and slow ones shrink it."""
+        batcher = AdaptiveBatcher(10, target_latency=1.0)
+        batcher.observe(BatchOutcome(index=0, start=0, size=10, result=[], elapsed=0.1))
+        assert batcher.size == 20
+        batcher.observe(BatchOutcome(index=1, start=10, size=20, result=[], elapsed=2.0))
+        assert batcher.size == 10
+
+    def test_too_large_batch_is_split_and_resent(self):
+        """Test a rejected batch is split in halves and later batches are smaller."""
+        sent = []
+
+        def send(batch):
+            sent.append(len(batch))
+            if len(batch) > 2:
+                raise DocumentInsertError(Mock(status_code=413), Mock())
+            return [{"_id": d} for d in batch]
+
+        batcher = AdaptiveBatcher(8)
+        result = batcher.wrap(send)(list(range(8)))
+        assert result == [{"_id": d} for d in range(8)]
+        assert sent == [8, 4, 2, 2, 4, 2, 2]
+        assert batcher.size <= 2 and batcher.splits == 3
+
+    def test_bulk_insert_reports_batch_sizes(self):
+        """Test handle_bulk_insert reports each batch with adaptive batching."""
+        db = Mock()
+        db.collection.return_value.insert_many.side_effect = (
+            lambda batch, return_new, sync: [{"_id": d["_key"]} for d in batch]
+        )
+        docs = [{"_key": str(i)} for i in range(15)]
+        result = handle_bulk_insert(
+            db, {"collection": "c", "documents": docs, "batch_size": 1, "adaptive_batching": True}
+        )
+        assert result["inserted_count"] == 15
+        assert [b["batch_size"] for b in result["batch_history"]] == [1, 2, 4, 8]
+        assert result["adaptive_batching"]["final_batch_size"] == 16
+
+    def test_bulk_update_adaptive(self):
+        """Test handle_bulk_update batches normalized updates adaptively."""
+        db = Mock()
+        db.collection.return_value.update_many.side_effect = lambda batch, **kw: list(batch)
+        updates = [{"key": str(i), "update": {"n": i}} for i in range(3)]
+        result = handle_bulk_update(
+            db, {"collection": "c", "updates": updates, "batch_size": 1, "adaptive_batching": True}
+        )
+        assert result["updated_count"] == 3
+        assert [b["batch_size"] for b in result["batch_history"]] == [1, 2]
+        first = db.collection.return_value.update_many.call_args_list[0][0][0]
+        assert first == [{"_key": "0", "n": 0}]
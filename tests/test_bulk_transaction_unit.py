@@ -0,0 +1,132 @@
+"""Unit tests for chunked stream transactions in bulk_insert and bulk_update."""
+
+from unittest.mock import Mock
+
+from arango.exceptions import DocumentInsertError, DocumentUpdateError, TransactionAbortError
+
+from mcp_arangodb_async.bulk import ChunkedTransaction
+from mcp_arangodb_async.handlers import handle_bulk_insert, handle_bulk_update
+
+
+def _db(fail_keys=(), batch_error_keys=()):
+    """Database mock recording transaction begin/commit/abort and inserts per transaction."""
+    db = Mock()
+    db.log = []
+
+    def begin_transaction(**kwargs):
+        trx = Mock()
+        number = sum(1 for entry in db.log if entry[0] == "begin")
+        db.log.append(("begin", kwargs))
+
+        def insert_many(batch, return_new):
+            if any(d["_key"] in batch_error_keys for d in batch):
+                raise DocumentInsertError(Mock(), Mock())
+            db.log.append(("insert", number, [d["_key"] for d in batch]))
+            return [
+                DocumentInsertError(Mock(), Mock()) if d["_key"] in fail_keys else {"_id": f"c/{d['_key']}"}
+                for d in batch
+            ]
+
+        trx.collection.return_value.insert_many.side_effect = insert_many
+        trx.collection.return_value.update_many.side_effect = lambda batch, **kw: [
+            DocumentUpdateError(Mock(), Mock()) if d["_key"] in fail_keys else {} for d in batch
+        ]
+        trx.commit_transaction.side_effect = lambda: db.log.append(("commit", number))
+        trx.abort_transaction.side_effect = lambda: db.log.append(("abort", number))
+        return trx
+
+    db.begin_transaction.side_effect = begin_transaction
+    return db
+
+
+def _docs(n):
+    return [{"_key": str(i)} for i in range(n)]
+
+
+class TestChunkedTransactionBulkInsert:
+    """Test transaction mode of handle_bulk_insert."""
+
+    def test_commits_every_n_batches(self):
+        """Test batches are grouped into transactions of commit_every batches."""
+        db = _db()
+        result = handle_bulk_insert(
+            db,
+            {"collection": "c", "documents": _docs(5), "batch_size": 1, "transaction": True,
+             "commit_every": 2, "sync": False, "concurrency": 4},
+        )
+        assert [e[0] for e in db.log] == [
+            "begin", "insert", "insert", "commit",
+            "begin", "insert", "insert", "commit",
+            "begin", "insert", "commit",
+        ]
+        assert db.log[0][1]["sync"] is False and db.log[0][1]["write"] == "c"
+        assert result["inserted_count"] == 5
+        assert result["transaction"] == {"commit_every": 2, "committed": 3, "aborted": 0, "rolled_back_count": 0}
+
+    def test_stop_rolls_back_open_chunk(self):
+        """Test a failure with on_error=stop aborts the open transaction and fixes the counts."""
+        db = _db(fail_keys={"4"})
+        result = handle_bulk_insert(
+            db,
+            {"collection": "c", "documents": _docs(6), "batch_size": 1, "transaction": True, "commit_every": 3},
+        )
+        assert ("commit", 0) in db.log and ("abort", 1) in db.log
+        assert result["inserted_count"] == 3
+        assert result["inserted_ids"] == ["c/0", "c/1", "c/2"]
+        assert result["transaction"]["rolled_back_count"] == 1
+        assert result["error_count"] == 1
+        assert db.begin_transaction.call_count == 2
+
+    def test_atomic_load_rolls_back_everything(self):
+        """Test commit_every=0 keeps one transaction, so a failed batch undoes the whole call."""
+        db = _db(batch_error_keys={"4"})
+        result = handle_bulk_insert(
+            db, {"collection": "c", "documents": _docs(6), "batch_size": 2, "transaction": True}
+        )
+        assert [e[0] for e in db.log] == ["begin", "insert", "insert", "abort"]
+        assert result["inserted_count"] == 0 and result["inserted_ids"] == []
+        assert result["transaction"]["rolled_back_count"] == 4
+        assert result["transaction"]["aborted"] == 1
+
+    def test_import_engine_rejected(self):
+        """Test transaction mode is limited to the document engine."""
+        result = handle_bulk_insert(
+            Mock(), {"collection": "c", "documents": _docs(1), "transaction": True, "engine": "import"}
+        )
+        assert "engine='document'" in result["error"]
+
+
+def test_bulk_update_in_single_transaction():
+    """Test bulk_update commits all batches in one transaction by default."""
+    db = _db()
+    updates = [{"key": str(i), "update": {"n": i}} for i in range(4)]
+    result = handle_bulk_update(
+        db, {"collection": "c", "updates": updates, "batch_size": 2, "transaction": True}
+    )
+    assert [e[0] for e in db.log] == ["begin", "commit"]
+    assert result["updated_count"] == 4
+    assert result["transaction"]["committed"] == 1
+
+
+def test_bulk_update_stop_rolls_back_on_missing_key():
+    """Test a per-document update error (e.g. missing key) counts as an error and aborts the transaction."""
+    db = _db(fail_keys={"1"})
+    updates = [{"key": str(i), "update": {"n": i}} for i in range(3)]
+    result = handle_bulk_update(
+        db, {"collection": "c", "updates": updates, "transaction": True, "on_error": "stop"}
+    )
+    assert [e[0] for e in db.log] == ["begin", "abort"]
+    assert result["updated_count"] == 0
+    assert result["error_count"] == 1
+    assert result["errors"][0]["index"] == 1
+    assert result["transaction"]["aborted"] == 1 and result["transaction"]["rolled_back_count"] == 2
+
+
+def test_abort_ignores_already_aborted_transaction():
+    """Test aborting a transaction the server already ended is not an error."""
+    db = Mock()
+    db.begin_transaction.return_value.abort_transaction.side_effect = TransactionAbortError(Mock(), Mock())
+    txn = ChunkedTransaction(db, "c")
+    txn.collection()
+    txn.abort()
+    assert not txn.is_open and txn.aborted == 1
@@ -22,6 +22,7 @@ class TestResolveDatabase:
         self.config_loader = Mock(spec=ConfigFileLoader)
         self.config_loader.default_database = None
         self.config_loader.get_configured_databases.return_value = {}
+        self.config_loader.first_database_key.return_value = None
 
     def test_level_1_per_tool_override(self):
         """Test Level 1: Per-tool override takes highest priority."""
@@ -97,10 +98,9 @@ class TestResolveDatabase:
             username="user",
             password_env="PASS"
         )
-        self.config_loader.get_configured_databases.return_value = {
-            "first": config1,
-            "second": config2
-        }
+        self.config_loader = ConfigFileLoader(config_path="unused.yaml")
+        self.config_loader.add_database("first", config1)
+        self.config_loader.add_database("second", config2)
         
         result = resolve_database(
             tool_args, self.session_state, self.session_id, self.config_loader
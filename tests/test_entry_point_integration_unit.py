@@ -20,6 +20,7 @@ class TestEntryPointIntegration:
         self.config_loader = Mock(spec=ConfigFileLoader)
         self.config_loader.default_database = "production"
         self.config_loader.get_configured_databases.return_value = {}
+        self.config_loader.first_database_key.return_value = None
 
     def test_implicit_session_creation(self):
         """Test implicit session creation on first tool call."""
@@ -0,0 +1,236 @@
+"""Unit tests for the tool worker pool (executor.py)."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from mcp_arangodb_async.executor import (
+    ExecutorConfig,
+    ExecutorSaturatedError,
+    ToolExecutor,
+    ToolTimeoutError,
+    load_executor_config,
+    parse_tool_timeouts,
+)
+
+
+class TestExecutorConfig:
+    """Test ExecutorConfig validation and environment loading."""
+
+    def test_parse_tool_timeouts(self):
+        """Test parsing of per-tool timeout overrides."""
+        result = parse_tool_timeouts("arango_backup=600, arango_query=1.5,")
+        assert result == {"arango_backup": 600.0, "arango_query": 1.5}
+        assert parse_tool_timeouts(None) == {}
+        assert parse_tool_timeouts("") == {}
+
+    def test_parse_tool_timeouts_invalid(self):
+        """Test malformed timeout entries are rejected."""
+        with pytest.raises(ValueError):
+            parse_tool_timeouts("arango_query")
+        with pytest.raises(ValueError):
+            parse_tool_timeouts("arango_query=0")
+
+    def test_invalid_config_values(self):
+        """Test negative sizes and non-positive timeouts are rejected."""
+        with pytest.raises(ValueError):
+            ExecutorConfig(max_workers=-1)
+        with pytest.raises(ValueError):
+            ExecutorConfig(queue_size=-1)
+        with pytest.raises(ValueError):
+            ExecutorConfig(default_timeout=0)
+
+    @patch.dict(os.environ, {
+        "MCP_EXECUTOR_WORKERS": "3",
+        "MCP_EXECUTOR_QUEUE_SIZE": "7",
+        "MCP_TOOL_TIMEOUT_SEC": "30",
+        "MCP_TOOL_TIMEOUTS": "arango_backup=600",
+    })
+    def test_load_executor_config_from_env(self):
+        """Test configuration is read from environment variables."""
+        config = load_executor_config()
+        assert config.max_workers == 3
+        assert config.queue_size == 7
+        assert config.default_timeout == 30.0
+        assert config.tool_timeouts == {"arango_backup": 600.0}
+
+        executor = ToolExecutor(config)
+        assert executor.get_timeout("arango_backup") == 600.0
+        assert executor.get_timeout("arango_query") == 30.0
+
+
+class TestToolExecutor:
+    """Test offloading, bounding, timeouts and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self):
+        """Test sync callables run off the event loop thread."""
+        executor = ToolExecutor(ExecutorConfig(max_workers=2))
+        try:
+            thread_name = await executor.run("t", lambda: threading.current_thread().name)
+            assert thread_name != threading.current_thread().name
+            assert thread_name.startswith("mcp-arango-tool")
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_disabled_runs_inline(self):
+        """Test max_workers=0 runs callables inline."""
+        executor = ToolExecutor(ExecutorConfig(max_workers=0))
+        thread_name = await executor.run("t", lambda: threading.current_thread().name)
+        assert thread_name == threading.current_thread().name
+        assert executor.get_metrics()["enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self):
+        """Test N blocking calls on N workers take about one call's time."""
+        executor = ToolExecutor(ExecutorConfig(max_workers=4))
+        try:
+            start = time.perf_counter()
+            await asyncio.gather(*[executor.run("slow", time.sleep, 0.2) for _ in range(4)])
+            elapsed = time.perf_counter() - start
+            assert elapsed < 0.6
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """Test the event loop keeps running while a worker blocks."""
+        executor = ToolExecutor(ExecutorConfig(max_workers=1))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        try:
+            await asyncio.gather(executor.run("slow", time.sleep, 0.2), ticker())
+            assert ticks == 5
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated(self):
+        """Test calls beyond max_workers + queue_size are rejected."""
+        executor = ToolExecutor(ExecutorConfig(max_workers=1, queue_size=1))
+        release = threading.Event()
+        try:
+            first = asyncio.ensure_future(executor.run("block", release.wait))
+            second = asyncio.ensure_future(executor.run("block", release.wait))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ExecutorSaturatedError):
+                await executor.run("block", release.wait)
+
+            metrics = executor.get_metrics()
+            assert metrics["running"] == 1
+            assert metrics["queued"] == 1
+            assert metrics["tools"]["block"]["rejected"] == 1
+
+            release.set()
+            await asyncio.gather(first, second)
+            assert executor.get_metrics()["tools"]["block"]["completed"] == 2
+        finally:
+            release.set()
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_per_tool_timeout(self):
+        """Test per-tool timeouts raise ToolTimeoutError and are counted."""
+        executor = ToolExecutor(
+            ExecutorConfig(max_workers=1, tool_timeouts={"slow": 0.05})
+        )
+        try:
+            with pytest.raises(ToolTimeoutError) as exc_info:
+                await executor.run("slow", time.sleep, 0.3)
+            assert exc_info.value.timeout == 0.05
+            assert executor.get_metrics()["tools"]["slow"]["timeouts"] == 1
+        finally:
+            executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_metrics_split_queue_wait_and_execution(self):
+        """Test queue wait is recorded separately from execution time."""
+        executor = ToolExecutor(ExecutorConfig(max_workers=1))
+        try:
+            await asyncio.gather(
+                executor.run("q", time.sleep, 0.1),
+                executor.run("q", time.sleep, 0.1),
+            )
+            stats = executor.get_metrics()["tools"]["q"]
+            assert stats["calls"] == 2
+            assert stats["completed"] == 2
+            assert stats["max_execution_ms"] >= 90
+            # The second call waited for the single worker
+            assert stats["max_queue_wait_ms"] >= 90
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_counted(self):
+        """Test exceptions from the callable propagate to the caller."""
+        executor = ToolExecutor(ExecutorConfig(max_workers=1))
+
+        def boom():
+            raise RuntimeError("boom")
+
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                await executor.run("bad", boom)
+            assert executor.get_metrics()["tools"]["bad"]["errors"] == 1
+        finally:
+            executor.shutdown()
+
+
+class TestInvokeHandlerWithExecutor:
+    """Test entry-point dispatch through the executor."""
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_offloaded(self):
+        """Test sync handlers are dispatched to the worker pool."""
+        from mcp_arangodb_async.entry import _invoke_handler
+
+        executor = ToolExecutor(ExecutorConfig(max_workers=1))
+        loop_thread = threading.current_thread().name
+
+        def handler(db, args):
+            return {"thread": threading.current_thread().name, "value": args["x"]}
+
+        try:
+            result = await _invoke_handler(
+                handler, Mock(), {"x": 1}, executor=executor, tool_name="t"
+            )
+            assert result["value"] == 1
+            assert result["thread"] != loop_thread
+            assert executor.get_metrics()["tools"]["t"]["completed"] == 1
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_call_tool_reports_timeout(self):
+        """Test call_tool returns a structured ToolTimeout error."""
+        from mcp_arangodb_async.entry import server
+
+        executor = ToolExecutor(
+            ExecutorConfig(max_workers=1, tool_timeouts={"arango_query": 0.05})
+        )
+        mock_db = Mock()
+        mock_db.aql.execute.side_effect = lambda *a, **k: time.sleep(0.3) or []
+
+        try:
+            with patch.object(server, "request_context") as mock_ctx:
+                mock_ctx.lifespan_context = {"db": mock_db, "executor": executor}
+                result = await server._handlers["call_tool"](
+                    "arango_query", {"query": "RETURN 1"}
+                )
+            response = json.loads(result[0].text)
+            assert response["type"] == "ToolTimeout"
+            assert response["tool"] == "arango_query"
+        finally:
+            executor.shutdown(wait=True)
@@ -0,0 +1,115 @@
+"""Unit tests for filter-based update/remove/upsert tools."""
+
+from unittest.mock import Mock
+
+from mcp_arangodb_async.handlers import (
+    handle_remove_by_filter,
+    handle_update_by_filter,
+    handle_upsert_by_filter,
+)
+from mcp_arangodb_async.query_cache import written_collections
+
+
+def _db(matched, batches):
+    """Database mock: first query returns the match count, then one key batch per call."""
+    db = Mock()
+    db.aql.execute.side_effect = [iter([matched])] + [iter(b) for b in batches]
+    return db
+
+
+FILTERS = [{"field": "status", "op": "==", "value": "stale"}]
+
+
+class TestUpdateRemoveByFilter:
+    """Test batched UPDATE/REMOVE with the max-affected guard."""
+
+    def test_update_in_key_ordered_batches(self):
+        """Test matches are updated in batches that resume after the last key."""
+        db = _db(5, [["a", "b"], ["c", "d"], ["e"]])
+        result = handle_update_by_filter(
+            db,
+            {"collection": "orders", "filters": FILTERS, "update": {"archived": True}, "batch_size": 2},
+        )
+        assert result["matched"] == 5
+        assert result["updated_count"] == 5
+        assert result["batches"] == 3
+
+        count_call, *batch_calls = db.aql.execute.call_args_list
+        assert count_call[1]["bind_vars"] == {"v0": "stale", "guard_limit": 10001}
+        query = batch_calls[0][0][0]
+        assert "FILTER doc.status == @v0" in query
+        assert "UPDATE doc WITH @update IN orders" in query
+        assert [c[1]["bind_vars"]["after_key"] for c in batch_calls] == ["", "b", "d"]
+        assert batch_calls[0][1]["bind_vars"]["update"] == {"archived": True}
+
+    def test_guard_rejects_too_many_matches(self):
+        """Test nothing is changed when more documents match than max_affected."""
+        db = _db(4, [])
+        result = handle_remove_by_filter(
+            db, {"collection": "orders", "filters": FILTERS, "max_affected": 3}
+        )
+        assert "max_affected" in result["error"]
+        assert db.aql.execute.call_count == 1
+
+    def test_dry_run_and_last_batch_capped(self):
+        """Test dry_run only counts and batches never exceed max_affected."""
+        db = _db(2, [])
+        result = handle_remove_by_filter(
+            db, {"collection": "orders", "filters": FILTERS, "dry_run": True}
+        )
+        assert result == {
+            "collection": "orders", "operation": "remove", "matched": 2,
+            "removed_count": 0, "batches": 0, "dry_run": True,
+        }
+
+        db = _db(3, [["a", "b"], ["c"]])
+        result = handle_remove_by_filter(
+            db, {"collection": "orders", "filters": FILTERS, "batch_size": 2, "max_affected": 3}
+        )
+        assert result["removed_count"] == 3
+        limits = [c[1]["bind_vars"]["batch_limit"] for c in db.aql.execute.call_args_list[1:]]
+        assert limits == [2, 1]
+        assert "REMOVE doc IN orders" in db.aql.execute.call_args[0][0]
+
+    def test_invalid_fields_rejected(self):
+        """Test field and collection names are validated like the query builder."""
+        result = handle_update_by_filter(
+            Mock(),
+            {"collection": "orders", "filters": [{"field": "a; REMOVE", "op": "==", "value": 1}],
+             "update": {"x": 1}},
+        )
+        assert "Invalid field name" in result["error"]
+        result = handle_remove_by_filter(Mock(), {"collection": "orders x", "filters": FILTERS})
+        assert "Invalid collection name" in result["error"]
+
+
+class TestUpsertByFilter:
+    """Test AQL UPSERT by equality filters."""
+
+    def test_upsert_builds_search_document(self):
+        """Test equality filters become the UPSERT search document."""
+        db = Mock()
+        db.aql.execute.return_value = iter([{"_key": "k1", "inserted": True}])
+        result = handle_upsert_by_filter(
+            db,
+            {"collection": "users", "filters": [{"field": "email", "op": "==", "value": "a@b.c"}],
+             "update": {"active": True}},
+        )
+        assert result["inserted"] is True and result["_key"] == "k1"
+        query, kwargs = db.aql.execute.call_args[0][0], db.aql.execute.call_args[1]
+        assert "UPSERT { email: @v0 }" in query
+        assert kwargs["bind_vars"]["insert"] == {"email": "a@b.c", "active": True}
+
+    def test_upsert_requires_equality(self):
+        """Test non-equality or nested filters are rejected."""
+        result = handle_upsert_by_filter(
+            Mock(),
+            {"collection": "users", "filters": [{"field": "age", "op": ">", "value": 1}], "update": {}},
+        )
+        assert "'==' conditions" in result["error"]
+
+
+def test_filter_tools_invalidate_query_cache():
+    """Test the new write tools invalidate cached reads of their collection."""
+    assert written_collections("arango_update_by_filter", {"collection": "orders"}) == frozenset({"orders"})
+    assert written_collections("arango_bulk_insert_file", {"collection": "users"}) == frozenset({"users"})
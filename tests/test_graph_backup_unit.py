@@ -122,6 +122,28 @@ class TestBackupGraphToDir:
                 assert result["metadata_included"] is False
                 assert not os.path.exists(os.path.join(tmp_dir, "graph_metadata.json"))
 
+    def test_backup_graph_parallel(self):
+        """Test parallel graph backup passes cursor batch sizes and reports timings."""
+        mock_db = Mock()
+        mock_db.has_graph.return_value = True
+        mock_db.graph.return_value.properties.return_value = {
+            "edge_definitions": [{"edge_collection": "follows", "from_vertex_collections": ["users"], "to_vertex_collections": ["posts"]}],
+            "orphan_collections": []
+        }
+        mock_db.has_collection.return_value = True
+
+        with TemporaryDirectory() as tmp_dir:
+            with patch('mcp_arangodb_async.graph_backup._backup_collection_to_file', return_value=4) as mock_backup_col, \
+                 patch('mcp_arangodb_async.graph_backup.export_batch_size', return_value=500):
+                result = backup_graph_to_dir(mock_db, "test_graph", tmp_dir, parallelism=4)
+
+        assert result["parallelism"] == 3
+        assert result["total_documents"] == 12
+        assert {f["collection"] for f in result["vertex_files"]} == {"users", "posts"}
+        assert [f["collection"] for f in result["edge_files"]] == ["follows"]
+        assert all("elapsed_sec" in f for f in result["vertex_files"] + result["edge_files"])
+        assert {c[1]["batch_size"] for c in mock_backup_col.call_args_list} == {500}
+
 
 class TestRestoreGraphFromDir:
     """Test cases for restore_graph_from_dir function."""
@@ -129,6 +151,7 @@ class TestRestoreGraphFromDir:
     def test_restore_graph_success(self):
         """Test successful graph restore."""
         mock_db = Mock()
+        mock_db.name = "test_db"
         mock_db.has_graph.return_value = False  # Graph doesn't exist yet
         mock_db.create_graph.return_value = Mock()
         
@@ -171,6 +194,71 @@ class TestRestoreGraphFromDir:
                     assert len(result["restored_edges"]) == 1
                     assert result["total_documents_restored"] == 2
 
+    def test_restore_graph_reports_conflicts_and_throughput(self):
+        """Test existing keys are reported as conflicts and each collection reports its throughput."""
+        mock_db = Mock()
+        mock_db.name = "test_db"
+        mock_db.has_graph.return_value = False
+        mock_db.has_collection.return_value = True
+        metadata = {"graph_name": "g", "graph_properties": {"edge_definitions": [], "orphan_collections": ["v"]}}
+
+        with TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "vertices"))
+            with open(os.path.join(tmp_dir, "graph_metadata.json"), "w") as f:
+                json.dump(metadata, f)
+            with open(os.path.join(tmp_dir, "vertices", "v.jsonl"), "w") as f:
+                f.writelines(json.dumps({"_key": str(i)}) + "\n" for i in range(4))
+
+            with patch('mcp_arangodb_async.graph_backup.import_documents') as mock_import:
+                mock_import.return_value = {"created": 3, "ignored": 1}
+                result = restore_graph_from_dir(mock_db, tmp_dir, conflict_resolution="skip", validate_integrity=False)
+
+        mock_import.assert_called_once()
+        restored = result["restored_vertices"][0]
+        assert restored["total_processed"] == 4
+        assert "elapsed_sec" in restored and "docs_per_sec" in restored
+        assert result["conflicts"] == [{"collection": "v", "count": 1, "resolution": "skip"}]
+        assert "elapsed_sec" in result
+
+    def test_restore_graph_parallel_schedules_edges_after_vertices(self):
+        """Test edge collections wait for the vertex collections of their edge definitions."""
+        metadata = {
+            "graph_name": "g",
+            "graph_properties": {
+                "edge_definitions": [
+                    {"edge_collection": "e1", "from_vertex_collections": ["a"], "to_vertex_collections": ["a"]},
+                    {"edge_collection": "e2", "from_vertex_collections": ["b"], "to_vertex_collections": ["c"]},
+                ],
+                "orphan_collections": [],
+            },
+        }
+        mock_db = Mock()
+        mock_db.name = "test_db"
+        mock_db.has_graph.return_value = False
+        with TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "vertices"))
+            os.makedirs(os.path.join(tmp_dir, "edges"))
+            with open(os.path.join(tmp_dir, "graph_metadata.json"), "w") as f:
+                json.dump(metadata, f)
+            for sub_dir, names in (("vertices", "abc"), ("edges", ["e1", "e2"])):
+                for name in names:
+                    open(os.path.join(tmp_dir, sub_dir, f"{name}.jsonl"), "w").close()
+
+            with patch('mcp_arangodb_async.graph_backup.run_scheduled') as mock_run:
+                mock_run.side_effect = lambda fn, jobs, deps, workers: [
+                    {"collection": job[0], "inserted": 1} for job in jobs
+                ]
+                result = restore_graph_from_dir(
+                    mock_db, tmp_dir, validate_integrity=False, parallelism=4, memory_budget_mb=1
+                )
+
+        jobs, dependencies, workers = mock_run.call_args[0][1:]
+        names = [job[0] for job in jobs]
+        deps = {names[i]: sorted(names[d] for d in ds) for i, ds in dependencies.items()}
+        assert deps == {"e1": ["a"], "e2": ["b", "c"]}
+        assert workers == 4 and result["parallelism"] == 4
+        assert len(result["restored_vertices"]) == 3 and len(result["restored_edges"]) == 2
+
     def test_restore_graph_missing_metadata(self):
         """Test restore with missing metadata file."""
         with TemporaryDirectory() as tmp_dir:
@@ -180,6 +268,7 @@ class TestRestoreGraphFromDir:
     def test_restore_graph_conflict_error(self):
         """Test restore with existing graph and error conflict resolution."""
         mock_db = Mock()
+        mock_db.name = "test_db"
         mock_db.has_graph.return_value = True  # Graph already exists
 
         # Note: python-arango returns snake_case keys, not camelCase
@@ -199,6 +288,47 @@ class TestRestoreGraphFromDir:
             assert "already exists" in result["errors"][0]["error"]
 
 
+class TestRestoreCollectionStreaming:
+    """Test streaming restore of a single collection file."""
+
+    def _db(self, exists=False):
+        db = Mock()
+        db.has_collection.return_value = exists
+        return db
+
+    def test_restore_jsonl_in_batches(self, tmp_path):
+        """Test JSON Lines files are imported batch by batch and the edge flag is honoured."""
+        path = tmp_path / "knows.jsonl"
+        path.write_text("".join(json.dumps({"_key": str(i)}) + "\n" for i in range(5)) + "\n")
+        db = self._db()
+        with patch('mcp_arangodb_async.graph_backup.import_documents') as mock_import:
+            mock_import.side_effect = lambda col, batch, **kw: {"created": len(batch)}
+            result = _restore_collection_from_file(db, "knows", str(path), "skip", batch_size=2, edge=True)
+
+        assert [len(call[0][1]) for call in mock_import.call_args_list] == [2, 2, 1]
+        db.create_collection.assert_called_once_with("knows", edge=True)
+        assert result["inserted"] == 5 and result["total_processed"] == 5
+
+    def test_restore_legacy_json_detects_edges_from_first_document(self, tmp_path):
+        """Test legacy JSON array files still restore and edges are detected from the first document."""
+        path = tmp_path / "knows.json"
+        path.write_text(json.dumps([{"_key": "1", "_from": "v/1", "_to": "v/2"}]))
+        db = self._db()
+        with patch('mcp_arangodb_async.graph_backup.import_documents', return_value={"created": 1}):
+            result = _restore_collection_from_file(db, "knows", str(path), "skip")
+
+        db.create_collection.assert_called_once_with("knows", edge=True)
+        assert result["total_processed"] == 1
+
+    def test_restore_reports_corrupt_record(self, tmp_path):
+        """Test an unparsable line fails the restore with its line number."""
+        path = tmp_path / "users.jsonl"
+        path.write_text('{"_key": "1"}\n{"_key": \n')
+        with patch('mcp_arangodb_async.graph_backup.import_documents', return_value={"created": 1}):
+            with pytest.raises(ValueError, match="line 2"):
+                _restore_collection_from_file(self._db(exists=True), "users", str(path), "skip")
+
+
 class TestBackupNamedGraphs:
     """Test cases for backup_named_graphs function."""
 
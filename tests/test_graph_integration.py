@@ -13,6 +13,7 @@ class TestGraphManagementIntegration:
     def setup_method(self):
         """Set up test fixtures."""
         self.mock_db = Mock()
+        self.mock_db.name = "test_db"
         self.mock_client = Mock()
 
     @pytest.mark.asyncio
@@ -130,6 +131,7 @@ class TestGraphManagementIntegration:
             # Mock the file operations and directory existence
             with patch('os.path.exists') as mock_exists, \
                  patch('os.listdir') as mock_listdir, \
+                 patch('mcp_arangodb_async.graph_backup.validate_input_directory', side_effect=lambda path: path), \
                  patch('mcp_arangodb_async.graph_backup._restore_collection_from_file') as mock_restore_file:
 
                 mock_exists.return_value = True  # Directory exists
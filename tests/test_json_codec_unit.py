@@ -0,0 +1,88 @@
+"""Unit tests for the JSON codec used to serialize tool responses."""
+
+import json
+import uuid
+import pytest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from mcp_arangodb_async import json_codec
+from mcp_arangodb_async.content_converter import MCPContentConverter
+
+
+AVAILABLE_BACKENDS = ["stdlib"] + [
+    name for name in ("orjson", "msgspec") if getattr(json_codec, name) is not None
+]
+
+
+@pytest.fixture(params=AVAILABLE_BACKENDS)
+def backend(request):
+    previous = json_codec.get_backend()
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(previous)
+
+
+class TestJsonCodec:
+    """Test every installed backend produces the same JSON."""
+
+    def test_special_types(self, backend):
+        """Test datetime, bytes, Decimal, UUID and sets are encoded."""
+        value = {
+            "dt": datetime(2024, 1, 2, 3, 4, 5, 123456),
+            "aware": datetime(2024, 1, 2, tzinfo=timezone.utc),
+            "day": date(2024, 1, 2),
+            "raw": b"\x00\x01abc",
+            "price": Decimal("12.3400000000000000001"),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "set": {1},
+        }
+        assert json.loads(json_codec.dumps(value)) == {
+            "dt": "2024-01-02T03:04:05.123456",
+            "aware": "2024-01-02T00:00:00+00:00",
+            "day": "2024-01-02",
+            "raw": "AAFhYmM=",
+            "price": "12.3400000000000000001",
+            "id": "12345678-1234-5678-1234-567812345678",
+            "set": [1],
+        }
+
+    def test_output_matches_stdlib(self, backend):
+        """Test compact output is byte-identical to stdlib compact JSON."""
+        value = [{"_key": "1", "name": "Zürich", "n": 1.5, "ok": True, "none": None, 2: "x"}]
+        expected = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        assert json_codec.dumps(value) == expected
+        assert json_codec.dumps_bytes(value) == expected.encode("utf-8")
+
+    def test_big_integers_fall_back(self, backend):
+        """Test integers beyond 64 bits still serialize."""
+        assert json_codec.dumps({"n": 2 ** 70}) == '{"n":%d}' % 2 ** 70
+
+    def test_unsupported_type_raises(self, backend):
+        """Test values without a JSON form raise TypeError."""
+        with pytest.raises(TypeError):
+            json_codec.dumps({"x": object()})
+
+    def test_invalid_backend_rejected(self):
+        """Test unknown backend names are rejected."""
+        with pytest.raises(ValueError):
+            json_codec.set_backend("ujson")
+
+
+class TestConverterSerialization:
+    """Test MCPContentConverter serializes in one pass with the codec."""
+
+    def test_objects_and_special_types(self, backend):
+        """Test objects, datetimes and Decimals in converter output."""
+        class Row:
+            def __init__(self):
+                self.when = datetime(2024, 1, 1)
+                self.amount = Decimal("1.10")
+
+        text = MCPContentConverter(indent=2).to_text_content({"row": Row()})[0].text
+        assert json.loads(text) == {"row": {"when": "2024-01-01T00:00:00", "amount": "1.10"}}
+
+    def test_compact_keeps_stdlib_spacing(self, backend):
+        """Test compact converter output keeps ', ' and ': ' separators."""
+        text = MCPContentConverter().to_text_content({"a": 1, "b": [1, 2]})[0].text
+        assert text == '{"a": 1, "b": [1, 2]}'
@@ -47,6 +47,9 @@ class TestMultiTenancyTools:
         self.config_loader = Mock(spec=ConfigFileLoader)
         self.config_loader.default_database = "production"
         self.config_loader.get_configured_databases.return_value = self.db_manager.get_configured_databases()
+        self.config_loader.first_database_key.return_value = next(
+            iter(self.db_manager.get_configured_databases()), None
+        )
 
     def _create_session_context(self):
         """Create session context for handlers."""
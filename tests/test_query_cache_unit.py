@@ -0,0 +1,173 @@
+"""Unit tests for the AQL read-result cache (query_cache.py)."""
+
+import json
+import time
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from mcp_arangodb_async.multi_db_manager import DatabaseConfig
+from mcp_arangodb_async.query_cache import (
+    ALL_COLLECTIONS,
+    QueryCache,
+    QueryCacheConfig,
+    aql_read_set,
+    cache_key_for,
+    normalize_aql,
+    written_collections,
+)
+
+
+class TestQueryCacheKeys:
+    """Test normalization, read sets and write detection."""
+
+    def test_normalize_collapses_whitespace_and_comments(self):
+        """Test formatting differences map to the same query text."""
+        a = "FOR u IN users\n   FILTER u.name == 'a  b' // comment\n RETURN u"
+        b = "FOR u IN users FILTER u.name == 'a  b' RETURN u"
+        assert normalize_aql(a) == normalize_aql(b)
+        assert "'a  b'" in normalize_aql(a)
+
+    def test_bind_vars_are_part_of_key(self):
+        """Test different bind values produce different keys, order does not."""
+        k1, _ = cache_key_for("arango_query", "db", {"query": "RETURN @a", "bind_vars": {"a": 1, "b": 2}})
+        k2, _ = cache_key_for("arango_query", "db", {"query": "RETURN @a", "bind_vars": {"b": 2, "a": 1}})
+        k3, _ = cache_key_for("arango_query", "db", {"query": "RETURN @a", "bind_vars": {"a": 3, "b": 2}})
+        assert k1 == k2
+        assert k1 != k3
+
+    def test_read_set_covers_collections(self):
+        """Test collection names, document ids and @@ bind values are collected."""
+        read = aql_read_set(
+            "FOR u IN users FOR o IN @@col RETURN DOCUMENT('orders/1')",
+            {"@col": "items"},
+        )
+        assert {"users", "orders", "items"} <= read
+        assert aql_read_set("FOR v IN 1..2 OUTBOUND 'a/1' GRAPH 'g' RETURN v", {}) is ALL_COLLECTIONS
+
+    def test_uncacheable_calls(self):
+        """Test writes, paged queries and other tools are not cached."""
+        assert cache_key_for("arango_query", "db", {"query": "INSERT {} INTO users"}) is None
+        assert cache_key_for("arango_query", "db", {"query": "RETURN 1", "batch_size": 10}) is None
+        assert cache_key_for("arango_list_collections", "db", {}) is None
+
+    def test_written_collections(self):
+        """Test write tools map to the collections they modify."""
+        assert written_collections("arango_insert", {"collection": "users"}) == {"users"}
+        assert written_collections("arango_restore_graph", {}) is ALL_COLLECTIONS
+        assert written_collections("arango_query", {"query": "REMOVE 'a' IN users"}) is ALL_COLLECTIONS
+        assert written_collections("arango_query", {"query": "RETURN 1"}) == frozenset()
+
+
+class TestQueryCache:
+    """Test LRU/TTL behaviour and invalidation."""
+
+    def test_hit_and_miss_counters(self):
+        """Test a stored result is served and counted."""
+        cache = QueryCache()
+        assert cache.get("k") == (False, None)
+        cache.put(("db", "k"), [1, 2], frozenset({"users"}), "db", cache.begin_read("db"))
+        assert cache.get(("db", "k")) == (True, [1, 2])
+        metrics = cache.get_metrics()
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["entries"] == 1
+
+    def test_ttl_expiry(self):
+        """Test entries expire after their TTL."""
+        cache = QueryCache(QueryCacheConfig(ttl=0.05))
+        cache.put(("db", "k"), [1], frozenset(), "db", 0)
+        time.sleep(0.1)
+        assert cache.get(("db", "k")) == (False, None)
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted when over budget."""
+        cache = QueryCache(QueryCacheConfig(max_bytes=30))
+        cache.put(("db", "a"), "x" * 10, frozenset(), "db", 0)
+        cache.put(("db", "b"), "y" * 10, frozenset(), "db", 0)
+        cache.get(("db", "a"))
+        cache.put(("db", "c"), "z" * 10, frozenset(), "db", 0)
+        assert cache.get(("db", "b"))[0] is False
+        assert cache.get(("db", "a"))[0] is True
+        assert cache.get_metrics()["evictions"] == 1
+
+    def test_oversized_result_not_cached(self):
+        """Test results above max_entry_bytes are skipped."""
+        cache = QueryCache(QueryCacheConfig(max_entry_bytes=5))
+        assert cache.put(("db", "k"), "x" * 100, frozenset(), "db", 0) is False
+
+    def test_invalidation_is_scoped(self):
+        """Test writes drop only entries of the same database and collections."""
+        cache = QueryCache()
+        cache.put(("db", "users"), [1], frozenset({"users"}), "db", 0)
+        cache.put(("db", "orders"), [2], frozenset({"orders"}), "db", 0)
+        cache.put(("other", "users"), [3], frozenset({"users"}), "other", 0)
+        assert cache.invalidate("db", frozenset({"users"})) == 1
+        assert cache.get(("db", "users"))[0] is False
+        assert cache.get(("db", "orders"))[0] is True
+        assert cache.get(("other", "users"))[0] is True
+
+    def test_read_racing_write_is_not_stored(self):
+        """Test a read that started before an invalidation is discarded."""
+        cache = QueryCache()
+        epoch = cache.begin_read("db")
+        cache.invalidate("db", frozenset({"users"}))
+        assert cache.put(("db", "k"), [1], frozenset({"users"}), "db", epoch) is False
+
+
+class TestQueryCacheDispatch:
+    """Test call_tool integration."""
+
+    async def _call(self, lifespan, name, args):
+        from mcp_arangodb_async.entry import server
+
+        with patch.object(server, "request_context") as mock_ctx:
+            mock_ctx.lifespan_context = lifespan
+            result = await server._handlers["call_tool"](name, args)
+        return json.loads(result[0].text)
+
+    def _lifespan(self, query_cache_enabled):
+        from mcp_arangodb_async.session_state import SessionState
+
+        db = Mock()
+        db.aql.execute.side_effect = lambda *a, **k: iter([{"n": db.aql.execute.call_count}])
+        db.has_collection.return_value = True
+        db.collection.return_value.insert.return_value = {"_id": "users/1", "_key": "1", "_rev": "r"}
+        db_manager = Mock()
+        db_manager.get_connection = AsyncMock(return_value=(Mock(), db))
+        db_manager.get_async_database = AsyncMock(return_value=None)
+        db_manager.get_database_config.return_value = DatabaseConfig(
+            url="http://arango:8529", database="d", username="root",
+            password_env="P", query_cache=query_cache_enabled,
+        )
+        config_loader = Mock()
+        config_loader.default_database = "main"
+        return db, {
+            "db": db,
+            "session_state": SessionState(),
+            "db_manager": db_manager,
+            "config_loader": config_loader,
+            "query_cache": QueryCache(),
+        }
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_served_from_cache_until_write(self):
+        """Test repeats hit the cache and a write to the collection invalidates."""
+        db, lifespan = self._lifespan(True)
+        query = {"query": "FOR u IN users RETURN u"}
+        assert await self._call(lifespan, "arango_query", query) == [{"n": 1}]
+        assert await self._call(lifespan, "arango_query", query) == [{"n": 1}]
+        assert db.aql.execute.call_count == 1
+
+        await self._call(lifespan, "arango_insert", {"collection": "users", "document": {"a": 1}})
+        assert await self._call(lifespan, "arango_query", query) == [{"n": 2}]
+        assert lifespan["query_cache"].get_metrics()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_opt_in_per_database(self):
+        """Test databases without query_cache always execute."""
+        db, lifespan = self._lifespan(False)
+        query = {"query": "FOR u IN users RETURN u"}
+        await self._call(lifespan, "arango_query", query)
+        await self._call(lifespan, "arango_query", query)
+        assert db.aql.execute.call_count == 2
+        assert lifespan["query_cache"].get_metrics()["entries"] == 0
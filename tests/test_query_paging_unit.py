@@ -0,0 +1,215 @@
+"""Unit tests for arango_query paging and the cursor registry."""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+
+from mcp_arangodb_async.cursor_registry import CursorRegistry
+from mcp_arangodb_async.handlers import handle_arango_query, handle_query_next
+from mcp_arangodb_async.session_state import SessionState
+
+
+class FakeCursor:
+    """python-arango-like streaming cursor serving rows in server batches."""
+
+    def __init__(self, rows, batch_size):
+        self._pending = list(rows)
+        self._batch_size = batch_size
+        self._batch = []
+        self.fetches = 0
+        self.closed = False
+        self._load()
+
+    def _load(self):
+        self._batch = self._pending[: self._batch_size]
+        self._pending = self._pending[self._batch_size:]
+        self.fetches += 1
+
+    def empty(self):
+        return not self._batch
+
+    def has_more(self):
+        return bool(self._pending)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self._batch:
+            if not self._pending:
+                raise StopIteration
+            self._load()
+        return self._batch.pop(0)
+
+    def close(self):
+        self.closed = True
+        self.closed_on = threading.get_ident()
+
+
+class FakeAsyncCursor:
+    """async_driver-like cursor that yields to the event loop on every row."""
+
+    def __init__(self, rows):
+        self._rows = list(rows)
+        self.has_more = False
+        self.closed = False
+
+    def empty(self):
+        return not self._rows
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if not self._rows:
+            raise StopAsyncIteration
+        return self._rows.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestQueryPaging:
+    """Test paged arango_query and arango_query_next."""
+
+    def setup_method(self):
+        self.session_state = SessionState()
+        self.session_state.initialize_session("s1")
+        self.cursor = FakeCursor(range(25), batch_size=10)
+        self.db = Mock()
+        self.db.aql.execute.return_value = self.cursor
+
+    def _args(self, **kwargs):
+        kwargs["_session_context"] = {"session_state": self.session_state, "session_id": "s1"}
+        return kwargs
+
+    @pytest.mark.asyncio
+    async def test_pages_through_result(self):
+        """Test first page plus cursor handle, then next pages until exhausted."""
+        page = handle_arango_query(self.db, self._args(query="FOR x IN 1..25 RETURN x", batch_size=10))
+        assert page["rows"] == list(range(10))
+        assert page["has_more"] is True
+        _, kwargs = self.db.aql.execute.call_args
+        assert kwargs["batch_size"] == 10
+        assert kwargs["stream"] is True
+
+        page2 = await handle_query_next(self.db, self._args(cursor=page["cursor"]))
+        assert page2["rows"] == list(range(10, 20))
+        assert page2["cursor"] == page["cursor"]
+
+        page3 = await handle_query_next(self.db, self._args(cursor=page["cursor"]))
+        assert page3["rows"] == list(range(20, 25))
+        assert page3["has_more"] is False
+        assert page3["cursor"] is None
+        assert page3["total_returned"] == 25
+        assert self.cursor.closed
+        assert self.session_state.cursors.count("s1") == 0
+
+    @pytest.mark.asyncio
+    async def test_max_rows_truncates(self):
+        """Test max_rows caps rows across pages and closes the cursor."""
+        page = handle_arango_query(self.db, self._args(query="q", batch_size=10, max_rows=15))
+        page2 = await handle_query_next(self.db, self._args(cursor=page["cursor"]))
+        assert page2["rows"] == list(range(10, 15))
+        assert page2["cursor"] is None
+        assert page2["truncated"] is True
+        assert self.cursor.closed
+
+    def test_max_rows_only_returns_single_page(self):
+        """Test max_rows without batch_size returns at most max_rows rows."""
+        page = handle_arango_query(self.db, self._args(query="q", max_rows=5))
+        assert page["rows"] == list(range(5))
+        assert page["cursor"] is None
+        assert page["truncated"] is True
+
+    def test_unpaged_query_unchanged(self):
+        """Test queries without paging arguments still return a plain list."""
+        assert handle_arango_query(self.db, self._args(query="q")) == list(range(25))
+
+    @pytest.mark.asyncio
+    async def test_cursor_scoped_to_session(self):
+        """Test another session cannot read a cursor handle."""
+        page = handle_arango_query(self.db, self._args(query="q", batch_size=10))
+        result = await handle_query_next(
+            self.db,
+            {"cursor": page["cursor"], "_session_context": {
+                "session_state": self.session_state, "session_id": "other"}},
+        )
+        assert result["type"] == "CursorNotFound"
+
+    @pytest.mark.asyncio
+    async def test_close_cursor(self):
+        """Test close=True discards the cursor."""
+        page = handle_arango_query(self.db, self._args(query="q", batch_size=10))
+        result = await handle_query_next(self.db, self._args(cursor=page["cursor"], close=True))
+        assert result["closed"] is True
+        assert self.cursor.closed
+        again = await handle_query_next(self.db, self._args(cursor=page["cursor"]))
+        assert again["type"] == "CursorNotFound"
+
+    @pytest.mark.asyncio
+    async def test_sync_cursor_closed_off_event_loop(self):
+        """Test closing a python-arango cursor (a blocking HTTP call) runs on a worker thread."""
+        page = handle_arango_query(self.db, self._args(query="q", batch_size=10))
+        await handle_query_next(self.db, self._args(cursor=page["cursor"], close=True))
+        assert self.cursor.closed_on != threading.get_ident()
+
+        self.cursor = self.db.aql.execute.return_value = FakeCursor(range(15), batch_size=10)
+        page = handle_arango_query(self.db, self._args(query="q", batch_size=10))
+        await handle_query_next(self.db, self._args(cursor=page["cursor"]))
+        assert self.cursor.closed and self.cursor.closed_on != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_next_calls_take_disjoint_pages(self):
+        """Test concurrent calls on one async cursor neither share rows nor exceed max_rows."""
+        handle = self.session_state.cursors.register("s1", FakeAsyncCursor(range(100)), 10, max_rows=25)
+        pages = await asyncio.gather(
+            *(handle_query_next(self.db, self._args(cursor=handle)) for _ in range(4))
+        )
+        rows = [row for page in pages if "rows" in page for row in page["rows"]]
+        assert sorted(rows) == list(range(25))
+        assert [p.get("type") for p in pages].count("CursorNotFound") == 1
+
+    def test_session_cleanup_closes_cursors(self):
+        """Test cleaning up a session closes its open cursors."""
+        handle_arango_query(self.db, self._args(query="q", batch_size=10))
+        self.session_state.cleanup_session("s1")
+        assert self.cursor.closed
+
+
+class TestCursorRegistry:
+    """Test TTL expiry and per-session limits."""
+
+    def test_expired_cursor_is_closed(self):
+        """Test cursors idle beyond the TTL are purged and closed."""
+        registry = CursorRegistry(ttl=0.05)
+        cursor = Mock()
+        handle = registry.register("s1", cursor, batch_size=10)
+        time.sleep(0.1)
+        assert registry.get("s1", handle) is None
+        cursor.close.assert_called_once()
+
+    def test_close_waits_for_page_read(self):
+        """Test close() does not close a cursor while a page read holds its lock."""
+        registry = CursorRegistry()
+        cursor = Mock()
+        handle = registry.register("s1", cursor, batch_size=10)
+        entry = registry.get("s1", handle)
+        with entry.lock:
+            closer = threading.Thread(target=registry.close, args=("s1", handle))
+            closer.start()
+            closer.join(0.1)
+            cursor.close.assert_not_called()
+        closer.join()
+        cursor.close.assert_called_once()
+
+    def test_per_session_limit_evicts_oldest(self):
+        """Test the least recently used cursor is evicted at the limit."""
+        registry = CursorRegistry(max_per_session=2)
+        first, second, third = Mock(), Mock(), Mock()
+        h1 = registry.register("s1", first, batch_size=1)
+        registry.register("s1", second, batch_size=1)
+        registry.register("s1", third, batch_size=1)
+        assert registry.count("s1") == 2
+        assert registry.get("s1", h1) is None
+        first.close.assert_called_once()
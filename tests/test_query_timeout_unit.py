@@ -0,0 +1,192 @@
+"""Unit tests for query runtime limits and server-side query kill (query_tracker.py)."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from mcp_arangodb_async.executor import ToolTimeoutError
+from mcp_arangodb_async.query_tracker import (
+    QueryCancelledError,
+    QueryRuntimeConfig,
+    QueryTracker,
+    load_query_runtime_config,
+    tag_query,
+)
+
+
+def _db_with_running(queries):
+    db = Mock()
+    db.aql.queries.return_value = queries
+    return db
+
+
+def _tagged(call_id, query_id, text="FOR d IN c RETURN d"):
+    return {"id": query_id, "query": f"/* mcp-call:{call_id} */ {text}"}
+
+
+class TestQueryTracker:
+    """Test tagging, kill on timeout/cancellation and session close."""
+
+    @pytest.mark.asyncio
+    async def test_tag_query_only_inside_tracked_call(self):
+        """Test queries are tagged with the call marker only inside track()."""
+        tracker = QueryTracker()
+        assert tag_query("RETURN 1") == "RETURN 1"
+        async with tracker.track("s1", "arango_query", Mock()) as call_id:
+            assert tag_query("RETURN 1") == f"/* mcp-call:{call_id} */ RETURN 1"
+            assert tracker.running("s1")[0]["tool"] == "arango_query"
+        assert tag_query("RETURN 1") == "RETURN 1"
+        assert tracker.running() == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_only_the_calls_queries(self):
+        """Test a timed-out call kills its own queries and reports the count."""
+        tracker = QueryTracker()
+        db = _db_with_running([])
+        with pytest.raises(ToolTimeoutError) as exc_info:
+            async with tracker.track("s1", "arango_query", db) as call_id:
+                db.aql.queries.return_value = [
+                    _tagged(call_id, "11"),
+                    _tagged("othercall", "12"),
+                    {"id": "13", "query": "RETURN SLEEP(10)"},
+                ]
+                raise ToolTimeoutError("arango_query", 1.0)
+        db.aql.kill.assert_called_once_with("11")
+        assert exc_info.value.killed_queries == 1
+        assert tracker.killed == 1
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_in_background(self):
+        """Test cancelling a call kills its queries and blocks further queries."""
+        tracker = QueryTracker()
+        db = _db_with_running([])
+        entered = asyncio.Event()
+        seen = {}
+
+        async def call():
+            async with tracker.track("s1", "arango_traverse", db) as call_id:
+                seen["call_id"] = call_id
+                seen["call"] = tracker._calls[call_id]
+                entered.set()
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(call())
+        await entered.wait()
+        db.aql.queries.return_value = [_tagged(seen["call_id"], "21")]
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.gather(*tracker._kill_tasks)
+        db.aql.kill.assert_called_once_with("21")
+        assert seen["call"].cancelled
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_cannot_start_new_queries(self):
+        """Test tag_query raises once the current call has been cancelled."""
+        tracker = QueryTracker()
+        async with tracker.track("s1", "arango_graph_statistics", _db_with_running([])):
+            tracker.close_session("s1")
+            with pytest.raises(QueryCancelledError):
+                tag_query("RETURN 1")
+        await asyncio.gather(*tracker._kill_tasks)
+
+    @pytest.mark.asyncio
+    async def test_session_close_kills_running_calls(self):
+        """Test closing a session kills its calls but not other sessions'."""
+        tracker = QueryTracker()
+        mine, other = _db_with_running([]), _db_with_running([])
+        async with tracker.track("s1", "arango_query", mine) as call_id:
+            async with tracker.track("s2", "arango_query", other):
+                mine.aql.queries.return_value = [_tagged(call_id, "31")]
+                assert tracker.close_session("s1") == 1
+                await asyncio.gather(*tracker._kill_tasks)
+        mine.aql.kill.assert_called_once_with("31")
+        other.aql.queries.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_driver_database(self):
+        """Test queries on an async_driver database are killed with its async API."""
+        tracker = QueryTracker()
+        db = Mock()
+        db.aql.queries = AsyncMock(return_value=[_tagged("c1", "41")])
+        db.aql.kill = AsyncMock(return_value=True)
+        assert await tracker.kill_call("c1", db) == 1
+        db.aql.kill.assert_awaited_once_with("41")
+
+
+class TestQueryRuntimeConfig:
+    """Test max_runtime resolution and configuration."""
+
+    def test_per_call_then_per_tool_then_default(self):
+        """Test the per-call value wins over the per-tool and global limits."""
+        tracker = QueryTracker(
+            QueryRuntimeConfig(default_max_runtime=60.0, tool_max_runtimes={"arango_traverse": 10.0})
+        )
+        assert tracker.resolve_max_runtime("arango_traverse", {"max_runtime": 2.5}) == 2.5
+        assert tracker.resolve_max_runtime("arango_traverse", {}) == 10.0
+        assert tracker.resolve_max_runtime("arango_query", {}) == 60.0
+        assert QueryTracker().resolve_max_runtime("arango_query", {}) is None
+
+    def test_load_from_environment(self, monkeypatch):
+        """Test limits are read from environment variables."""
+        monkeypatch.setenv("MCP_QUERY_MAX_RUNTIME_SEC", "30")
+        monkeypatch.setenv("MCP_QUERY_MAX_RUNTIMES", "arango_query_builder=5")
+        config = load_query_runtime_config()
+        assert config.default_max_runtime == 30.0
+        assert config.get_max_runtime("arango_query_builder") == 5.0
+
+    def test_invalid_default_rejected(self):
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            QueryRuntimeConfig(default_max_runtime=0)
+
+
+class TestCallToolIntegration:
+    """Test call_tool passes max_runtime and tags queries."""
+
+    @pytest.mark.asyncio
+    async def test_query_runs_with_max_runtime_and_marker(self):
+        """Test arango_query executes the tagged query with the configured limit."""
+        from mcp_arangodb_async.entry import server
+        from mcp_arangodb_async.session_state import SessionState
+
+        db = Mock()
+        db.aql.execute.return_value = [1]
+        session_state = SessionState()
+        session_state.queries = QueryTracker(QueryRuntimeConfig(default_max_runtime=30.0))
+        db_manager = Mock()
+        db_manager.get_connection = AsyncMock(return_value=(Mock(), db))
+        db_manager.get_async_database = AsyncMock(return_value=None)
+        db_manager.get_database_config.return_value = None
+        config_loader = Mock()
+        config_loader.default_database = "main"
+        with patch.object(server, "request_context") as mock_ctx:
+            mock_ctx.lifespan_context = {
+                "db": db,
+                "session_state": session_state,
+                "db_manager": db_manager,
+                "config_loader": config_loader,
+            }
+            result = await server._handlers["call_tool"]("arango_query", {"query": "RETURN 1"})
+        assert json.loads(result[0].text) == [1]
+        query = db.aql.execute.call_args[0][0]
+        assert query.startswith("/* mcp-call:") and query.endswith(" RETURN 1")
+        assert db.aql.execute.call_args[1]["max_runtime"] == 30.0
+
+    def test_graph_statistics_passes_max_runtime(self):
+        """Test graph analytics queries run with the requested max_runtime."""
+        from mcp_arangodb_async.graph_backup import calculate_graph_statistics
+
+        db = Mock()
+        db.has_graph.return_value = True
+        db.graph.return_value.properties.return_value = {
+            "edge_definitions": [
+                {"edge_collection": "e", "from_vertex_collections": ["v"], "to_vertex_collections": ["v"]}
+            ]
+        }
+        db.collection.return_value.count.return_value = 10
+        db.aql.execute.return_value = [{"degree": 1, "frequency": 10}]
+        stats = calculate_graph_statistics(db, "g", include_connectivity=False, max_runtime=5.0)
+        assert stats["statistics"][0]["max_out_degree"] == 1
+        assert db.aql.execute.call_args[1] == {"max_runtime": 5.0}
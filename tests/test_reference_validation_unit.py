@@ -0,0 +1,154 @@
+"""Unit tests for batched reference validation (references.py, bulk_insert validate_refs, validate_references)."""
+
+from unittest.mock import Mock
+
+from mcp_arangodb_async.bulk import key_ranges
+from mcp_arangodb_async.handlers import handle_bulk_insert, handle_validate_references
+from mcp_arangodb_async.references import ReferenceChecker, split_document_id
+
+
+def _db(existing):
+    """Database mock whose key lookups return the keys present in existing[collection]."""
+    db = Mock()
+    db.has_collection.side_effect = lambda name: name in existing
+    db.aql.execute.side_effect = lambda query, bind_vars: iter(
+        [k for k in bind_vars["keys"] if k in existing[bind_vars["@collection"]]]
+    )
+    return db
+
+
+class TestReferenceChecker:
+    """Test per-collection lookups and the positive cache."""
+
+    def test_one_query_per_target_collection(self):
+        """Test references are grouped by collection and checked in one query each."""
+        db = _db({"users": {"1", "2"}, "products": {"p1"}})
+        checker = ReferenceChecker(db)
+        invalid = checker.check(
+            [
+                {"user_id": "users/1", "product_id": "products/p1"},
+                {"user_id": "users/2", "product_id": "products/missing"},
+                {"user_id": "ghosts/1"},
+                {"user_id": "not-an-id", "note_id": None},
+            ]
+        )
+        assert invalid == {
+            1: [{"field": "product_id", "value": "products/missing"}],
+            2: [{"field": "user_id", "value": "ghosts/1"}],
+            3: [{"field": "user_id", "value": "not-an-id"}],
+        }
+        assert db.aql.execute.call_count == 2
+        assert checker.lookups == 2
+
+    def test_existing_ids_are_cached(self):
+        """Test IDs found once are not looked up again; missing ones are."""
+        db = _db({"users": {"1"}})
+        checker = ReferenceChecker(db, ["owner"])
+        checker.check([{"owner": "users/1"}, {"owner": "users/9"}])
+        assert checker.check([{"owner": "users/1"}]) == {}
+        assert db.aql.execute.call_count == 1
+        checker.check([{"owner": "users/9"}])
+        assert db.aql.execute.call_count == 2
+
+    def test_split_document_id(self):
+        """Test only "collection/key" strings are document IDs."""
+        assert split_document_id("users/1") == ("users", "1")
+        assert split_document_id("users/") is None
+        assert split_document_id(5) is None
+
+
+class TestBulkInsertValidateRefs:
+    """Test handle_bulk_insert with validate_refs."""
+
+    def test_invalid_documents_skipped_and_reported(self):
+        """Test documents with invalid references are not inserted and keep their index."""
+        db = _db({"users": {"1"}})
+        inserted = []
+
+        def insert_many(batch, return_new, sync):
+            inserted.extend(batch)
+            return [{"_id": f"orders/{d['_key']}"} for d in batch]
+
+        db.collection.return_value.insert_many.side_effect = insert_many
+        docs = [{"_key": str(i), "user_id": "users/1" if i % 2 == 0 else "users/x"} for i in range(6)]
+        result = handle_bulk_insert(
+            db,
+            {"collection": "orders", "documents": docs, "batch_size": 3, "validate_refs": True,
+             "on_error": "continue"},
+        )
+        assert [d["_key"] for d in inserted] == ["0", "2", "4"]
+        assert result["inserted_ids"] == ["orders/0", "orders/2", "orders/4"]
+        assert [e["index"] for e in result["errors"]] == [1, 3, 5]
+        assert result["errors"][0]["invalid_references"] == [{"field": "user_id", "value": "users/x"}]
+        assert result["error_count"] == 3
+        # One lookup per batch for the unresolved IDs
+        assert result["reference_lookups"] == 2
+
+
+class TestValidateReferencesStreaming:
+    """Test the aggregated validate_references mode."""
+
+    def _db(self, invalid_count, sample, removed_batches, total=4):
+        """Database mock answering count, sample, key-boundary and REMOVE queries."""
+        db = Mock()
+        db.collection.return_value.count.return_value = total
+        removed = iter(removed_batches)
+
+        def execute(query, bind_vars, **kwargs):
+            if "COLLECT WITH COUNT" in query:
+                return iter([invalid_count])
+            if "LIMIT @sample_size" in query:
+                return iter(sample[: bind_vars["sample_size"]])
+            if "LIMIT @offset, 1" in query:
+                return iter([f"k{bind_vars['offset']}"])
+            return iter(next(removed))
+
+        db.aql.execute.side_effect = execute
+        return db
+
+    def test_count_and_bounded_sample(self):
+        """Test invalid documents are counted server-side and only a sample is returned."""
+        sample = [{"_key": str(i), "invalid_references": []} for i in range(3)]
+        db = self._db(250, sample, [])
+        result = handle_validate_references(
+            db, {"collection": "orders", "reference_fields": ["user_id"], "streaming": True, "sample_size": 2}
+        )
+        assert result["invalid_count"] == 250
+        assert len(result["invalid_documents"]) == 2 and result["sample_truncated"]
+        assert result["validation_passed"] is False
+        for call in db.aql.execute.call_args_list:
+            assert call[1]["bind_vars"]["fields"] == ["user_id"]
+            assert "user_id" not in call[0][0]
+
+    def test_fix_invalid_in_key_range_batches(self):
+        """Test removal walks each key range in batches."""
+        db = self._db(5, [], [["a", "b"], ["c"], ["m", "n"], []])
+        result = handle_validate_references(
+            db,
+            {"collection": "orders", "reference_fields": ["user_id"], "streaming": True,
+             "fix_invalid": True, "fix_batch_size": 2, "fix_parallelism": 2},
+        )
+        assert result["removed_count"] == 5
+        assert result["removal_partitions"] == 2
+        remove_calls = [c for c in db.aql.execute.call_args_list if "REMOVE doc" in c[0][0]]
+        ranges = {(c[1]["bind_vars"].get("until_key"), c[1]["bind_vars"]["after_key"]) for c in remove_calls}
+        assert (("k1", "") in ranges) and any(until is None and after == "k1" for until, after in ranges)
+
+    def test_default_mode_uses_bind_vars_and_batched_removal(self):
+        """Test the full report passes fields as bind variables and deletes in batches."""
+        db = Mock()
+        db.aql.execute.return_value = iter([{"_key": str(i)} for i in range(5)])
+        result = handle_validate_references(
+            db, {"collection": "orders", "reference_fields": ["user_id"], "fix_invalid": True, "fix_batch_size": 2}
+        )
+        assert db.aql.execute.call_args[1]["bind_vars"] == {"@collection": "orders", "fields": ["user_id"]}
+        assert [len(c[0][0]) for c in db.collection.return_value.delete_many.call_args_list] == [2, 2, 1]
+        assert result["removed_count"] == 5
+
+
+def test_key_ranges_cover_key_space():
+    """Test ranges are contiguous (after, until] slices cut at evenly spaced keys."""
+    db = Mock()
+    db.aql.execute.side_effect = lambda query, bind_vars: iter([f"k{bind_vars['offset']:02d}"])
+    assert key_ranges(db, "c", 3, total=30) == [(None, "k09"), ("k09", "k19"), ("k19", None)]
+    assert key_ranges(db, "c", 4, total=0) == [(None, None)]
@@ -0,0 +1,62 @@
+"""Unit tests for per-session lifespans of a shared server context (entry.py)."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import anyio
+import pytest
+from mcp.server.lowlevel import Server
+
+from mcp_arangodb_async.entry import _open_contexts, server_lifespan
+from mcp_arangodb_async.query_tracker import QueryTracker
+from mcp_arangodb_async.session_state import SessionState
+
+
+async def _run_closed_session(server):
+    """Run the server over a session whose client disconnects right away."""
+    client_send, server_read = anyio.create_memory_object_stream(10)
+    server_send, client_read = anyio.create_memory_object_stream(10)
+    await client_send.aclose()
+    async with client_read:
+        await server.run(server_read, server_send, server.create_initialization_options())
+
+
+class TestSessionLifespan:
+    """Test an ended session releases its cursors and kills its queries."""
+
+    @pytest.mark.asyncio
+    async def test_ended_session_kills_its_queries(self):
+        """Test Server.run() scopes a session whose queries are killed when it ends."""
+        server = Server("test", lifespan=server_lifespan)
+        state = SessionState()
+        state.queries = QueryTracker()
+        _open_contexts[server] = {"session_state": state}
+        mine, other = Mock(), Mock()
+        cursor = Mock()
+        state.cursors.register("sess-1", cursor, 10)
+
+        with patch("mcp_arangodb_async.entry.uuid4", return_value=SimpleNamespace(hex="sess-1")):
+            async with state.queries.track("sess-1", "arango_query", mine) as call_id:
+                async with state.queries.track("sess-2", "arango_query", other):
+                    mine.aql.queries.return_value = [
+                        {"id": "51", "query": f"/* mcp-call:{call_id} */ FOR d IN c RETURN d"}
+                    ]
+                    await _run_closed_session(server)
+                    await asyncio.gather(*state.queries._kill_tasks)
+
+        mine.aql.kill.assert_called_once_with("51")
+        other.aql.queries.assert_not_called()
+        cursor.close.assert_called_once()
+        assert state.cursors.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_context_under_own_ids(self):
+        """Test nested lifespans share the open context with a session_id each."""
+        server = Server("test", lifespan=server_lifespan)
+        shared = {"session_state": SessionState(), "db": Mock()}
+        _open_contexts[server] = shared
+        async with server_lifespan(server) as first, server_lifespan(server) as second:
+            assert first["db"] is second["db"] is shared["db"]
+            assert first["session_id"] != second["session_id"]
+        assert "session_id" not in shared
@@ -0,0 +1,81 @@
+"""Unit tests for the cached tool catalog (tool_catalog.py)."""
+
+import json
+import os
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from mcp_arangodb_async.tool_catalog import ToolCatalog
+from mcp_arangodb_async.tool_registry import ToolRegistration
+
+
+class _QueryArgs(BaseModel):
+    query: str
+
+
+class _OtherArgs(BaseModel):
+    name: str
+    limit: int = 10
+
+
+def _registry():
+    return {
+        "q": ToolRegistration(name="q", description="query", model=_QueryArgs, handler=lambda db, a: a),
+        "o": ToolRegistration(name="o", description="other", model=_OtherArgs, handler=lambda db, a: a),
+    }
+
+
+class TestToolCatalog:
+    """Test schema reuse, subset lists and invalidation on registry changes."""
+
+    def test_schemas_built_once(self):
+        """Test repeated listings reuse the same schema and Tool objects."""
+        catalog = ToolCatalog(_registry())
+        with patch.object(_QueryArgs, "model_json_schema", wraps=_QueryArgs.model_json_schema) as spy:
+            first = catalog.tools()
+            second = catalog.tools()
+        assert spy.call_count == 1
+        assert [t.name for t in first] == ["q", "o"]
+        assert first[0] is second[0]
+        assert first is not second
+        assert catalog.schema("q") == _QueryArgs.model_json_schema()
+
+    def test_subsets_and_serialized_bytes(self):
+        """Test subsets keep requested order and serialize to the same tools."""
+        catalog = ToolCatalog(_registry())
+        assert [t.name for t in catalog.tools(["o", "q", "missing"])] == ["o", "q"]
+        payload = json.loads(catalog.serialized(["q"]))
+        assert payload[0]["name"] == "q"
+        assert payload[0]["inputSchema"]["required"] == ["query"]
+
+    def test_registration_change_rebuilds_entry(self):
+        """Test replacing or adding a registration is picked up."""
+        registry = _registry()
+        catalog = ToolCatalog(registry)
+        catalog.tools()
+        registry["q"] = ToolRegistration(name="q", description="changed", model=_QueryArgs, handler=lambda db, a: a)
+        registry["n"] = ToolRegistration(name="n", description="new", model=_OtherArgs, handler=lambda db, a: a)
+        tools = catalog.tools()
+        assert [t.name for t in tools] == ["q", "o", "n"]
+        assert tools[0].description == "changed"
+
+    def test_disk_cache_round_trip(self, tmp_path):
+        """Test schemas persisted by one catalog are reused by the next."""
+        ToolCatalog(_registry(), cache_dir=str(tmp_path)).tools()
+        files = os.listdir(tmp_path)
+        assert len(files) == 1 and files[0].startswith("tool-catalog-")
+
+        with patch.object(_QueryArgs, "model_json_schema") as spy:
+            tools = ToolCatalog(_registry(), cache_dir=str(tmp_path)).tools()
+        spy.assert_not_called()
+        assert tools[0].inputSchema == _QueryArgs.model_json_schema()
+
+    def test_disk_cache_ignores_changed_tools(self, tmp_path):
+        """Test entries whose fingerprint changed are rebuilt."""
+        ToolCatalog(_registry(), cache_dir=str(tmp_path)).tools()
+        registry = _registry()
+        registry["q"].description = "different"
+        with patch.object(_QueryArgs, "model_json_schema", return_value={"fresh": True}):
+            tools = ToolCatalog(registry, cache_dir=str(tmp_path)).tools()
+        assert tools[0].inputSchema == {"fresh": True}
@@ -0,0 +1,84 @@
+"""Unit tests for tool registration and precomputed dispatch plans."""
+
+import json
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing import Optional
+from unittest.mock import AsyncMock, Mock, patch
+
+import mcp_arangodb_async.handlers  # noqa: F401 - populates TOOL_REGISTRY
+from mcp_arangodb_async.tool_registry import (
+    TOOL_REGISTRY,
+    ToolRegistration,
+    build_args_validator,
+    register_async_handler,
+)
+from mcp_arangodb_async.tools import ARANGO_LIST_WORKFLOWS, ARANGO_QUERY
+
+
+class _Args(BaseModel):
+    name: str
+    limit: Optional[int] = None
+
+
+class TestDispatchPlan:
+    """Test plans are built at registration and follow handler changes."""
+
+    def test_plan_captures_calling_convention(self):
+        """Test kwargs/async detection happens once per handler."""
+        async def kwargs_handler(db, **kwargs):
+            return kwargs
+
+        reg = ToolRegistration(name="t", description="", model=_Args, handler=kwargs_handler)
+        plan = reg.plan
+        assert plan.pass_kwargs is True
+        assert plan.is_async is True
+        assert reg.plan is plan
+
+        def dict_handler(db, args):
+            return args
+
+        reg.handler = dict_handler
+        assert reg.plan is not plan
+        assert reg.plan.pass_kwargs is False
+        assert reg.plan.is_async is False
+
+    def test_validator_matches_model_dump(self):
+        """Test the cached validator equals model(**args).model_dump(exclude_none=True)."""
+        validate = build_args_validator(_Args)
+        assert validate({"name": "a"}) == _Args(name="a").model_dump(exclude_none=True)
+        assert validate({"name": "a", "limit": 3}) == {"name": "a", "limit": 3}
+        with pytest.raises(ValidationError):
+            validate({})
+
+    def test_registered_tools_have_plans(self):
+        """Test every registered tool has a plan and DB-free tools are flagged."""
+        for reg in TOOL_REGISTRY.values():
+            assert reg.plan.handler is reg.handler
+        assert TOOL_REGISTRY[ARANGO_QUERY].plan.needs_db is True
+        assert TOOL_REGISTRY[ARANGO_LIST_WORKFLOWS].plan.needs_db is False
+
+    def test_async_handler_must_be_coroutine(self):
+        """Test attaching a sync function as async variant is rejected."""
+        with pytest.raises(TypeError):
+            register_async_handler(ARANGO_QUERY)(lambda db, args: None)
+
+    @pytest.mark.asyncio
+    async def test_db_free_tool_skips_connection(self):
+        """Test tools with needs_db=False never resolve or connect a database."""
+        from mcp_arangodb_async.entry import server
+        from mcp_arangodb_async.session_state import SessionState
+
+        db_manager = Mock()
+        db_manager.get_connection = AsyncMock(side_effect=AssertionError("connected"))
+        with patch.object(server, "request_context") as mock_ctx:
+            mock_ctx.lifespan_context = {
+                "db": None,
+                "session_state": SessionState(),
+                "db_manager": db_manager,
+                "config_loader": Mock(),
+            }
+            result = await server._handlers["call_tool"](ARANGO_LIST_WORKFLOWS, {})
+        data = json.loads(result[0].text)
+        assert "contexts" in data
+        db_manager.get_connection.assert_not_called()